@@ -7,17 +7,23 @@ import json
 import uuid
 import logging
 import os
+import random
 import sys
+import time
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Set, Tuple
 
 # 프로젝트 루트 경로 추가 (database 모듈 import를 위함)
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 sys.path.insert(0, os.path.join(project_root, '8_DATABASE'))
+# 루트의 구버전 모듈(ocpp_messages.py 등)보다 이 디렉토리의 모듈을 우선 사용
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from ocpp_messages import OCPPMessage, OCPPv201RequestBuilder
+from ocpp_messages import OCPPMessage, OCPPv201RequestBuilder, TransactionEventTemplate, utc_timestamp
+from protocol_trace import get_trace, DIRECTION_SEND, DIRECTION_RECV
+from latency_histogram import LatencyRecorder
 
 # 로깅 설정
 logging.basicConfig(
@@ -26,12 +32,54 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# 상세 프로토콜 로깅 활성화 여부
+# 상세 프로토콜 로깅 활성화 여부 (송수신 프레임을 protocol_trace에 한 번만 기록)
 PROTOCOL_DEBUG = os.getenv('OCPP_PROTOCOL_DEBUG', 'false').lower() == 'true'
 
+# 왕복 시간 요약 로그 주기 (초, 0이면 비활성화)
+LATENCY_SUMMARY_INTERVAL = float(os.getenv('OCPP_LATENCY_SUMMARY_INTERVAL', '60'))
+
+
+class EVSEState:
+    """EVSE 하나의 거래/계량 상태 (EVSE마다 커넥터 1개)"""
+
+    __slots__ = (
+        "evse_id", "connector_id", "transaction_id", "is_charging",
+        "meter_value", "current", "meter_samples", "event_template"
+    )
+
+    def __init__(self, evse_id: int, connector_id: int = 1):
+        self.evse_id = evse_id
+        self.connector_id = connector_id
+        self.transaction_id = str(uuid.uuid4())
+        self.is_charging = False
+        self.meter_value = 0.0  # kWh
+        self.current = 0.0
+        # 묶음 전송 대기 중인 미터 샘플과 거래별 프레임 템플릿 (meter_batch_size > 1일 때)
+        self.meter_samples: list = []
+        self.event_template: Optional[TransactionEventTemplate] = None
+
+
+def _primary_evse_attr(name: str) -> property:
+    """EVSE 1의 속성을 충전기 속성으로 노출 (단일 커넥터 API 호환)"""
+    return property(
+        lambda self: getattr(self.evses[1], name),
+        lambda self, value: setattr(self.evses[1], name, value)
+    )
+
 
 class ChargerSimulator:
-    """OCPP 2.0.1 충전기 시뮬레이터"""
+    """
+    OCPP 2.0.1 충전기 시뮬레이터
+
+    num_connectors개의 EVSE(각 커넥터 1개)를 가지며, EVSE마다 독립적으로 거래를 진행한다.
+    하나의 웹소켓으로 여러 세션의 메시지를 보내는 대형 급속 충전소를 흉내낼 수 있다.
+    transaction_id/is_charging/meter_value/current는 EVSE 1의 상태를 가리킨다.
+    """
+
+    transaction_id = _primary_evse_attr("transaction_id")
+    is_charging = _primary_evse_attr("is_charging")
+    meter_value = _primary_evse_attr("meter_value")
+    current = _primary_evse_attr("current")
 
     def __init__(
         self,
@@ -39,44 +87,101 @@ class ChargerSimulator:
         server_url: str = "ws://localhost:9000",
         charger_model: str = "EVBox Home",
         charger_vendor: str = "EVBox",
-        num_connectors: int = 1
+        num_connectors: int = 1,
+        metrics=None,
+        heartbeat_interval: float = 30.0,
+        meter_interval: float = 5.0,
+        meter_batch_size: int = 1,
+        auto_reconnect: bool = False,
+        reconnect_base_delay: float = 1.0,
+        reconnect_max_delay: float = 60.0
     ):
         self.charger_id = charger_id
         self.server_url = server_url
         self.charger_model = charger_model
         self.charger_vendor = charger_vendor
         self.num_connectors = num_connectors
+        self.heartbeat_interval = heartbeat_interval
+        self.meter_interval = meter_interval
+        # meter_interval마다 샘플링하고 meter_batch_size개를 TransactionEvent 하나로 묶어 전송 (1이면 매번 전송)
+        self.meter_batch_size = meter_batch_size
+        # EVSE ID(1부터) -> 상태
+        self.evses: Dict[int, EVSEState] = {
+            evse_id: EVSEState(evse_id) for evse_id in range(1, max(1, num_connectors) + 1)
+        }
+        # 예기치 않은 연결 끊김 시 지수 백오프(full jitter)로 재연결
+        self.auto_reconnect = auto_reconnect
+        self.reconnect_base_delay = reconnect_base_delay
+        self.reconnect_max_delay = reconnect_max_delay
+        self.reconnect_count = 0      # 성공한 재연결 수
+        self.reconnect_failures = 0   # 실패한 재연결 시도 수
+        # 마지막으로 BootNotification이 Accepted된 시각 (monotonic)
+        self.boot_accepted_at: Optional[float] = None
+        self._start_loops = True
+        self._closing = False
+        # 현재 연결의 수신/하트비트/충전/요약 태스크 (연결이 끊기면 취소)
+        self._tasks: Set[asyncio.Task] = set()
+        self._reconnect_task: Optional[asyncio.Task] = None
         self.websocket = None
         self.connected = False
-        self.pending_requests: Dict[str, dict] = {}
-        self.transaction_id = str(uuid.uuid4())
-        self.is_charging = False
-        self.meter_value = 0.0
-        self.charge_rate = 0.1  # kWh per second
-        self.current = 0.0
+        # 응답 대기 중인 CALL: 메시지 ID -> (액션, 전송 시각 monotonic)
+        self.pending_requests: Dict[str, Tuple[str, float]] = {}
+        # record_rtt(action, seconds) / record_error(kind)를 제공하는 지표 수집기
+        # (미지정 시 충전기별 LatencyRecorder, fleet 모드에서는 여러 충전기가 공유)
+        self.metrics = metrics if metrics is not None else LatencyRecorder()
+        self.charge_rate = 0.1  # kWh per meter_interval
         self.voltage = 400.0
 
-    async def connect(self):
-        """서버에 연결"""
+    async def connect(self, start_loops: bool = True):
+        """
+        서버에 연결
+
+        Args:
+            start_loops: False이면 하트비트/충전 루프를 만들지 않는다
+                         (fleet_simulator처럼 외부 타이머가 send_heartbeat/charging_tick을 호출할 때)
+        """
+        self._closing = False
+        await self._connect(start_loops)
+
+    async def _connect(self, start_loops: bool):
+        """연결 수립 (disconnect() 이후에는 수립된 연결도 닫고 ConnectionError)"""
+        self._start_loops = start_loops
+        # 이전 연결의 루프가 남아 있으면 정리 (재연결 시 루프 중복 방지)
+        self._cancel_tasks()
+        previous = self.websocket
         try:
             uri = f"{self.server_url}/{self.charger_id}"
             logger.info(f"충전기 {self.charger_id} 서버에 연결 중: {uri}")
             
-            self.websocket = await websockets.connect(uri, subprotocols=["ocpp2.0.1"])
+            websocket = await websockets.connect(uri, subprotocols=["ocpp2.0.1"])
+            if self._closing:
+                # 핸드셰이크 중에 disconnect()가 호출됨
+                await websocket.close()
+                raise ConnectionError("연결 해제 요청으로 연결 취소")
+            self.websocket = websocket
             self.connected = True
             logger.info(f"충전기 {self.charger_id} 서버에 연결됨")
+            if previous is not None:
+                try:
+                    await previous.close()
+                except Exception:
+                    pass
             
+            # 메시지 수신 태스크 시작
+            self._spawn(self.receive_messages())
+
             # 부팅 알림 전송
             await self.send_boot_notification()
-            
-            # 메시지 수신 태스크 시작
-            asyncio.create_task(self.receive_messages())
-            
-            # 하트비트 태스크 시작
-            asyncio.create_task(self.heartbeat_loop())
-            
-            # 충전 시뮬레이션 태스크 시작
-            asyncio.create_task(self.charging_loop())
+
+            if start_loops:
+                # 하트비트 태스크 시작
+                self._spawn(self.heartbeat_loop())
+
+                # 충전 시뮬레이션 태스크 시작
+                self._spawn(self.charging_loop())
+
+                if LATENCY_SUMMARY_INTERVAL > 0:
+                    self._spawn(self.latency_summary_loop(LATENCY_SUMMARY_INTERVAL))
             
         except Exception as e:
             logger.error(f"연결 실패: {e}")
@@ -90,57 +195,135 @@ class ChargerSimulator:
                 charger_model=self.charger_model,
                 charger_vendor=self.charger_vendor,
                 charger_serial=self.charger_id,
-                reason="PowerUp"
+                reason="PowerUp",
+                message_id=self._new_call_id("BootNotification")
             )
             await self.send_message(message)
             logger.info(f"부팅 알림 전송: {self.charger_id}")
         except Exception as e:
             logger.error(f"부팅 알림 전송 실패: {e}")
 
+    def _new_call_id(self, action: str) -> str:
+        """CALL 메시지 ID 생성 및 응답 대기 등록 (왕복 시간 측정용)"""
+        message_id = str(uuid.uuid4())
+        self.pending_requests[message_id] = (action, time.monotonic())
+        return message_id
+
+    def _spawn(self, coro) -> asyncio.Task:
+        """현재 연결에 속한 태스크 생성 (연결이 끊기면 _cancel_tasks로 취소)"""
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def _cancel_tasks(self):
+        """현재 연결의 태스크 취소 (호출한 태스크 자신은 제외, 스스로 종료)"""
+        current = asyncio.current_task()
+        for task in list(self._tasks):
+            if task is not current:
+                task.cancel()
+
+    def _connection_lost(self):
+        """
+        연결 끊김 처리: 이 연결의 태스크와 응답 대기 CALL을 정리하고,
+        disconnect()로 닫는 중이 아니면 재연결을 예약한다 (중복 예약 없음)
+        """
+        self.connected = False
+        self._cancel_tasks()
+        # 끊긴 연결의 CALL 응답은 오지 않음
+        self.pending_requests.clear()
+        if (self.auto_reconnect and not self._closing
+                and (self._reconnect_task is None or self._reconnect_task.done())):
+            self._reconnect_task = asyncio.create_task(self.reconnect())
+
+    def reconnect_delay(self, attempt: int) -> float:
+        """attempt번째(0부터) 재연결 시도 전 대기 시간: [0, min(최대, 기본 * 2^attempt)] 균등 분포"""
+        return random.uniform(0, min(self.reconnect_max_delay, self.reconnect_base_delay * (2 ** attempt)))
+
+    async def reconnect(self, max_attempts: Optional[int] = None) -> bool:
+        """
+        지터를 준 지수 백오프로 재연결
+
+        모든 충전기가 동시에 끊겨도 재연결 시점이 흩어져 서버에 부팅이 몰리지 않는다.
+        disconnect()가 호출되면 중단한다 (연결 중이던 시도도 연결하지 않음).
+
+        Returns:
+            재연결 성공 여부
+        """
+        attempt = 0
+        while max_attempts is None or attempt < max_attempts:
+            await asyncio.sleep(self.reconnect_delay(attempt))
+            if self._closing or self.connected:
+                return self.connected
+            try:
+                await self._connect(self._start_loops)
+                self.reconnect_count += 1
+                return True
+            except Exception:
+                if self._closing:
+                    return False
+                self.reconnect_failures += 1
+                attempt += 1
+        return False
+
+    def _record_error(self, kind: str):
+        self.metrics.record_error(kind)
+
+    def expire_pending(self, timeout: float) -> int:
+        """timeout 이상 응답이 없는 CALL 제거 (제거 건수 반환)"""
+        deadline = time.monotonic() - timeout
+        expired = [mid for mid, (_, sent_at) in self.pending_requests.items() if sent_at <= deadline]
+        for message_id in expired:
+            del self.pending_requests[message_id]
+            self._record_error("timeout")
+        return len(expired)
+
     async def send_message(self, message: str):
         """메시지 전송"""
         if self.websocket and self.connected:
             try:
                 if PROTOCOL_DEBUG:
-                    logger.debug(f"[CHARGER-SEND] {self.charger_id}: {message}")
+                    get_trace().record(self.charger_id, DIRECTION_SEND, message)
                 await self.websocket.send(message)
             except Exception as e:
                 logger.error(f"메시지 전송 실패: {e}")
-                self.connected = False
+                self._record_error("send")
+                self._connection_lost()
 
     async def receive_messages(self):
-        """메시지 수신"""
+        """메시지 수신 (이 연결의 소켓이 닫히거나 오류가 나면 _connection_lost)"""
+        websocket = self.websocket
         try:
-            while self.connected and self.websocket:
-                try:
-                    message = await asyncio.wait_for(
-                        self.websocket.recv(),
-                        timeout=30.0
-                    )
-                    await self.handle_message(message)
-                except asyncio.TimeoutError:
-                    logger.warning(f"메시지 수신 타임아웃: {self.charger_id}")
-                except websockets.exceptions.ConnectionClosed:
-                    logger.warning(f"연결 종료: {self.charger_id}")
-                    self.connected = False
-                    break
+            while self.connected and self.websocket is websocket:
+                message = await websocket.recv()
+                await self.handle_message(message)
+        except websockets.exceptions.ConnectionClosed:
+            if not self._closing and self.websocket is websocket:
+                logger.warning(f"연결 종료: {self.charger_id}")
+                self._record_error("disconnect")
         except Exception as e:
             logger.error(f"메시지 수신 오류: {e}")
-            self.connected = False
+        # 재연결로 소켓이 바뀐 뒤 끝난 이전 수신 태스크는 무시
+        if self.websocket is websocket:
+            self._connection_lost()
 
     async def handle_message(self, message: str):
         """메시지 처리"""
         try:
             if PROTOCOL_DEBUG:
-                logger.debug(f"[CHARGER-RECV] {self.charger_id}: {message}")
-            
+                get_trace().record(self.charger_id, DIRECTION_RECV, message)
+
             message_type, message_id, action, payload = OCPPMessage.parse_message(message)
             
             if message_type == OCPPMessage.CALLRESULT:
                 # 응답 처리
-                if message_id in self.pending_requests:
-                    logger.info(f"응답 수신: {action}, ID: {message_id}")
-                    del self.pending_requests[message_id]
+                pending = self.pending_requests.pop(message_id, None)
+                if pending is not None:
+                    request_action, sent_at = pending
+                    logger.debug(f"응답 수신: {request_action}, ID: {message_id}")
+                    self.metrics.record_rtt(request_action, time.monotonic() - sent_at)
+                    if request_action == "BootNotification" and payload.get("status") == "Accepted":
+                        self.boot_accepted_at = time.monotonic()
             
             elif message_type == OCPPMessage.CALL:
                 # 요청 처리
@@ -149,11 +332,16 @@ class ChargerSimulator:
             
             elif message_type == OCPPMessage.CALLERROR:
                 logger.error(f"오류 응답: {action} - {payload}")
-                if message_id in self.pending_requests:
-                    del self.pending_requests[message_id]
+                pending = self.pending_requests.pop(message_id, None)
+                if pending is not None:
+                    # 오류 응답도 서버 응답 시간이므로 히스토그램에 포함
+                    request_action, sent_at = pending
+                    self.metrics.record_rtt(request_action, time.monotonic() - sent_at)
+                    self._record_error(f"{request_action}:{action}")
                     
         except Exception as e:
             logger.error(f"메시지 처리 오류: {e}")
+            self._record_error("parse")
 
     async def handle_request(self, message_id: str, action: str, payload: Dict[str, Any]):
         """요청 처리"""
@@ -173,50 +361,87 @@ class ChargerSimulator:
         except Exception as e:
             logger.error(f"요청 처리 오류: {e}")
 
+    def idle_evse(self) -> Optional[EVSEState]:
+        """거래가 없는 첫 EVSE"""
+        for evse in self.evses.values():
+            if not evse.is_charging:
+                return evse
+        return None
+
+    def find_evse(self, transaction_id: Optional[str]) -> Optional[EVSEState]:
+        """거래 ID로 충전 중인 EVSE 찾기"""
+        for evse in self.evses.values():
+            if evse.is_charging and evse.transaction_id == transaction_id:
+                return evse
+        return None
+
+    async def start_transaction(self, transaction_id: Optional[str] = None, current: float = 16.0, evse_id: int = 1):
+        """충전기 측에서 EVSE evse_id의 거래 시작 (Started 이벤트 전송)"""
+        evse = self.evses[evse_id]
+        evse.is_charging = True
+        evse.transaction_id = transaction_id or str(uuid.uuid4())
+        evse.current = current
+        evse.meter_samples = []
+        if self.meter_batch_size > 1:
+            evse.event_template = TransactionEventTemplate(evse.transaction_id, evse.evse_id, evse.connector_id)
+        logger.info(f"거래 시작: {evse.transaction_id} (EVSE {evse_id})")
+        await self.send_transaction_event(event_type="Started", meter_value=0.0, evse_id=evse_id)
+
+    async def stop_transaction(self, evse_id: int = 1):
+        """충전기 측에서 EVSE evse_id의 거래 종료 (남은 미터 샘플 전송 후 Ended 이벤트 전송)"""
+        evse = self.evses[evse_id]
+        await self.flush_meter_values(evse_id)
+        evse.is_charging = False
+        evse.event_template = None
+        logger.info(f"거래 중지: {evse.transaction_id} (EVSE {evse_id})")
+        await self.send_transaction_event(event_type="Ended", meter_value=evse.meter_value, evse_id=evse_id)
+        evse.meter_value = 0.0
+        evse.current = 0.0
+
     async def handle_request_start_transaction(self, message_id: str, payload: Dict[str, Any]):
-        """거래 시작 요청 처리"""
+        """거래 시작 요청 처리 (evseId 지정 시 해당 EVSE, 아니면 비어 있는 첫 EVSE)"""
         try:
-            self.is_charging = True
-            self.transaction_id = str(uuid.uuid4())
-            self.current = 16.0  # 16A로 시작
-            
-            logger.info(f"거래 시작: {self.transaction_id}")
-            
+            evse_id = payload.get("evseId")
+            evse = self.evses.get(evse_id) if evse_id is not None else self.idle_evse()
+            if evse is None or evse.is_charging:
+                message = OCPPMessage.create_call_result(message_id, {"status": "Rejected"})
+                await self.send_message(message)
+                return
+
+            transaction_id = str(uuid.uuid4())
             response = {
                 "status": "Accepted",
-                "transactionId": self.transaction_id
+                "transactionId": transaction_id
             }
             message = OCPPMessage.create_call_result(message_id, response)
             await self.send_message(message)
-            
+
             # 거래 시작 이벤트 전송
-            await self.send_transaction_event(
-                event_type="Started",
-                meter_value=0.0
-            )
+            await self.start_transaction(transaction_id, evse_id=evse.evse_id)
         except Exception as e:
             logger.error(f"거래 시작 처리 오류: {e}")
 
     async def handle_request_stop_transaction(self, message_id: str, payload: Dict[str, Any]):
-        """거래 중지 요청 처리"""
+        """
+        거래 중지 요청 처리
+
+        transactionId로 EVSE를 찾는다. 일치하는 거래가 없어도 충전 중인 EVSE가
+        하나뿐이면 그 거래를 종료한다 (거래 ID 없이 호출하던 단일 커넥터 방식 호환).
+        """
         try:
-            self.is_charging = False
-            logger.info(f"거래 중지: {self.transaction_id}")
-            
+            evse = self.find_evse(payload.get("transactionId"))
+            if evse is None:
+                charging = [e for e in self.evses.values() if e.is_charging]
+                evse = charging[0] if len(charging) == 1 else None
             response = {
-                "status": "Accepted"
+                "status": "Accepted" if evse is not None else "Rejected"
             }
             message = OCPPMessage.create_call_result(message_id, response)
             await self.send_message(message)
-            
+
             # 거래 종료 이벤트 전송
-            await self.send_transaction_event(
-                event_type="Ended",
-                meter_value=self.meter_value
-            )
-            
-            self.meter_value = 0.0
-            self.current = 0.0
+            if evse is not None:
+                await self.stop_transaction(evse.evse_id)
         except Exception as e:
             logger.error(f"거래 중지 처리 오류: {e}")
 
@@ -230,31 +455,83 @@ class ChargerSimulator:
         except Exception as e:
             logger.error(f"충전 프로필 설정 오류: {e}")
 
-    async def send_transaction_event(self, event_type: str, meter_value: float):
-        """거래 이벤트 전송"""
+    async def send_transaction_event(self, event_type: str, meter_value: float, evse_id: int = 1):
+        """EVSE evse_id의 거래 이벤트 전송"""
         try:
+            evse = self.evses[evse_id]
             message = OCPPv201RequestBuilder.transaction_event(
                 event_type=event_type,
-                transaction_id=self.transaction_id,
-                evse_id=1,
-                connector_id=1,
+                transaction_id=evse.transaction_id,
+                evse_id=evse.evse_id,
+                connector_id=evse.connector_id,
                 meter_value=meter_value,
                 voltage=self.voltage,
-                current=self.current
+                current=evse.current,
+                message_id=self._new_call_id("TransactionEvent")
             )
             await self.send_message(message)
-            logger.info(f"거래 이벤트 전송: {event_type}, 에너지: {meter_value} kWh")
+            logger.debug(f"거래 이벤트 전송: {event_type}, 에너지: {meter_value} kWh")
         except Exception as e:
             logger.error(f"거래 이벤트 전송 오류: {e}")
 
+    async def send_heartbeat(self):
+        """하트비트 전송"""
+        message = OCPPv201RequestBuilder.heartbeat(message_id=self._new_call_id("Heartbeat"))
+        await self.send_message(message)
+        logger.debug(f"하트비트 전송: {self.charger_id}")
+
+    async def send_status_notification(self, status: str, evse_id: int = 1, connector_id: int = 1):
+        """커넥터 상태 알림 전송 (Available, Occupied, Faulted 등)"""
+        message = OCPPv201RequestBuilder.status_notification(
+            evse_id=evse_id,
+            connector_id=connector_id,
+            status=status,
+            message_id=self._new_call_id("StatusNotification")
+        )
+        await self.send_message(message)
+        logger.debug(f"상태 알림 전송: {self.charger_id} {status}")
+
+    async def charging_tick(self, energy_kwh: Optional[float] = None, evse_id: Optional[int] = None):
+        """
+        충전 중인 EVSE마다 미터 값을 올리고 Updated 이벤트 전송
+        (meter_batch_size > 1이면 샘플만 쌓고, meter_batch_size개가 모이면 한 프레임으로 전송)
+
+        Args:
+            energy_kwh: 이번 주기에 EVSE별로 충전된 에너지 (미지정 시 charge_rate)
+            evse_id: 지정 시 해당 EVSE만 갱신
+        """
+        evses = self.evses.values() if evse_id is None else (self.evses[evse_id],)
+        for evse in evses:
+            if not evse.is_charging:
+                continue
+            evse.meter_value += self.charge_rate if energy_kwh is None else energy_kwh
+            if evse.event_template is None:
+                await self.send_transaction_event(
+                    event_type="Updated",
+                    meter_value=evse.meter_value,
+                    evse_id=evse.evse_id
+                )
+                continue
+            evse.meter_samples.append((utc_timestamp(), evse.meter_value * 1000, self.voltage * evse.current))
+            if len(evse.meter_samples) >= self.meter_batch_size:
+                await self.flush_meter_values(evse.evse_id)
+
+    async def flush_meter_values(self, evse_id: Optional[int] = None):
+        """모아 둔 미터 샘플을 EVSE별로 meterValue 여러 개를 담은 Updated 이벤트 하나로 전송"""
+        evses = self.evses.values() if evse_id is None else (self.evses[evse_id],)
+        for evse in evses:
+            if not evse.meter_samples or evse.event_template is None:
+                continue
+            samples, evse.meter_samples = evse.meter_samples, []
+            message = evse.event_template.updated(self._new_call_id("TransactionEvent"), samples)
+            await self.send_message(message)
+
     async def heartbeat_loop(self):
         """하트비트 루프"""
         while self.connected:
             try:
-                await asyncio.sleep(30)  # 30초마다 하트비트
-                message = OCPPv201RequestBuilder.heartbeat()
-                await self.send_message(message)
-                logger.debug(f"하트비트 전송: {self.charger_id}")
+                await asyncio.sleep(self.heartbeat_interval)
+                await self.send_heartbeat()
             except Exception as e:
                 logger.error(f"하트비트 전송 오류: {e}")
 
@@ -262,22 +539,43 @@ class ChargerSimulator:
         """충전 시뮬레이션 루프"""
         while self.connected:
             try:
-                if self.is_charging:
-                    self.meter_value += self.charge_rate
-                    
-                    # 5초마다 거래 업데이트 이벤트 전송
-                    await self.send_transaction_event(
-                        event_type="Updated",
-                        meter_value=self.meter_value
-                    )
-                
-                await asyncio.sleep(5)
+                # meter_interval초마다 거래 업데이트 이벤트 전송
+                await self.charging_tick()
+                await asyncio.sleep(self.meter_interval)
             except Exception as e:
                 logger.error(f"충전 루프 오류: {e}")
 
+    def get_latency_stats(self) -> Dict[str, Any]:
+        """
+        액션별 왕복 시간 통계 조회
+
+        Returns:
+            {"rtt": {액션: {count, min_ms, mean_ms, max_ms, p50_ms, p90_ms, p99_ms, p99.9_ms}},
+             "errors": {종류: 건수}, "pending": 응답 대기 건수}
+        """
+        stats = self.metrics.get_stats()
+        stats["pending"] = len(self.pending_requests)
+        return stats
+
+    async def latency_summary_loop(self, interval: float):
+        """interval초마다 왕복 시간 요약 로그"""
+        while self.connected:
+            await asyncio.sleep(interval)
+            logger.info(f"왕복 시간 [{self.charger_id}] {self.metrics.format_summary()}")
+
     async def disconnect(self):
-        """서버에서 연결 해제"""
+        """서버에서 연결 해제 (진행 중인 재연결도 중단)"""
+        self._closing = True
+        reconnect_task = self._reconnect_task
+        if reconnect_task is not None and reconnect_task is not asyncio.current_task():
+            reconnect_task.cancel()
+            try:
+                await reconnect_task
+            except asyncio.CancelledError:
+                pass
         self.connected = False
+        self._cancel_tasks()
+        self.pending_requests.clear()
         if self.websocket:
             await self.websocket.close()
         logger.info(f"충전기 {self.charger_id} 연결 해제됨")
@@ -0,0 +1,307 @@
+"""
+대규모 충전기 부하 생성기 (fleet 모드)
+
+ChargerSimulator 수천~수만 대를 한 프로세스(또는 여러 워커 프로세스)에서 구동한다.
+충전기마다 하트비트/충전 루프 태스크를 만들지 않고, 프로세스당 하나의 타이머 루프가
+충전기를 슬롯별로 나누어 하트비트와 미터 값 갱신을 보낸다 (충전기당 태스크는 수신 1개).
+
+측정 항목:
+    - 연결 지연 (웹소켓 핸드셰이크 완료까지)
+    - CALL -> CALLRESULT 왕복 시간 (액션별 HDR 히스토그램, p50/p90/p99/max)
+    - 오류 수 (연결 실패, 연결 끊김, 전송 실패, 응답 타임아웃, CALLERROR)
+
+사용법:
+    python fleet_simulator.py --url ws://localhost:9000 --count 10000 --ramp-rate 500 --duration 120
+    python fleet_simulator.py --count 40000 --workers 4 --output fleet_report.json
+    python fleet_simulator.py --count 20000 --meter-interval 1 --meter-batch 10   # 1초 샘플, 10초마다 묶어 전송
+    python fleet_simulator.py --count 500 --connectors 12 --charging-ratio 1      # 웹소켓 하나에 세션 12개 (급속 충전 허브)
+
+    ※ 충전기 1대당 소켓 1개를 쓰므로 ulimit -n을 충전기 수보다 크게 설정해야 한다.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+import sys
+import time
+from typing import Any, Dict, List
+
+# 루트의 구버전 모듈(ocpp_messages.py 등)보다 이 디렉토리의 모듈을 우선 사용
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from charger_simulator import ChargerSimulator
+from latency_histogram import LatencyHistogram, LatencyRecorder
+
+logger = logging.getLogger(__name__)
+
+
+class FleetMetrics(LatencyRecorder):
+    """
+    부하 생성 지표 수집기 (ChargerSimulator의 metrics로 전달)
+
+    왕복 시간과 연결 지연을 모두 HDR 히스토그램으로 기록하므로
+    충전기 수·실행 시간과 무관하게 메모리가 일정하다.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.connect = LatencyHistogram()
+
+    def record_connect(self, seconds: float):
+        self.connect.record(seconds)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """히스토그램 직렬화 (워커 간 병합용)"""
+        data = super().to_dict()
+        data["connect"] = self.connect.to_dict()
+        return data
+
+    def merge(self, data: Dict[str, Any]):
+        """다른 워커의 to_dict() 결과 병합"""
+        self.merge_dict(data)
+        self.connect.merge(LatencyHistogram.from_dict(data["connect"]))
+
+    def report(self) -> Dict[str, Any]:
+        """요약 보고서"""
+        report = self.get_stats()
+        report["connect"] = self.connect.summary()
+        return report
+
+
+class Fleet:
+    """한 프로세스에서 구동하는 가상 충전기 집합"""
+
+    def __init__(
+        self,
+        server_url: str = "ws://localhost:9000",
+        count: int = 1000,
+        prefix: str = "FLEET",
+        start_index: int = 0,
+        ramp_rate: float = 200.0,
+        heartbeat_interval: float = 30.0,
+        meter_interval: float = 5.0,
+        meter_batch_size: int = 1,
+        connectors: int = 1,
+        charging_ratio: float = 0.5,
+        tick: float = 0.1,
+        call_timeout: float = 30.0,
+        summary_interval: float = 10.0
+    ):
+        self.server_url = server_url
+        self.count = count
+        self.prefix = prefix
+        self.start_index = start_index
+        self.ramp_rate = ramp_rate
+        self.heartbeat_interval = heartbeat_interval
+        self.meter_interval = meter_interval
+        self.meter_batch_size = meter_batch_size
+        # 충전기(웹소켓)당 EVSE 수: 충전 중인 충전기는 모든 EVSE에서 동시에 거래를 진행
+        self.connectors = connectors
+        self.charging_ratio = charging_ratio
+        self.tick = tick
+        self.call_timeout = call_timeout
+        self.summary_interval = summary_interval
+        self.metrics = FleetMetrics()
+        self.chargers: List[ChargerSimulator] = []
+        self._running = False
+
+    def _charger_id(self, index: int) -> str:
+        return f"{self.prefix}_{self.start_index + index:06d}"
+
+    async def _connect_one(self, index: int):
+        charger = ChargerSimulator(
+            self._charger_id(index), self.server_url, metrics=self.metrics,
+            meter_batch_size=self.meter_batch_size,
+            num_connectors=self.connectors
+        )
+        started = time.perf_counter()
+        try:
+            await charger.connect(start_loops=False)
+        except Exception:
+            self.metrics.record_error("connect")
+            return
+        self.metrics.record_connect(time.perf_counter() - started)
+        self.chargers.append(charger)
+        # 충전 비율만큼 거래를 시작해 미터 값 갱신 부하를 만든다
+        if index < self.count * self.charging_ratio:
+            for evse_id in charger.evses:
+                await charger.start_transaction(evse_id=evse_id)
+
+    async def ramp(self):
+        """ramp_rate(대/초) 속도로 연결"""
+        tasks = []
+        interval = 1.0 / self.ramp_rate if self.ramp_rate > 0 else 0.0
+        started = time.perf_counter()
+        for index in range(self.count):
+            tasks.append(asyncio.create_task(self._connect_one(index)))
+            if interval:
+                delay = started + (index + 1) * interval - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+        await asyncio.gather(*tasks)
+        logger.info(f"연결 완료: {len(self.chargers)}/{self.count}대 ({time.perf_counter() - started:.1f}초)")
+
+    async def _send_slot(self, chargers: List[ChargerSimulator], action: str):
+        coros = []
+        for charger in chargers:
+            if not charger.connected:
+                continue
+            coros.append(charger.send_heartbeat() if action == "Heartbeat" else charger.charging_tick())
+        if coros:
+            await asyncio.gather(*coros)
+
+    async def timer_loop(self):
+        """
+        단일 타이머 루프
+
+        충전기 i는 tick 슬롯 (i mod 슬롯 수)에 배정되어, 주기 안에서 하트비트와
+        미터 갱신이 고르게 분산된다.
+        """
+        heartbeat_slots = max(1, int(round(self.heartbeat_interval / self.tick)))
+        meter_slots = max(1, int(round(self.meter_interval / self.tick)))
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+        next_summary = next_tick + self.summary_interval
+        step = 0
+        while self._running:
+            chargers = self.chargers
+            hb_slot = step % heartbeat_slots
+            meter_slot = step % meter_slots
+            await self._send_slot(chargers[hb_slot::heartbeat_slots], "Heartbeat")
+            await self._send_slot(chargers[meter_slot::meter_slots], "Meter")
+            if step % heartbeat_slots == 0:
+                for charger in chargers:
+                    charger.expire_pending(self.call_timeout)
+            if self.summary_interval > 0 and loop.time() >= next_summary:
+                logger.info(f"왕복 시간 ({len(self.chargers)}대) {self.metrics.format_summary()}")
+                next_summary += self.summary_interval
+            step += 1
+            next_tick += self.tick
+            await asyncio.sleep(max(0.0, next_tick - loop.time()))
+
+    async def run(self, duration: float) -> Dict[str, Any]:
+        """연결 후 duration초 동안 부하 생성, 원본 지표 반환"""
+        self._running = True
+        timer = asyncio.create_task(self.timer_loop())
+        started = time.perf_counter()
+        try:
+            await self.ramp()
+            remaining = duration - (time.perf_counter() - started)
+            if remaining > 0:
+                await asyncio.sleep(remaining)
+        finally:
+            self._running = False
+            await timer
+            connected = sum(1 for c in self.chargers if c.connected)
+            await asyncio.gather(*(c.disconnect() for c in self.chargers), return_exceptions=True)
+        data = self.metrics.to_dict()
+        data["connected_at_end"] = connected
+        data["elapsed"] = time.perf_counter() - started
+        return data
+
+
+def _run_worker(options: Dict[str, Any]) -> Dict[str, Any]:
+    """워커 프로세스 진입점"""
+    logging.getLogger("charger_simulator").setLevel(logging.WARNING)
+    duration = options.pop("duration")
+    fleet = Fleet(**options)
+    return asyncio.run(fleet.run(duration))
+
+
+def run_fleet(
+    count: int,
+    workers: int = 1,
+    duration: float = 60.0,
+    ramp_rate: float = 200.0,
+    **options
+) -> Dict[str, Any]:
+    """
+    워커 프로세스 workers개로 충전기 count대를 구동하고 병합된 보고서 반환
+
+    각 워커는 충전기 ID 구간과 ramp_rate를 나누어 맡는다.
+    """
+    per_worker = [count // workers + (1 if i < count % workers else 0) for i in range(workers)]
+    jobs = []
+    start_index = 0
+    for share in per_worker:
+        jobs.append({
+            **options,
+            "count": share,
+            "start_index": start_index,
+            "ramp_rate": ramp_rate / workers,
+            "duration": duration
+        })
+        start_index += share
+
+    if workers == 1:
+        results = [_run_worker(jobs[0])]
+    else:
+        with multiprocessing.Pool(workers) as pool:
+            results = pool.map(_run_worker, jobs)
+
+    metrics = FleetMetrics()
+    for result in results:
+        metrics.merge(result)
+    report = metrics.report()
+    report["chargers"] = count
+    report["workers"] = workers
+    report["connected_at_end"] = sum(r["connected_at_end"] for r in results)
+    report["elapsed_seconds"] = max(r["elapsed"] for r in results)
+    return report
+
+
+def print_report(report: Dict[str, Any]):
+    """보고서 출력"""
+    print(f"\n충전기 {report['chargers']}대 / 워커 {report['workers']}개 / "
+          f"종료 시 연결 {report['connected_at_end']}대 / {report['elapsed_seconds']:.1f}초")
+    rows = [("connect", report["connect"])] + list(report["rtt"].items())
+    print(f"{'항목':<20}{'count':>9}{'p50(ms)':>10}{'p90(ms)':>10}{'p99(ms)':>10}{'max(ms)':>10}")
+    for name, s in rows:
+        print(f"{name:<20}{s['count']:>9}{s['p50_ms']:>10.1f}{s['p90_ms']:>10.1f}{s['p99_ms']:>10.1f}{s['max_ms']:>10.1f}")
+    print(f"오류: {report['errors'] or '없음'}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OCPP 2.0.1 대규모 충전기 부하 생성기")
+    parser.add_argument("--url", default="ws://localhost:9000", help="OCPP 서버 주소")
+    parser.add_argument("--count", type=int, default=1000, help="가상 충전기 수")
+    parser.add_argument("--workers", type=int, default=1, help="워커 프로세스 수")
+    parser.add_argument("--ramp-rate", type=float, default=200.0, help="초당 연결 수 (전체)")
+    parser.add_argument("--duration", type=float, default=60.0, help="총 실행 시간 (초, 연결 시간 포함)")
+    parser.add_argument("--heartbeat-interval", type=float, default=30.0, help="하트비트 주기 (초)")
+    parser.add_argument("--meter-interval", type=float, default=5.0, help="미터 값 샘플링 주기 (초)")
+    parser.add_argument("--meter-batch", type=int, default=1, help="TransactionEvent 하나에 묶을 미터 샘플 수")
+    parser.add_argument("--connectors", type=int, default=1, help="충전기당 EVSE 수 (충전 중이면 모두 동시 거래)")
+    parser.add_argument("--charging-ratio", type=float, default=0.5, help="충전 중인 충전기 비율")
+    parser.add_argument("--prefix", default="FLEET", help="충전기 ID 접두어")
+    parser.add_argument("--summary-interval", type=float, default=10.0, help="왕복 시간 요약 로그 주기 (초, 0이면 끔)")
+    parser.add_argument("--output", help="보고서 JSON 파일 경로")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    report = run_fleet(
+        count=args.count,
+        workers=args.workers,
+        duration=args.duration,
+        ramp_rate=args.ramp_rate,
+        server_url=args.url,
+        prefix=args.prefix,
+        heartbeat_interval=args.heartbeat_interval,
+        meter_interval=args.meter_interval,
+        meter_batch_size=args.meter_batch,
+        connectors=args.connectors,
+        charging_ratio=args.charging_ratio,
+        summary_interval=args.summary_interval
+    )
+    print_report(report)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"\n결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
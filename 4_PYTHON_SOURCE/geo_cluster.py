@@ -0,0 +1,203 @@
+"""
+충전기 지도 클러스터 (줌 레벨별 사전 집계)
+
+줌 레벨마다 웹 메르카토르 좌표를 cluster_px(타일 픽셀) 크기의 칸으로 나누고,
+칸별로 충전기 수, 좌표 합(중심 계산용), 상태별 수를 유지한다.
+    - 충전기 추가/이동/삭제: 줌 레벨 수만큼 칸 카운터만 갱신
+    - 상태 변경: 줌 레벨 수만큼 칸의 상태별 수만 갱신 (전체 재계산 없음)
+    - 조회: 해당 줌에서 화면 영역과 겹치는 칸만 반환
+
+넓은 지역 화면에서도 전체 충전기 대신 수백 개 이하의 클러스터만 전달하면 된다.
+max_zoom보다 확대한 화면은 개별 충전기 조회(/geo/chargers)를 쓴다.
+"""
+import math
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# 클러스터를 유지하는 최대 줌 레벨
+DEFAULT_MAX_ZOOM = 16
+# 클러스터 칸 크기 (256px 타일 기준 픽셀)
+DEFAULT_CLUSTER_PX = 64
+# 웹 메르카토르 위도 한계
+MAX_LATITUDE = 85.05112878
+
+Cell = Tuple[int, int]
+
+
+def mercator(lon: float, lat: float) -> Tuple[float, float]:
+    """경위도 -> 웹 메르카토르 정규 좌표 (0~1, y는 북쪽이 0)"""
+    lat = max(-MAX_LATITUDE, min(MAX_LATITUDE, lat))
+    x = (lon + 180.0) / 360.0
+    sin_lat = math.sin(math.radians(lat))
+    y = 0.5 - math.log((1 + sin_lat) / (1 - sin_lat)) / (4 * math.pi)
+    return min(max(x, 0.0), 1.0 - 1e-12), min(max(y, 0.0), 1.0 - 1e-12)
+
+
+class Cluster:
+    """한 칸의 집계 (충전기 수, 좌표 합, 상태별 수)"""
+
+    __slots__ = ("count", "sum_lon", "sum_lat", "statuses")
+
+    def __init__(self):
+        self.count = 0
+        self.sum_lon = 0.0
+        self.sum_lat = 0.0
+        self.statuses: Dict[str, int] = {}
+
+    @property
+    def longitude(self) -> float:
+        return self.sum_lon / self.count
+
+    @property
+    def latitude(self) -> float:
+        return self.sum_lat / self.count
+
+
+class GeoClusterIndex:
+    """줌 레벨별 충전기 클러스터"""
+
+    def __init__(self, max_zoom: int = DEFAULT_MAX_ZOOM, cluster_px: int = DEFAULT_CLUSTER_PX):
+        self.max_zoom = max_zoom
+        self.cluster_px = cluster_px
+        # 줌별 세계 폭 대비 칸 수
+        self._scales = [256 * (1 << zoom) / cluster_px for zoom in range(max_zoom + 1)]
+        # 충전기 ID -> (경도, 위도, 상태, 메르카토르 x, y)
+        self.points: Dict[str, Tuple[float, float, str, float, float]] = {}
+        self.levels: List[Dict[Cell, Cluster]] = [{} for _ in range(max_zoom + 1)]
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    # ==================== 갱신 ====================
+
+    def upsert(self, key: str, lon: float, lat: float, status: str):
+        """충전기 추가 또는 이동"""
+        if key in self.points:
+            self.remove(key)
+        x, y = mercator(lon, lat)
+        self.points[key] = (lon, lat, status, x, y)
+        for level, scale in zip(self.levels, self._scales):
+            cell = (int(x * scale), int(y * scale))
+            cluster = level.get(cell)
+            if cluster is None:
+                cluster = level[cell] = Cluster()
+            cluster.count += 1
+            cluster.sum_lon += lon
+            cluster.sum_lat += lat
+            cluster.statuses[status] = cluster.statuses.get(status, 0) + 1
+
+    def remove(self, key: str) -> bool:
+        point = self.points.pop(key, None)
+        if point is None:
+            return False
+        lon, lat, status, x, y = point
+        for level, scale in zip(self.levels, self._scales):
+            cell = (int(x * scale), int(y * scale))
+            cluster = level[cell]
+            cluster.count -= 1
+            if not cluster.count:
+                del level[cell]
+                continue
+            cluster.sum_lon -= lon
+            cluster.sum_lat -= lat
+            self._decrement(cluster.statuses, status)
+        return True
+
+    def set_status(self, key: str, status: str) -> bool:
+        """
+        충전기 상태 변경 반영
+
+        Returns:
+            반영 여부 (미등록 충전기 또는 같은 상태면 False)
+        """
+        point = self.points.get(key)
+        if point is None or point[2] == status:
+            return False
+        lon, lat, old, x, y = point
+        self.points[key] = (lon, lat, status, x, y)
+        for level, scale in zip(self.levels, self._scales):
+            statuses = level[(int(x * scale), int(y * scale))].statuses
+            self._decrement(statuses, old)
+            statuses[status] = statuses.get(status, 0) + 1
+        return True
+
+    @staticmethod
+    def _decrement(statuses: Dict[str, int], status: str):
+        remaining = statuses[status] - 1
+        if remaining:
+            statuses[status] = remaining
+        else:
+            del statuses[status]
+
+    def rebuild(self, points: Iterable[Tuple[str, float, float, str]]):
+        """
+        전체 재구성 ((key, lon, lat, status) 목록)
+
+        줌이 1 낮아지면 칸 크기가 정확히 2배이므로, 최대 줌만 좌표로 집계하고
+        낮은 줌은 한 단계 높은 줌의 칸을 합쳐 만든다.
+        """
+        self.points = {}
+        finest: Dict[Cell, Cluster] = {}
+        scale = self._scales[self.max_zoom]
+        for key, lon, lat, status in points:
+            if lon is None or lat is None:
+                continue
+            if key in self.points:
+                continue  # 중복 ID는 처음 것만
+            x, y = mercator(lon, lat)
+            self.points[key] = (lon, lat, status, x, y)
+            cell = (int(x * scale), int(y * scale))
+            cluster = finest.get(cell)
+            if cluster is None:
+                cluster = finest[cell] = Cluster()
+            cluster.count += 1
+            cluster.sum_lon += lon
+            cluster.sum_lat += lat
+            cluster.statuses[status] = cluster.statuses.get(status, 0) + 1
+
+        self.levels = [{} for _ in range(self.max_zoom)] + [finest]
+        for zoom in range(self.max_zoom - 1, -1, -1):
+            level = self.levels[zoom]
+            for (x, y), child in self.levels[zoom + 1].items():
+                cell = (x >> 1, y >> 1)
+                cluster = level.get(cell)
+                if cluster is None:
+                    cluster = level[cell] = Cluster()
+                cluster.count += child.count
+                cluster.sum_lon += child.sum_lon
+                cluster.sum_lat += child.sum_lat
+                for status, count in child.statuses.items():
+                    cluster.statuses[status] = cluster.statuses.get(status, 0) + count
+
+    # ==================== 조회 ====================
+
+    def query(
+        self,
+        zoom: int,
+        min_lon: float = -180.0,
+        min_lat: float = -90.0,
+        max_lon: float = 180.0,
+        max_lat: float = 90.0
+    ) -> List[Cluster]:
+        """줌 레벨에서 영역과 겹치는 클러스터 (zoom은 0~max_zoom으로 제한)"""
+        zoom = max(0, min(self.max_zoom, zoom))
+        level = self.levels[zoom]
+        scale = self._scales[zoom]
+        west, north = mercator(min_lon, max_lat)
+        east, south = mercator(max_lon, min_lat)
+        x0, y0 = int(west * scale), int(north * scale)
+        x1, y1 = int(east * scale), int(south * scale)
+
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > len(level):
+            # 영역이 넓으면 점유된 칸만 확인
+            return [cluster for (x, y), cluster in level.items() if x0 <= x <= x1 and y0 <= y <= y1]
+        clusters = []
+        for x in range(x0, x1 + 1):
+            for y in range(y0, y1 + 1):
+                cluster = level.get((x, y))
+                if cluster is not None:
+                    clusters.append(cluster)
+        return clusters
+
+    def status_of(self, key: str) -> Optional[str]:
+        point = self.points.get(key)
+        return point[2] if point else None
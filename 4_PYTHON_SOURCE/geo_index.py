@@ -0,0 +1,187 @@
+"""
+충전기 위치 격자 공간 인덱스
+
+경위도를 cell_size(도) 크기의 격자 칸으로 나눠 칸별로 충전기 좌표를 보관한다.
+    - 영역(bbox) 조회: 겹치는 칸만 확인 (경계 칸의 좌표만 개별 비교)
+    - 반경 조회: 반경을 덮는 bbox 후보 -> 하버사인 거리로 거름
+    - 최근접 N개: 중심 칸에서 고리 모양으로 넓혀 가며, 남은 칸의 최소 거리가
+                  현재 N번째 거리보다 멀어지면 중단
+
+(longitude, latitude) B-tree 인덱스는 한 축 범위만 좁히므로 2차원 범위 조회에 약하다.
+10만 대 기준 화면 영역/최근접 조회가 1ms 이내가 되도록 메모리에서 처리한다.
+"""
+import math
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# 지구 반지름 (km)
+EARTH_RADIUS_KM = 6371.0088
+# 위도 1도의 거리 (km)
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180.0
+
+# 기본 격자 크기 (도, 약 1km)
+DEFAULT_CELL_SIZE = 0.01
+
+Cell = Tuple[int, int]
+
+
+def haversine_km(lon1: float, lat1: float, lon2: float, lat2: float) -> float:
+    """두 지점 사이 대원 거리 (km)"""
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    dphi = phi2 - phi1
+    dlmb = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlmb / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+class GeoGridIndex:
+    """충전기 ID -> 좌표 격자 인덱스"""
+
+    def __init__(self, cell_size: float = DEFAULT_CELL_SIZE):
+        self.cell_size = cell_size
+        self.points: Dict[str, Tuple[float, float]] = {}
+        self.cells: Dict[Cell, Dict[str, Tuple[float, float]]] = {}
+        # 점유된 칸 범위 (최근접 탐색 종료 조건, 제거 시에는 줄이지 않음)
+        self._bounds: Optional[List[int]] = None
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+    def _cell(self, lon: float, lat: float) -> Cell:
+        return (math.floor(lon / self.cell_size), math.floor(lat / self.cell_size))
+
+    # ==================== 갱신 ====================
+
+    def upsert(self, key: str, lon: float, lat: float):
+        """좌표 추가 또는 이동"""
+        if key in self.points:
+            self.remove(key)
+        cell = self._cell(lon, lat)
+        bucket = self.cells.get(cell)
+        if bucket is None:
+            bucket = self.cells[cell] = {}
+        bucket[key] = (lon, lat)
+        self.points[key] = (lon, lat)
+
+        if self._bounds is None:
+            self._bounds = [cell[0], cell[1], cell[0], cell[1]]
+        else:
+            bounds = self._bounds
+            bounds[0] = min(bounds[0], cell[0])
+            bounds[1] = min(bounds[1], cell[1])
+            bounds[2] = max(bounds[2], cell[0])
+            bounds[3] = max(bounds[3], cell[1])
+
+    def remove(self, key: str) -> bool:
+        point = self.points.pop(key, None)
+        if point is None:
+            return False
+        cell = self._cell(*point)
+        bucket = self.cells[cell]
+        del bucket[key]
+        if not bucket:
+            del self.cells[cell]
+        return True
+
+    def rebuild(self, points: Iterable[Tuple[str, float, float]]):
+        """전체 재구성 ((key, lon, lat) 목록)"""
+        self.points = {}
+        self.cells = {}
+        self._bounds = None
+        for key, lon, lat in points:
+            if lon is not None and lat is not None:
+                self.upsert(key, lon, lat)
+
+    # ==================== 조회 ====================
+
+    def _bbox_buckets(self, min_lon: float, min_lat: float, max_lon: float, max_lat: float):
+        """영역과 겹치는 (칸, 칸 내부 여부, 칸 좌표 사전) 목록"""
+        x0, y0 = self._cell(min_lon, min_lat)
+        x1, y1 = self._cell(max_lon, max_lat)
+        cells = self.cells
+
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > len(cells):
+            # 영역이 넓으면 빈 칸을 훑지 않고 점유된 칸만 확인
+            return [(x0 < x < x1 and y0 < y < y1, bucket) for (x, y), bucket in cells.items()
+                    if x0 <= x <= x1 and y0 <= y <= y1]
+        buckets = []
+        for x in range(x0, x1 + 1):
+            for y in range(y0, y1 + 1):
+                bucket = cells.get((x, y))
+                if bucket:
+                    buckets.append((x0 < x < x1 and y0 < y < y1, bucket))
+        return buckets
+
+    def bbox(self, min_lon: float, min_lat: float, max_lon: float, max_lat: float) -> List[str]:
+        """영역 안의 충전기 ID (경계 포함)"""
+        result = []
+        for inner, bucket in self._bbox_buckets(min_lon, min_lat, max_lon, max_lat):
+            if inner:
+                result.extend(bucket)  # 내부 칸은 좌표 비교 불필요
+                continue
+            for key, (lon, lat) in bucket.items():
+                if min_lon <= lon <= max_lon and min_lat <= lat <= max_lat:
+                    result.append(key)
+        return result
+
+    def radius(self, lon: float, lat: float, radius_km: float) -> List[Tuple[str, float]]:
+        """반경 안의 충전기 (ID, 거리 km), 가까운 순"""
+        dlat = radius_km / KM_PER_DEGREE
+        cos_lat = max(math.cos(math.radians(min(89.9, abs(lat) + dlat))), 1e-6)
+        dlon = min(180.0, radius_km / (KM_PER_DEGREE * cos_lat))
+
+        # 하버사인 계산을 인라인으로 (후보가 수백 개라 함수 호출 비용이 큼)
+        sin, cos, asin, sqrt = math.sin, math.cos, math.asin, math.sqrt
+        to_rad = math.pi / 180.0
+        cos_phi0 = cos(lat * to_rad)
+        # 반경에 해당하는 하버사인 a 값 (a가 이보다 크면 반경 밖)
+        a_limit = sin(min(math.pi / 2, radius_km / (2 * EARTH_RADIUS_KM))) ** 2
+        result = []
+        for _, bucket in self._bbox_buckets(lon - dlon, lat - dlat, lon + dlon, lat + dlat):
+            for key, (plon, plat) in bucket.items():
+                half_dphi = (plat - lat) * to_rad / 2
+                half_dlmb = (plon - lon) * to_rad / 2
+                a = sin(half_dphi) ** 2 + cos_phi0 * cos(plat * to_rad) * sin(half_dlmb) ** 2
+                if a <= a_limit:
+                    result.append((2 * EARTH_RADIUS_KM * asin(min(1.0, sqrt(a))), key))
+        result.sort()
+        return [(key, distance) for distance, key in result]
+
+    def nearest(self, lon: float, lat: float, n: int = 10, max_km: Optional[float] = None) -> List[Tuple[str, float]]:
+        """가장 가까운 충전기 n개 (ID, 거리 km), 가까운 순"""
+        if n <= 0 or not self.points:
+            return []
+        if max_km is not None:
+            return self.radius(lon, lat, max_km)[:n]
+
+        cx, cy = self._cell(lon, lat)
+        x0, y0, x1, y1 = self._bounds
+        max_ring = max(cx - x0, x1 - cx, cy - y0, y1 - cy)
+        cells = self.cells
+        found: List[Tuple[float, str]] = []
+
+        ring = 0
+        while ring <= max_ring:
+            for x in range(cx - ring, cx + ring + 1):
+                if ring == 0 or x in (cx - ring, cx + ring):
+                    ys = range(cy - ring, cy + ring + 1)
+                else:
+                    ys = (cy - ring, cy + ring)
+                for y in ys:
+                    bucket = cells.get((x, y))
+                    if bucket:
+                        for key, (plon, plat) in bucket.items():
+                            found.append((haversine_km(lon, lat, plon, plat), key))
+
+            # 아직 보지 않은 칸의 점은 중심에서 최소 ring 칸 이상 떨어져 있다
+            if len(found) >= n:
+                found.sort()
+                reach_deg = ring * self.cell_size
+                cos_lat = math.cos(math.radians(min(89.9, abs(lat) + reach_deg)))
+                if found[n - 1][0] <= reach_deg * KM_PER_DEGREE * cos_lat:
+                    break
+                del found[n:]
+            ring += 1
+
+        found.sort()
+        return [(key, distance) for distance, key in found[:n]]
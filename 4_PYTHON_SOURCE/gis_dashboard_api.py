@@ -20,15 +20,18 @@ if sys.platform == 'win32' and sys.stdout.encoding != 'utf-8':
     sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', write_through=True)
     sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', write_through=True)
 
-from fastapi import FastAPI, HTTPException, Query, Depends
+from fastapi import FastAPI, HTTPException, Query, Depends, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, FileResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
-from datetime import datetime, date, timedelta
+from typing import List, Optional, Dict, Any, Set, Tuple
+from datetime import datetime, date, timedelta, timezone
 from decimal import Decimal
+import asyncio
+import json
 import logging
+import time
 
 from database.models_postgresql import (
     DatabaseManager, ChargerTypeEnum, ChargerStatusEnum
@@ -37,10 +40,39 @@ from database.services import (
     StationService, ChargerService, UsageLogService,
     PowerConsumptionService, StatisticsService
 )
+from persistence import CONNECTOR_STATUS_MAP
+from geo_index import GeoGridIndex
+from geo_cluster import GeoClusterIndex
+from heatmap_tiles import HeatmapTiles
+from database.timeseries import (
+    create_store_from_env, downsample, records_to_array, to_timestamp, from_timestamp
+)
 
 # 데이터베이스 매니저 (지연 초기화)
 db_manager: Optional[DatabaseManager] = None
 
+# /statistics/dashboard 응답 캐시 유지 시간 (초, 0이면 캐시 안 함)
+DASHBOARD_CACHE_TTL = float(os.getenv('DASHBOARD_CACHE_TTL', '0'))
+_dashboard_cache: Dict[date, Tuple[float, Dict[str, Any]]] = {}
+
+# 충전기 위치 공간 인덱스 / 줌별 클러스터
+# (첫 GIS 조회 시 적재, 등록·상태 변경 시 갱신, GEO_INDEX_REFRESH_INTERVAL초마다 재적재)
+GEO_INDEX_REFRESH_INTERVAL = float(os.getenv('GEO_INDEX_REFRESH_INTERVAL', '300'))
+geo_index = GeoGridIndex()
+cluster_index = GeoClusterIndex()
+_geo_index_loaded_at: Optional[float] = None
+
+# 히트맵 격자 누적 배열 (HEATMAP_HISTORY_DAYS일치 적재, 날짜가 바뀌면 전체 재적재,
+# HEATMAP_REFRESH_INTERVAL초마다 전일/당일 값만 다시 읽음)
+HEATMAP_HISTORY_DAYS = int(os.getenv('HEATMAP_HISTORY_DAYS', '730'))
+HEATMAP_REFRESH_INTERVAL = float(os.getenv('HEATMAP_REFRESH_INTERVAL', '60'))
+heatmap_tiles: Optional[HeatmapTiles] = None
+_heatmap_loaded_on: Optional[date] = None
+_heatmap_refreshed_at = 0.0
+
+# 전력 시계열 저장소 (OCPP_POWER_STORE_DIR, OCPP 서버와 같은 경로. 미설정 시 power_consumption 테이블 조회)
+power_store = create_store_from_env()
+
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -167,6 +199,23 @@ class GeoChargerResponse(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class NearestChargerResponse(GeoChargerResponse):
+    """최근접 충전기 응답 (거리 포함)"""
+    distance_km: float
+
+
+class GeoClusterResponse(BaseModel):
+    """GIS 맵 클러스터 응답 (중심 좌표, 상태별 충전기 수)"""
+    longitude: float
+    latitude: float
+    count: int
+    available: int
+    in_use: int
+    fault: int
+    offline: int  # 나머지 상태 (오프라인/정비/예약)
+    charger_id: Optional[str] = None  # 개별 충전기 (max_zoom보다 확대한 경우)
+
+
 class ChargerDashboard(BaseModel):
     """충전기 대시보드 정보"""
     charger_id: str
@@ -396,6 +445,9 @@ async def create_charger(charger: ChargerCreate, db=Depends(get_db)):
             station.total_chargers = len(ChargerService.get_chargers_by_station(db, charger.station_id))
             db.commit()
         
+        if _geo_index_loaded_at is not None:
+            geo_index.upsert(result.charger_id, result.longitude, result.latitude)
+            cluster_index.upsert(result.charger_id, result.longitude, result.latitude, result.current_status)
         return result
     except Exception as e:
         logger.error(f"충전기 등록 실패: {str(e)}")
@@ -429,93 +481,290 @@ async def update_charger_status(charger_id: str, update: ChargerStatusUpdate, db
     result = ChargerService.update_charger_status(db, charger_id, update.status)
     if not result:
         raise HTTPException(status_code=404, detail="충전기를 찾을 수 없습니다")
+    cluster_index.set_status(charger_id, update.status)
     return {"charger_id": charger_id, "status": update.status}
 
 
 # ==================== GIS 맵 엔드포인트 ====================
 
+def refresh_geo_indexes(db):
+    """위치 인덱스/클러스터가 없거나 오래되었으면 DB에서 재적재 (쿼리 1회)"""
+    global _geo_index_loaded_at
+    now = time.monotonic()
+    if _geo_index_loaded_at is None or now - _geo_index_loaded_at >= GEO_INDEX_REFRESH_INTERVAL:
+        rows = ChargerService.get_locations(db, with_status=True)
+        geo_index.rebuild((charger_id, lon, lat) for charger_id, lon, lat, _ in rows)
+        cluster_index.rebuild(rows)
+        _geo_index_loaded_at = now
+
+
+def get_geo_index(db) -> GeoGridIndex:
+    """충전기 위치 인덱스"""
+    refresh_geo_indexes(db)
+    return geo_index
+
+
+def get_cluster_index(db) -> GeoClusterIndex:
+    """줌별 충전기 클러스터"""
+    refresh_geo_indexes(db)
+    return cluster_index
+
+
+def parse_bbox(bbox: str) -> Tuple[float, float, float, float]:
+    """'서,남,동,북' 문자열 (Leaflet LatLngBounds.toBBoxString 형식) 파싱"""
+    try:
+        west, south, east, north = (float(value) for value in bbox.split(","))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="bbox는 '서경,남위,동경,북위' 형식이어야 합니다")
+    return west, south, east, north
+
+
+def spatial_filter(
+    db,
+    bbox: Optional[str],
+    lon: Optional[float],
+    lat: Optional[float],
+    radius_km: Optional[float]
+) -> Optional[List[str]]:
+    """bbox 또는 반경 조건에 해당하는 충전기 ID (조건이 없으면 None, 반경은 가까운 순)"""
+    if bbox:
+        return get_geo_index(db).bbox(*parse_bbox(bbox))
+    if radius_km is not None:
+        if lon is None or lat is None:
+            raise HTTPException(status_code=400, detail="radius_km에는 lon, lat이 필요합니다")
+        return [key for key, _ in get_geo_index(db).radius(lon, lat, radius_km)]
+    return None
+
+
+def geo_charger_dict(charger) -> Dict[str, Any]:
+    station = charger.station
+    return {
+        "charger_id": charger.charger_id,
+        "station_id": charger.station_id,
+        "station_name": station.station_name if station else "Unknown",
+        "address": station.address if station else "",
+        "longitude": charger.longitude,
+        "latitude": charger.latitude,
+        "charger_type": charger.charger_type,
+        "current_status": charger.current_status,
+        "rated_power": charger.rated_power,
+        "unit_price_kwh": charger.unit_price_kwh
+    }
+
+
 @app.get("/geo/chargers", response_model=List[GeoChargerResponse])
 async def get_geo_chargers(
     station_id: Optional[str] = Query(None, description="충전소 필터"),
     status: Optional[ChargerStatusEnum] = Query(None, description="상태 필터"),
     charger_type: Optional[ChargerTypeEnum] = Query(None, description="종류 필터"),
+    bbox: Optional[str] = Query(None, description="지도 영역 '서경,남위,동경,북위'"),
+    lon: Optional[float] = Query(None, description="반경 조회 중심 경도"),
+    lat: Optional[float] = Query(None, description="반경 조회 중심 위도"),
+    radius_km: Optional[float] = Query(None, gt=0, description="반경 (km)"),
     db=Depends(get_db)
 ):
-    """GIS 맵용 충전기 위치 정보 조회"""
-    if station_id:
-        chargers = ChargerService.get_chargers_by_station(db, station_id)
-    elif status:
-        chargers = ChargerService.get_chargers_by_status(db, status)
-    elif charger_type:
-        chargers = ChargerService.get_chargers_by_type(db, charger_type)
-    else:
-        from database.models import ChargerInfo
-        chargers = db.query(ChargerInfo).all()
+    """GIS 맵용 충전기 위치 정보 조회 (bbox/반경 지정 시 공간 인덱스로 범위 제한)"""
+    charger_ids = spatial_filter(db, bbox, lon, lat, radius_km)
+    if charger_ids is not None and not charger_ids:
+        return []
+    chargers = ChargerService.get_chargers_with_station(db, station_id, status, charger_type, charger_ids)
+    if radius_km is not None and not bbox:
+        order = {charger_id: index for index, charger_id in enumerate(charger_ids)}
+        chargers.sort(key=lambda charger: order[charger.charger_id])
     
-    # 충전소 정보 추가
-    result = []
-    for charger in chargers:
-        station = StationService.get_station(db, charger.station_id)
-        result.append({
-            "charger_id": charger.charger_id,
-            "station_id": charger.station_id,
-            "station_name": station.station_name if station else "Unknown",
-            "address": station.address if station else "",
-            "longitude": charger.longitude,
-            "latitude": charger.latitude,
-            "charger_type": charger.charger_type,
-            "current_status": charger.current_status,
-            "rated_power": charger.rated_power,
-            "unit_price_kwh": charger.unit_price_kwh
-        })
+    return [geo_charger_dict(charger) for charger in chargers]
+
+
+@app.get("/geo/nearest", response_model=List[NearestChargerResponse])
+async def get_nearest_chargers(
+    lon: float = Query(..., description="기준 경도"),
+    lat: float = Query(..., description="기준 위도"),
+    limit: int = Query(10, ge=1, le=100, description="최대 개수"),
+    max_km: Optional[float] = Query(None, gt=0, description="최대 거리 (km)"),
+    db=Depends(get_db)
+):
+    """기준 위치에서 가까운 충전기 (가까운 순)"""
+    nearest = get_geo_index(db).nearest(lon, lat, limit, max_km)
+    if not nearest:
+        return []
+    chargers = {
+        charger.charger_id: charger
+        for charger in ChargerService.get_chargers_with_station(db, charger_ids=[key for key, _ in nearest])
+    }
+    return [
+        {**geo_charger_dict(chargers[key]), "distance_km": round(distance, 3)}
+        for key, distance in nearest
+        if key in chargers
+    ]
+
+
+def cluster_status_counts(statuses: Dict[str, int], count: int) -> Dict[str, int]:
+    available = statuses.get(ChargerStatusEnum.AVAILABLE, 0)
+    in_use = statuses.get(ChargerStatusEnum.IN_USE, 0)
+    fault = statuses.get(ChargerStatusEnum.FAULT, 0)
+    return {
+        "available": available,
+        "in_use": in_use,
+        "fault": fault,
+        "offline": count - available - in_use - fault
+    }
+
+
+@app.get("/geo/clusters", response_model=List[GeoClusterResponse])
+async def get_geo_clusters(
+    zoom: int = Query(..., ge=0, le=22, description="지도 줌 레벨"),
+    bbox: Optional[str] = Query(None, description="지도 영역 '서경,남위,동경,북위'"),
+    db=Depends(get_db)
+):
+    """
+    줌 레벨별 충전기 클러스터 (상태별 수 포함)
+
+    클러스터는 메모리에 미리 집계되어 있고 상태 변경 시 증분 갱신되므로 DB를 조회하지 않는다.
+    클러스터 최대 줌보다 확대하면 영역 안의 충전기를 개별 항목(charger_id 포함)으로 반환한다.
+    """
+    clusters = get_cluster_index(db)
+    bounds = parse_bbox(bbox) if bbox else (-180.0, -90.0, 180.0, 90.0)
     
-    return result
+    if zoom > clusters.max_zoom:
+        result = []
+        for charger_id in geo_index.bbox(*bounds):
+            lon, lat, status, _, _ = clusters.points[charger_id]
+            result.append({
+                "longitude": lon,
+                "latitude": lat,
+                "count": 1,
+                "charger_id": charger_id,
+                **cluster_status_counts({status: 1}, 1)
+            })
+        return result
+    
+    return [
+        {
+            "longitude": cluster.longitude,
+            "latitude": cluster.latitude,
+            "count": cluster.count,
+            **cluster_status_counts(cluster.statuses, cluster.count)
+        }
+        for cluster in clusters.query(zoom, *bounds)
+    ]
+
+
+def get_heatmap_tiles(db) -> HeatmapTiles:
+    """
+    히트맵 누적 배열 (날짜가 바뀌면 전체 재적재, 갱신 주기가 지나면 전일/당일만 교체)
+
+    갱신 중 위치가 바뀐 충전기를 발견하면 과거 값도 새 칸으로 옮기기 위해 전체를 다시 적재한다.
+    """
+    global heatmap_tiles, _heatmap_loaded_on, _heatmap_refreshed_at
+    today = date.today()
+    now = time.monotonic()
+    reload = heatmap_tiles is None or _heatmap_loaded_on != today
+    if not reload and now - _heatmap_refreshed_at >= HEATMAP_REFRESH_INTERVAL:
+        yesterday = today - timedelta(days=1)
+        recent = StatisticsService.get_daily_values(db, yesterday)
+        moved = heatmap_tiles.moved_chargers(recent)
+        if moved:
+            logger.info(f"히트맵 재적재: 위치 변경 충전기 {len(moved)}대")
+            reload = True
+        else:
+            heatmap_tiles.replace_days(recent, {yesterday, today})
+            _heatmap_refreshed_at = now
+    if reload:
+        tiles = HeatmapTiles(today - timedelta(days=HEATMAP_HISTORY_DAYS))
+        tiles.replace_days(StatisticsService.get_daily_values(db, tiles.first_day))
+        heatmap_tiles, _heatmap_loaded_on, _heatmap_refreshed_at = tiles, today, now
+        logger.info(f"히트맵 적재: 칸 {len(tiles)}개, {tiles.num_days}일")
+    return heatmap_tiles
 
 
 @app.get("/geo/heatmap")
 async def get_heatmap_data(
     start_date: date = Query(None),
     end_date: date = Query(None),
+    bbox: Optional[str] = Query(None, description="지도 영역 '서경,남위,동경,북위'"),
     db=Depends(get_db)
 ):
-    """충전기 이용량 히트맵 데이터"""
+    """
+    충전기 이용량 히트맵 데이터 (격자 칸별 기간 합계)
+
+    칸 x 날짜 누적합 배열에서 기간 합계를 뺄셈으로 구하므로 기간 길이와 무관하게 칸 수에만 비례한다.
+    """
     if not start_date:
         start_date = date.today() - timedelta(days=30)
     if not end_date:
         end_date = date.today()
     
-    from database.models import ChargerInfo, DailyChargerStats
-    chargers = db.query(ChargerInfo).all()
-    
-    heatmap_data = []
-    for charger in chargers:
-        stats = db.query(DailyChargerStats).filter(
-            (DailyChargerStats.charger_id == charger.charger_id) &
-            (DailyChargerStats.stats_date >= start_date) &
-            (DailyChargerStats.stats_date <= end_date)
-        ).all()
-        
-        total_revenue = sum(s.total_revenue or 0 for s in stats)
-        total_energy = sum(s.total_energy or 0 for s in stats)
-        
-        if total_revenue > 0 or total_energy > 0:
-            heatmap_data.append({
-                "longitude": charger.longitude,
-                "latitude": charger.latitude,
-                "charger_id": charger.charger_id,
-                "intensity": float(total_revenue),
-                "energy": float(total_energy),
-                "revenue": float(total_revenue)
-            })
+    tiles = get_heatmap_tiles(db)
+    cells = tiles.query(start_date, end_date, parse_bbox(bbox) if bbox else None)
     
     return {
         "period": f"{start_date} ~ {end_date}",
-        "data": heatmap_data
+        "cell_size": tiles.cell_size,
+        "data": [
+            {
+                "longitude": cell["longitude"],
+                "latitude": cell["latitude"],
+                "num_chargers": cell["num_chargers"],
+                "intensity": cell["revenue"],
+                "energy": cell["energy"],
+                "revenue": cell["revenue"]
+            }
+            for cell in cells
+        ]
     }
 
 
 # ==================== 통계 엔드포인트 ====================
 
+def _utc_naive(value: datetime) -> datetime:
+    """시간대가 있으면 UTC로 바꾼 뒤 naive로 (DB/저장소 기준)"""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def _series_values(values, digits: int = 3) -> List[Optional[float]]:
+    return [None if value != value else round(value, digits) for value in values.tolist()]
+
+
+@app.get("/statistics/charger/{charger_id}/power")
+async def get_charger_power_series(
+    charger_id: str,
+    start_time: datetime = Query(..., description="시작 시각 (UTC)"),
+    end_time: datetime = Query(..., description="종료 시각 (UTC)"),
+    bucket_seconds: int = Query(300, ge=1, le=86400, description="축약 구간 (초)"),
+    db=Depends(get_db)
+):
+    """
+    충전기 전력 시계열 (bucket_seconds 구간별 평균/최대 전력, 평균 전압/전류, 마지막 누적 에너지)
+
+    시계열 저장소가 설정되어 있으면 묶음 파일에서, 아니면 power_consumption 테이블에서
+    컬럼만 읽어 같은 방식으로 축약한다.
+    """
+    start_time, end_time = _utc_naive(start_time), _utc_naive(end_time)
+    if end_time < start_time:
+        raise HTTPException(status_code=400, detail="end_time은 start_time 이후여야 합니다")
+    
+    if power_store is not None:
+        series = power_store.downsample(charger_id, start_time, end_time, bucket_seconds)
+    else:
+        data = records_to_array(PowerConsumptionService.get_power_columns(db, charger_id, start_time, end_time))
+        series = downsample(data, to_timestamp(start_time), bucket_seconds)
+    
+    return {
+        "charger_id": charger_id,
+        "bucket_seconds": bucket_seconds,
+        "source": "timeseries" if power_store is not None else "table",
+        "time": [from_timestamp(timestamp).isoformat() for timestamp in series["timestamp"].tolist()],
+        "samples": series["samples"].tolist(),
+        "power_avg": _series_values(series["power_avg"]),
+        "power_max": _series_values(series["power_max"]),
+        "voltage": _series_values(series["voltage"], 1),
+        "current": _series_values(series["current"], 1),
+        "energy": _series_values(series["energy"])
+    }
+
+
 @app.get("/statistics/charger/{charger_id}/daily")
 async def get_charger_daily_stats(
     charger_id: str,
@@ -559,55 +808,239 @@ async def get_station_summary(
     return result
 
 
-@app.get("/statistics/dashboard")
-async def get_dashboard_stats(
-    target_date: date = None,
-    db=Depends(get_db)
-):
-    """전체 대시보드 통계"""
-    if not target_date:
-        target_date = date.today()
-    
-    from database.models import ChargerInfo, StationInfo, DailyChargerStats, ChargerUsageLog
-    from sqlalchemy import func
-    
-    # 전체 충전소 및 충전기 수
-    stations = db.query(StationInfo).all()
-    chargers = db.query(ChargerInfo).all()
-    
-    # 상태별 충전기 수
-    available = len(ChargerService.get_chargers_by_status(db, ChargerStatusEnum.AVAILABLE))
-    in_use = len(ChargerService.get_chargers_by_status(db, ChargerStatusEnum.IN_USE))
-    fault = len(ChargerService.get_chargers_by_status(db, ChargerStatusEnum.FAULT))
-    
-    # 오늘의 총 매출 및 에너지
-    today_logs = db.query(ChargerUsageLog).filter(
-        (ChargerUsageLog.session_date == target_date) &
-        (ChargerUsageLog.payment_status == 'completed')
-    ).all()
-    
-    total_revenue = sum(log.total_charge or 0 for log in today_logs)
-    total_energy = sum(log.energy_delivered or 0 for log in today_logs)
+def _utc_today() -> date:
+    """당일 집계 기준 날짜 (charger_usage_log.session_date, live_push와 같은 UTC 기준)"""
+    return datetime.now(timezone.utc).date()
+
+
+def _dashboard_response(target_date: date, summary: Dict[str, Any]) -> Dict[str, Any]:
+    """StatisticsService.get_dashboard_summary 결과 -> /statistics/dashboard 응답 형식"""
+    status_counts = summary['status_counts']
+    available = status_counts.get(ChargerStatusEnum.AVAILABLE, 0)
+    in_use = status_counts.get(ChargerStatusEnum.IN_USE, 0)
+    fault = status_counts.get(ChargerStatusEnum.FAULT, 0)
+    num_sessions = summary['num_sessions']
+    total_revenue = summary['total_revenue']
     
     return {
         "date": target_date,
-        "total_stations": len(stations),
-        "total_chargers": len(chargers),
+        "total_stations": summary['num_stations'],
+        "total_chargers": summary['num_chargers'],
         "charger_status": {
             "available": available,
             "in_use": in_use,
             "fault": fault,
-            "offline": len(chargers) - available - in_use - fault
+            "offline": summary['num_chargers'] - available - in_use - fault
         },
         "daily_stats": {
-            "sessions": len(today_logs),
+            "sessions": num_sessions,
             "total_revenue": float(total_revenue),
-            "total_energy": float(total_energy),
-            "avg_charge": float(total_revenue / len(today_logs)) if today_logs else 0
+            "total_energy": float(summary['total_energy']),
+            "avg_charge": float(total_revenue / num_sessions) if num_sessions else 0
         }
     }
 
 
+@app.get("/statistics/dashboard")
+async def get_dashboard_stats(
+    target_date: date = None,
+    db=Depends(get_db)
+):
+    """전체 대시보드 통계 (집계 쿼리 2회, DASHBOARD_CACHE_TTL 동안 캐시)"""
+    if not target_date:
+        target_date = _utc_today()
+    
+    now = time.monotonic()
+    if DASHBOARD_CACHE_TTL > 0:
+        cached = _dashboard_cache.get(target_date)
+        if cached is not None and now - cached[0] < DASHBOARD_CACHE_TTL:
+            return cached[1]
+    
+    result = _dashboard_response(target_date, StatisticsService.get_dashboard_summary(db, target_date))
+    
+    if DASHBOARD_CACHE_TTL > 0:
+        if len(_dashboard_cache) > 32:
+            _dashboard_cache.clear()
+        _dashboard_cache[target_date] = (now, result)
+    return result
+
+
+# ==================== 실시간 전달 (WebSocket) ====================
+
+class LiveEventBatch(BaseModel):
+    """OCPP 서버가 전달하는 변경분 (live_push.LivePublisher)"""
+    statuses: Dict[str, str] = {}  # 충전기 ID -> OCPP connectorStatus
+    # 종료된 거래 {"charger_id", "transaction_id", "session_date", "energy_kwh", "total_cost"}
+    sessions: List[Dict[str, Any]] = []
+
+
+class LiveHub:
+    """
+    대시보드 실시간 배포 허브
+
+    구독 중인 대시보드가 있을 때만 충전기 상태와 당일 집계를 메모리에 유지하고
+    (구독 시작 시 DB 조회 4회), 이후에는 OCPP 서버의 변경분만 반영한다.
+    종료 거래는 transaction_id당 한 번, 세션 날짜가 집계 날짜인 것만 더하므로
+    (재전송된 종료 이벤트 무시) /statistics/dashboard의 DB 집계와 같은 값을 유지한다.
+    변경 메시지는 한 번만 직렬화해 모든 구독자 큐에 넣으므로 대시보드 수가 늘어도 DB 부하는 같다.
+    큐가 가득 찬 느린 구독자는 연결을 끊는다 (재접속 시 전체를 다시 조회).
+    """
+
+    def __init__(self, queue_size: int = 100):
+        self.queue_size = queue_size
+        self.subscribers: Set[asyncio.Queue] = set()
+        self.statuses: Dict[str, ChargerStatusEnum] = {}
+        self.summary: Optional[Dict[str, Any]] = None
+        self.summary_date: Optional[date] = None
+        # 집계 날짜에 이미 반영된 완료 거래 ID
+        self.completed: Set[str] = set()
+
+    def subscribe(self) -> asyncio.Queue:
+        if not self.subscribers:
+            # 구독자가 없던 동안의 변경은 반영되지 않았으므로 다시 적재
+            self.summary = None
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        self.subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        self.subscribers.discard(queue)
+
+    def ensure_loaded(self):
+        """상태/집계가 없거나 날짜가 바뀌었으면 DB에서 적재"""
+        today = _utc_today()
+        if self.summary is not None and self.summary_date == today:
+            return
+        if db_manager is None:
+            initialize_db()
+        db = db_manager.get_session()
+        try:
+            self.statuses = ChargerService.get_status_map(db)
+            self.summary = StatisticsService.get_dashboard_summary(db, today)
+            self.completed = UsageLogService.get_completed_transaction_ids(db, today)
+            self.summary_date = today
+        finally:
+            db.close()
+
+    def snapshot_message(self) -> str:
+        return self._encode({"type": "snapshot", "dashboard": _dashboard_response(self.summary_date, self.summary)})
+
+    def apply(self, batch: LiveEventBatch) -> List[Dict[str, Any]]:
+        """
+        변경분 반영
+
+        Returns:
+            상태가 바뀐 충전기 목록 [{"charger_id", "current_status"}]
+        """
+        status_counts = self.summary['status_counts']
+        changed = []
+        for charger_id, connector_status in batch.statuses.items():
+            old = self.statuses.get(charger_id)
+            new = CONNECTOR_STATUS_MAP.get(connector_status, ChargerStatusEnum.OFFLINE)
+            if old is None or old == new:
+                continue  # 미등록 충전기 또는 변화 없음
+            self.statuses[charger_id] = new
+            status_counts[old] = status_counts.get(old, 0) - 1
+            status_counts[new] = status_counts.get(new, 0) + 1
+            changed.append({"charger_id": charger_id, "current_status": new.value})
+
+        for item in batch.sessions:
+            if item.get("charger_id") not in self.statuses:
+                continue
+            session_date = item.get("session_date")
+            if session_date is not None and date.fromisoformat(str(session_date)) != self.summary_date:
+                continue  # 다른 날짜의 세션은 당일 집계에 포함되지 않음
+            transaction_id = item.get("transaction_id")
+            if transaction_id is not None:
+                if transaction_id in self.completed:
+                    continue  # 재전송된 종료 이벤트
+                self.completed.add(transaction_id)
+            self.summary['num_sessions'] += 1
+            self.summary['total_revenue'] += Decimal(str(item.get("total_cost") or 0))
+            self.summary['total_energy'] += Decimal(str(item.get("energy_kwh") or 0))
+        return changed
+
+    def publish(self, message: str):
+        for queue in list(self.subscribers):
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                self.subscribers.discard(queue)
+                queue.get_nowait()
+                queue.put_nowait(None)
+
+    @staticmethod
+    def _encode(message: Dict[str, Any]) -> str:
+        return json.dumps(message, default=str, ensure_ascii=False)
+
+    def ingest(self, batch: LiveEventBatch) -> int:
+        """OCPP 서버 변경분 반영 후 구독자에게 배포 (구독자가 없으면 무시)"""
+        if not self.subscribers:
+            return 0
+        self.ensure_loaded()
+        changed = self.apply(batch)
+        if changed or batch.sessions:
+            self.publish(self._encode({
+                "type": "delta",
+                "chargers": changed,
+                "dashboard": _dashboard_response(self.summary_date, self.summary)
+            }))
+        return len(self.subscribers)
+
+
+live_hub = LiveHub()
+
+
+@app.post("/live/events")
+async def ingest_live_events(batch: LiveEventBatch):
+    """OCPP 서버 변경분 수신 (live_push.LivePublisher가 호출)"""
+    if _geo_index_loaded_at is not None:
+        for charger_id, connector_status in batch.statuses.items():
+            cluster_index.set_status(
+                charger_id, CONNECTOR_STATUS_MAP.get(connector_status, ChargerStatusEnum.OFFLINE)
+            )
+    return {"subscribers": live_hub.ingest(batch)}
+
+
+@app.websocket("/ws/live")
+async def live_updates(websocket: WebSocket):
+    """
+    대시보드 실시간 구독
+
+    접속 직후 {"type": "snapshot", "dashboard"}를, 이후 변경이 있을 때마다
+    {"type": "delta", "chargers": [{"charger_id", "current_status"}], "dashboard"}를 전송한다.
+    dashboard는 /statistics/dashboard와 같은 형식이다.
+    """
+    await websocket.accept()
+    queue = live_hub.subscribe()
+    # 변경 대기 중에도 연결 종료를 감지하기 위해 수신을 함께 대기 (클라이언트 메시지는 무시)
+    receiver = asyncio.ensure_future(websocket.receive())
+    try:
+        live_hub.ensure_loaded()
+        await websocket.send_text(live_hub.snapshot_message())
+        while True:
+            getter = asyncio.ensure_future(queue.get())
+            done, _ = await asyncio.wait({getter, receiver}, return_when=asyncio.FIRST_COMPLETED)
+            if getter not in done:
+                getter.cancel()
+            if receiver in done:
+                if receiver.result()["type"] == "websocket.disconnect":
+                    break
+                receiver = asyncio.ensure_future(websocket.receive())
+            if getter in done:
+                message = getter.result()
+                if message is None:
+                    # 느린 구독자: 연결을 끊어 재접속 시 전체를 다시 조회하도록 함
+                    await websocket.close()
+                    break
+                await websocket.send_text(message)
+    except (WebSocketDisconnect, RuntimeError):
+        pass
+    finally:
+        receiver.cancel()
+        live_hub.unsubscribe(queue)
+
+
 if __name__ == "__main__":
     import uvicorn
     
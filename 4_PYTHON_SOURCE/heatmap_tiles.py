@@ -0,0 +1,201 @@
+"""
+히트맵 격자 칸별 일일 에너지/매출 누적 배열
+
+충전기 위치를 cell_size(도) 격자 칸으로 묶고, 칸 x 날짜 2차원 배열에
+DailyChargerStats의 일일 에너지/매출을 합산해 둔다.
+날짜 축 누적합(prefix sum)을 미리 계산하므로 기간 합계는
+
+    누적[칸, 종료일 + 1] - 누적[칸, 시작일]
+
+한 번의 뺄셈이 되어 1일 조회와 365일 조회의 비용이 같다 (칸 수에만 비례).
+
+    - replace_days(): 지정한 날짜들의 값을 DB 결과로 교체 (당일/전일 증분 갱신용)
+    - 누적합은 값이 바뀐 뒤 첫 조회에서 한 번만 다시 계산
+    - 충전기 칸은 처음 적재할 때 정해지므로, 위치가 바뀐 충전기(moved_chargers)가 있으면
+      과거 값도 새 칸으로 옮기도록 전체를 다시 적재한다
+"""
+import math
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+# 기본 격자 크기 (도, 약 1km)
+DEFAULT_CELL_SIZE = 0.01
+
+Cell = Tuple[int, int]
+# (충전기 ID, 경도, 위도, 날짜, 에너지, 매출)
+DailyValue = Tuple[str, float, float, date, Any, Any]
+
+
+class HeatmapTiles:
+    """격자 칸 x 날짜 에너지/매출 배열"""
+
+    def __init__(self, first_day: date, cell_size: float = DEFAULT_CELL_SIZE, day_capacity: int = 64):
+        self.cell_size = cell_size
+        self.first_day = first_day
+        self.num_days = 0
+        self.cells: Dict[Cell, int] = {}  # 칸 -> 행 번호
+        self.charger_rows: Dict[str, int] = {}  # 충전기 ID -> 행 번호
+        self.charger_locations: Dict[str, Tuple[float, float]] = {}  # 충전기 ID -> 등록 좌표
+        # 칸 중심 = 칸에 속한 충전기 좌표 평균
+        self._sum_lon: List[float] = []
+        self._sum_lat: List[float] = []
+        self._num_chargers: List[int] = []
+        self.energy = np.zeros((16, day_capacity))
+        self.revenue = np.zeros((16, day_capacity))
+        self._prefix: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]] = None
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    # ==================== 갱신 ====================
+
+    def _row(self, charger_id: str, lon: float, lat: float) -> int:
+        """충전기의 행 번호 (처음 보는 충전기면 칸에 등록)"""
+        row = self.charger_rows.get(charger_id)
+        if row is not None:
+            return row
+        cell = (math.floor(lon / self.cell_size), math.floor(lat / self.cell_size))
+        row = self.cells.get(cell)
+        if row is None:
+            row = self.cells[cell] = len(self.cells)
+            self._sum_lon.append(0.0)
+            self._sum_lat.append(0.0)
+            self._num_chargers.append(0)
+            if row >= self.energy.shape[0]:
+                self._grow(rows=row + 1)
+        self._sum_lon[row] += lon
+        self._sum_lat[row] += lat
+        self._num_chargers[row] += 1
+        self.charger_rows[charger_id] = row
+        self.charger_locations[charger_id] = (lon, lat)
+        return row
+
+    def moved_chargers(self, values: Iterable[DailyValue]) -> Set[str]:
+        """
+        등록 때와 좌표가 달라진 충전기 ID
+
+        누적 배열에는 칸별 합계만 있어 충전기 하나의 과거 값을 옮길 수 없으므로,
+        결과가 비어 있지 않으면 새 HeatmapTiles로 전체를 다시 적재해야 한다.
+        """
+        locations = self.charger_locations
+        return {
+            charger_id
+            for charger_id, lon, lat, _, _, _ in values
+            if charger_id in locations and lon is not None and lat is not None
+            and locations[charger_id] != (lon, lat)
+        }
+
+    def _grow(self, rows: int = 0, days: int = 0):
+        """배열 용량을 두 배씩 늘림"""
+        old_rows, old_days = self.energy.shape
+        new_rows = max(old_rows, rows) if rows <= old_rows else max(rows, old_rows * 2)
+        new_days = max(old_days, days) if days <= old_days else max(days, old_days * 2)
+        for name in ("energy", "revenue"):
+            grown = np.zeros((new_rows, new_days))
+            grown[:old_rows, :old_days] = getattr(self, name)
+            setattr(self, name, grown)
+
+    def replace_days(self, values: Iterable[DailyValue], days: Optional[Set[date]] = None) -> int:
+        """
+        날짜별 값을 교체
+
+        Args:
+            values: DB의 일일 통계 (StatisticsService.get_daily_values)
+            days: 교체할 날짜 (None이면 values에 있는 날짜만 누적, 전체 적재용)
+
+        Returns:
+            반영한 행 수 (first_day 이전 날짜는 무시)
+        """
+        if days:
+            offsets = [(day - self.first_day).days for day in days]
+            offsets = [offset for offset in offsets if 0 <= offset < self.num_days]
+            self.energy[:, offsets] = 0.0
+            self.revenue[:, offsets] = 0.0
+
+        rows, offsets, energies, revenues = [], [], [], []
+        first_ordinal = self.first_day.toordinal()
+        for charger_id, lon, lat, stats_date, energy, revenue in values:
+            offset = stats_date.toordinal() - first_ordinal
+            if offset < 0 or lon is None or lat is None:
+                continue
+            rows.append(self._row(charger_id, lon, lat))
+            offsets.append(offset)
+            energies.append(float(energy or 0))
+            revenues.append(float(revenue or 0))
+
+        if offsets:
+            last = max(offsets) + 1
+            if last > self.energy.shape[1]:
+                self._grow(days=last)
+            self.num_days = max(self.num_days, last)
+            # 같은 칸·날짜에 여러 충전기가 있으므로 누적 (np.add.at)
+            np.add.at(self.energy, (rows, offsets), energies)
+            np.add.at(self.revenue, (rows, offsets), revenues)
+
+        self._prefix = None
+        return len(offsets)
+
+    # ==================== 조회 ====================
+
+    def _prefix_sums(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """(에너지 누적, 매출 누적, 칸 중심 경도, 칸 중심 위도), 값이 바뀐 뒤 한 번만 계산"""
+        if self._prefix is None:
+            rows = len(self.cells)
+            energy = np.zeros((rows, self.num_days + 1))
+            revenue = np.zeros((rows, self.num_days + 1))
+            np.cumsum(self.energy[:rows, :self.num_days], axis=1, out=energy[:, 1:])
+            np.cumsum(self.revenue[:rows, :self.num_days], axis=1, out=revenue[:, 1:])
+            count = np.array(self._num_chargers, dtype=float)
+            self._prefix = (
+                energy,
+                revenue,
+                np.array(self._sum_lon) / count,
+                np.array(self._sum_lat) / count
+            )
+        return self._prefix
+
+    def query(
+        self,
+        start_date: date,
+        end_date: date,
+        bbox: Optional[Tuple[float, float, float, float]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        기간 합계가 0보다 큰 칸 목록 (시작/종료일 포함, 적재 범위 밖은 잘라냄)
+
+        Args:
+            bbox: (서경, 남위, 동경, 북위) 칸 중심 기준 영역 제한
+        """
+        start = max(0, (start_date - self.first_day).days)
+        end = min(self.num_days - 1, (end_date - self.first_day).days)
+        if end < start or not self.cells:
+            return []
+
+        energy_sum, revenue_sum, lon, lat = self._prefix_sums()
+        energy = energy_sum[:, end + 1] - energy_sum[:, start]
+        revenue = revenue_sum[:, end + 1] - revenue_sum[:, start]
+        mask = (energy > 1e-9) | (revenue > 1e-9)
+        if bbox is not None:
+            west, south, east, north = bbox
+            mask &= (lon >= west) & (lon <= east) & (lat >= south) & (lat <= north)
+
+        rows = np.flatnonzero(mask)
+        num_chargers = self._num_chargers
+        return [
+            {
+                "longitude": cell_lon,
+                "latitude": cell_lat,
+                "num_chargers": num_chargers[row],
+                "energy": cell_energy,
+                "revenue": cell_revenue
+            }
+            for row, cell_lon, cell_lat, cell_energy, cell_revenue in zip(
+                rows.tolist(),
+                lon[rows].tolist(),
+                lat[rows].tolist(),
+                energy[rows].round(3).tolist(),
+                revenue[rows].round(2).tolist()
+            )
+        ]
@@ -0,0 +1,172 @@
+"""
+HDR 방식 지연 시간 히스토그램
+
+값(마이크로초)을 로그-선형 버킷에 세어 메모리는 일정하게 유지하면서
+상대 오차 약 1% 이내로 백분위수를 계산한다.
+    - 0 ~ 127us 는 1us 단위
+    - 그 이상은 2의 거듭제곱 구간마다 64개 하위 버킷
+
+여러 프로세스의 히스토그램은 to_dict()/from_dict()/merge()로 합칠 수 있다.
+"""
+from typing import Any, Dict, Iterable, Optional
+
+# 하위 버킷 비트 수 (2^7 = 128 → 구간당 64개 하위 버킷, 상대 오차 < 1/64)
+_SUB_BUCKET_BITS = 7
+_SUB_BUCKET_MASK = (1 << 8) - 1
+
+# 요약에 포함하는 백분위수
+DEFAULT_PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+
+def _bucket_key(value: int) -> int:
+    exponent = max(0, value.bit_length() - _SUB_BUCKET_BITS)
+    return (exponent << 8) | (value >> exponent)
+
+
+def _bucket_upper(key: int) -> int:
+    """버킷에 속하는 가장 큰 값"""
+    exponent = key >> 8
+    mantissa = key & _SUB_BUCKET_MASK
+    return ((mantissa + 1) << exponent) - 1
+
+
+class LatencyHistogram:
+    """지연 시간 히스토그램 (기록 단위: 초, 내부 단위: 마이크로초)"""
+
+    __slots__ = ("counts", "count", "total_us", "min_us", "max_us")
+
+    def __init__(self):
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total_us = 0
+        self.min_us: Optional[int] = None
+        self.max_us = 0
+
+    def record(self, seconds: float):
+        """지연 시간 한 건 기록"""
+        value = int(seconds * 1_000_000)
+        if value < 0:
+            value = 0
+        key = _bucket_key(value)
+        counts = self.counts
+        counts[key] = counts.get(key, 0) + 1
+        self.count += 1
+        self.total_us += value
+        if self.min_us is None or value < self.min_us:
+            self.min_us = value
+        if value > self.max_us:
+            self.max_us = value
+
+    def percentile(self, pct: float) -> float:
+        """백분위수 (초, 버킷 상한값 기준)"""
+        if self.count == 0:
+            return 0.0
+        target = max(1, int(round(pct / 100.0 * self.count + 0.4999999)))
+        seen = 0
+        for key in sorted(self.counts):
+            seen += self.counts[key]
+            if seen >= target:
+                return min(_bucket_upper(key), self.max_us) / 1_000_000
+        return self.max_us / 1_000_000
+
+    def mean(self) -> float:
+        """평균 (초)"""
+        return self.total_us / self.count / 1_000_000 if self.count else 0.0
+
+    def merge(self, other: "LatencyHistogram"):
+        """다른 히스토그램 합치기"""
+        for key, count in other.counts.items():
+            self.counts[key] = self.counts.get(key, 0) + count
+        self.count += other.count
+        self.total_us += other.total_us
+        if other.min_us is not None and (self.min_us is None or other.min_us < self.min_us):
+            self.min_us = other.min_us
+        self.max_us = max(self.max_us, other.max_us)
+
+    def summary(self, percentiles: Iterable[float] = DEFAULT_PERCENTILES) -> Dict[str, float]:
+        """요약 (밀리초)"""
+        result = {
+            "count": self.count,
+            "min_ms": (self.min_us or 0) / 1000,
+            "mean_ms": self.mean() * 1000,
+            "max_ms": self.max_us / 1000
+        }
+        for pct in percentiles:
+            result[f"p{pct:g}_ms"] = self.percentile(pct) * 1000
+        return result
+
+    def to_dict(self) -> Dict[str, Any]:
+        """직렬화 (프로세스 간 전달용)"""
+        return {
+            "counts": self.counts,
+            "count": self.count,
+            "total_us": self.total_us,
+            "min_us": self.min_us,
+            "max_us": self.max_us
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencyHistogram":
+        hist = cls()
+        hist.counts = {int(key): count for key, count in data["counts"].items()}
+        hist.count = data["count"]
+        hist.total_us = data["total_us"]
+        hist.min_us = data["min_us"]
+        hist.max_us = data["max_us"]
+        return hist
+
+
+class LatencyRecorder:
+    """
+    액션별 왕복 시간 히스토그램 + 오류 카운터
+
+    ChargerSimulator의 metrics로 전달하면 CALL -> CALLRESULT 왕복 시간이 기록된다.
+    여러 충전기가 하나의 기록기를 공유할 수 있다.
+    """
+
+    def __init__(self):
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        self.errors: Dict[str, int] = {}
+
+    def record_rtt(self, action: str, seconds: float):
+        hist = self.histograms.get(action)
+        if hist is None:
+            hist = self.histograms[action] = LatencyHistogram()
+        hist.record(seconds)
+
+    def record_error(self, kind: str):
+        self.errors[kind] = self.errors.get(kind, 0) + 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """액션별 지연 요약과 오류 수"""
+        return {
+            "rtt": {action: hist.summary() for action, hist in sorted(self.histograms.items())},
+            "errors": dict(sorted(self.errors.items()))
+        }
+
+    def format_summary(self) -> str:
+        """한 줄 요약 (주기적 로그용)"""
+        parts = [
+            f"{action} n={hist.count} p50={hist.percentile(50) * 1000:.1f}ms "
+            f"p99={hist.percentile(99) * 1000:.1f}ms max={hist.max_us / 1000:.1f}ms"
+            for action, hist in sorted(self.histograms.items())
+        ]
+        if self.errors:
+            parts.append(f"오류 {self.errors}")
+        return " | ".join(parts) if parts else "기록 없음"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "histograms": {action: hist.to_dict() for action, hist in self.histograms.items()},
+            "errors": self.errors
+        }
+
+    def merge_dict(self, data: Dict[str, Any]):
+        """다른 기록기의 to_dict() 결과 병합"""
+        for action, hist_data in data["histograms"].items():
+            hist = self.histograms.get(action)
+            if hist is None:
+                hist = self.histograms[action] = LatencyHistogram()
+            hist.merge(LatencyHistogram.from_dict(hist_data))
+        for kind, count in data["errors"].items():
+            self.errors[kind] = self.errors.get(kind, 0) + count
@@ -0,0 +1,151 @@
+"""
+OCPP 서버 -> 대시보드 API 실시간 이벤트 전달
+
+핸들러는 record_*()로 변경 사항을 메모리에 모으기만 하고 (대기 없음),
+백그라운드 태스크가 push_interval마다 모인 변경분을 한 번의 HTTP POST로
+대시보드 API(gis_dashboard_api의 /live/events)에 전달한다.
+대시보드 API는 이를 WebSocket(/ws/live) 구독자들에게 한 번만 직렬화해 배포한다.
+
+    - 상태 알림   -> 충전기별 마지막 connectorStatus만 전달
+    - 거래 종료   -> 당일 세션/매출/에너지 증분 집계용으로 전달
+                     (session_date: 거래 시작 UTC 날짜, DB의 charger_usage_log.session_date와 같은 기준)
+
+실시간 표시용이므로 전달 실패 시 해당 변경분은 버린다 (대시보드는 재접속 시 전체를 다시 조회).
+
+환경변수:
+    OCPP_LIVE_PUSH_URL       이벤트 수신 URL (예: http://localhost:8000/live/events, 미설정 시 비활성화)
+    OCPP_LIVE_PUSH_INTERVAL  전달 주기 (초, 기본 0.5)
+"""
+import asyncio
+import logging
+import os
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+
+class LivePublisher:
+    """대시보드 실시간 이벤트 전달기"""
+
+    def __init__(self, url: str, push_interval: float = 0.5, max_sessions: int = 10000):
+        self.url = url
+        self.push_interval = push_interval
+        self.max_sessions = max_sessions
+        # 충전기 ID -> 마지막 connectorStatus (전달 전까지 병합)
+        self._statuses: Dict[str, str] = {}
+        self._sessions: List[Dict[str, Any]] = []
+        # 진행 중 거래 ID -> (충전기 ID, 시작 날짜 UTC ISO 문자열), 시작 순서 유지
+        # 종료 이벤트가 오지 않는 거래는 충전기 Offline 시 정리, 가득 차면 가장 오래된 것부터 제거
+        self._started: Dict[str, Tuple[str, str]] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._http: Optional[aiohttp.ClientSession] = None
+        self.stats = {"pushed": 0, "events": 0, "dropped": 0, "failed": 0}
+
+    # ==================== 변경 사항 적재 (핸들러에서 호출, 대기 없음) ====================
+
+    def record_status(self, charger_id: str, connector_status: str):
+        """충전기 상태 변경 (OCPP connectorStatus 또는 'Offline')"""
+        self._statuses[charger_id] = connector_status
+        if connector_status == "Offline" and self._started:
+            # 연결이 끊긴 충전기의 거래는 종료 이벤트를 받지 못할 수 있음
+            for transaction_id in [tid for tid, (cid, _) in self._started.items() if cid == charger_id]:
+                del self._started[transaction_id]
+
+    def record_transaction(
+        self,
+        charger_id: str,
+        event_type: str,
+        transaction_id: str,
+        energy_kwh: float = 0.0,
+        total_cost: float = 0.0,
+        power_w: Optional[float] = None
+    ):
+        """거래 이벤트 (종료된 거래만 전달, 시작 이벤트는 세션 날짜 계산용으로 기억)"""
+        today = datetime.now(timezone.utc).date().isoformat()
+        if event_type != "Ended":
+            if transaction_id not in self._started:
+                if len(self._started) >= self.max_sessions:
+                    del self._started[next(iter(self._started))]
+                self._started[transaction_id] = (charger_id, today)
+            return
+        # 시작을 보지 못한 거래는 종료 시각 기준 (DB 저장과 같은 규칙)
+        session_date = self._started.pop(transaction_id, (charger_id, today))[1]
+        if len(self._sessions) >= self.max_sessions:
+            self.stats["dropped"] += 1
+            return
+        self._sessions.append({
+            "charger_id": charger_id,
+            "transaction_id": transaction_id,
+            "session_date": session_date,
+            "energy_kwh": energy_kwh,
+            "total_cost": total_cost
+        })
+
+    # ==================== 백그라운드 전달 ====================
+
+    def start(self):
+        """전달 태스크 시작"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+            logger.info(f"대시보드 실시간 전달 시작: {self.url} (주기 {self.push_interval}초)")
+
+    async def stop(self):
+        """전달 태스크 종료 (남은 변경분은 한 번 더 전달 시도)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.push()
+        if self._http is not None:
+            await self._http.close()
+            self._http = None
+
+    async def run(self):
+        while True:
+            await asyncio.sleep(self.push_interval)
+            await self.push()
+
+    def take_batch(self) -> Optional[Dict[str, Any]]:
+        """모인 변경분을 꺼내 전달 형식으로 변환 (없으면 None)"""
+        if not self._statuses and not self._sessions:
+            return None
+        batch = {"statuses": self._statuses, "sessions": self._sessions}
+        self._statuses = {}
+        self._sessions = []
+        return batch
+
+    async def push(self) -> bool:
+        """변경분 한 번 전달"""
+        batch = self.take_batch()
+        if batch is None:
+            return True
+        events = len(batch["statuses"]) + len(batch["sessions"])
+        try:
+            if self._http is None:
+                self._http = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=5))
+            async with self._http.post(self.url, json=batch) as response:
+                response.raise_for_status()
+            self.stats["pushed"] += 1
+            self.stats["events"] += events
+            return True
+        except Exception as e:
+            self.stats["failed"] += 1
+            if self.stats["failed"] % 100 == 1:
+                logger.warning(f"대시보드 실시간 전달 실패 ({events}건 폐기): {type(e).__name__}: {e}")
+            return False
+
+
+def create_publisher_from_env() -> Optional[LivePublisher]:
+    """
+    환경변수 설정으로 전달기 생성 (OCPP_LIVE_PUSH_URL이 없으면 None)
+    """
+    url = os.getenv("OCPP_LIVE_PUSH_URL")
+    if not url:
+        return None
+    return LivePublisher(url, push_interval=float(os.getenv("OCPP_LIVE_PUSH_INTERVAL", "0.5")))
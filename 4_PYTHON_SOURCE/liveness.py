@@ -0,0 +1,132 @@
+"""
+충전기 연결 생존 감시 (해시 타이머 휠)
+
+수신 경로는 연결 객체의 last_seen(monotonic)만 갱신하고, 타이머는 만들지 않는다.
+휠은 연결마다 만료 예정 시각의 슬롯 하나에만 들어 있으며, tick마다 현재 슬롯만 검사한다.
+- 그 사이 메시지가 있었으면 새 만료 시각의 슬롯으로 옮긴다 (타임아웃 주기당 최대 1회).
+- 없었으면 만료 콜백을 호출한다.
+따라서 tick 비용은 전체 연결 수가 아니라 해당 슬롯의 항목 수에 비례한다.
+"""
+import asyncio
+import logging
+import math
+import time
+from typing import Any, Callable, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# 만료 콜백: 만료된 연결 객체를 받는다
+ExpireCallback = Callable[[Any], None]
+
+
+class LivenessWheel:
+    """
+    last_seen 기반 해시 타이머 휠
+
+    등록되는 연결 객체는 last_seen(float, time.monotonic 기준) 속성을 가져야 한다.
+    """
+
+    def __init__(
+        self,
+        timeout: float,
+        on_expire: ExpireCallback,
+        tick: float = 1.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        if timeout <= 0 or tick <= 0:
+            raise ValueError("timeout과 tick은 0보다 커야 합니다")
+        self.timeout = timeout
+        self.tick = tick
+        self.on_expire = on_expire
+        self.clock = clock
+        # 타임아웃 전체를 덮는 슬롯 수 (+1: 현재 슬롯과 겹치지 않도록)
+        self.slot_count = int(math.ceil(timeout / tick)) + 1
+        self._slots: List[Set[Any]] = [set() for _ in range(self.slot_count)]
+        # 연결 객체 -> 현재 들어 있는 슬롯 번호
+        self._slot_of: Dict[Any, int] = {}
+        self._cursor = self._tick_index(self.clock())
+        self._task: Optional[asyncio.Task] = None
+        self.expired_count = 0
+
+    def __len__(self):
+        return len(self._slot_of)
+
+    def _tick_index(self, when: float) -> int:
+        return int(when // self.tick)
+
+    def _schedule(self, conn: Any, deadline: float):
+        # 만료 시각 이전의 tick에서 꺼내지지 않도록 올림
+        slot = int(math.ceil(deadline / self.tick)) % self.slot_count
+        self._slots[slot].add(conn)
+        self._slot_of[conn] = slot
+
+    def add(self, conn: Any):
+        """연결 등록 (last_seen을 현재 시각으로 초기화)"""
+        self.remove(conn)
+        now = self.clock()
+        conn.last_seen = now
+        self._schedule(conn, now + self.timeout)
+
+    def remove(self, conn: Any):
+        """연결 등록 해제"""
+        slot = self._slot_of.pop(conn, None)
+        if slot is not None:
+            self._slots[slot].discard(conn)
+
+    def advance(self, now: Optional[float] = None) -> List[Any]:
+        """
+        현재 시각까지 밀린 슬롯을 처리
+
+        Returns:
+            이번 호출에서 만료된 연결 목록
+        """
+        if now is None:
+            now = self.clock()
+        target = self._tick_index(now)
+        expired = []
+        # 밀린 tick이 휠 한 바퀴보다 많으면 한 바퀴만 돌면 된다
+        start = max(self._cursor + 1, target - self.slot_count + 1)
+        for index in range(start, target + 1):
+            slot = self._slots[index % self.slot_count]
+            if not slot:
+                continue
+            due = list(slot)
+            slot.clear()
+            for conn in due:
+                del self._slot_of[conn]
+                deadline = conn.last_seen + self.timeout
+                if deadline <= now:
+                    expired.append(conn)
+                else:
+                    self._schedule(conn, deadline)
+        self._cursor = max(self._cursor, target)
+
+        for conn in expired:
+            self.expired_count += 1
+            try:
+                self.on_expire(conn)
+            except Exception as e:
+                logger.error(f"만료 처리 오류: {e}")
+        return expired
+
+    async def run(self):
+        """tick 간격으로 휠을 돌리는 단일 감시 태스크"""
+        while True:
+            await asyncio.sleep(self.tick)
+            self.advance()
+
+    def start(self):
+        """감시 태스크 시작"""
+        if self._task is None or self._task.done():
+            self._cursor = self._tick_index(self.clock())
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        """감시 태스크 종료"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
@@ -5,6 +5,7 @@ import logging
 import os
 import sys
 from datetime import datetime
+from typing import Optional
 
 # 환경변수 기반 로깅 설정
 PROTOCOL_DEBUG = os.getenv('OCPP_PROTOCOL_DEBUG', 'false').lower() == 'true'
@@ -118,48 +119,69 @@ def print_protocol_debug_help():
     setup_logging(enable_protocol_debug=True, log_file='ocpp.log')
     
     
-    프로토콜 로그 태그
+    4️⃣  프로토콜 트레이스 조회
     ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    
-    [OCPP-CALL-SEND]        Call 메시지 전송
-    [OCPP-PAYLOAD-SEND]     전송 페이로드
-    [OCPP-CALLRESULT-SEND]  CallResult 전송
-    [OCPP-RESPONSE-SEND]    응답 페이로드
-    [OCPP-CALLERROR-SEND]   오류 메시지 전송
-    [OCPP-ERROR-SEND]       오류 상세 정보
-    
-    [OCPP-CALL-RECV]        Call 메시지 수신
-    [OCPP-PAYLOAD-RECV]     수신 페이로드
-    [OCPP-CALLRESULT-RECV]  CallResult 수신
-    [OCPP-RESPONSE-RECV]    응답 페이로드
-    [OCPP-CALLERROR-RECV]   오류 메시지 수신
-    [OCPP-ERROR-RECV]       오류 상세 정보
-    [OCPP-RAW-RECV]         원본 메시지
-    
-    [CHARGER-SEND]          충전기 전송
-    [CHARGER-RECV]          충전기 수신
-    
-    [SERVER-SEND]           서버 전송
-    [SERVER-RECV]           서버 수신
-    
-    
-    로그 필터링 예제
-    ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-    
-    # 모든 Call 메시지만 보기 (PowerShell)
-    Select-String "OCPP-CALL" ocpp_protocol_debug.log
-    
-    # TransactionEvent만 (PowerShell)
-    Select-String "TransactionEvent" ocpp_protocol_debug.log
-    
-    # 오류만 (PowerShell)
-    Select-String "ERROR" ocpp_protocol_debug.log
-    
-    
+
+    송수신 프레임은 포매팅 없이 원본 그대로 링 버퍼(protocol_trace)에 한 번만
+    기록됩니다. 액션/메시지 ID 추출과 JSON 들여쓰기는 조회할 때만 수행됩니다.
+
+    $env:OCPP_TRACE_CAPACITY = '10000'        # 링 버퍼 크기 (프레임 수)
+    $env:OCPP_TRACE_FILE = 'ocpp_trace.bin'   # 회전 바이너리 파일 (선택)
+    $env:OCPP_TRACE_MAX_BYTES = '67108864'    # 파일 회전 크기
+
+    # 트레이스 파일 보기
+    python logging_config.py --trace ocpp_trace.bin
+    python logging_config.py --trace ocpp_trace.bin --charger CP001 --action TransactionEvent
+
+    # 실행 중인 서버의 링 버퍼 보기
+    GET /debug/trace?charger_id=CP001&limit=100
+
+
     자세한 가이드는 PROTOCOL_DEBUG_GUIDE.md 파일을 확인하세요.
     """)
 
 
+def dump_protocol_trace(
+    path: str,
+    charger_id: Optional[str] = None,
+    action: Optional[str] = None,
+    limit: Optional[int] = None
+):
+    """
+    바이너리 트레이스 파일을 사람이 읽기 좋은 형태로 출력
+
+    Args:
+        path: 트레이스 파일 경로 (OCPP_TRACE_FILE)
+        charger_id: 특정 충전기만 출력
+        action: 특정 액션만 출력
+        limit: 마지막 limit건만 출력
+    """
+    from protocol_trace import read_trace_file, format_record
+
+    records = [
+        r for r in read_trace_file(path)
+        if (charger_id is None or r["charger_id"] == charger_id)
+        and (action is None or r["action"] == action)
+    ]
+    if limit:
+        records = records[-limit:]
+    for record in records:
+        print(format_record(record))
+    print(f"\n총 {len(records)}건")
+
+
 if __name__ == "__main__":
-    # 도움말 출력
-    print_protocol_debug_help()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="OCPP 프로토콜 디버그 도구")
+    parser.add_argument("--trace", help="출력할 바이너리 트레이스 파일")
+    parser.add_argument("--charger", help="충전기 ID 필터")
+    parser.add_argument("--action", help="액션 필터")
+    parser.add_argument("--limit", type=int, help="마지막 N건만 출력")
+    args = parser.parse_args()
+
+    if args.trace:
+        dump_protocol_trace(args.trace, args.charger, args.action, args.limit)
+    else:
+        # 도움말 출력
+        print_protocol_debug_help()
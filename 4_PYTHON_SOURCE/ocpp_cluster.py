@@ -0,0 +1,442 @@
+"""
+OCPP 2.0.1 멀티 프로세스 샤딩 서버
+
+N개의 워커 프로세스가 SO_REUSEPORT로 같은 포트를 공유하고, 각 워커는 자체
+이벤트 루프에서 독립된 OCPPServer를 실행한다. 커널이 신규 연결을 워커에 분산하므로
+부팅 폭주 시에도 JSON 파싱/디스패치가 여러 CPU 코어에 나뉜다.
+
+마스터 프로세스는 공유 레지스트리(충전기 ID -> 소속 워커)로 충전기를 찾고,
+원격 명령은 해당 워커의 명령 큐로 전달한다. 비정상 종료된 워커는 마스터가 같은 워커 번호로
+다시 기동한다 (해당 워커의 충전기는 재연결 후 다시 등록되고, 응답 대기 중인 명령은 실패 처리). ShardedOCPPServer는 OCPPServer와 같은
+get_charger_status / request_*_transaction 인터페이스를 제공하므로 ServerAPI를
+그대로 사용할 수 있다.
+
+사용법:
+    python ocpp_cluster.py --workers 4 --port 9000 --api-port 8080
+"""
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import os
+import queue
+import socket
+import sys
+import uuid
+from typing import Dict, Any, Optional, List, Set, Tuple
+
+# 루트의 구버전 모듈보다 이 디렉토리의 모듈을 우선 사용
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from ocpp_server import OCPPServer, OCPPCallError, monotonic_to_iso
+
+logger = logging.getLogger(__name__)
+
+# 워커 -> 레지스트리 동기화 주기 (초)
+REGISTRY_SYNC_INTERVAL = 1.0
+# 마스터가 워커 명령 응답을 기다리는 기본 시간 (초)
+DEFAULT_COMMAND_TIMEOUT = 35.0
+# 워커 종료 대기 시간 (초)
+WORKER_STOP_TIMEOUT = 5.0
+
+
+def reuseport_supported() -> bool:
+    """현재 플랫폼의 SO_REUSEPORT 지원 여부"""
+    return hasattr(socket, "SO_REUSEPORT")
+
+
+def create_reuseport_socket(host: str, port: int, backlog: int = 2048) -> socket.socket:
+    """SO_REUSEPORT 리스닝 소켓 생성 (워커마다 하나씩 바인딩)"""
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.setblocking(False)
+    return sock
+
+
+class ShardRegistry:
+    """
+    워커 간 공유 충전기 레지스트리
+
+    multiprocessing.Manager의 dict 프록시를 감싼다. 값은
+    {"worker_id", "connected", "boot_status", "last_heartbeat"} 형태이며 (last_heartbeat는
+    time.monotonic 값으로 보관하여 변경이 없으면 동기화 대상에서 빠지도록 한다),
+    프록시 호출은 IPC이므로 워커는 변경분만 모아서 주기적으로 반영한다.
+    """
+
+    def __init__(self, shared_dict):
+        self._chargers = shared_dict
+
+    def lookup(self, charger_id: str) -> Optional[Dict[str, Any]]:
+        """충전기 소속 워커 및 상태 조회"""
+        return self._chargers.get(charger_id)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """전체 레지스트리 복사본"""
+        return dict(self._chargers)
+
+    def publish(self, worker_id: int, changed: Dict[str, Dict[str, Any]], removed: List[str]):
+        """워커의 변경분 반영 (다른 워커로 재접속한 충전기는 삭제하지 않음)"""
+        if changed:
+            self._chargers.update(changed)
+        for charger_id in removed:
+            entry = self._chargers.get(charger_id)
+            if entry is not None and entry.get("worker_id") == worker_id:
+                self._chargers.pop(charger_id, None)
+
+    def purge_worker(self, worker_id: int):
+        """종료된 워커 소속 항목 일괄 삭제"""
+        for charger_id, entry in list(self._chargers.items()):
+            if entry.get("worker_id") == worker_id:
+                self._chargers.pop(charger_id, None)
+
+
+class ShardWorker:
+    """워커 프로세스 내부에서 OCPPServer와 레지스트리/명령 큐를 연결"""
+
+    def __init__(self, worker_id: int, server: OCPPServer, registry: ShardRegistry,
+                 command_queue, reply_queue):
+        self.worker_id = worker_id
+        self.server = server
+        self.registry = registry
+        self.command_queue = command_queue
+        self.reply_queue = reply_queue
+        self._published: Dict[str, Dict[str, Any]] = {}
+        # 실행 중인 원격 명령 태스크 (완료 전 GC 방지, 종료 시 취소)
+        self._commands: Set[asyncio.Task] = set()
+
+    def _collect_changes(self):
+        """마지막 동기화 이후 변경된 충전기 목록 계산"""
+        current = {}
+        for charger_id, charger in self.server.chargers.items():
+            current[charger_id] = {
+                "worker_id": self.worker_id,
+                "connected": charger.connected,
+                "boot_status": charger.boot_status,
+                "last_heartbeat": charger.last_heartbeat
+            }
+        changed = {cid: info for cid, info in current.items() if self._published.get(cid) != info}
+        removed = [cid for cid in self._published if cid not in current]
+        self._published = current
+        return changed, removed
+
+    async def sync_loop(self):
+        """로컬 충전기 상태를 레지스트리에 주기적으로 반영 (IPC는 스레드에서 수행)"""
+        loop = asyncio.get_running_loop()
+        while not self.server.shutdown_event.is_set():
+            changed, removed = self._collect_changes()
+            if changed or removed:
+                try:
+                    await loop.run_in_executor(
+                        None, self.registry.publish, self.worker_id, changed, removed
+                    )
+                except Exception as e:
+                    logger.error(f"레지스트리 동기화 실패 (worker {self.worker_id}): {e}")
+            await asyncio.sleep(REGISTRY_SYNC_INTERVAL)
+
+    async def command_loop(self):
+        """마스터가 보낸 원격 명령 처리"""
+        loop = asyncio.get_running_loop()
+        while not self.server.shutdown_event.is_set():
+            try:
+                command = await loop.run_in_executor(None, self.command_queue.get, True, 1.0)
+            except queue.Empty:
+                continue
+            if command is None:
+                self.server.shutdown_event.set()
+                return
+            task = asyncio.create_task(self._execute(command))
+            self._commands.add(task)
+            task.add_done_callback(self._commands.discard)
+
+    async def _execute(self, command: Dict[str, Any]):
+        """명령 실행 후 결과를 응답 큐로 전달"""
+        request_id = command["request_id"]
+        method = command["method"]
+        try:
+            if method == "request_start_transaction":
+                result = await self.server.request_start_transaction(*command["args"])
+            elif method == "request_stop_transaction":
+                result = await self.server.request_stop_transaction(*command["args"])
+            else:
+                raise ValueError(f"지원하지 않는 명령: {method}")
+            reply = {"request_id": request_id, "result": result}
+        except asyncio.TimeoutError:
+            reply = {"request_id": request_id, "error": "timeout"}
+        except OCPPCallError as e:
+            reply = {"request_id": request_id, "error": "call_error",
+                     "error_code": e.error_code, "error_message": e.error_message}
+        except Exception as e:
+            reply = {"request_id": request_id, "error": "exception", "error_message": str(e)}
+        try:
+            await asyncio.get_running_loop().run_in_executor(None, self.reply_queue.put, reply)
+        except Exception as e:
+            logger.error(f"명령 응답 전달 실패 (worker {self.worker_id}, {method}): {e}")
+
+    async def run(self, sock: socket.socket):
+        """OCPP 서버와 보조 태스크 실행"""
+        tasks = [
+            asyncio.create_task(self.sync_loop()),
+            asyncio.create_task(self.command_loop())
+        ]
+        try:
+            await self.server.start(sock=sock)
+        finally:
+            for task in tasks + list(self._commands):
+                task.cancel()
+            # 종료 시 자신의 항목 정리
+            try:
+                self.registry.purge_worker(self.worker_id)
+            except Exception:
+                pass
+
+
+def _run_worker(worker_id: int, host: str, port: int, shared_dict, command_queue, reply_queue,
+                server_kwargs: Dict[str, Any]):
+    """워커 프로세스 진입점"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format=f'%(asctime)s - worker{worker_id} - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    async def worker_main():
+        sock = create_reuseport_socket(host, port)
+        server = OCPPServer(host=host, port=port, **server_kwargs)
+        worker = ShardWorker(worker_id, server, ShardRegistry(shared_dict), command_queue, reply_queue)
+        logger.info(f"워커 {worker_id} 시작 (pid={os.getpid()})")
+        await worker.run(sock)
+
+    try:
+        asyncio.run(worker_main())
+    except KeyboardInterrupt:
+        pass
+
+
+class ShardedOCPPServer:
+    """
+    샤딩 모드 OCPP 서버 (마스터 프로세스)
+
+    OCPPServer와 같은 조회/원격 명령 인터페이스를 제공하여 ServerAPI에 그대로 연결된다.
+    """
+
+    def __init__(self, host: str = "0.0.0.0", port: int = 9000, workers: int = None,
+                 command_timeout: float = DEFAULT_COMMAND_TIMEOUT, **server_kwargs):
+        self.host = host
+        self.port = port
+        self.num_workers = workers or os.cpu_count() or 1
+        self.command_timeout = command_timeout
+        self.server_kwargs = server_kwargs
+        self.shutdown_event = asyncio.Event()
+        self.manager = None
+        self.registry: Optional[ShardRegistry] = None
+        self.processes: List[multiprocessing.Process] = []
+        self.command_queues: List[Any] = []
+        self.reply_queue = None
+        # 요청 ID -> (명령을 보낸 워커 번호, 응답 future)
+        self._waiters: Dict[str, Tuple[int, asyncio.Future]] = {}
+        # 비정상 종료 후 다시 기동한 워커 수
+        self.restart_count = 0
+        # SO_REUSEPORT 미지원 시 사용하는 단일 프로세스 서버
+        self._local_server: Optional[OCPPServer] = None
+
+    async def start(self):
+        """워커 프로세스 기동 후 종료 이벤트까지 대기"""
+        if not reuseport_supported():
+            logger.warning("SO_REUSEPORT 미지원 플랫폼: 단일 프로세스 서버로 실행합니다.")
+            server = OCPPServer(host=self.host, port=self.port, **self.server_kwargs)
+            server.shutdown_event = self.shutdown_event
+            self._local_server = server
+            await server.start()
+            return
+
+        self.manager = multiprocessing.Manager()
+        self.registry = ShardRegistry(self.manager.dict())
+        self.reply_queue = self.manager.Queue()
+
+        self.command_queues = [None] * self.num_workers
+        self.processes = [None] * self.num_workers
+        for worker_id in range(self.num_workers):
+            self._start_worker(worker_id)
+
+        logger.info(f"OCPP 2.0.1 샤딩 서버 시작: ws://{self.host}:{self.port} (워커 {self.num_workers}개)")
+
+        reply_task = asyncio.create_task(self._reply_loop())
+        monitor_task = asyncio.create_task(self._monitor_loop())
+        try:
+            await self.shutdown_event.wait()
+        finally:
+            reply_task.cancel()
+            monitor_task.cancel()
+            await self._stop_workers()
+
+    def _start_worker(self, worker_id: int):
+        """워커 프로세스 기동 (재기동 시 이전 명령이 남지 않도록 명령 큐도 새로 만듦)"""
+        command_queue = self.manager.Queue()
+        process = multiprocessing.Process(
+            target=_run_worker,
+            args=(worker_id, self.host, self.port, self.registry._chargers,
+                  command_queue, self.reply_queue, self.server_kwargs),
+            name=f"ocpp-worker-{worker_id}",
+            daemon=True
+        )
+        process.start()
+        self.command_queues[worker_id] = command_queue
+        self.processes[worker_id] = process
+
+    async def _stop_workers(self):
+        """워커 종료 요청 및 정리"""
+        loop = asyncio.get_running_loop()
+        for command_queue in self.command_queues:
+            try:
+                await loop.run_in_executor(None, command_queue.put, None)
+            except Exception:
+                pass
+        for process in self.processes:
+            await loop.run_in_executor(None, process.join, WORKER_STOP_TIMEOUT)
+            if process.is_alive():
+                process.terminate()
+        if self.manager is not None:
+            self.manager.shutdown()
+            self.manager = None
+
+    async def _monitor_loop(self):
+        """비정상 종료된 워커 정리 후 재기동 (REGISTRY_SYNC_INTERVAL마다 확인)"""
+        loop = asyncio.get_running_loop()
+        while True:
+            for worker_id, process in enumerate(self.processes):
+                if not process.is_alive():
+                    logger.error(f"워커 {worker_id} 종료됨 (exitcode={process.exitcode}), 재기동")
+                    await loop.run_in_executor(None, self._restart_worker, worker_id)
+                    self._fail_waiters(worker_id)
+            await asyncio.sleep(REGISTRY_SYNC_INTERVAL)
+
+    def _restart_worker(self, worker_id: int):
+        """종료된 워커의 레지스트리 항목을 정리하고 다시 기동 (IPC, 스레드에서 호출)"""
+        self.registry.purge_worker(worker_id)
+        self._start_worker(worker_id)
+        self.restart_count += 1
+
+    def _fail_waiters(self, worker_id: int):
+        """종료된 워커에 보낸 명령의 응답 대기를 오류로 종료"""
+        for request_id, (target, future) in list(self._waiters.items()):
+            if target == worker_id:
+                self._resolve(future, {"request_id": request_id, "error": "worker_exit",
+                                       "error_message": f"워커 {worker_id} 종료"})
+
+    @staticmethod
+    def _resolve(future: asyncio.Future, reply: Dict[str, Any]):
+        if not future.done():
+            future.set_result(reply)
+
+    async def _reply_loop(self):
+        """워커 응답을 대기 중인 요청에 전달"""
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                reply = await loop.run_in_executor(None, self.reply_queue.get, True, 1.0)
+            except queue.Empty:
+                continue
+            waiter = self._waiters.pop(reply["request_id"], None)
+            if waiter is not None:
+                self._resolve(waiter[1], reply)
+
+    async def _dispatch(self, charger_id: str, method: str, *args):
+        """충전기 소속 워커로 명령 전달 후 결과 대기"""
+        if self.registry is None:
+            return await getattr(self._local_server, method)(charger_id, *args)
+
+        entry = self.registry.lookup(charger_id)
+        if entry is None:
+            logger.error(f"충전기를 찾을 수 없음: {charger_id}")
+            return None
+
+        worker_id = entry["worker_id"]
+        request_id = str(uuid.uuid4())
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._waiters[request_id] = (worker_id, future)
+        try:
+            # Manager 큐 put은 IPC 왕복이므로 이벤트 루프를 막지 않도록 스레드에서 수행
+            await loop.run_in_executor(None, self.command_queues[worker_id].put, {
+                "request_id": request_id,
+                "method": method,
+                "args": (charger_id,) + args
+            })
+            reply = await asyncio.wait_for(future, self.command_timeout)
+        finally:
+            self._waiters.pop(request_id, None)
+
+        error = reply.get("error")
+        if error == "timeout":
+            raise asyncio.TimeoutError()
+        if error == "call_error":
+            raise OCPPCallError(reply["error_code"], reply.get("error_message", ""))
+        if error:
+            raise RuntimeError(reply.get("error_message", error))
+        return reply["result"]
+
+    async def request_start_transaction(self, charger_id: str, evse_id: int = 1, connector_id: int = 1):
+        """거래 시작 요청 (소속 워커에서 실행)"""
+        return await self._dispatch(charger_id, "request_start_transaction", evse_id, connector_id)
+
+    async def request_stop_transaction(self, charger_id: str, transaction_id: str = None):
+        """거래 중지 요청 (소속 워커에서 실행)"""
+        return await self._dispatch(charger_id, "request_stop_transaction", transaction_id)
+
+    def get_charger_status(self, charger_id: str = None) -> Dict[str, Any]:
+        """충전기 상태 조회 (모든 워커 대상)"""
+        if self.registry is None:
+            return self._local_server.get_charger_status(charger_id)
+
+        if charger_id:
+            entry = self.registry.lookup(charger_id)
+            if entry is None:
+                return {"error": f"Charger {charger_id} not found"}
+            return {"charger_id": charger_id, **self._format_entry(entry)}
+        return {cid: self._format_entry(entry) for cid, entry in self.registry.snapshot().items()}
+
+    @staticmethod
+    def _format_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
+        """레지스트리 항목 출력 형식 변환 (monotonic 시각 -> ISO 문자열)"""
+        return {**entry, "last_heartbeat": monotonic_to_iso(entry["last_heartbeat"])}
+
+
+async def run_sharded_server_with_api(host: str, port: int, workers: int, api_port: int):
+    """샤딩 서버와 REST API 동시 실행"""
+    from server_api import ServerAPI
+
+    cluster = ShardedOCPPServer(host=host, port=port, workers=workers)
+    api = ServerAPI(cluster, api_port=api_port)
+    await api.start()
+    try:
+        await cluster.start()
+    except (asyncio.CancelledError, KeyboardInterrupt):
+        logger.info("종료 신호 수신, 워커 정리 중...")
+        cluster.shutdown_event.set()
+
+
+def main():
+    """명령줄 진입점"""
+    parser = argparse.ArgumentParser(description="OCPP 2.0.1 멀티 프로세스 샤딩 서버")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--workers", type=int, default=int(os.getenv("OCPP_WORKERS", "0")) or None,
+                        help="워커 프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument("--api-port", type=int, default=8080)
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    try:
+        asyncio.run(run_sharded_server_with_api(args.host, args.port, args.workers, args.api_port))
+    except KeyboardInterrupt:
+        print("\n서버가 종료되었습니다.")
+
+
+if __name__ == "__main__":
+    main()
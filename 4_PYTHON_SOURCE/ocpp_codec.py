@@ -0,0 +1,130 @@
+"""
+OCPP 메시지 JSON 코덱
+
+설치된 고속 JSON 라이브러리를 자동으로 선택한다 (orjson > msgspec > ujson > json).
+OCPP_JSON_CODEC 환경변수로 특정 구현을 강제할 수 있다.
+
+    $env:OCPP_JSON_CODEC = 'json'   # 표준 라이브러리 강제
+"""
+import json
+import os
+from typing import Any, Callable, Dict, List, Optional, Type, Union
+
+# 코덱 선택 우선순위
+CODEC_PRIORITY = ("orjson", "msgspec", "ujson", "json")
+
+
+class JSONCodec:
+    """
+    JSON 인코더/디코더 한 쌍
+
+    dumps()는 웹소켓으로 바로 보낼 수 있는 UTF-8 bytes를, dumps_str()은 str을 반환한다.
+    loads()는 str과 bytes를 모두 받는다.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        dumps: Callable[[Any], bytes],
+        dumps_str: Callable[[Any], str],
+        loads: Callable[[Union[str, bytes]], Any],
+        decode_error: Type[Exception]
+    ):
+        self.name = name
+        self.dumps = dumps
+        self.dumps_str = dumps_str
+        self.loads = loads
+        self.decode_error = decode_error
+
+    def __repr__(self):
+        return f"<JSONCodec({self.name})>"
+
+
+def _build_orjson() -> JSONCodec:
+    import orjson
+    dumps = orjson.dumps
+    return JSONCodec(
+        "orjson",
+        dumps,
+        lambda obj: dumps(obj).decode("utf-8"),
+        orjson.loads,
+        orjson.JSONDecodeError
+    )
+
+
+def _build_msgspec() -> JSONCodec:
+    import msgspec
+    encoder = msgspec.json.Encoder()
+    decoder = msgspec.json.Decoder()
+    encode = encoder.encode
+    return JSONCodec(
+        "msgspec",
+        encode,
+        lambda obj: encode(obj).decode("utf-8"),
+        decoder.decode,
+        msgspec.DecodeError
+    )
+
+
+def _build_ujson() -> JSONCodec:
+    import ujson
+    dumps = ujson.dumps
+    return JSONCodec(
+        "ujson",
+        lambda obj: dumps(obj, ensure_ascii=False).encode("utf-8"),
+        lambda obj: dumps(obj, ensure_ascii=False),
+        ujson.loads,
+        ujson.JSONDecodeError
+    )
+
+
+def _build_json() -> JSONCodec:
+    encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+    encode = encoder.encode
+    return JSONCodec(
+        "json",
+        lambda obj: encode(obj).encode("utf-8"),
+        encode,
+        json.loads,
+        json.JSONDecodeError
+    )
+
+
+_BUILDERS: Dict[str, Callable[[], JSONCodec]] = {
+    "orjson": _build_orjson,
+    "msgspec": _build_msgspec,
+    "ujson": _build_ujson,
+    "json": _build_json,
+}
+
+
+def available_codecs() -> List[JSONCodec]:
+    """설치된 모든 코덱 (우선순위 순)"""
+    codecs = []
+    for name in CODEC_PRIORITY:
+        try:
+            codecs.append(_BUILDERS[name]())
+        except ImportError:
+            continue
+    return codecs
+
+
+def select_codec(preferred: Optional[str] = None) -> JSONCodec:
+    """
+    코덱 선택
+
+    Args:
+        preferred: 사용할 코덱 이름. 설치되어 있지 않거나 None이면 우선순위에 따라 선택.
+    """
+    if preferred:
+        builder = _BUILDERS.get(preferred.lower())
+        if builder is not None:
+            try:
+                return builder()
+            except ImportError:
+                pass
+    return available_codecs()[0]
+
+
+# 모듈 전역 코덱 (프로세스 시작 시 한 번 선택)
+codec = select_codec(os.getenv("OCPP_JSON_CODEC"))
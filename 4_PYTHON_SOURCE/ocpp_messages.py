@@ -1,17 +1,35 @@
 """
 OCPP 2.0.1 메시지 핸들링
+
+프로토콜 디버그 기록은 연결 계층(ocpp_server / charger_simulator)에서
+protocol_trace로 원본 프레임을 한 번만 남긴다. 이 모듈은 페이로드를 다시
+직렬화하여 로깅하지 않는다.
 """
-import json
 import uuid
 import logging
-import os
-from typing import Dict, Any, Tuple
+import time
+from typing import Dict, Any, List, Tuple, Optional, Union
 from datetime import datetime
 
-# 상세 프로토콜 로깅 활성화 여부 (환경변수로 제어)
-PROTOCOL_DEBUG = os.getenv('OCPP_PROTOCOL_DEBUG', 'false').lower() == 'true'
+from ocpp_codec import codec as _codec
+
 logger = logging.getLogger(__name__)
 
+# 미터 샘플: (ISO 시각, 누적 에너지 Wh, 순간 전력 W)
+MeterSample = Tuple[str, float, float]
+
+# 같은 초 안에서는 포매팅한 시각 문자열을 재사용 [초, 문자열]
+_timestamp_cache: List[Any] = [None, ""]
+
+
+def utc_timestamp(now: Optional[float] = None) -> str:
+    """ISO 8601 UTC 시각 문자열 (초 단위, 초가 바뀔 때만 새로 포매팅)"""
+    second = int(time.time() if now is None else now)
+    if second != _timestamp_cache[0]:
+        _timestamp_cache[0] = second
+        _timestamp_cache[1] = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(second))
+    return _timestamp_cache[1]
+
 
 class OCPPMessage:
     """OCPP 메시지 기본 클래스"""
@@ -22,44 +40,44 @@ class OCPPMessage:
     CALLERROR = 4
 
     @staticmethod
-    def create_call(action: str, payload: Dict[str, Any]) -> str:
-        """Call 메시지 생성"""
-        message_id = str(uuid.uuid4())
-        message = [OCPPMessage.CALL, message_id, action, payload]
-        result = json.dumps(message)
-        if PROTOCOL_DEBUG:
-            logger.debug(f"[OCPP-CALL-SEND] Action: {action}, ID: {message_id}")
-            logger.debug(f"[OCPP-PAYLOAD-SEND] {json.dumps(payload, indent=2, ensure_ascii=False)}")
-        return result
+    def create_call(action: str, payload: Dict[str, Any], message_id: Optional[str] = None) -> str:
+        """Call 메시지 생성 (message_id 미지정 시 UUID 자동 생성)"""
+        if message_id is None:
+            message_id = str(uuid.uuid4())
+        return _codec.dumps_str([OCPPMessage.CALL, message_id, action, payload])
 
     @staticmethod
     def create_call_result(message_id: str, payload: Dict[str, Any]) -> str:
         """CallResult 메시지 생성"""
-        message = [OCPPMessage.CALLRESULT, message_id, payload]
-        result = json.dumps(message)
-        if PROTOCOL_DEBUG:
-            logger.debug(f"[OCPP-CALLRESULT-SEND] ID: {message_id}")
-            logger.debug(f"[OCPP-RESPONSE-SEND] {json.dumps(payload, indent=2, ensure_ascii=False)}")
-        return result
+        return _codec.dumps_str([OCPPMessage.CALLRESULT, message_id, payload])
 
     @staticmethod
     def create_call_error(message_id: str, error_code: str, error_message: str) -> str:
         """CallError 메시지 생성"""
-        message = [OCPPMessage.CALLERROR, message_id, error_code, error_message]
-        result = json.dumps(message)
-        if PROTOCOL_DEBUG:
-            logger.debug(f"[OCPP-CALLERROR-SEND] ID: {message_id}")
-            logger.debug(f"[OCPP-ERROR-SEND] Code: {error_code}, Message: {error_message}")
-        return result
+        return _codec.dumps_str([OCPPMessage.CALLERROR, message_id, error_code, error_message])
 
     @staticmethod
-    def parse_message(message: str) -> Tuple[int, str, str, Dict[str, Any]]:
-        """메시지 파싱"""
+    def encode_call(action: str, payload: Dict[str, Any], message_id: Optional[str] = None) -> bytes:
+        """Call 메시지 생성 (웹소켓 전송용 UTF-8 bytes)"""
+        if message_id is None:
+            message_id = str(uuid.uuid4())
+        return _codec.dumps([OCPPMessage.CALL, message_id, action, payload])
+
+    @staticmethod
+    def encode_call_result(message_id: str, payload: Dict[str, Any]) -> bytes:
+        """CallResult 메시지 생성 (웹소켓 전송용 UTF-8 bytes)"""
+        return _codec.dumps([OCPPMessage.CALLRESULT, message_id, payload])
+
+    @staticmethod
+    def encode_call_error(message_id: str, error_code: str, error_message: str) -> bytes:
+        """CallError 메시지 생성 (웹소켓 전송용 UTF-8 bytes)"""
+        return _codec.dumps([OCPPMessage.CALLERROR, message_id, error_code, error_message])
+
+    @staticmethod
+    def parse_message(message: Union[str, bytes]) -> Tuple[int, str, str, Dict[str, Any]]:
+        """메시지 파싱 (str/bytes 모두 지원)"""
         try:
-            if PROTOCOL_DEBUG:
-                logger.debug(f"[OCPP-RAW-RECV] {message}")
-            
-            data = json.loads(message)
+            data = _codec.loads(message)
             if not isinstance(data, list) or len(data) < 3:
                 raise ValueError("Invalid message format")
             
@@ -69,26 +87,17 @@ class OCPPMessage:
             if message_type == OCPPMessage.CALL:
                 action = data[2]
                 payload = data[3] if len(data) > 3 else {}
-                if PROTOCOL_DEBUG:
-                    logger.debug(f"[OCPP-CALL-RECV] Action: {action}, ID: {message_id}")
-                    logger.debug(f"[OCPP-PAYLOAD-RECV] {json.dumps(payload, indent=2, ensure_ascii=False)}")
                 return message_type, message_id, action, payload
             elif message_type == OCPPMessage.CALLRESULT:
                 payload = data[2] if len(data) > 2 else {}
-                if PROTOCOL_DEBUG:
-                    logger.debug(f"[OCPP-CALLRESULT-RECV] ID: {message_id}")
-                    logger.debug(f"[OCPP-RESPONSE-RECV] {json.dumps(payload, indent=2, ensure_ascii=False)}")
                 return message_type, message_id, "", payload
             elif message_type == OCPPMessage.CALLERROR:
                 error_code = data[2]
                 error_message = data[3] if len(data) > 3 else ""
-                if PROTOCOL_DEBUG:
-                    logger.debug(f"[OCPP-CALLERROR-RECV] ID: {message_id}")
-                    logger.debug(f"[OCPP-ERROR-RECV] Code: {error_code}, Message: {error_message}")
                 return message_type, message_id, error_code, {"errorMessage": error_message}
             else:
                 raise ValueError(f"Unknown message type: {message_type}")
-        except json.JSONDecodeError as e:
+        except _codec.decode_error as e:
             raise ValueError(f"JSON decode error: {e}")
 
 
@@ -100,7 +109,8 @@ class OCPPv201RequestBuilder:
         charger_model: str,
         charger_vendor: str,
         charger_serial: str = "CHARGER001",
-        reason: str = "PowerUp"
+        reason: str = "PowerUp",
+        message_id: Optional[str] = None
     ) -> str:
         """부팅 알림 요청"""
         payload = {
@@ -112,18 +122,19 @@ class OCPPv201RequestBuilder:
                 "firmwareVersion": "1.0.0"
             }
         }
-        return OCPPMessage.create_call("BootNotification", payload)
+        return OCPPMessage.create_call("BootNotification", payload, message_id)
 
     @staticmethod
-    def heartbeat() -> str:
+    def heartbeat(message_id: Optional[str] = None) -> str:
         """하트비트 요청"""
-        return OCPPMessage.create_call("Heartbeat", {})
+        return OCPPMessage.create_call("Heartbeat", {}, message_id)
 
     @staticmethod
     def status_notification(
         evse_id: int,
         connector_id: int,
-        status: str = "Available"
+        status: str = "Available",
+        message_id: Optional[str] = None
     ) -> str:
         """상태 알림 요청"""
         payload = {
@@ -132,7 +143,7 @@ class OCPPv201RequestBuilder:
             "evseId": evse_id,
             "connectorId": connector_id
         }
-        return OCPPMessage.create_call("StatusNotification", payload)
+        return OCPPMessage.create_call("StatusNotification", payload, message_id)
 
     @staticmethod
     def transaction_event(
@@ -142,7 +153,8 @@ class OCPPv201RequestBuilder:
         connector_id: int,
         meter_value: float = 0.0,
         voltage: float = 400.0,
-        current: float = 0.0
+        current: float = 0.0,
+        message_id: Optional[str] = None
     ) -> str:
         """트랜잭션 이벤트 요청"""
         power = voltage * current
@@ -177,10 +189,10 @@ class OCPPv201RequestBuilder:
             "evseId": evse_id,
             "connectorId": connector_id
         }
-        return OCPPMessage.create_call("TransactionEvent", payload)
+        return OCPPMessage.create_call("TransactionEvent", payload, message_id)
 
     @staticmethod
-    def authorize(id_token: str) -> str:
+    def authorize(id_token: str, message_id: Optional[str] = None) -> str:
         """인증 요청"""
         payload = {
             "idToken": {
@@ -188,4 +200,40 @@ class OCPPv201RequestBuilder:
                 "type": "Central"
             }
         }
-        return OCPPMessage.create_call("Authorize", payload)
+        return OCPPMessage.create_call("Authorize", payload, message_id)
+
+
+# meterValue 항목 하나 (값 자리만 남긴 JSON 조각)
+_METER_VALUE_TEMPLATE = (
+    '{"timestamp":"%s","sampledValue":['
+    '{"value":%.1f,"measurand":"Energy.Active.Import.Register","unitOfMeasure":{"unit":"Wh"}},'
+    '{"value":%.1f,"measurand":"Power.Active.Import","unitOfMeasure":{"unit":"W"}}]}'
+)
+
+
+class TransactionEventTemplate:
+    """
+    거래 하나의 Updated TransactionEvent 프레임 템플릿
+
+    거래 ID/EVSE 등 고정 부분은 거래 시작 시 한 번만 JSON 조각으로 만들어 두고,
+    프레임마다 샘플 값만 문자열 포매팅으로 채운다 (dict 트리 생성/JSON 인코딩 없음).
+    여러 샘플을 meterValue 배열 하나에 모아 보낸다.
+    """
+
+    __slots__ = ("_head", "seq_no")
+
+    def __init__(self, transaction_id: str, evse_id: int = 1, connector_id: int = 1, seq_no: int = 0):
+        self._head = (
+            '","TransactionEvent",{"eventType":"Updated","triggerReason":"MeterValuePeriodic",'
+            '"transactionInfo":{"transactionId":' + _codec.dumps_str(transaction_id)
+            + ',"chargingState":"Charging"},"evse":{"id":%d,"connectorId":%d},' % (evse_id, connector_id)
+        )
+        self.seq_no = seq_no
+
+    def updated(self, message_id: str, samples: List[MeterSample]) -> str:
+        """샘플 묶음으로 Updated CALL 프레임 생성"""
+        self.seq_no += 1
+        meter_values = ",".join([_METER_VALUE_TEMPLATE % sample for sample in samples])
+        return '[2,"%s%s"timestamp":"%s","seqNo":%d,"meterValue":[%s]}]' % (
+            message_id, self._head, samples[-1][0], self.seq_no, meter_values
+        )
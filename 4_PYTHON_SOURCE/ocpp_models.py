@@ -2,9 +2,9 @@
 OCPP 2.0.1 데이터 모델 정의
 """
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Callable, Iterable, Type
 from enum import Enum
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 
 
 # Enums
@@ -54,6 +54,39 @@ class TransactionEventEnum(str, Enum):
     ENDED = "Ended"
 
 
+class EventTriggerEnum(str, Enum):
+    """이벤트 알림 발생 원인"""
+    ALERTING = "Alerting"
+    DELTA = "Delta"
+    PERIODIC = "Periodic"
+
+
+class EventNotificationEnum(str, Enum):
+    """이벤트 알림 종류"""
+    HARD_WIRED_NOTIFICATION = "HardWiredNotification"
+    HARD_WIRED_MONITOR = "HardWiredMonitor"
+    PRECONFIGURED_MONITOR = "PreconfiguredMonitor"
+    CUSTOM_MONITOR = "CustomMonitor"
+
+
+class FirmwareStatusEnum(str, Enum):
+    """펌웨어 업데이트 상태"""
+    DOWNLOADED = "Downloaded"
+    DOWNLOAD_FAILED = "DownloadFailed"
+    DOWNLOADING = "Downloading"
+    DOWNLOAD_SCHEDULED = "DownloadScheduled"
+    DOWNLOAD_PAUSED = "DownloadPaused"
+    IDLE = "Idle"
+    INSTALLATION_FAILED = "InstallationFailed"
+    INSTALLING = "Installing"
+    INSTALLED = "Installed"
+    INSTALL_REBOOTING = "InstallRebooting"
+    INSTALL_SCHEDULED = "InstallScheduled"
+    INSTALL_VERIFICATION_FAILED = "InstallVerificationFailed"
+    INVALID_SIGNATURE = "InvalidSignature"
+    SIGNATURE_VERIFIED = "SignatureVerified"
+
+
 class ReasonEnum(str, Enum):
     """종료 이유"""
     DE_AUTHORIZED = "DeAuthorized"
@@ -132,6 +165,56 @@ class MeterValue(BaseModel):
     sampledValue: List[Dict[str, Any]] = []
 
 
+class MeterValuesRequest(BaseModel):
+    """미터 값 요청 (거래 외 측정값)"""
+    evseId: int
+    meterValue: List[MeterValue] = Field(..., min_length=1)
+
+
+class ComponentModel(BaseModel):
+    """장치 모델 컴포넌트"""
+    name: str
+    instance: Optional[str] = None
+    evse: Optional[Dict[str, Any]] = None
+
+
+class VariableModel(BaseModel):
+    """장치 모델 변수"""
+    name: str
+    instance: Optional[str] = None
+
+
+class EventDataModel(BaseModel):
+    """이벤트 알림 항목"""
+    eventId: int
+    timestamp: datetime
+    trigger: EventTriggerEnum
+    actualValue: str
+    component: ComponentModel
+    variable: VariableModel
+    eventNotificationType: EventNotificationEnum
+    cause: Optional[int] = None
+    techCode: Optional[str] = None
+    techInfo: Optional[str] = None
+    cleared: Optional[bool] = None
+    transactionId: Optional[str] = None
+    variableMonitoringId: Optional[int] = None
+
+
+class NotifyEventRequest(BaseModel):
+    """이벤트 알림 요청"""
+    generatedAt: datetime
+    seqNo: int
+    eventData: List[EventDataModel] = Field(..., min_length=1)
+    tbc: bool = False
+
+
+class FirmwareStatusNotificationRequest(BaseModel):
+    """펌웨어 상태 알림 요청"""
+    status: FirmwareStatusEnum
+    requestId: Optional[int] = None
+
+
 class TransactionEventRequest(BaseModel):
     """트랜잭션 이벤트 요청"""
     eventType: TransactionEventEnum
@@ -175,3 +258,50 @@ class AuthorizeResponse(BaseModel):
     """인증 응답"""
     idTokenInfo: Dict[str, Any]
     certificateStatus: Optional[str] = None
+
+
+# 충전기 -> 서버 요청 액션별 검증 모델
+REQUEST_MODELS: Dict[str, Type[BaseModel]] = {
+    "BootNotification": BootNotificationRequest,
+    "Heartbeat": HeartbeatRequest,
+    "TransactionEvent": TransactionEventRequest,
+    "StatusNotification": StatusNotificationRequest,
+    "Authorize": AuthorizeRequest,
+    "MeterValues": MeterValuesRequest,
+    "NotifyEvent": NotifyEventRequest,
+    "FirmwareStatusNotification": FirmwareStatusNotificationRequest,
+}
+
+PayloadValidator = Callable[[Dict[str, Any]], Any]
+
+
+def compile_request_validators(actions: Optional[Iterable[str]] = None) -> Dict[str, PayloadValidator]:
+    """
+    요청 페이로드 검증기 생성 (서버 시작 시 한 번만 호출)
+
+    TypeAdapter는 생성 시 검증 스키마를 컴파일하므로, 메시지마다 만들지 않고
+    여기서 만든 validate_python을 재사용한다.
+
+    Args:
+        actions: 검증할 액션 목록 (None이면 REQUEST_MODELS 전체)
+
+    Returns:
+        액션 이름 -> 검증 함수 (실패 시 pydantic.ValidationError)
+    """
+    names = REQUEST_MODELS.keys() if actions is None else actions
+    return {
+        action: TypeAdapter(REQUEST_MODELS[action]).validate_python
+        for action in names
+        if action in REQUEST_MODELS
+    }
+
+
+def describe_validation_error(error: ValidationError) -> str:
+    """CallError 설명용 검증 오류 요약 (첫 번째 오류 위치와 사유)"""
+    details = error.errors()
+    if not details:
+        return "Payload validation failed"
+    first = details[0]
+    location = ".".join(str(part) for part in first.get("loc", ())) or "payload"
+    suffix = f" (+{len(details) - 1} more)" if len(details) > 1 else ""
+    return f"{location}: {first.get('msg')}{suffix}"
@@ -2,20 +2,36 @@
 OCPP 2.0.1 중앙 서버
 """
 import asyncio
+import inspect
 import websockets
 import logging
 import os
+import socket
 import sys
-from typing import Dict, Set, Optional, Any
+import time
+import uuid
+from typing import Dict, List, Set, Optional, Any, Callable, Awaitable, Tuple, Union, TYPE_CHECKING
+from collections import deque
 from datetime import datetime
+from pydantic import ValidationError
 
 # 프로젝트 루트 경로 추가 (4_PYTHON_SOURCE에서 실행할 때도 지원)
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 sys.path.insert(0, os.path.join(project_root, '8_DATABASE'))
+# 루트의 구버전 모듈(ocpp_messages.py 등)보다 이 디렉토리의 모듈을 우선 사용
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from ocpp_messages import OCPPMessage, OCPPv201RequestBuilder
+from protocol_trace import get_trace, DIRECTION_SEND, DIRECTION_RECV
+from ocpp_models import compile_request_validators, describe_validation_error
+from liveness import LivenessWheel
+from latency_histogram import LatencyHistogram
+
+if TYPE_CHECKING:
+    from persistence import PersistencePipeline
+    from live_push import LivePublisher
 
 # 로깅 설정
 logging.basicConfig(
@@ -24,42 +40,302 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# 상세 프로토콜 로깅 활성화 여부
+# 상세 프로토콜 로깅 활성화 여부 (송수신 프레임을 protocol_trace에 한 번만 기록)
 PROTOCOL_DEBUG = os.getenv('OCPP_PROTOCOL_DEBUG', 'false').lower() == 'true'
 
+# 수신 요청 페이로드 스키마 검증 활성화 여부 (ocpp_models 기반)
+VALIDATE_PAYLOADS = os.getenv('OCPP_VALIDATE_PAYLOADS', 'false').lower() == 'true'
 
-class ChargerConnection:
-    """충전기 연결 관리"""
+# BootNotification 응답으로 충전기에 알려주는 하트비트 주기 (초)
+HEARTBEAT_INTERVAL = 300
+# 이 시간 동안 아무 프레임도 받지 못한 충전기는 오프라인 처리 (기본: 하트비트 주기의 2배)
+LIVENESS_TIMEOUT = float(os.getenv('OCPP_LIVENESS_TIMEOUT', str(HEARTBEAT_INTERVAL * 2)))
+
+# 서버 발신 CALL 기본 응답 대기 시간 (초)
+DEFAULT_CALL_TIMEOUT = 30.0
+# 동시에 응답을 기다릴 수 있는 최대 CALL 수
+MAX_PENDING_REQUESTS = 10000
+
+# 연결별 송신 큐 크기 및 큐 초과 시 정책
+DEFAULT_SEND_QUEUE_SIZE = 1000
+# 송신 태스크가 한 번에 소켓 버퍼에 쓰고 drain하는 최대 메시지 수
+SEND_BATCH_SIZE = int(os.getenv('OCPP_SEND_BATCH_SIZE', '64'))
+OVERFLOW_DROP = "drop"    # 새 메시지를 버리고 연결 유지
+OVERFLOW_CLOSE = "close"  # 느린 충전기 연결을 끊음
+
+
+class OCPPCallError(Exception):
+    """충전기가 CALLERROR로 응답한 경우"""
+
+    def __init__(self, error_code: str, error_message: str = ""):
+        super().__init__(f"{error_code}: {error_message}")
+        self.error_code = error_code
+        self.error_message = error_message
+
+
+# 웹소켓 구현별 bytes 텍스트 프레임 전송 지원 여부 캐시
+_TEXT_BYTES_SUPPORT: Dict[type, bool] = {}
+
+
+def _supports_text_bytes(websocket) -> bool:
+    """websocket.send(bytes, text=True) 지원 여부 (websockets 13+)"""
+    cls = type(websocket)
+    supported = _TEXT_BYTES_SUPPORT.get(cls)
+    if supported is None:
+        try:
+            supported = "text" in inspect.signature(websocket.send).parameters
+        except (TypeError, ValueError):
+            supported = False
+        _TEXT_BYTES_SUPPORT[cls] = supported
+    return supported
+
+
+# 웹소켓 구현별 일괄 프레임 쓰기 지원 여부 캐시
+_BATCH_WRITE_SUPPORT: Dict[type, bool] = {}
+
+
+def _supports_batch_write(websocket) -> bool:
+    """send_context()/protocol.send_text()로 여러 프레임을 쓰고 한 번에 flush 가능 여부 (websockets 13+ asyncio 구현)"""
+    cls = type(websocket)
+    supported = _BATCH_WRITE_SUPPORT.get(cls)
+    if supported is None:
+        supported = callable(getattr(cls, "send_context", None)) and hasattr(websocket, "protocol")
+        _BATCH_WRITE_SUPPORT[cls] = supported
+    return supported
+
+
+# 완료 전까지 참조를 유지하는 소켓 종료 태스크 (참조가 없으면 실행 전에 GC될 수 있음)
+_closing_tasks: Set[asyncio.Task] = set()
+
+
+def _on_close_done(task: asyncio.Task):
+    _closing_tasks.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.debug(f"소켓 종료 실패: {task.exception()}")
+
+
+def close_websocket_soon(websocket) -> asyncio.Task:
+    """동기 콜백/송신 경로에서 소켓 종료 예약 (태스크 참조 유지, 예외는 회수 후 로그)"""
+    task = asyncio.create_task(websocket.close())
+    _closing_tasks.add(task)
+    task.add_done_callback(_on_close_done)
+    return task
+
+
+# 충전기당 보관하는 종료 거래 수 (초과 시 가장 오래된 거래부터 제거)
+MAX_STORED_TRANSACTIONS = int(os.getenv('OCPP_MAX_STORED_TRANSACTIONS', '100'))
+
+
+def monotonic_to_iso(timestamp: float) -> str:
+    """time.monotonic 기준 시각을 현재 벽시계 기준 ISO 문자열로 변환 (출력 시에만 사용)"""
+    return datetime.fromtimestamp(time.time() - (time.monotonic() - timestamp)).isoformat()
+
+
+def read_meter_values(meter_values: List[Dict[str, Any]]) -> Tuple[Optional[float], Optional[float]]:
+    """
+    OCPP 2.0.1 meterValue 배열에서 마지막 누적 에너지(kWh)와 순간 전력(W) 추출
+
+    measurand가 없으면 Energy.Active.Import.Register, 단위가 없으면 Wh/W로 본다 (OCPP 기본값).
+    unitOfMeasure.multiplier(10의 거듭제곱)와 kWh/kW 단위를 반영한다.
+    여러 샘플이 묶여 오면 배열 순서상 마지막 값을 사용한다.
+    """
+    energy_kwh = None
+    power_w = None
+    for meter_value in meter_values:
+        for sampled in meter_value.get("sampledValue", []):
+            measurand = sampled.get("measurand", "Energy.Active.Import.Register")
+            unit = sampled.get("unitOfMeasure") or {}
+            value = float(sampled.get("value", 0)) * (10 ** unit.get("multiplier", 0))
+            if measurand == "Energy.Active.Import.Register":
+                energy_kwh = value if unit.get("unit") == "kWh" else value / 1000.0
+            elif measurand == "Power.Active.Import":
+                power_w = value * 1000.0 if unit.get("unit") == "kW" else value
+    return energy_kwh, power_w
 
-    def __init__(self, charger_id: str, websocket, path: str):
+
+# 액션 핸들러 시그니처: (charger, message_id, payload) -> None
+ActionHandler = Callable[["ChargerConnection", str, Dict[str, Any]], Awaitable[None]]
+
+
+class ChargerConnection:
+    """
+    충전기 연결 관리
+
+    동시 접속 10만 대 규모를 고려해 __slots__로 인스턴스 __dict__를 없애고,
+    시각은 time.monotonic float로 보관한다. 송신 큐는 첫 적재 시 만들고,
+    송신 태스크는 큐에 메시지가 있는 동안에만 실행한다.
+    """
+
+    __slots__ = (
+        "charger_id", "websocket", "path", "connected", "last_heartbeat", "last_seen",
+        "boot_status", "transactions", "pending_calls", "send_queue", "send_queue_size",
+        "overflow_policy", "writer_enabled", "writer_task", "sent_count", "dropped_count", "max_queue_depth",
+        "__weakref__"
+    )
+
+    def __init__(
+        self,
+        charger_id: str,
+        websocket,
+        path: str,
+        send_queue_size: int = DEFAULT_SEND_QUEUE_SIZE,
+        overflow_policy: str = OVERFLOW_DROP
+    ):
         self.charger_id = charger_id
         self.websocket = websocket
         self.path = path
         self.connected = True
-        self.last_heartbeat = datetime.now()
+        now = time.monotonic()
+        # 마지막 부팅/하트비트 시각 (time.monotonic, 출력 시 monotonic_to_iso로 변환)
+        self.last_heartbeat = now
+        # 마지막 수신 시각 (time.monotonic, LivenessWheel이 만료 여부 판단에 사용)
+        self.last_seen = now
         self.boot_status = False
+        # 종료 거래 (삽입 순서 유지, 최대 MAX_STORED_TRANSACTIONS건)
         self.transactions: Dict[str, dict] = {}
+        # 이 충전기로 보낸 뒤 응답을 기다리는 CALL 메시지 ID
+        self.pending_calls: Set[str] = set()
+        # 송신 큐 (송신 태스크가 소비, 첫 적재 시 생성)
+        self.send_queue: Optional[deque] = None
+        self.send_queue_size = send_queue_size
+        self.overflow_policy = overflow_policy
+        self.writer_enabled = False
+        self.writer_task: Optional[asyncio.Task] = None
+        # 송신 큐 지표
+        self.sent_count = 0
+        self.dropped_count = 0
+        self.max_queue_depth = 0
+
+    def start_writer(self):
+        """큐 기반 송신 활성화 (송신 태스크는 보낼 메시지가 있을 때만 실행)"""
+        self.writer_enabled = True
+
+    async def stop_writer(self):
+        """큐 기반 송신 비활성화 (남은 메시지는 폐기)"""
+        self.writer_enabled = False
+        task = self.writer_task
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+            self.writer_task = None
+        if self.send_queue is not None:
+            self.send_queue.clear()
+
+    async def send(self, message: Union[str, bytes]):
+        """
+        메시지 전송
+
+        큐 기반 송신이 활성화되어 있으면 큐에 적재만 하고 즉시 반환하므로 느린 소켓이
+        호출한 핸들러를 지연시키지 않는다. 비활성화 상태면 직접 전송한다.
+        """
+        if not self.connected:
+            return
 
-    async def send(self, message: str):
-        """메시지 전송"""
+        if not self.writer_enabled:
+            await self._write(message)
+            return
+
+        queue = self.send_queue
+        if queue is None:
+            queue = self.send_queue = deque()
+        if len(queue) >= self.send_queue_size:
+            self.dropped_count += 1
+            if self.overflow_policy == OVERFLOW_CLOSE:
+                logger.error(f"송신 큐 초과, 연결 종료 ({self.charger_id})")
+                self.connected = False
+                close_websocket_soon(self.websocket)
+            else:
+                logger.warning(f"송신 큐 초과, 메시지 폐기 ({self.charger_id}): 누적 {self.dropped_count}건")
+            return
+
+        queue.append(message)
+        depth = len(queue)
+        if depth > self.max_queue_depth:
+            self.max_queue_depth = depth
+        if self.writer_task is None:
+            self.writer_task = asyncio.create_task(self._drain_queue())
+
+    async def _write(self, message: Union[str, bytes]):
+        """웹소켓으로 실제 전송 (OCPP-J는 텍스트 프레임만 허용하므로 bytes도 텍스트로 전송)"""
         try:
             if PROTOCOL_DEBUG:
-                logger.debug(f"[SERVER-SEND] {self.charger_id}: {message}")
-            await self.websocket.send(message)
+                get_trace().record(self.charger_id, DIRECTION_SEND, message)
+            if isinstance(message, bytes):
+                if _supports_text_bytes(self.websocket):
+                    await self.websocket.send(message, text=True)
+                else:
+                    await self.websocket.send(message.decode("utf-8"))
+            else:
+                await self.websocket.send(message)
+            self.sent_count += 1
         except Exception as e:
             logger.error(f"메시지 전송 실패 ({self.charger_id}): {e}")
             self.connected = False
 
+    async def _write_batch(self, messages: List[Union[str, bytes]]):
+        """
+        여러 메시지를 각각 텍스트 프레임으로 소켓 버퍼에 쓴 뒤 한 번만 flush/drain
+
+        큐 기반 송신에서는 송신 태스크만 이 연결에 쓰므로 websocket.send()의 조각 메시지 대기를 생략한다.
+        """
+        websocket = self.websocket
+        try:
+            async with websocket.send_context():
+                for message in messages:
+                    if PROTOCOL_DEBUG:
+                        get_trace().record(self.charger_id, DIRECTION_SEND, message)
+                    websocket.protocol.send_text(message if isinstance(message, bytes) else message.encode("utf-8"))
+            self.sent_count += len(messages)
+        except Exception as e:
+            logger.error(f"메시지 전송 실패 ({self.charger_id}): {e}")
+            self.connected = False
+
+    async def _drain_queue(self):
+        """
+        송신 큐를 비울 때까지 전송하고 종료 (유휴 연결은 송신 태스크를 보유하지 않음)
+
+        여러 메시지가 쌓여 있으면 SEND_BATCH_SIZE개씩 묶어 한 번에 쓴다
+        (일괄 쓰기를 지원하지 않는 웹소켓은 한 건씩 전송).
+        """
+        queue = self.send_queue
+        batch_write = _supports_batch_write(self.websocket)
+        try:
+            while queue and self.connected:
+                if batch_write and len(queue) > 1:
+                    await self._write_batch([queue.popleft() for _ in range(min(len(queue), SEND_BATCH_SIZE))])
+                else:
+                    await self._write(queue.popleft())
+        finally:
+            self.writer_task = None
+
+    def store_transaction(self, transaction_id: str, record: dict):
+        """종료 거래 보관 (상한 초과 시 가장 오래된 거래 제거)"""
+        transactions = self.transactions
+        transactions.pop(transaction_id, None)
+        transactions[transaction_id] = record
+        while len(transactions) > MAX_STORED_TRANSACTIONS:
+            del transactions[next(iter(transactions))]
+
+    def get_send_metrics(self) -> Dict[str, int]:
+        """송신 큐 지표 조회"""
+        return {
+            "queue_depth": len(self.send_queue) if self.send_queue is not None else 0,
+            "max_queue_depth": self.max_queue_depth,
+            "sent": self.sent_count,
+            "dropped": self.dropped_count
+        }
+
     async def receive(self) -> Optional[str]:
-        """메시지 수신"""
+        """메시지 수신 (수신 타임아웃은 서버의 LivenessWheel이 일괄 감시)"""
         try:
-            msg = await asyncio.wait_for(self.websocket.recv(), timeout=60.0)
+            msg = await self.websocket.recv()
+            self.last_seen = time.monotonic()
             if PROTOCOL_DEBUG:
-                logger.debug(f"[SERVER-RECV] {self.charger_id}: {msg}")
+                get_trace().record(self.charger_id, DIRECTION_RECV, msg)
             return msg
-        except asyncio.TimeoutError:
-            logger.warning(f"메시지 수신 타임아웃 ({self.charger_id})")
-            return None
         except websockets.exceptions.ConnectionClosed:
             logger.warning(f"연결 종료 ({self.charger_id})")
             self.connected = False
@@ -73,28 +349,167 @@ class ChargerConnection:
 class OCPPServer:
     """OCPP 2.0.1 중앙 서버"""
 
-    def __init__(self, host: str = "0.0.0.0", port: int = 9000):
+    def __init__(
+        self,
+        host: str = "0.0.0.0",
+        port: int = 9000,
+        call_timeout: float = DEFAULT_CALL_TIMEOUT,
+        max_pending_requests: int = MAX_PENDING_REQUESTS,
+        send_queue_size: int = DEFAULT_SEND_QUEUE_SIZE,
+        send_overflow_policy: str = OVERFLOW_DROP,
+        validate_payloads: Optional[bool] = None,
+        liveness_timeout: float = LIVENESS_TIMEOUT,
+        persistence: Optional["PersistencePipeline"] = None,
+        live: Optional["LivePublisher"] = None
+    ):
         self.host = host
         self.port = port
         self.chargers: Dict[str, ChargerConnection] = {}
         self.shutdown_event = asyncio.Event()  # 종료 이벤트
+        # 메시지 ID -> {"future", "charger_id", "action", "sent_at"}
         self.pending_requests: Dict[str, dict] = {}
+        self.call_timeout = call_timeout
+        self.max_pending_requests = max_pending_requests
+        self.send_queue_size = send_queue_size
+        self.send_overflow_policy = send_overflow_policy
+        # 액션 이름 -> 핸들러 코루틴 (O(1) 디스패치)
+        self.handlers: Dict[str, ActionHandler] = {}
+        # 액션별 처리 통계 (단일 디스패치 지점에서 집계)
+        self.action_stats: Dict[str, Dict[str, Any]] = {}
+        # 액션 이름 -> 컴파일된 페이로드 검증기 (검증 비활성화 시 비어 있음)
+        if validate_payloads is None:
+            validate_payloads = VALIDATE_PAYLOADS
+        self.validators: Dict[str, Callable[[Dict[str, Any]], Any]] = (
+            compile_request_validators() if validate_payloads else {}
+        )
+        # 모든 연결의 마지막 수신 시각을 감시하는 단일 타이머 휠
+        self.liveness = LivenessWheel(liveness_timeout, self._on_liveness_expired)
+        # DB 비동기 저장 파이프라인 (None이면 OCPP_PERSISTENCE 환경변수에 따라 생성)
+        if persistence is None and os.getenv('OCPP_PERSISTENCE', 'false').lower() == 'true':
+            from persistence import create_pipeline_from_env
+            persistence = create_pipeline_from_env()
+        self.persistence = persistence
+        # 대시보드 실시간 전달기 (None이면 OCPP_LIVE_PUSH_URL 환경변수에 따라 생성)
+        if live is None and os.getenv('OCPP_LIVE_PUSH_URL'):
+            from live_push import create_publisher_from_env
+            live = create_publisher_from_env()
+        self.live = live
+        self._register_default_handlers()
+
+    def _register_default_handlers(self):
+        """기본 OCPP 2.0.1 액션 핸들러 등록"""
+        self.register_handler("BootNotification", self.handle_boot_notification)
+        self.register_handler("Heartbeat", self.handle_heartbeat)
+        self.register_handler("StatusNotification", self.handle_status_notification)
+        self.register_handler("TransactionEvent", self.handle_transaction_event)
+        self.register_handler("Authorize", self.handle_authorize)
+        self.register_handler("MeterValues", self.handle_meter_values)
+        self.register_handler("NotifyEvent", self.handle_notify_event)
+        self.register_handler("FirmwareStatusNotification", self.handle_firmware_status_notification)
+
+    def register_handler(self, action: str, handler: Optional[ActionHandler] = None):
+        """
+        액션 핸들러 등록
+
+        직접 호출하거나 데코레이터로 사용할 수 있다. 같은 액션을 다시 등록하면
+        기존 핸들러를 대체한다.
+
+        Examples:
+            server.register_handler("DataTransfer", handle_data_transfer)
+
+            @server.register_handler("NotifyReport")
+            async def handle_notify_report(charger, message_id, payload):
+                ...
+        """
+        if handler is None:
+            def decorator(func: ActionHandler) -> ActionHandler:
+                self.handlers[action] = func
+                return func
+            return decorator
+
+        self.handlers[action] = handler
+        return handler
+
+    def unregister_handler(self, action: str) -> bool:
+        """액션 핸들러 등록 해제"""
+        return self.handlers.pop(action, None) is not None
+
+    def get_action_stats(self) -> Dict[str, Dict[str, float]]:
+        """액션별 처리 건수/오류/지연시간(ms, 평균/p50/p99/최대) 통계 조회"""
+        result = {}
+        for action, stats in self.action_stats.items():
+            count = stats["count"]
+            histogram = stats["histogram"]
+            result[action] = {
+                "count": count,
+                "errors": stats["errors"],
+                "avg_ms": (stats["total_time"] / count) * 1000 if count else 0.0,
+                "p50_ms": histogram.percentile(50) * 1000,
+                "p99_ms": histogram.percentile(99) * 1000,
+                "max_ms": stats["max_time"] * 1000
+            }
+        return result
+
+    def reset_action_stats(self):
+        """액션별 통계 초기화 (벤치마크 구간 측정용)"""
+        self.action_stats.clear()
+
+    def _record_action_stats(self, action: str, elapsed: float, failed: bool):
+        """액션 처리 통계 갱신"""
+        stats = self.action_stats.get(action)
+        if stats is None:
+            stats = {"count": 0, "errors": 0, "total_time": 0.0, "max_time": 0.0, "histogram": LatencyHistogram()}
+            self.action_stats[action] = stats
+        stats["histogram"].record(elapsed)
+        stats["count"] += 1
+        stats["total_time"] += elapsed
+        if elapsed > stats["max_time"]:
+            stats["max_time"] = elapsed
+        if failed:
+            stats["errors"] += 1
+
+    async def start(self, sock: Optional[socket.socket] = None):
+        """
+        서버 시작
+
+        Args:
+            sock: 미리 바인딩된 리스닝 소켓 (샤딩 워커가 SO_REUSEPORT 소켓을 넘길 때 사용).
+                  None이면 host/port로 직접 바인딩한다.
+        """
+        if sock is not None:
+            listen_args = {"sock": sock}
+        else:
+            listen_args = {"host": self.host, "port": self.port}
 
-    async def start(self):
-        """서버 시작"""
-        # Windows 시스템에서 TIME_WAIT 상태의 포트를 빠르게 재사용하기 위해
-        # 소켓 옵션 설정
         async with websockets.serve(
             self.handle_charger_connection,
-            self.host,
-            self.port,
             subprotocols=["ocpp2.0.1"],
             ping_interval=20,
-            ping_timeout=20
+            ping_timeout=20,
+            **listen_args
         ):
             logger.info(f"OCPP 2.0.1 서버 시작: ws://{self.host}:{self.port}")
-            # 종료 이벤트를 기다림 (기본적으로 무한 대기)
-            await self.shutdown_event.wait()
+            self.liveness.start()
+            if self.persistence is not None:
+                self.persistence.start()
+            if self.live is not None:
+                self.live.start()
+            try:
+                # 종료 이벤트를 기다림 (기본적으로 무한 대기)
+                await self.shutdown_event.wait()
+            finally:
+                await self.liveness.stop()
+                if self.persistence is not None:
+                    await self.persistence.stop()
+                if self.live is not None:
+                    await self.live.stop()
+
+    def _on_liveness_expired(self, charger: ChargerConnection):
+        """생존 타임아웃: 오프라인 처리 후 소켓 종료 (정리는 연결 핸들러의 finally에서 수행)"""
+        idle = time.monotonic() - charger.last_seen
+        logger.warning(f"충전기 응답 없음, 오프라인 처리 ({charger.charger_id}): {idle:.0f}초 동안 수신 없음")
+        charger.connected = False
+        close_websocket_soon(charger.websocket)
 
 
     async def handle_charger_connection(self, websocket):
@@ -124,8 +539,14 @@ class OCPPServer:
         logger.info(f"충전기 연결: {charger_id}")
         
         # 충전기 연결 객체 생성
-        charger = ChargerConnection(charger_id, websocket, path)
+        charger = ChargerConnection(
+            charger_id, websocket, path,
+            send_queue_size=self.send_queue_size,
+            overflow_policy=self.send_overflow_policy
+        )
         self.chargers[charger_id] = charger
+        self.liveness.add(charger)
+        charger.start_writer()
 
         try:
             # 메시지 수신 및 처리 루프
@@ -149,7 +570,8 @@ class OCPPServer:
                             await self.handle_response(charger_id, message_id, payload)
                         
                         elif message_type == OCPPMessage.CALLERROR:
-                            logger.error(f"오류 응답 ({charger_id}): {action}")
+                            # action 자리에 오류 코드가 전달됨
+                            await self.handle_call_error(charger_id, message_id, action, payload)
                     
                     except Exception as e:
                         logger.error(f"메시지 처리 오류 ({charger_id}): {type(e).__name__}: {e}", exc_info=True)
@@ -157,9 +579,6 @@ class OCPPServer:
                 except asyncio.CancelledError:
                     logger.info(f"연결 취소됨: {charger_id}")
                     break
-                except asyncio.TimeoutError:
-                    logger.warning(f"메시지 수신 타임아웃: {charger_id}")
-                    continue
                 except Exception as e:
                     logger.error(f"메시지 수신 오류 ({charger_id}): {type(e).__name__}: {e}")
                     break
@@ -169,82 +588,97 @@ class OCPPServer:
         
         finally:
             # 연결 종료
-            if charger_id in self.chargers:
+            self.liveness.remove(charger)
+            await charger.stop_writer()
+            self._fail_pending_calls(charger)
+            if self.chargers.get(charger_id) is charger:
                 del self.chargers[charger_id]
+                if self.persistence is not None:
+                    self.persistence.record_status(charger_id, "Offline")
+                if self.live is not None:
+                    self.live.record_status(charger_id, "Offline")
             logger.info(f"충전기 연결 해제: {charger_id}")
 
     async def handle_request(self, charger: ChargerConnection, message_id: str, action: str, payload: Dict[str, Any]):
-        """요청 처리"""
+        """요청 처리 (핸들러 레지스트리 기반 디스패치)"""
         logger.info(f"요청 처리 ({charger.charger_id}): {action}")
 
+        handler = self.handlers.get(action)
+        if handler is None:
+            logger.warning(f"처리되지 않은 요청: {action}")
+            response = OCPPMessage.encode_call_error(
+                message_id, "NotImplemented", f"Action {action} not implemented"
+            )
+            await charger.send(response)
+            return
+
+        started = time.perf_counter()
+        failed = False
         try:
-            if action == "BootNotification":
-                await self.handle_boot_notification(charger, message_id, payload)
-            
-            elif action == "Heartbeat":
-                await self.handle_heartbeat(charger, message_id)
-            
-            elif action == "StatusNotification":
-                await self.handle_status_notification(charger, message_id, payload)
-            
-            elif action == "TransactionEvent":
-                await self.handle_transaction_event(charger, message_id, payload)
-            
-            elif action == "Authorize":
-                await self.handle_authorize(charger, message_id, payload)
-            
-            else:
-                logger.warning(f"처리되지 않은 요청: {action}")
-                response = OCPPMessage.create_call_error(
-                    message_id, "NotImplemented", f"Action {action} not implemented"
-                )
-                await charger.send(response)
-        
+            validator = self.validators.get(action)
+            if validator is not None:
+                try:
+                    validator(payload)
+                except ValidationError as e:
+                    failed = True
+                    reason = describe_validation_error(e)
+                    logger.warning(f"페이로드 검증 실패 ({charger.charger_id}): {action} - {reason}")
+                    await charger.send(OCPPMessage.encode_call_error(message_id, "FormatViolation", reason))
+                    return
+            await handler(charger, message_id, payload)
         except Exception as e:
+            failed = True
             logger.error(f"요청 처리 오류: {e}")
-            response = OCPPMessage.create_call_error(
+            response = OCPPMessage.encode_call_error(
                 message_id, "InternalError", str(e)
             )
             await charger.send(response)
+        finally:
+            self._record_action_stats(action, time.perf_counter() - started, failed)
 
     async def handle_boot_notification(self, charger: ChargerConnection, message_id: str, payload: Dict[str, Any]):
         """부팅 알림 처리"""
         logger.info(f"부팅 알림 수신 ({charger.charger_id}): {payload.get('reason')}")
         
         charger.boot_status = True
-        charger.last_heartbeat = datetime.now()
+        charger.last_heartbeat = time.monotonic()
         
         response = {
             "currentTime": datetime.utcnow().isoformat() + "Z",
-            "interval": 300,
+            "interval": HEARTBEAT_INTERVAL,
             "status": "Accepted"
         }
         
-        message = OCPPMessage.create_call_result(message_id, response)
+        message = OCPPMessage.encode_call_result(message_id, response)
         await charger.send(message)
         
         logger.info(f"부팅 알림 응답 전송 ({charger.charger_id})")
 
-    async def handle_heartbeat(self, charger: ChargerConnection, message_id: str):
+    async def handle_heartbeat(self, charger: ChargerConnection, message_id: str, payload: Dict[str, Any]):
         """하트비트 처리"""
-        charger.last_heartbeat = datetime.now()
+        charger.last_heartbeat = time.monotonic()
         
         response = {
             "currentTime": datetime.utcnow().isoformat() + "Z"
         }
         
-        message = OCPPMessage.create_call_result(message_id, response)
+        message = OCPPMessage.encode_call_result(message_id, response)
         await charger.send(message)
         
         logger.debug(f"하트비트 응답 전송 ({charger.charger_id})")
 
     async def handle_status_notification(self, charger: ChargerConnection, message_id: str, payload: Dict[str, Any]):
         """상태 알림 처리"""
-        logger.info(f"상태 알림 ({charger.charger_id}): {payload.get('connectorStatus')}")
-        
+        connector_status = payload.get('connectorStatus')
+        logger.info(f"상태 알림 ({charger.charger_id}): {connector_status}")
+        if self.persistence is not None and connector_status:
+            self.persistence.record_status(charger.charger_id, connector_status)
+        if self.live is not None and connector_status:
+            self.live.record_status(charger.charger_id, connector_status)
+
         response = {}
         
-        message = OCPPMessage.create_call_result(message_id, response)
+        message = OCPPMessage.encode_call_result(message_id, response)
         await charger.send(message)
 
     async def handle_transaction_event(self, charger: ChargerConnection, message_id: str, payload: Dict[str, Any]):
@@ -259,51 +693,62 @@ class OCPPServer:
             
             # chargingPeriods에서 에너지 데이터 추출
             energy_delivered = 0.0
+            power_w = None
             charging_periods = transaction_data.get("chargingPeriods", []) or transaction_info.get("chargingPeriods", []) or []
             
             if charging_periods:
                 for period in charging_periods:
                     dimensions = period.get("dimensions", [])
                     for dimension in dimensions:
-                        if dimension.get("name") == "Energy.Active.Import.Register":
+                        name = dimension.get("name")
+                        if name == "Energy.Active.Import.Register":
                             # value는 Wh단위이므로 kWh로 변환 (unitMultiplier가 1이면 그대로 사용)
                             energy_wh = dimension.get("value", 0)
                             energy_delivered = energy_wh / 1000.0  # Wh to kWh
-                            break
+                        elif name == "Power.Active.Import":
+                            power_w = dimension.get("value")
             else:
-                # fallback: meterValue 구조를 사용하는 메시지 지원
-                meter_values = payload.get("meterValue", [])
-                for mv in meter_values:
-                    for sampled in mv.get("sampledValue", []):
-                        if sampled.get("measurand") == "Energy.Active.Import.Register":
-                            energy_delivered = float(sampled.get("value", 0))
-                            break
+                # OCPP 2.0.1 표준 meterValue 구조 (여러 샘플이 묶여 올 수 있음)
+                energy_kwh, power_w = read_meter_values(payload.get("meterValue") or [])
+                if energy_kwh is not None:
+                    energy_delivered = energy_kwh
             
             logger.info(f"거래 이벤트 ({charger.charger_id}): {event_type}, ID: {transaction_id}, "
                        f"에너지: {energy_delivered:.2f} kWh, 비용: {total_cost}")
+
+            # DB 반영은 저장 파이프라인 큐에 넣기만 함 (응답은 DB 왕복을 기다리지 않음)
+            if self.persistence is not None and transaction_id:
+                self.persistence.record_transaction(
+                    charger.charger_id, event_type, transaction_id,
+                    energy_delivered, total_cost, power_w
+                )
+            if self.live is not None and transaction_id:
+                self.live.record_transaction(
+                    charger.charger_id, event_type, transaction_id, energy_delivered, total_cost
+                )
             
             # 거래 정보 저장 (Ended 이벤트일 때만)
             if event_type == "Ended" and transaction_id:
                 try:
-                    charger.transactions[transaction_id] = {
+                    charger.store_transaction(transaction_id, {
                         "transaction_id": transaction_id,
                         "charger_id": charger.charger_id,
                         "energy_delivered": energy_delivered,
                         "total_cost": total_cost,
-                        "timestamp": datetime.now()
-                    }
+                        "timestamp": time.time()
+                    })
                     logger.info(f"거래 저장 완료: {transaction_id}, 에너지: {energy_delivered:.2f} kWh")
                 except Exception as e:
                     logger.error(f"거래 저장 실패: {e}")
             
             response = {}
-            message = OCPPMessage.create_call_result(message_id, response)
+            message = OCPPMessage.encode_call_result(message_id, response)
             await charger.send(message)
             
         except Exception as e:
             logger.error(f"거래 이벤트 처리 오류 ({charger.charger_id}): {e}")
             response = {}
-            message = OCPPMessage.create_call_result(message_id, response)
+            message = OCPPMessage.encode_call_result(message_id, response)
             await charger.send(message)
 
     async def handle_authorize(self, charger: ChargerConnection, message_id: str, payload: Dict[str, Any]):
@@ -318,21 +763,137 @@ class OCPPServer:
             }
         }
         
-        message = OCPPMessage.create_call_result(message_id, response)
+        message = OCPPMessage.encode_call_result(message_id, response)
+        await charger.send(message)
+
+    async def handle_meter_values(self, charger: ChargerConnection, message_id: str, payload: Dict[str, Any]):
+        """미터 값 처리"""
+        meter_values = payload.get("meterValue", []) or []
+        logger.debug(f"미터 값 수신 ({charger.charger_id}): EVSE {payload.get('evseId')}, {len(meter_values)}건")
+
+        message = OCPPMessage.encode_call_result(message_id, {})
+        await charger.send(message)
+
+    async def handle_notify_event(self, charger: ChargerConnection, message_id: str, payload: Dict[str, Any]):
+        """이벤트 알림 처리"""
+        event_data = payload.get("eventData", []) or []
+        for event in event_data:
+            component = (event.get("component") or {}).get("name")
+            variable = (event.get("variable") or {}).get("name")
+            logger.info(f"이벤트 알림 ({charger.charger_id}): {event.get('trigger')} "
+                        f"{component}.{variable} = {event.get('actualValue')}")
+
+        message = OCPPMessage.encode_call_result(message_id, {})
+        await charger.send(message)
+
+    async def handle_firmware_status_notification(self, charger: ChargerConnection, message_id: str, payload: Dict[str, Any]):
+        """펌웨어 상태 알림 처리"""
+        logger.info(f"펌웨어 상태 알림 ({charger.charger_id}): {payload.get('status')}")
+
+        message = OCPPMessage.encode_call_result(message_id, {})
         await charger.send(message)
 
     async def handle_response(self, charger_id: str, message_id: str, payload: Dict[str, Any]):
-        """응답 처리"""
-        logger.debug(f"응답 수신 ({charger_id}), ID: {message_id}")
+        """응답 처리 (대기 중인 CALL과 메시지 ID로 매칭)"""
+        pending = self.pending_requests.get(message_id)
+        if pending is None:
+            logger.debug(f"매칭되지 않은 응답 수신 ({charger_id}), ID: {message_id}")
+            return
+        if pending["charger_id"] != charger_id:
+            logger.warning(f"다른 충전기로 보낸 CALL의 응답 무시 ({charger_id}, 대상: {pending['charger_id']}), ID: {message_id}")
+            return
+
+        elapsed_ms = (time.monotonic() - pending["sent_at"]) * 1000
+        logger.debug(f"응답 수신 ({charger_id}): {pending['action']}, ID: {message_id}, {elapsed_ms:.1f}ms")
+        future = pending["future"]
+        if not future.done():
+            future.set_result(payload)
+
+    async def handle_call_error(self, charger_id: str, message_id: str, error_code: str, payload: Dict[str, Any]):
+        """CALLERROR 응답 처리"""
+        error_message = payload.get("errorMessage", "")
+        logger.error(f"오류 응답 ({charger_id}): {error_code} {error_message}")
+
+        pending = self.pending_requests.get(message_id)
+        if pending is None:
+            return
+        if pending["charger_id"] != charger_id:
+            logger.warning(f"다른 충전기로 보낸 CALL의 오류 응답 무시 ({charger_id}, 대상: {pending['charger_id']}), ID: {message_id}")
+            return
+        if not pending["future"].done():
+            pending["future"].set_exception(OCPPCallError(error_code, error_message))
+
+    async def call(
+        self,
+        charger: ChargerConnection,
+        action: str,
+        payload: Dict[str, Any],
+        timeout: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        충전기로 CALL을 보내고 CALLRESULT 페이로드를 기다린다.
+
+        Raises:
+            asyncio.TimeoutError: 제한 시간 내에 응답이 없는 경우
+            OCPPCallError: 충전기가 CALLERROR로 응답한 경우
+            ConnectionError: 응답 전에 충전기 연결이 끊긴 경우
+            RuntimeError: 대기 중인 요청 수가 상한에 도달한 경우
+        """
+        if len(self.pending_requests) >= self.max_pending_requests:
+            raise RuntimeError(f"대기 중인 요청 수 초과 ({self.max_pending_requests})")
+
+        message_id = str(uuid.uuid4())
+        future = asyncio.get_running_loop().create_future()
+        self.pending_requests[message_id] = {
+            "future": future,
+            "charger_id": charger.charger_id,
+            "action": action,
+            "sent_at": time.monotonic()
+        }
+        charger.pending_calls.add(message_id)
 
-    async def request_start_transaction(self, charger_id: str, evse_id: int = 1, connector_id: int = 1):
-        """거래 시작 요청"""
-        if charger_id not in self.chargers:
+        try:
+            message = OCPPMessage.encode_call(action, payload, message_id=message_id)
+            await charger.send(message)
+            return await asyncio.wait_for(future, self.call_timeout if timeout is None else timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"응답 타임아웃 ({charger.charger_id}): {action}, ID: {message_id}")
+            raise
+        finally:
+            # 성공/실패/타임아웃 모두 상관 테이블에서 제거
+            self.pending_requests.pop(message_id, None)
+            charger.pending_calls.discard(message_id)
+
+    def _fail_pending_calls(self, charger: Optional[ChargerConnection]):
+        """연결 종료 시 해당 충전기의 대기 중인 CALL을 모두 실패 처리"""
+        if charger is None:
+            return
+        for message_id in list(charger.pending_calls):
+            pending = self.pending_requests.pop(message_id, None)
+            if pending is not None and not pending["future"].done():
+                pending["future"].set_exception(
+                    ConnectionError(f"충전기 연결 종료: {charger.charger_id}")
+                )
+        charger.pending_calls.clear()
+
+    async def request_start_transaction(
+        self,
+        charger_id: str,
+        evse_id: int = 1,
+        connector_id: int = 1,
+        timeout: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        거래 시작 요청
+
+        Returns:
+            충전기의 RequestStartTransaction 응답 페이로드 (충전기가 없으면 None)
+        """
+        charger = self.chargers.get(charger_id)
+        if charger is None:
             logger.error(f"충전기를 찾을 수 없음: {charger_id}")
-            return False
+            return None
 
-        charger = self.chargers[charger_id]
-        
         payload = {
             "evseId": evse_id,
             "connectorId": connector_id,
@@ -341,30 +902,37 @@ class OCPPServer:
                 "type": "Central"
             }
         }
-        
-        message = OCPPMessage.create_call("RequestStartTransaction", payload)
-        await charger.send(message)
-        
-        logger.info(f"거래 시작 요청 전송: {charger_id}")
-        return True
 
-    async def request_stop_transaction(self, charger_id: str, transaction_id: str = None):
-        """거래 중지 요청"""
-        if charger_id not in self.chargers:
+        logger.info(f"거래 시작 요청 전송: {charger_id}")
+        response = await self.call(charger, "RequestStartTransaction", payload, timeout)
+        logger.info(f"거래 시작 요청 응답 ({charger_id}): {response.get('status')}")
+        return response
+
+    async def request_stop_transaction(
+        self,
+        charger_id: str,
+        transaction_id: str = None,
+        timeout: Optional[float] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        거래 중지 요청
+
+        Returns:
+            충전기의 RequestStopTransaction 응답 페이로드 (충전기가 없으면 None)
+        """
+        charger = self.chargers.get(charger_id)
+        if charger is None:
             logger.error(f"충전기를 찾을 수 없음: {charger_id}")
-            return False
+            return None
 
-        charger = self.chargers[charger_id]
-        
         payload = {
             "transactionId": transaction_id or "default_transaction"
         }
-        
-        message = OCPPMessage.create_call("RequestStopTransaction", payload)
-        await charger.send(message)
-        
+
         logger.info(f"거래 중지 요청 전송: {charger_id}")
-        return True
+        response = await self.call(charger, "RequestStopTransaction", payload, timeout)
+        logger.info(f"거래 중지 요청 응답 ({charger_id}): {response.get('status')}")
+        return response
 
     def get_charger_status(self, charger_id: str = None) -> Dict[str, Any]:
         """충전기 상태 조회"""
@@ -375,7 +943,9 @@ class OCPPServer:
                     "charger_id": charger_id,
                     "connected": charger.connected,
                     "boot_status": charger.boot_status,
-                    "last_heartbeat": charger.last_heartbeat.isoformat()
+                    "last_heartbeat": monotonic_to_iso(charger.last_heartbeat),
+                    "idle_seconds": round(time.monotonic() - charger.last_seen, 1),
+                    "send_queue": charger.get_send_metrics()
                 }
             return {"error": f"Charger {charger_id} not found"}
         
@@ -385,7 +955,9 @@ class OCPPServer:
             status[cid] = {
                 "connected": charger.connected,
                 "boot_status": charger.boot_status,
-                "last_heartbeat": charger.last_heartbeat.isoformat()
+                "last_heartbeat": monotonic_to_iso(charger.last_heartbeat),
+                "idle_seconds": round(time.monotonic() - charger.last_seen, 1),
+                "send_queue": charger.get_send_metrics()
             }
         return status
 
@@ -0,0 +1,392 @@
+"""
+OCPP 서버 -> 데이터베이스 비동기 저장 파이프라인 (write-behind)
+
+핸들러는 record_*()로 이벤트를 큐에 넣기만 하고 바로 응답한다 (DB 왕복 없음).
+백그라운드 태스크가 flush_interval 또는 batch_size 단위로 이벤트를 모아
+전용 스레드에서 database.services의 일괄 메서드로 한 번에 반영한다.
+
+    - 상태 알림       -> ChargerService.bulk_update_status (충전기별 마지막 상태만)
+    - 거래 이벤트     -> UsageLogService.bulk_upsert_sessions (거래별로 병합)
+    - 전력 측정값     -> PowerConsumptionService.bulk_create_power_records
+                         (OCPP_POWER_STORE_DIR 설정 시 database.timeseries 컬럼형 저장소)
+    - 완료된 세션     -> UsageAggregator (일별/시간별 통계 증분 집계, 주기적으로 upsert)
+
+charger_info에 등록되지 않은 충전기의 이벤트는 외래키 위반을 피하기 위해 건너뛴다.
+
+환경변수:
+    OCPP_PERSISTENCE                 true이면 서버 시작 시 파이프라인 활성화
+    DATABASE_URL                     데이터베이스 연결 문자열 (미설정 시 SQLite 기본값)
+    OCPP_PERSISTENCE_FLUSH_INTERVAL  최대 반영 지연 (초, 기본 1.0)
+    OCPP_PERSISTENCE_BATCH_SIZE      한 번에 반영할 최대 이벤트 수 (기본 500)
+    OCPP_PERSISTENCE_QUEUE_SIZE      대기 이벤트 상한 (초과 시 폐기, 기본 100000)
+    OCPP_STATS_AGGREGATION           false이면 통계 증분 집계 비활성화 (기본 true)
+    OCPP_STATS_FLUSH_INTERVAL        통계 테이블 반영 주기 (초, 기본 60)
+    OCPP_POWER_STORE_DIR             전력 측정값을 power_consumption 대신 저장할 시계열 저장소 경로
+"""
+import asyncio
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+# 프로젝트 루트 경로 추가 (database 모듈 import를 위함)
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(project_root, '8_DATABASE'))
+
+from database.models import ChargerStatusEnum, DatabaseManager, DEFAULT_DATABASE_URL
+from database.services import ChargerService, UsageLogService, PowerConsumptionService
+from database.aggregation import UsageAggregator
+from database.timeseries import PowerSeriesStore, create_store_from_env
+
+logger = logging.getLogger(__name__)
+
+# OCPP 커넥터 상태 -> DB 충전기 상태
+CONNECTOR_STATUS_MAP: Dict[str, ChargerStatusEnum] = {
+    "Available": ChargerStatusEnum.AVAILABLE,
+    "Occupied": ChargerStatusEnum.IN_USE,
+    "Charging": ChargerStatusEnum.IN_USE,
+    "Reserved": ChargerStatusEnum.RESERVED,
+    "Unavailable": ChargerStatusEnum.MAINTENANCE,
+    "Faulted": ChargerStatusEnum.FAULT,
+}
+
+# 큐 이벤트 종류 (튜플 첫 항목)
+EVENT_STATUS = "status"
+EVENT_TRANSACTION = "transaction"
+
+# 세션 팩토리: 호출할 때마다 새 SQLAlchemy Session 반환
+SessionFactory = Callable[[], Any]
+
+
+def _utc(timestamp: float) -> datetime:
+    """time.time() 값을 모델과 같은 naive UTC datetime으로 변환"""
+    return datetime.fromtimestamp(timestamp, timezone.utc).replace(tzinfo=None)
+
+
+class PersistencePipeline:
+    """OCPP 이벤트 일괄 저장 파이프라인"""
+
+    def __init__(
+        self,
+        session_factory: SessionFactory,
+        flush_interval: float = 1.0,
+        batch_size: int = 500,
+        max_queue_size: int = 100000,
+        aggregator: Optional[UsageAggregator] = None,
+        power_store: Optional[PowerSeriesStore] = None
+    ):
+        self.session_factory = session_factory
+        self.aggregator = aggregator
+        self.power_store = power_store
+        # 시계열 저장소에서 봉인을 마친 기준일 (지난 날짜 묶음은 하루 한 번 압축)
+        self._sealed_before: Optional[date] = None
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue_size)
+        # DB 작업은 한 스레드에서 순서대로 수행
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ocpp-persist")
+        self._task: Optional[asyncio.Task] = None
+        # 종료(취소) 시점에 run()이 모으던 이벤트, stop()에서 반영
+        self._unflushed: List[Tuple] = []
+        # charger_info에 등록된 것으로 확인된 충전기 ID
+        self._known_chargers: Set[str] = set()
+        # 처리 지표
+        self.stats = {"queued": 0, "dropped": 0, "written": 0, "skipped": 0, "failed": 0, "batches": 0}
+
+    # ==================== 이벤트 적재 (핸들러에서 호출, 대기 없음) ====================
+
+    def _submit(self, event: Tuple):
+        try:
+            self.queue.put_nowait(event)
+            self.stats["queued"] += 1
+        except asyncio.QueueFull:
+            self.stats["dropped"] += 1
+            if self.stats["dropped"] % 1000 == 1:
+                logger.warning(f"저장 큐 초과, 이벤트 폐기: 누적 {self.stats['dropped']}건")
+
+    def record_status(self, charger_id: str, connector_status: str):
+        """충전기 상태 변경 (OCPP connectorStatus 또는 'Offline')"""
+        status = CONNECTOR_STATUS_MAP.get(connector_status, ChargerStatusEnum.OFFLINE)
+        self._submit((EVENT_STATUS, charger_id, status, time.time()))
+
+    def record_transaction(
+        self,
+        charger_id: str,
+        event_type: str,
+        transaction_id: str,
+        energy_kwh: float = 0.0,
+        total_cost: float = 0.0,
+        power_w: Optional[float] = None
+    ):
+        """거래 이벤트 (Started/Updated/Ended)"""
+        self._submit((
+            EVENT_TRANSACTION, charger_id, event_type, transaction_id,
+            energy_kwh, total_cost, power_w, time.time()
+        ))
+
+    # ==================== 백그라운드 반영 ====================
+
+    def start(self):
+        """반영 태스크 시작"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+            logger.info(f"DB 저장 파이프라인 시작 (주기 {self.flush_interval}초, 배치 {self.batch_size}건)")
+
+    async def stop(self):
+        """반영 태스크 종료 (남은 이벤트는 모두 반영)"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._unflushed:
+            batch, self._unflushed = self._unflushed, []
+            await self._flush(batch)
+        while not self.queue.empty():
+            await self._flush(self._drain(self.batch_size))
+        if self.aggregator is not None:
+            await self._flush_stats()
+        self._executor.shutdown(wait=True)
+
+    async def run(self):
+        """이벤트를 모아 주기적으로 반영"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = []
+            try:
+                if self.aggregator is None:
+                    batch.append(await self.queue.get())
+                else:
+                    # 이벤트가 없어도 통계 증분은 주기적으로 반영
+                    try:
+                        batch.append(await asyncio.wait_for(self.queue.get(), self.aggregator.flush_interval))
+                    except asyncio.TimeoutError:
+                        await self._flush_stats()
+                        continue
+                deadline = loop.time() + self.flush_interval
+                while len(batch) < self.batch_size:
+                    batch.extend(self._drain(self.batch_size - len(batch)))
+                    remaining = deadline - loop.time()
+                    if len(batch) >= self.batch_size or remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self.queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                # 큐에서 이미 꺼낸 이벤트는 stop()이 반영
+                self._unflushed = batch
+                raise
+            await self._flush(batch)
+
+    def _drain(self, limit: int) -> List[Tuple]:
+        items = []
+        queue = self.queue
+        while len(items) < limit and not queue.empty():
+            items.append(queue.get_nowait())
+        return items
+
+    async def _flush(self, batch: List[Tuple]):
+        if not batch:
+            return
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._executor, self.write_batch, batch)
+        cancelled = False
+        while not future.done():
+            try:
+                await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # 이미 시작한 쓰기는 끝까지 기다려 집계한 뒤 취소를 전달
+                cancelled = True
+            except Exception:
+                break
+        try:
+            written = future.result()
+            self.stats["written"] += written
+            self.stats["skipped"] += len(batch) - written
+            self.stats["batches"] += 1
+        except Exception as e:
+            self.stats["failed"] += len(batch)
+            logger.error(f"DB 일괄 저장 실패 ({len(batch)}건): {e}")
+        if cancelled:
+            raise asyncio.CancelledError
+
+    async def _flush_stats(self):
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(self._executor, self.write_stats)
+        except Exception as e:
+            logger.error(f"통계 반영 실패 (다음 주기에 재시도): {e}")
+
+    def write_stats(self) -> int:
+        """집계기의 미반영 통계 증분을 upsert (저장 스레드에서 실행)"""
+        if self.aggregator is None or not self.aggregator.pending_count():
+            return 0
+        session = self.session_factory()
+        try:
+            return self.aggregator.flush(session)
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    async def rebuild_daily_stats(self, charger_id: str, stats_date: date) -> Optional[Dict[str, Any]]:
+        """
+        집계기의 일일 통계를 사용 이력에서 재계산 (UsageAggregator.rebuild_daily)
+
+        집계기와 같은 저장 스레드에서 실행한다. 집계기가 없으면 None.
+        """
+        if self.aggregator is None:
+            return None
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._rebuild_daily_stats, charger_id, stats_date)
+
+    def _rebuild_daily_stats(self, charger_id: str, stats_date: date) -> Dict[str, Any]:
+        session = self.session_factory()
+        try:
+            return self.aggregator.rebuild_daily(session, charger_id, stats_date)
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def write_batch(self, batch: List[Tuple]) -> int:
+        """
+        이벤트 묶음을 트랜잭션 한 번으로 반영 (저장 스레드에서 실행)
+
+        Returns:
+            반영된 이벤트 수 (미등록 충전기 이벤트 제외)
+        """
+        statuses: Dict[str, ChargerStatusEnum] = {}
+        status_time = 0.0
+        sessions: Dict[str, Dict[str, Any]] = {}
+        power_records: List[Dict[str, Any]] = []
+        completed: List[Dict[str, Any]] = []
+
+        session = self.session_factory()
+        try:
+            charger_ids = {event[1] for event in batch}
+            unknown = charger_ids - self._known_chargers
+            if unknown:
+                self._known_chargers |= ChargerService.get_existing_charger_ids(session, unknown)
+
+            written = 0
+            for event in batch:
+                charger_id = event[1]
+                if charger_id not in self._known_chargers:
+                    continue
+                written += 1
+                if event[0] == EVENT_STATUS:
+                    statuses[charger_id] = event[2]
+                    status_time = max(status_time, event[3])
+                    continue
+
+                _, _, event_type, transaction_id, energy_kwh, total_cost, power_w, timestamp = event
+                when = _utc(timestamp)
+                item = sessions.get(transaction_id)
+                if item is None:
+                    item = sessions[transaction_id] = {
+                        "transaction_id": transaction_id,
+                        "charger_id": charger_id,
+                        "start_time": when,
+                        "status": "in_progress",
+                        "payment_status": "pending"
+                    }
+                item["energy_delivered"] = energy_kwh
+                item["total_charge"] = total_cost
+                if event_type == "Ended":
+                    item["end_time"] = when
+                    item["status"] = "completed"
+                    item["payment_status"] = "completed"
+                if power_w is not None:
+                    power_records.append({
+                        "charger_id": charger_id,
+                        "measurement_time": when,
+                        "input_power": power_w / 1000.0,
+                        "cumulative_energy": energy_kwh,
+                        "is_charging": event_type != "Ended",
+                        "charger_status": "charging" if event_type != "Ended" else "available"
+                    })
+
+            if statuses:
+                ChargerService.bulk_update_status(session, statuses, updated_at=_utc(status_time), commit=False)
+            UsageLogService.bulk_upsert_sessions(
+                session, list(sessions.values()), commit=False,
+                on_completed=completed.append if self.aggregator is not None else None
+            )
+            if self.power_store is None:
+                PowerConsumptionService.bulk_create_power_records(session, power_records, commit=False)
+            session.commit()
+            if self.power_store is not None and power_records:
+                self._store_power(power_records)
+            if completed:
+                # 커밋된 완료 세션만 집계 (롤백된 배치가 중복 집계되지 않도록)
+                self._aggregate(session, completed)
+            return written
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    def _store_power(self, power_records: List[Dict[str, Any]]):
+        """측정값을 시계열 저장소에 이어 쓰고, 날짜가 바뀌었으면 지난 묶음을 봉인"""
+        try:
+            self.power_store.append_records(power_records)
+            today = datetime.now(timezone.utc).date()
+            if self._sealed_before != today:
+                sealed = self.power_store.seal(today)
+                self._sealed_before = today
+                if sealed:
+                    logger.info(f"전력 시계열 묶음 {sealed}개 봉인")
+        except Exception as e:
+            logger.error(f"전력 시계열 저장 실패 ({len(power_records)}건): {e}")
+
+    def _aggregate(self, session, completed: List[Dict[str, Any]]):
+        for item in completed:
+            self.aggregator.record_session(
+                item["charger_id"], item["start_time"], item["energy_delivered"],
+                item["total_charge"], item["duration_minutes"]
+            )
+        if self.aggregator.due():
+            try:
+                self.aggregator.flush(session)
+            except Exception as e:
+                session.rollback()
+                logger.error(f"통계 반영 실패 (다음 주기에 재시도): {e}")
+
+    def get_stats(self) -> Dict[str, int]:
+        """처리 지표 조회"""
+        stats = {**self.stats, "pending": self.queue.qsize()}
+        if self.aggregator is not None:
+            stats["stats_pending"] = self.aggregator.pending_count()
+        return stats
+
+
+def create_pipeline_from_env() -> Optional[PersistencePipeline]:
+    """
+    환경변수 설정으로 파이프라인 생성 (OCPP_PERSISTENCE=true가 아니면 None)
+    """
+    if os.getenv("OCPP_PERSISTENCE", "false").lower() != "true":
+        return None
+
+    manager = DatabaseManager(os.getenv("DATABASE_URL", DEFAULT_DATABASE_URL))
+    manager.initialize()
+    aggregator = None
+    if os.getenv("OCPP_STATS_AGGREGATION", "true").lower() == "true":
+        aggregator = UsageAggregator(flush_interval=float(os.getenv("OCPP_STATS_FLUSH_INTERVAL", "60")))
+    return PersistencePipeline(
+        manager.get_session,
+        flush_interval=float(os.getenv("OCPP_PERSISTENCE_FLUSH_INTERVAL", "1.0")),
+        batch_size=int(os.getenv("OCPP_PERSISTENCE_BATCH_SIZE", "500")),
+        max_queue_size=int(os.getenv("OCPP_PERSISTENCE_QUEUE_SIZE", "100000")),
+        aggregator=aggregator,
+        power_store=create_store_from_env()
+    )
@@ -0,0 +1,205 @@
+"""
+OCPP 프로토콜 트레이스 기록기
+
+프로토콜 디버그(OCPP_PROTOCOL_DEBUG=true) 시 송수신 원본 프레임을 한 번만 기록한다.
+기록 시에는 직렬화/포매팅을 하지 않고 (시각, 충전기 ID, 방향, 원본) 튜플만
+링 버퍼에 넣으며, 선택적으로 회전 바이너리 파일에 덧붙인다.
+액션/메시지 ID 추출과 JSON 들여쓰기 출력은 조회할 때만 수행한다.
+
+환경변수:
+    OCPP_TRACE_CAPACITY   링 버퍼 크기 (기본 10000 프레임)
+    OCPP_TRACE_FILE       바이너리 트레이스 파일 경로 (미설정 시 메모리만 사용)
+    OCPP_TRACE_MAX_BYTES  파일 회전 크기 (기본 64MB)
+
+트레이스 파일 보기:
+    python logging_config.py --trace ocpp_trace.bin
+"""
+import json
+import os
+import struct
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+DIRECTION_SEND = "send"
+DIRECTION_RECV = "recv"
+
+_DIRECTION_CODES = {DIRECTION_SEND: 0, DIRECTION_RECV: 1}
+_DIRECTION_NAMES = {code: name for name, code in _DIRECTION_CODES.items()}
+
+# 파일 레코드 헤더: 시각(double), 방향(uint8), 충전기 ID 길이(uint16), 프레임 길이(uint32)
+_RECORD_HEADER = struct.Struct("<dBHI")
+
+# (timestamp, charger_id, direction, action, message_id, raw)
+TraceEntry = Tuple[float, str, str, Optional[str], Optional[str], Union[str, bytes]]
+
+
+class ProtocolTrace:
+    """송수신 프레임 링 버퍼 + 회전 바이너리 파일"""
+
+    def __init__(
+        self,
+        capacity: int = 10000,
+        file_path: Optional[str] = None,
+        max_file_bytes: int = 64 * 1024 * 1024,
+        backup_count: int = 3
+    ):
+        self._buffer: deque = deque(maxlen=capacity)
+        self.file_path = file_path
+        self.max_file_bytes = max_file_bytes
+        self.backup_count = backup_count
+        self._file = None
+        self._file_size = 0
+        self._lock = threading.Lock()
+        if file_path:
+            self._open_file()
+
+    def record(
+        self,
+        charger_id: str,
+        direction: str,
+        raw: Union[str, bytes],
+        action: Optional[str] = None,
+        message_id: Optional[str] = None
+    ):
+        """프레임 한 건 기록 (포매팅 없음)"""
+        timestamp = time.time()
+        self._buffer.append((timestamp, charger_id, direction, action, message_id, raw))
+        if self._file is not None:
+            self._write_record(timestamp, charger_id, direction, raw)
+
+    def records(self, charger_id: Optional[str] = None, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """버퍼의 프레임 조회 (최신 limit건, 액션/메시지 ID는 이때 추출)"""
+        entries = list(self._buffer)
+        if charger_id:
+            entries = [e for e in entries if e[1] == charger_id]
+        if limit:
+            entries = entries[-limit:]
+        return [_entry_to_dict(e) for e in entries]
+
+    def format(self, charger_id: Optional[str] = None, limit: Optional[int] = None) -> str:
+        """버퍼의 프레임을 사람이 읽기 좋은 형태로 출력"""
+        return "\n".join(format_record(r) for r in self.records(charger_id, limit))
+
+    def clear(self):
+        """버퍼 비우기"""
+        self._buffer.clear()
+
+    def flush(self):
+        """파일 버퍼 비우기"""
+        with self._lock:
+            if self._file is not None:
+                self._file.flush()
+
+    def close(self):
+        """파일 닫기"""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __len__(self):
+        return len(self._buffer)
+
+    def _open_file(self):
+        self._file = open(self.file_path, "ab", buffering=256 * 1024)
+        self._file_size = self._file.tell()
+
+    def _write_record(self, timestamp: float, charger_id: str, direction: str, raw: Union[str, bytes]):
+        cid = charger_id.encode("utf-8")
+        body = raw if isinstance(raw, bytes) else raw.encode("utf-8")
+        header = _RECORD_HEADER.pack(timestamp, _DIRECTION_CODES.get(direction, 0), len(cid), len(body))
+        with self._lock:
+            if self._file is None:
+                return
+            self._file.write(header)
+            self._file.write(cid)
+            self._file.write(body)
+            self._file_size += len(header) + len(cid) + len(body)
+            if self._file_size >= self.max_file_bytes:
+                self._rotate()
+
+    def _rotate(self):
+        """RotatingFileHandler와 같은 방식으로 .1, .2 ... 백업 파일 회전"""
+        self._file.close()
+        for i in range(self.backup_count - 1, 0, -1):
+            src = f"{self.file_path}.{i}"
+            if os.path.exists(src):
+                os.replace(src, f"{self.file_path}.{i + 1}")
+        if self.backup_count > 0:
+            os.replace(self.file_path, f"{self.file_path}.1")
+        else:
+            os.remove(self.file_path)
+        self._open_file()
+
+
+def read_trace_file(path: str) -> Iterator[Dict[str, Any]]:
+    """바이너리 트레이스 파일의 레코드 순회"""
+    header_size = _RECORD_HEADER.size
+    with open(path, "rb") as f:
+        while True:
+            header = f.read(header_size)
+            if len(header) < header_size:
+                return
+            timestamp, direction, cid_len, body_len = _RECORD_HEADER.unpack(header)
+            charger_id = f.read(cid_len).decode("utf-8")
+            raw = f.read(body_len)
+            yield _entry_to_dict(
+                (timestamp, charger_id, _DIRECTION_NAMES.get(direction, "?"), None, None, raw)
+            )
+
+
+def _entry_to_dict(entry: TraceEntry) -> Dict[str, Any]:
+    """기록 튜플을 조회용 dict로 변환 (액션/메시지 ID가 없으면 원본에서 추출)"""
+    timestamp, charger_id, direction, action, message_id, raw = entry
+    text = raw.decode("utf-8", errors="replace") if isinstance(raw, bytes) else raw
+    message_type = None
+    if action is None or message_id is None:
+        try:
+            frame = json.loads(text)
+            message_type = frame[0]
+            message_id = message_id or frame[1]
+            if message_type == 2:
+                action = action or frame[2]
+            elif message_type == 4:
+                action = action or frame[2]  # 오류 코드
+        except (ValueError, IndexError, TypeError, KeyError):
+            pass
+    return {
+        "timestamp": timestamp,
+        "charger_id": charger_id,
+        "direction": direction,
+        "message_type": message_type,
+        "action": action,
+        "message_id": message_id,
+        "raw": text
+    }
+
+
+def format_record(record: Dict[str, Any]) -> str:
+    """레코드 한 건을 들여쓰기된 JSON과 함께 출력"""
+    when = datetime.fromtimestamp(record["timestamp"]).isoformat(timespec="milliseconds")
+    arrow = "->" if record["direction"] == DIRECTION_SEND else "<-"
+    header = f"{when} {record['charger_id']} {arrow} {record.get('action') or ''} [{record.get('message_id')}]"
+    try:
+        body = json.dumps(json.loads(record["raw"]), indent=2, ensure_ascii=False)
+    except ValueError:
+        body = record["raw"]
+    return f"{header}\n{body}"
+
+
+_trace: Optional[ProtocolTrace] = None
+
+
+def get_trace() -> ProtocolTrace:
+    """프로세스 전역 트레이스 (환경변수 설정으로 최초 1회 생성)"""
+    global _trace
+    if _trace is None:
+        _trace = ProtocolTrace(
+            capacity=int(os.getenv("OCPP_TRACE_CAPACITY", "10000")),
+            file_path=os.getenv("OCPP_TRACE_FILE") or None,
+            max_file_bytes=int(os.getenv("OCPP_TRACE_MAX_BYTES", str(64 * 1024 * 1024)))
+        )
+    return _trace
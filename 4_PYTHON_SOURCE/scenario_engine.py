@@ -0,0 +1,461 @@
+"""
+시나리오 기반 충전기 트래픽 재생 엔진
+
+JSON(또는 PyYAML 설치 시 YAML) 시나리오로 충전기 집단의 하루 동작을 기술하고,
+시드로부터 결정적으로 만든 이벤트 타임라인을 서버에 재생한다.
+같은 시나리오/시드는 항상 같은 타임라인을 만들므로 릴리스 간 처리량 비교에 쓸 수 있다.
+
+시나리오 항목:
+    seed, duration(시뮬레이션 초), time_scale(시뮬레이션 초 / 실제 초), start_hour
+    chargers          {count, prefix, ramp_rate}
+    arrivals          {rate_per_hour: 충전기당 시간당 도착 수 (숫자 또는 24개 시간대 목록)}
+    session           {duration_minutes: 분포, max_kw: 분포}
+    power_curve       [[세션 진행률, 최대 출력 대비 비율], ...] 구간 선형
+    faults            [{at, fraction, duration, status, spread}]
+    reconnect_storms  [{at, fraction, window}]
+    heartbeat_interval, meter_interval (시뮬레이션 초)
+    meter_batch_size  TransactionEvent 하나에 묶을 미터 샘플 수 (기본 1)
+
+분포 표기:
+    7.0 | {"distribution": "uniform", "min": 1, "max": 2}
+        | {"distribution": "exponential" | "lognormal" | "normal", "mean": 45, "sigma": 0.5}
+        | {"distribution": "choice", "values": [7, 50], "weights": [0.7, 0.3]}
+    (min/max를 함께 주면 표본을 그 범위로 자른다)
+
+사용법:
+    python scenario_engine.py ../10_CONFIG_BUILD/scenarios/jeju_day.json --url ws://localhost:9000
+    python scenario_engine.py jeju_day.json --dry-run
+    python scenario_engine.py jeju_day.json --time-scale 600 --output scenario_report.json
+"""
+import argparse
+import asyncio
+import copy
+import json
+import logging
+import math
+import os
+import random
+import sys
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
+
+# 루트의 구버전 모듈(ocpp_messages.py 등)보다 이 디렉토리의 모듈을 우선 사용
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from charger_simulator import ChargerSimulator
+from latency_histogram import LatencyRecorder
+
+try:
+    import yaml
+except ImportError:  # YAML 시나리오는 선택 기능
+    yaml = None
+
+logger = logging.getLogger(__name__)
+
+EVENT_START = "start"
+EVENT_STOP = "stop"
+EVENT_FAULT = "fault"
+EVENT_RECOVER = "recover"
+EVENT_DISCONNECT = "disconnect"
+EVENT_RECONNECT = "reconnect"
+
+DEFAULT_SCENARIO: Dict[str, Any] = {
+    "name": "default",
+    "seed": 1,
+    "duration": 3600.0,
+    "time_scale": 1.0,
+    "start_hour": 0,
+    "server_url": "ws://localhost:9000",
+    "heartbeat_interval": 300.0,
+    "meter_interval": 60.0,
+    "meter_batch_size": 1,
+    "chargers": {"count": 10, "prefix": "SCN", "ramp_rate": 100.0},
+    "arrivals": {"rate_per_hour": 0.5},
+    "session": {
+        "duration_minutes": {"distribution": "lognormal", "mean": 45, "sigma": 0.5, "min": 5},
+        "max_kw": 7.0
+    },
+    "power_curve": [[0.0, 1.0], [0.8, 1.0], [1.0, 0.2]],
+    "faults": [],
+    "reconnect_storms": []
+}
+
+
+class ScenarioEvent(NamedTuple):
+    """타임라인 이벤트 (time: 시나리오 시작 기준 시뮬레이션 초)"""
+    time: float
+    charger: int
+    kind: str
+    params: Dict[str, Any]
+
+
+# ==================== 시나리오 로드 ====================
+
+def with_defaults(scenario: Dict[str, Any]) -> Dict[str, Any]:
+    """기본값 병합 (chargers/arrivals/session은 항목 단위로 병합)"""
+    merged = copy.deepcopy(DEFAULT_SCENARIO)
+    for key, value in scenario.items():
+        if isinstance(value, dict) and isinstance(merged.get(key), dict):
+            merged[key].update(value)
+        else:
+            merged[key] = value
+    return merged
+
+
+def load_scenario(path: str) -> Dict[str, Any]:
+    """시나리오 파일 로드 (.json, .yaml/.yml)"""
+    with open(path, "r", encoding="utf-8") as f:
+        if path.endswith((".yaml", ".yml")):
+            if yaml is None:
+                raise ImportError("YAML 시나리오를 읽으려면 PyYAML이 필요합니다 (pip install pyyaml)")
+            data = yaml.safe_load(f)
+        else:
+            data = json.load(f)
+    return with_defaults(data)
+
+
+# ==================== 분포/곡선 ====================
+
+def sample(rng: random.Random, spec: Any) -> float:
+    """분포 표기에서 표본 하나 추출"""
+    if isinstance(spec, (int, float)):
+        return float(spec)
+    kind = spec.get("distribution", "fixed")
+    if kind == "fixed":
+        value = float(spec["value"])
+    elif kind == "uniform":
+        value = rng.uniform(spec["min"], spec["max"])
+    elif kind == "exponential":
+        value = rng.expovariate(1.0 / spec["mean"])
+    elif kind == "normal":
+        value = rng.gauss(spec["mean"], spec["sigma"])
+    elif kind == "lognormal":
+        # mean은 로그 공간이 아닌 실제 평균
+        sigma = spec["sigma"]
+        value = rng.lognormvariate(math.log(spec["mean"]) - sigma * sigma / 2, sigma)
+    elif kind == "choice":
+        value = float(rng.choices(spec["values"], weights=spec.get("weights"))[0])
+    else:
+        raise ValueError(f"지원하지 않는 분포: {kind}")
+    if "min" in spec and kind != "uniform":
+        value = max(value, spec["min"])
+    if "max" in spec and kind != "uniform":
+        value = min(value, spec["max"])
+    return value
+
+
+def curve_value(points: Sequence[Sequence[float]], fraction: float) -> float:
+    """구간 선형 곡선 값 (범위 밖은 양 끝 값)"""
+    if fraction <= points[0][0]:
+        return points[0][1]
+    for (x0, y0), (x1, y1) in zip(points, points[1:]):
+        if fraction <= x1:
+            return y0 if x1 == x0 else y0 + (y1 - y0) * (fraction - x0) / (x1 - x0)
+    return points[-1][1]
+
+
+def arrival_rate(scenario: Dict[str, Any], sim_time: float) -> float:
+    """sim_time 시점의 충전기당 시간당 도착률"""
+    rates = scenario["arrivals"]["rate_per_hour"]
+    if isinstance(rates, (int, float)):
+        return float(rates)
+    hour = int(scenario["start_hour"] + sim_time // 3600) % len(rates)
+    return float(rates[hour])
+
+
+# ==================== 타임라인 생성 ====================
+
+def build_timeline(scenario: Dict[str, Any]) -> List[ScenarioEvent]:
+    """
+    시드로부터 결정적인 이벤트 타임라인 생성
+
+    충전기마다 (seed, 번호)로 독립된 난수열을 쓰므로, 충전기 수를 바꿔도
+    기존 충전기의 세션은 바뀌지 않는다.
+    """
+    seed = scenario["seed"]
+    count = scenario["chargers"]["count"]
+    duration = scenario["duration"]
+    rates = scenario["arrivals"]["rate_per_hour"]
+    max_rate = float(max(rates)) if isinstance(rates, list) else float(rates)
+    session_spec = scenario["session"]
+    events: List[ScenarioEvent] = []
+
+    # 도착: 시간대별 도착률을 따르는 비균질 포아송 과정 (thinning)
+    for index in range(count):
+        rng = random.Random(f"{seed}:{index}")
+        t = 0.0
+        session = 0
+        while max_rate > 0:
+            t += rng.expovariate(max_rate / 3600.0)
+            if t >= duration:
+                break
+            if rng.random() * max_rate > arrival_rate(scenario, t):
+                continue
+            length = sample(rng, session_spec["duration_minutes"]) * 60.0
+            max_kw = sample(rng, session_spec["max_kw"])
+            events.append(ScenarioEvent(t, index, EVENT_START, {
+                "session": session, "duration": length, "max_kw": max_kw
+            }))
+            if t + length < duration:
+                events.append(ScenarioEvent(t + length, index, EVENT_STOP, {"session": session}))
+            session += 1
+            t += length
+
+    # 장애 주입과 재연결 폭주는 시나리오 전체 난수열로 대상 선택
+    rng = random.Random(f"{seed}:population")
+    for fault in scenario["faults"]:
+        targets = rng.sample(range(count), int(round(fault["fraction"] * count)))
+        for index in sorted(targets):
+            at = fault["at"] + rng.uniform(0, fault.get("spread", 0))
+            events.append(ScenarioEvent(at, index, EVENT_FAULT, {"status": fault.get("status", "Faulted")}))
+            events.append(ScenarioEvent(at + fault.get("duration", 600), index, EVENT_RECOVER, {}))
+
+    for storm in scenario["reconnect_storms"]:
+        targets = rng.sample(range(count), int(round(storm["fraction"] * count)))
+        for index in sorted(targets):
+            events.append(ScenarioEvent(storm["at"], index, EVENT_DISCONNECT, {}))
+            events.append(ScenarioEvent(
+                storm["at"] + rng.uniform(0, storm.get("window", 10)), index, EVENT_RECONNECT, {}
+            ))
+
+    events = [e for e in events if e.time < duration]
+    events.sort(key=lambda e: (e.time, e.charger))
+    return events
+
+
+def summarize_timeline(events: List[ScenarioEvent]) -> Dict[str, int]:
+    """이벤트 종류별 건수"""
+    counts: Dict[str, int] = {}
+    for event in events:
+        counts[event.kind] = counts.get(event.kind, 0) + 1
+    return counts
+
+
+# ==================== 재생 ====================
+
+class ScenarioRunner:
+    """타임라인을 가상 충전기 집단에 재생"""
+
+    def __init__(
+        self,
+        scenario: Dict[str, Any],
+        server_url: Optional[str] = None,
+        time_scale: Optional[float] = None
+    ):
+        self.scenario = scenario
+        self.server_url = server_url or scenario["server_url"]
+        self.time_scale = time_scale or scenario["time_scale"]
+        self.timeline = build_timeline(scenario)
+        self.metrics = LatencyRecorder()
+        self.chargers: List[ChargerSimulator] = []
+        # 충전기별 진행 중 세션 (start 이벤트 params + 시작 시각) / 장애 여부
+        self.sessions: List[Optional[Dict[str, Any]]] = []
+        self.faulted: List[bool] = []
+        self.executed: Dict[str, int] = {}
+        self.skipped: Dict[str, int] = {}
+        self._running = False
+
+    def _count(self, table: Dict[str, int], kind: str):
+        table[kind] = table.get(kind, 0) + 1
+
+    async def connect_all(self):
+        """chargers.ramp_rate(대/초) 속도로 전체 연결"""
+        spec = self.scenario["chargers"]
+        self.chargers = [
+            ChargerSimulator(
+                f"{spec['prefix']}_{index:05d}", self.server_url, metrics=self.metrics,
+                meter_batch_size=self.scenario["meter_batch_size"]
+            )
+            for index in range(spec["count"])
+        ]
+        self.sessions = [None] * len(self.chargers)
+        self.faulted = [False] * len(self.chargers)
+        interval = 1.0 / spec["ramp_rate"] if spec.get("ramp_rate") else 0.0
+        tasks = []
+        for charger in self.chargers:
+            tasks.append(asyncio.create_task(self._connect(charger)))
+            if interval:
+                await asyncio.sleep(interval)
+        await asyncio.gather(*tasks)
+
+    async def _connect(self, charger: ChargerSimulator):
+        try:
+            await charger.connect(start_loops=False)
+        except Exception:
+            self.metrics.record_error("connect")
+
+    async def apply(self, event: ScenarioEvent):
+        """이벤트 한 건 적용 (적용 불가한 이벤트는 skipped로 집계)"""
+        charger = self.chargers[event.charger]
+        session = self.sessions[event.charger]
+
+        if event.kind == EVENT_START:
+            if session is not None or self.faulted[event.charger] or not charger.connected:
+                self._count(self.skipped, event.kind)
+                return
+            params = event.params
+            self.sessions[event.charger] = {**params, "started": event.time}
+            power_kw = params["max_kw"] * curve_value(self.scenario["power_curve"], 0.0)
+            await charger.send_status_notification("Occupied")
+            await charger.start_transaction(current=power_kw * 1000 / charger.voltage)
+
+        elif event.kind == EVENT_STOP:
+            if session is None or session["session"] != event.params["session"]:
+                self._count(self.skipped, event.kind)
+                return
+            self.sessions[event.charger] = None
+            await charger.stop_transaction()
+            await charger.send_status_notification("Available")
+
+        elif event.kind == EVENT_FAULT:
+            # 충전 중 장애는 거래를 종료시킨다
+            if session is not None:
+                self.sessions[event.charger] = None
+                await charger.stop_transaction()
+            self.faulted[event.charger] = True
+            await charger.send_status_notification(event.params["status"])
+
+        elif event.kind == EVENT_RECOVER:
+            self.faulted[event.charger] = False
+            await charger.send_status_notification("Available")
+
+        elif event.kind == EVENT_DISCONNECT:
+            if not charger.connected:
+                self._count(self.skipped, event.kind)
+                return
+            await charger.disconnect()
+
+        elif event.kind == EVENT_RECONNECT:
+            if charger.connected:
+                self._count(self.skipped, event.kind)
+                return
+            await self._connect(charger)
+
+        self._count(self.executed, event.kind)
+
+    async def meter_loop(self):
+        """
+        meter_interval(시뮬레이션 초)마다 충전 중인 충전기의 미터 값 갱신,
+        heartbeat_interval마다 하트비트 (충전기를 슬롯별로 분산)
+
+        출력은 실제 경과 시간이 아니라 tick 번호로 계산하므로 재생 속도와 무관하게 결정적이다.
+        """
+        meter_interval = self.scenario["meter_interval"]
+        heartbeat_slots = max(1, int(round(self.scenario["heartbeat_interval"] / meter_interval)))
+        curve = self.scenario["power_curve"]
+        loop = asyncio.get_running_loop()
+        wall_tick = meter_interval / self.time_scale
+        next_tick = loop.time()
+        step = 0
+        while self._running:
+            sim_now = step * meter_interval
+            coros = []
+            for index, charger in enumerate(self.chargers):
+                if not charger.connected:
+                    continue
+                session = self.sessions[index]
+                if session is not None:
+                    fraction = (sim_now - session["started"]) / session["duration"]
+                    power_kw = session["max_kw"] * curve_value(curve, fraction)
+                    charger.current = power_kw * 1000 / charger.voltage
+                    coros.append(charger.charging_tick(power_kw * meter_interval / 3600.0))
+                if index % heartbeat_slots == step % heartbeat_slots:
+                    coros.append(charger.send_heartbeat())
+            if coros:
+                await asyncio.gather(*coros)
+            step += 1
+            next_tick += wall_tick
+            await asyncio.sleep(max(0.0, next_tick - loop.time()))
+
+    async def run(self) -> Dict[str, Any]:
+        """연결 후 타임라인 재생, 보고서 반환"""
+        logger.info(
+            f"시나리오 '{self.scenario['name']}' 재생: 충전기 {self.scenario['chargers']['count']}대, "
+            f"이벤트 {len(self.timeline)}건, 배속 x{self.time_scale:g}"
+        )
+        await self.connect_all()
+        self._running = True
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        meter = asyncio.create_task(self.meter_loop())
+        try:
+            for event in self.timeline:
+                delay = started + event.time / self.time_scale - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                await self.apply(event)
+            remaining = started + self.scenario["duration"] / self.time_scale - loop.time()
+            if remaining > 0:
+                await asyncio.sleep(remaining)
+        finally:
+            self._running = False
+            await meter
+            await asyncio.gather(*(c.disconnect() for c in self.chargers if c.connected), return_exceptions=True)
+        return self.report(loop.time() - started)
+
+    def report(self, elapsed: float) -> Dict[str, Any]:
+        """재생 보고서 (릴리스 간 비교용)"""
+        stats = self.metrics.get_stats()
+        responses = sum(s["count"] for s in stats["rtt"].values())
+        return {
+            "scenario": self.scenario["name"],
+            "seed": self.scenario["seed"],
+            "chargers": len(self.chargers),
+            "sim_duration": self.scenario["duration"],
+            "time_scale": self.time_scale,
+            "elapsed_seconds": elapsed,
+            "timeline": summarize_timeline(self.timeline),
+            "executed": dict(sorted(self.executed.items())),
+            "skipped": dict(sorted(self.skipped.items())),
+            "responses": responses,
+            "responses_per_second": responses / elapsed if elapsed > 0 else 0.0,
+            "rtt": stats["rtt"],
+            "errors": stats["errors"]
+        }
+
+
+def print_report(report: Dict[str, Any]):
+    """보고서 출력"""
+    print(f"\n시나리오 '{report['scenario']}' (seed {report['seed']}) / 충전기 {report['chargers']}대 / "
+          f"{report['elapsed_seconds']:.1f}초 (x{report['time_scale']:g})")
+    print(f"이벤트 실행: {report['executed']}  건너뜀: {report['skipped'] or '없음'}")
+    print(f"응답 {report['responses']}건, {report['responses_per_second']:.1f}건/초")
+    print(f"{'액션':<20}{'count':>9}{'p50(ms)':>10}{'p99(ms)':>10}{'max(ms)':>10}")
+    for action, s in report["rtt"].items():
+        print(f"{action:<20}{s['count']:>9}{s['p50_ms']:>10.1f}{s['p99_ms']:>10.1f}{s['max_ms']:>10.1f}")
+    print(f"오류: {report['errors'] or '없음'}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OCPP 2.0.1 시나리오 트래픽 재생")
+    parser.add_argument("scenario", help="시나리오 파일 (.json / .yaml)")
+    parser.add_argument("--url", help="OCPP 서버 주소 (시나리오 값 대신 사용)")
+    parser.add_argument("--seed", type=int, help="난수 시드 (시나리오 값 대신 사용)")
+    parser.add_argument("--time-scale", type=float, help="재생 배속 (시뮬레이션 초 / 실제 초)")
+    parser.add_argument("--dry-run", action="store_true", help="타임라인 요약만 출력")
+    parser.add_argument("--output", help="보고서 JSON 파일 경로")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    logging.getLogger("charger_simulator").setLevel(logging.WARNING)
+    scenario = load_scenario(args.scenario)
+    if args.seed is not None:
+        scenario["seed"] = args.seed
+
+    if args.dry_run:
+        timeline = build_timeline(scenario)
+        print(f"시나리오 '{scenario['name']}' (seed {scenario['seed']}): 이벤트 {len(timeline)}건")
+        print(json.dumps(summarize_timeline(timeline), ensure_ascii=False))
+        return
+
+    runner = ScenarioRunner(scenario, server_url=args.url, time_scale=args.time_scale)
+    report = asyncio.run(runner.run())
+    print_report(report)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"\n결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
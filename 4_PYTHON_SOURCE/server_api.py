@@ -4,7 +4,8 @@ OCPP 서버 REST API (관리 및 모니터링용)
 from aiohttp import web
 import asyncio
 import logging
-from ocpp_server import OCPPServer
+from ocpp_server import OCPPServer, OCPPCallError
+from protocol_trace import get_trace
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +26,7 @@ class ServerAPI:
         self.app.router.add_post('/chargers/{charger_id}/start', self.start_transaction)
         self.app.router.add_post('/chargers/{charger_id}/stop', self.stop_transaction)
         self.app.router.add_get('/health', self.health_check)
+        self.app.router.add_get('/debug/trace', self.get_protocol_trace)
 
     async def get_chargers(self, request):
         """모든 충전기 조회"""
@@ -55,14 +57,25 @@ class ServerAPI:
             evse_id = data.get('evse_id', 1)
             connector_id = data.get('connector_id', 1)
             
-            success = await self.ocpp_server.request_start_transaction(
+            response = await self.ocpp_server.request_start_transaction(
                 charger_id, evse_id, connector_id
             )
             
-            if success:
-                return web.json_response({"status": "success"})
-            else:
-                return web.json_response({"error": "Failed to start transaction"}, status=400)
+            if response is None:
+                return web.json_response({"error": f"Charger {charger_id} not found"}, status=404)
+            return web.json_response({
+                "status": response.get("status"),
+                "transaction_id": response.get("transactionId"),
+                "response": response
+            })
+        except asyncio.TimeoutError:
+            logger.error(f"거래 시작 응답 타임아웃: {charger_id}")
+            return web.json_response({"error": "Charger response timeout"}, status=504)
+        except OCPPCallError as e:
+            logger.error(f"거래 시작 거부: {e}")
+            return web.json_response(
+                {"error": e.error_message, "error_code": e.error_code}, status=502
+            )
         except Exception as e:
             logger.error(f"거래 시작 실패: {e}")
             return web.json_response({"error": str(e)}, status=500)
@@ -74,21 +87,44 @@ class ServerAPI:
             data = await request.json()
             transaction_id = data.get('transaction_id')
             
-            success = await self.ocpp_server.request_stop_transaction(
+            response = await self.ocpp_server.request_stop_transaction(
                 charger_id, transaction_id
             )
             
-            if success:
-                return web.json_response({"status": "success"})
-            else:
-                return web.json_response({"error": "Failed to stop transaction"}, status=400)
+            if response is None:
+                return web.json_response({"error": f"Charger {charger_id} not found"}, status=404)
+            return web.json_response({
+                "status": response.get("status"),
+                "response": response
+            })
+        except asyncio.TimeoutError:
+            logger.error(f"거래 중지 응답 타임아웃: {charger_id}")
+            return web.json_response({"error": "Charger response timeout"}, status=504)
+        except OCPPCallError as e:
+            logger.error(f"거래 중지 거부: {e}")
+            return web.json_response(
+                {"error": e.error_message, "error_code": e.error_code}, status=502
+            )
         except Exception as e:
             logger.error(f"거래 중지 실패: {e}")
             return web.json_response({"error": str(e)}, status=500)
 
+    async def get_protocol_trace(self, request):
+        """프로토콜 트레이스 조회 (OCPP_PROTOCOL_DEBUG=true일 때 기록됨)"""
+        try:
+            charger_id = request.query.get('charger_id')
+            limit = int(request.query.get('limit', 100))
+            return web.json_response(get_trace().records(charger_id, limit))
+        except ValueError:
+            return web.json_response({"error": "limit은 정수여야 합니다"}, status=400)
+
     async def health_check(self, request):
         """헬스 체크"""
-        return web.json_response({"status": "healthy"})
+        health = {"status": "healthy"}
+        persistence = getattr(self.ocpp_server, "persistence", None)
+        if persistence is not None:
+            health["persistence"] = persistence.get_stats()
+        return web.json_response(health)
 
     async def start(self):
         """API 서버 시작"""
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+테스트 공용 도우미
+전송 프레임을 기록하는 가짜 웹소켓, 충전소/충전기를 미리 만든 임시 SQLite DB
+"""
+
+import sys
+import os
+
+# 프로젝트 경로 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(project_root, '8_DATABASE'))
+
+from database.models import DatabaseManager, ChargerTypeEnum
+from database.services import StationService, ChargerService
+
+
+class FakeWebSocket:
+    """전송 프레임과 종료 여부를 기록하는 테스트용 웹소켓"""
+
+    def __init__(self):
+        self.sent = []
+        self.closed = False
+
+    async def send(self, message):
+        self.sent.append(message)
+
+    async def close(self):
+        self.closed = True
+
+
+def new_database(tmp_dir, charger_ids=("CP001",), db_name="test.db", **charger_fields):
+    """
+    임시 디렉터리에 SQLite DB를 만들고 충전소 ST001과 충전기들을 생성
+
+    Args:
+        tmp_dir: DB 파일을 둘 디렉터리
+        charger_ids: 생성할 충전기 ID 목록
+        db_name: DB 파일 이름
+        **charger_fields: create_charger에 추가로 넘길 값 (예: current_status)
+    """
+    manager = DatabaseManager(f"sqlite:///{os.path.join(tmp_dir, db_name)}")
+    manager.initialize()
+    session = manager.get_session()
+    StationService.create_station(session, "ST001", "테스트 충전소", "제주시", 126.5, 33.5)
+    for charger_id in charger_ids:
+        ChargerService.create_charger(
+            session, charger_id, "ST001", f"SN-{charger_id}", ChargerTypeEnum.FAST,
+            rated_power=50, max_output=50, min_output=5, longitude=126.5, latitude=33.5,
+            **charger_fields
+        )
+    session.close()
+    return manager
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+과거 사용 이력 / 전력 기록 일괄 적재 테스트
+chunk 단위 다중 INSERT, transaction_id·측정 시각 기준 중복 건너뜀, CSV/JSONL 적재 재실행 검증 (SQLite)
+"""
+
+import sys
+import os
+import csv
+import json
+import tempfile
+from datetime import datetime, date, timedelta
+from decimal import Decimal
+
+# 프로젝트 경로 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, '8_DATABASE'))
+sys.path.insert(0, os.path.join(project_root, '6_PYTHON_SCRIPTS'))
+
+from database.models import ChargerUsageLog, PowerConsumption
+from database.services import UsageLogService, PowerConsumptionService
+from import_usage_history import import_file
+from helpers import new_database
+
+START = datetime(2024, 6, 1, 9, 0)
+
+
+def _usage_logs(count):
+    return [
+        {
+            "charger_id": "CP001" if i % 2 else "CP002",
+            "transaction_id": f"TX-{i:05d}",
+            "start_time": START + timedelta(hours=i),
+            "end_time": START + timedelta(hours=i, minutes=45),
+            "energy_delivered": 12.345,
+            "total_charge": 4200,
+            "payment_status": "completed"
+        }
+        for i in range(count)
+    ]
+
+
+def test_bulk_insert_usage_logs_is_idempotent():
+    """chunk 경계를 넘는 입력 중복과 재실행은 건너뛰고, 날짜/시간/금액은 변환"""
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = new_database(tmp, charger_ids=("CP001", "CP002"), db_name="ingest.db")
+        session = manager.get_session()
+        UsageLogService.create_usage_log(session, "CP001", "TX-00003", START.date(), START, total_charge=Decimal("1"))
+
+        logs = _usage_logs(25)
+        first = UsageLogService.bulk_insert_usage_logs(session, iter(logs + logs[:5]), chunk_size=7)
+        again = UsageLogService.bulk_insert_usage_logs(session, logs, chunk_size=100)
+
+        rows = session.query(ChargerUsageLog).order_by(ChargerUsageLog.transaction_id).all()
+        sample = rows[10]
+        kept = session.query(ChargerUsageLog).filter_by(transaction_id="TX-00003").one()
+        result = (len(rows), sample.session_date, sample.duration_minutes,
+                  sample.energy_delivered, sample.total_charge, kept.total_charge)
+        session.close()
+        manager.close()
+
+    assert first == {"inserted": 24, "skipped": 6}
+    assert again == {"inserted": 0, "skipped": 25}
+    assert result == (25, (START + timedelta(hours=10)).date(), 45, Decimal("12.345"), Decimal("4200"), Decimal("1"))
+
+
+def test_import_csv_and_jsonl_files():
+    """CSV 사용 이력/JSONL 전력 기록 적재, 같은 파일 재적재 시 행 수 변화 없음"""
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = new_database(tmp, charger_ids=("CP001", "CP002"), db_name="ingest.db")
+
+        usage_path = os.path.join(tmp, "usage.csv")
+        with open(usage_path, "w", encoding="utf-8", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=[
+                "transaction_id", "charger_id", "start_time", "end_time", "energy_delivered",
+                "total_charge", "payment_status", "max_power", "memo"
+            ])
+            writer.writeheader()
+            for i in range(30):
+                writer.writerow({
+                    "transaction_id": f"CSV-{i}", "charger_id": "CP001",
+                    "start_time": (START + timedelta(hours=i)).isoformat(),
+                    "end_time": "" if i == 0 else (START + timedelta(hours=i, minutes=30)).isoformat(),
+                    "energy_delivered": "20.5", "total_charge": "6150.00",
+                    "payment_status": "completed", "max_power": "48.2", "memo": "무시되는 열"
+                })
+
+        power_path = os.path.join(tmp, "power.jsonl")
+        with open(power_path, "w", encoding="utf-8") as f:
+            for i in range(96):
+                f.write(json.dumps({
+                    "charger_id": "CP002",
+                    "measurement_time": (START + timedelta(minutes=15 * i)).isoformat(),
+                    "input_power": 7.5, "cumulative_energy": 1.875 * i, "is_charging": True
+                }) + "\n")
+
+        usage = import_file(manager, "usage", usage_path, chunk_size=8)
+        power = import_file(manager, "power", power_path, chunk_size=40)
+        usage_again = import_file(manager, "usage", usage_path)
+        power_again = import_file(manager, "power", power_path)
+
+        session = manager.get_session()
+        open_session = session.query(ChargerUsageLog).filter_by(transaction_id="CSV-0").one()
+        closed_session = session.query(ChargerUsageLog).filter_by(transaction_id="CSV-1").one()
+        power_rows = session.query(PowerConsumption).count()
+        last = session.query(PowerConsumption).order_by(PowerConsumption.measurement_time.desc()).first()
+        checks = (
+            open_session.end_time, open_session.duration_minutes,
+            closed_session.duration_minutes, closed_session.max_power, closed_session.total_charge,
+            power_rows, last.measurement_date, last.hour, last.cumulative_energy, last.is_charging
+        )
+        session.close()
+        manager.close()
+
+    assert usage == {"inserted": 30, "skipped": 0} and power == {"inserted": 96, "skipped": 0}
+    assert usage_again == {"inserted": 0, "skipped": 30} and power_again == {"inserted": 0, "skipped": 96}
+    assert checks == (
+        None, None, 30, 48.2, Decimal("6150.00"),
+        96, date(2024, 6, 2), 8, Decimal("178.125"), True
+    )
+
+
+def test_bulk_insert_power_records_skips_existing_measurements():
+    """(충전기, 측정 시각)이 이미 있으면 건너뛰고, 다른 충전기의 같은 시각은 생성"""
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = new_database(tmp, charger_ids=("CP001", "CP002"), db_name="ingest.db")
+        session = manager.get_session()
+        PowerConsumptionService.create_power_record(session, "CP001", START, 7.0, 1.0)
+        records = [
+            {"charger_id": charger_id, "measurement_time": START + timedelta(minutes=5 * i),
+             "input_power": 7.0, "cumulative_energy": 0.5 * i}
+            for charger_id in ("CP001", "CP002") for i in range(10)
+        ]
+        result = PowerConsumptionService.bulk_insert_power_records(session, records, chunk_size=6)
+        total = session.query(PowerConsumption).count()
+        session.close()
+        manager.close()
+
+    assert result == {"inserted": 19, "skipped": 1}
+    assert total == 20
+
+
+if __name__ == "__main__":
+    test_bulk_insert_usage_logs_is_idempotent()
+    test_import_csv_and_jsonl_files()
+    test_bulk_insert_power_records_skips_existing_measurements()
+    print("✅ 일괄 적재 테스트 통과")
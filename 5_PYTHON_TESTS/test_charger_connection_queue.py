@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ChargerConnection 송신 큐 및 연결 상태 테스트
+느린 소켓에서도 send()가 즉시 반환되는지, 큐 초과 정책과 거래 보관 상한이 동작하는지 검증 (실서버 불필요)
+"""
+
+import sys
+import os
+import asyncio
+import gc
+
+import websockets
+
+# 프로젝트 경로 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, '8_DATABASE'))
+sys.path.insert(0, os.path.join(project_root, '4_PYTHON_SOURCE'))
+
+import ocpp_server
+from ocpp_server import ChargerConnection, OVERFLOW_DROP, OVERFLOW_CLOSE, MAX_STORED_TRANSACTIONS
+
+BATCH_PORT = 9149
+
+
+class SlowWebSocket:
+    """release 이벤트가 설정될 때까지 전송을 지연시키는 웹소켓"""
+
+    def __init__(self):
+        self.sent = []
+        self.release = asyncio.Event()
+        self.closed = False
+
+    async def send(self, message):
+        await self.release.wait()
+        self.sent.append(message)
+
+    async def close(self):
+        self.closed = True
+
+
+def test_send_does_not_wait_for_socket():
+    """소켓이 막혀 있어도 send()는 큐 적재 후 바로 반환"""
+    async def run():
+        ws = SlowWebSocket()
+        charger = ChargerConnection("Q_001", ws, "/Q_001")
+        charger.start_writer()
+        for i in range(5):
+            await asyncio.wait_for(charger.send(f"m{i}"), timeout=0.1)
+        assert ws.sent == []
+        ws.release.set()
+        while len(ws.sent) < 5:
+            await asyncio.sleep(0)
+        metrics = charger.get_send_metrics()
+        await charger.stop_writer()
+        return ws, metrics
+
+    ws, metrics = asyncio.run(run())
+    assert ws.sent == [f"m{i}" for i in range(5)]
+    assert metrics["sent"] == 5 and metrics["dropped"] == 0
+    assert metrics["max_queue_depth"] >= 4
+
+
+def test_overflow_drop_policy():
+    """큐 초과 시 drop 정책은 메시지를 버리고 연결 유지"""
+    async def run():
+        ws = SlowWebSocket()
+        charger = ChargerConnection("Q_002", ws, "/Q_002", send_queue_size=2,
+                                    overflow_policy=OVERFLOW_DROP)
+        charger.start_writer()
+        await asyncio.sleep(0)
+        for i in range(6):
+            await charger.send(f"m{i}")
+        metrics = charger.get_send_metrics()
+        connected = charger.connected
+        await charger.stop_writer()
+        return metrics, connected
+
+    metrics, connected = asyncio.run(run())
+    assert connected
+    assert metrics["dropped"] >= 3
+
+
+def test_overflow_close_policy():
+    """큐 초과 시 close 정책은 연결을 끊음"""
+    async def run():
+        ws = SlowWebSocket()
+        charger = ChargerConnection("Q_003", ws, "/Q_003", send_queue_size=1,
+                                    overflow_policy=OVERFLOW_CLOSE)
+        charger.start_writer()
+        await asyncio.sleep(0)
+        for i in range(4):
+            await charger.send(f"m{i}")
+        await asyncio.sleep(0)
+        connected = charger.connected
+        await charger.stop_writer()
+        return ws, connected
+
+    ws, connected = asyncio.run(run())
+    assert not connected
+    assert ws.closed
+
+
+def test_idle_connection_releases_writer():
+    """큐가 비면 송신 태스크가 종료되어 유휴 연결은 태스크를 보유하지 않음"""
+    async def run():
+        ws = SlowWebSocket()
+        ws.release.set()
+        charger = ChargerConnection("Q_004", ws, "/Q_004")
+        charger.start_writer()
+        assert charger.writer_task is None
+        await charger.send("m0")
+        assert charger.writer_task is not None
+        while charger.writer_task is not None:
+            await asyncio.sleep(0)
+        return ws, charger
+
+    ws, charger = asyncio.run(run())
+    assert ws.sent == ["m0"]
+    assert not hasattr(charger, "__dict__")
+
+
+def test_transactions_bounded():
+    """종료 거래는 상한을 넘으면 가장 오래된 것부터 제거"""
+    charger = ChargerConnection("Q_005", SlowWebSocket(), "/Q_005")
+    for i in range(MAX_STORED_TRANSACTIONS + 5):
+        charger.store_transaction(f"tx-{i}", {"transaction_id": f"tx-{i}"})
+    assert len(charger.transactions) == MAX_STORED_TRANSACTIONS
+    assert "tx-4" not in charger.transactions
+    assert next(iter(charger.transactions)) == "tx-5"
+
+
+def test_overflow_close_task_is_kept_and_reaped():
+    """close 정책의 소켓 종료 태스크는 완료까지 참조되고, 종료 중 예외도 회수됨"""
+    class FailingCloseWebSocket(SlowWebSocket):
+        async def close(self):
+            await asyncio.sleep(0.01)
+            self.closed = True
+            raise ConnectionError("already closed")
+
+    unretrieved = []
+
+    async def run():
+        asyncio.get_running_loop().set_exception_handler(lambda loop, context: unretrieved.append(context))
+        ws = FailingCloseWebSocket()
+        charger = ChargerConnection("Q_006", ws, "/Q_006", send_queue_size=1,
+                                    overflow_policy=OVERFLOW_CLOSE)
+        charger.start_writer()
+        for i in range(3):
+            await charger.send(f"m{i}")
+        pending = len(ocpp_server._closing_tasks)
+        gc.collect()
+        await asyncio.sleep(0.05)
+        await charger.stop_writer()
+        return ws, pending, len(ocpp_server._closing_tasks)
+
+    ws, pending, remaining = asyncio.run(run())
+    gc.collect()
+    assert pending == 1 and remaining == 0
+    assert ws.closed
+    assert unretrieved == []
+
+def test_queued_frames_are_written_in_batches():
+    """쌓인 메시지는 묶어서 쓰고 drain은 묶음당 한 번, 수신 측에는 순서대로 한 프레임씩 도착"""
+    count = 150
+
+    async def run():
+        received = []
+        done = asyncio.Event()
+
+        async def collect(websocket):
+            async for message in websocket:
+                received.append(message)
+                if len(received) == count:
+                    done.set()
+
+        async with websockets.serve(collect, "127.0.0.1", BATCH_PORT):
+            async with websockets.connect(f"ws://127.0.0.1:{BATCH_PORT}") as websocket:
+                drains = 0
+                original_drain = websocket.drain
+
+                async def counting_drain():
+                    nonlocal drains
+                    drains += 1
+                    await original_drain()
+
+                websocket.drain = counting_drain
+                charger = ChargerConnection("Q_007", websocket, "/Q_007")
+                charger.start_writer()
+                for i in range(count):
+                    await charger.send(f"m{i}" if i % 2 else f"m{i}".encode())
+                await asyncio.wait_for(done.wait(), 5.0)
+                await charger.stop_writer()
+                return received, drains, charger.get_send_metrics()["sent"]
+
+    received, drains, sent = asyncio.run(run())
+    assert received == [f"m{i}" for i in range(count)]
+    assert sent == count
+    # 150건 / 묶음 64건 -> 3회
+    assert drains == 3
+
+
+if __name__ == "__main__":
+    test_send_does_not_wait_for_socket()
+    test_overflow_drop_policy()
+    test_overflow_close_policy()
+    test_overflow_close_task_is_kept_and_reaped()
+    test_queued_frames_are_written_in_batches()
+    test_idle_connection_releases_writer()
+    test_transactions_bounded()
+    print("✅ 송신 큐 테스트 통과")
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+다중 EVSE 동시 거래 테스트
+EVSE별 거래/계량 상태, 원격 시작/중지 EVSE 선택, 로컬 서버 대상 동시 세션 검증
+"""
+
+import sys
+import os
+import asyncio
+import json
+import logging
+
+# 프로젝트 경로 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, '8_DATABASE'))
+sys.path.insert(0, os.path.join(project_root, '4_PYTHON_SOURCE'))
+
+from charger_simulator import ChargerSimulator
+from ocpp_server import OCPPServer
+from helpers import FakeWebSocket
+
+TEST_PORT = 9144
+
+
+def _new_charger(**kwargs):
+    charger = ChargerSimulator("CP_HUB", **kwargs)
+    charger.websocket = FakeWebSocket()
+    charger.connected = True
+    return charger
+
+
+def _events(charger):
+    frames = [json.loads(m) for m in charger.websocket.sent]
+    return [f[3] for f in frames if f[0] == 2 and f[2] == "TransactionEvent"]
+
+
+def test_concurrent_sessions_per_evse():
+    """EVSE마다 독립된 거래 ID/미터 값으로 동시에 충전 (묶음 모드 포함)"""
+    async def run(batch):
+        charger = _new_charger(num_connectors=3, meter_batch_size=batch)
+        for evse_id in (1, 2, 3):
+            await charger.start_transaction(current=10.0 * evse_id, evse_id=evse_id)
+        await charger.charging_tick(1.0)
+        await charger.charging_tick(1.0, evse_id=3)
+        await charger.stop_transaction(evse_id=2)
+        await charger.charging_tick(1.0)
+        await charger.flush_meter_values()
+        return charger
+
+    charger = asyncio.run(run(1))
+    assert [e.meter_value for e in charger.evses.values()] == [2.0, 0.0, 3.0]
+    assert [e.is_charging for e in charger.evses.values()] == [True, False, True]
+    # 호환 속성은 EVSE 1을 가리킨다
+    assert charger.transaction_id == charger.evses[1].transaction_id and charger.meter_value == 2.0
+    events = _events(charger)
+    assert len({e["transactionData"]["transactionId"] for e in events}) == 3
+    assert [e["evseId"] for e in events if e["eventType"] == "Started"] == [1, 2, 3]
+    ended = [e for e in events if e["eventType"] == "Ended"]
+    assert [e["evseId"] for e in ended] == [2]
+
+    batched = asyncio.run(run(10))
+    updated = [e for e in _events(batched) if e["eventType"] == "Updated"]
+    assert sorted((e["evse"]["id"], len(e["meterValue"])) for e in updated) == [(1, 2), (2, 1), (3, 3)]
+
+
+def test_remote_start_stop_selects_evse():
+    """원격 시작은 지정/빈 EVSE 선택, 원격 중지는 거래 ID로 EVSE 선택"""
+    async def run():
+        charger = _new_charger(num_connectors=2)
+        responses = {}
+
+        async def request(message_id, action, payload):
+            await charger.handle_message(json.dumps([2, message_id, action, payload]))
+            results = [json.loads(m) for m in charger.websocket.sent]
+            responses[message_id] = next(f[2] for f in results if f[0] == 3 and f[1] == message_id)
+
+        await request("s1", "RequestStartTransaction", {"evseId": 2, "idToken": {"idToken": "a", "type": "Central"}})
+        await request("s2", "RequestStartTransaction", {"idToken": {"idToken": "b", "type": "Central"}})
+        await request("s3", "RequestStartTransaction", {"idToken": {"idToken": "c", "type": "Central"}})
+        await request("x1", "RequestStopTransaction", {"transactionId": "unknown"})
+        await request("x2", "RequestStopTransaction", {"transactionId": responses["s1"]["transactionId"]})
+        await request("x3", "RequestStopTransaction", {"transactionId": "default_transaction"})
+        return charger, responses
+
+    charger, responses = asyncio.run(run())
+    assert responses["s1"]["status"] == "Accepted"
+    assert responses["s2"]["status"] == "Accepted"
+    assert responses["s3"]["status"] == "Rejected"
+    assert responses["x1"]["status"] == "Rejected"
+    assert responses["x2"]["status"] == "Accepted"
+    # 충전 중인 EVSE가 하나뿐이면 거래 ID 없이도 종료 (단일 커넥터 호환)
+    assert responses["x3"]["status"] == "Accepted"
+    assert not any(e.is_charging for e in charger.evses.values())
+    ended = [e for e in _events(charger) if e["eventType"] == "Ended"]
+    assert [e["evseId"] for e in ended] == [2, 1]
+
+
+def test_hub_against_local_server():
+    """웹소켓 하나로 EVSE 4개 동시 세션: 서버가 거래 4건을 각각 종료 처리"""
+    logging.getLogger("charger_simulator").setLevel(logging.WARNING)
+
+    async def run():
+        server = OCPPServer(host="127.0.0.1", port=TEST_PORT)
+        server_task = asyncio.create_task(server.start())
+        await asyncio.sleep(0.3)
+        charger = ChargerSimulator("CP_HUB", f"ws://127.0.0.1:{TEST_PORT}", num_connectors=4)
+        await charger.connect(start_loops=False)
+        await asyncio.sleep(0.1)
+        started = [await server.request_start_transaction("CP_HUB", evse_id=evse_id) for evse_id in (1, 2, 3, 4)]
+        await charger.charging_tick(2.0)
+        stopped = [await server.request_stop_transaction("CP_HUB", r["transactionId"]) for r in started]
+        await asyncio.sleep(0.2)
+        stored = dict(server.chargers["CP_HUB"].transactions)
+        await charger.disconnect()
+        server.shutdown_event.set()
+        await server_task
+        return started, stopped, stored
+
+    started, stopped, stored = asyncio.run(run())
+    assert all(r["status"] == "Accepted" for r in started + stopped)
+    assert set(stored) == {r["transactionId"] for r in started}
+    assert all(record["energy_delivered"] == 2.0 for record in stored.values())
+
+
+if __name__ == "__main__":
+    test_concurrent_sessions_per_evse()
+    test_remote_start_stop_selects_evse()
+    test_hub_against_local_server()
+    print("✅ 다중 EVSE 동시 거래 테스트 통과")
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+충전기 재연결 테스트
+지터를 준 지수 백오프, 연결 끊김 후 자동 재연결/재부팅, disconnect 시 재연결 중단 검증
+"""
+
+import sys
+import os
+import asyncio
+import logging
+
+# 프로젝트 경로 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, '8_DATABASE'))
+sys.path.insert(0, os.path.join(project_root, '4_PYTHON_SOURCE'))
+
+import charger_simulator
+from charger_simulator import ChargerSimulator
+from ocpp_server import OCPPServer
+
+TEST_PORT = 9143
+LOOPS_PORT = 9146
+SEND_FAILURE_PORT = 9147
+DISCONNECT_PORT = 9148
+
+
+def test_backoff_delay_bounds():
+    """대기 시간은 [0, min(최대, 기본 * 2^attempt)] 범위에서 흩어진다"""
+    charger = ChargerSimulator("CP_BACKOFF", reconnect_base_delay=1.0, reconnect_max_delay=8.0)
+    first = [charger.reconnect_delay(0) for _ in range(500)]
+    assert all(0 <= d <= 1.0 for d in first)
+    assert max(first) - min(first) > 0.5
+    assert all(0 <= charger.reconnect_delay(2) <= 4.0 for _ in range(500))
+    assert all(0 <= charger.reconnect_delay(20) <= 8.0 for _ in range(500))
+
+
+def test_auto_reconnect_after_drop():
+    """소켓이 끊기면 백오프 후 재연결하고 다시 부팅한다"""
+    logging.getLogger("charger_simulator").setLevel(logging.CRITICAL)
+
+    async def run():
+        server = OCPPServer(host="127.0.0.1", port=TEST_PORT)
+        server_task = asyncio.create_task(server.start())
+        await asyncio.sleep(0.3)
+        charger = ChargerSimulator(
+            "CP_RECONNECT", f"ws://127.0.0.1:{TEST_PORT}",
+            auto_reconnect=True, reconnect_base_delay=0.05, reconnect_max_delay=0.2
+        )
+        await charger.connect(start_loops=False)
+        await asyncio.sleep(0.2)
+        first_boot = charger.boot_accepted_at
+        assert first_boot is not None
+
+        charger.websocket.transport.abort()
+        for _ in range(50):
+            await asyncio.sleep(0.05)
+            if charger.boot_accepted_at != first_boot:
+                break
+        reconnected = charger.reconnect_count
+        boot_stats = server.get_action_stats()["BootNotification"]
+        registered = "CP_RECONNECT" in server.chargers
+
+        # 서버가 내려간 동안에는 재시도가 실패하고, disconnect()로 재연결을 멈출 수 있다
+        server.shutdown_event.set()
+        await server_task
+        charger.websocket.transport.abort()
+        await asyncio.sleep(0.5)
+        failures = charger.reconnect_failures
+        await charger.disconnect()
+        await asyncio.sleep(0.3)
+        return first_boot, charger, reconnected, boot_stats, registered, failures
+
+    first_boot, charger, reconnected, boot_stats, registered, failures = asyncio.run(run())
+    assert reconnected == 1
+    assert charger.boot_accepted_at > first_boot
+    assert registered
+    assert boot_stats["count"] == 2
+    assert boot_stats["p99_ms"] <= boot_stats["max_ms"]
+    assert failures >= 1
+    assert not charger.connected
+    assert charger.metrics.get_stats()["errors"]["disconnect"] == 2
+
+
+
+def _running_loops(name):
+    return sum(1 for task in asyncio.all_tasks() if task.get_coro().__name__ == name and not task.done())
+
+
+async def _wait_reconnect(charger, count):
+    for _ in range(60):
+        await asyncio.sleep(0.05)
+        if charger.reconnect_count >= count and charger.connected:
+            return
+
+
+def test_reconnect_with_loops_keeps_single_loop_set():
+    """start_loops=True로 여러 번 재연결해도 하트비트/충전 루프는 하나씩만 실행"""
+    logging.getLogger("charger_simulator").setLevel(logging.CRITICAL)
+
+    async def run():
+        server = OCPPServer(host="127.0.0.1", port=LOOPS_PORT)
+        server_task = asyncio.create_task(server.start())
+        await asyncio.sleep(0.3)
+        charger = ChargerSimulator(
+            "CP_LOOPS", f"ws://127.0.0.1:{LOOPS_PORT}", heartbeat_interval=0.1, meter_interval=0.1,
+            auto_reconnect=True, reconnect_base_delay=0.02, reconnect_max_delay=0.05
+        )
+        await charger.connect(start_loops=True)
+        for count in range(1, 4):
+            await asyncio.sleep(0.15)
+            charger.websocket.transport.abort()
+            await _wait_reconnect(charger, count)
+        loops = (_running_loops("heartbeat_loop"), _running_loops("charging_loop"), _running_loops("receive_messages"))
+
+        before = server.get_action_stats()["Heartbeat"]["count"]
+        await asyncio.sleep(1.0)
+        heartbeats = server.get_action_stats()["Heartbeat"]["count"] - before
+
+        await charger.disconnect()
+        await asyncio.sleep(0.1)
+        after_disconnect = _running_loops("heartbeat_loop") + _running_loops("charging_loop")
+        server.shutdown_event.set()
+        await server_task
+        return charger.reconnect_count, loops, heartbeats, after_disconnect
+
+    reconnects, loops, heartbeats, after_disconnect = asyncio.run(run())
+    assert reconnects == 3
+    assert loops == (1, 1, 1)
+    assert 5 <= heartbeats <= 12
+    assert after_disconnect == 0
+
+
+def test_reconnect_after_send_failure_and_receive_error():
+    """전송 실패로 먼저 끊기거나 수신 처리 중 예외가 나도 재연결하고, 응답 대기 CALL은 비움"""
+    logging.getLogger("charger_simulator").setLevel(logging.CRITICAL)
+
+    async def run():
+        server = OCPPServer(host="127.0.0.1", port=SEND_FAILURE_PORT)
+        server_task = asyncio.create_task(server.start())
+        await asyncio.sleep(0.3)
+        charger = ChargerSimulator(
+            "CP_SENDFAIL", f"ws://127.0.0.1:{SEND_FAILURE_PORT}",
+            auto_reconnect=True, reconnect_base_delay=0.02, reconnect_max_delay=0.05
+        )
+        await charger.connect(start_loops=False)
+        await asyncio.sleep(0.2)
+
+        async def broken_send(message):
+            raise ConnectionError("broken pipe")
+
+        # 응답이 오지 않을 CALL이 쌓인 상태에서 전송 실패
+        charger._new_call_id("Heartbeat")
+        charger.websocket.send = broken_send
+        await charger.send_heartbeat()
+        await _wait_reconnect(charger, 1)
+        after_send_failure = (charger.reconnect_count, charger.connected)
+
+        # 수신 처리 중 일반 예외
+        original = charger.handle_message
+
+        async def failing_handle(message):
+            charger.handle_message = original
+            raise RuntimeError("bad frame")
+
+        charger.handle_message = failing_handle
+        await charger.send_heartbeat()
+        await _wait_reconnect(charger, 2)
+        after_receive_error = (charger.reconnect_count, charger.connected)
+        await asyncio.sleep(0.2)
+        pending = len(charger.pending_requests)
+
+        await charger.disconnect()
+        server.shutdown_event.set()
+        await server_task
+        return after_send_failure, after_receive_error, pending, charger.metrics.get_stats()["errors"]
+
+    after_send_failure, after_receive_error, pending, errors = asyncio.run(run())
+    assert after_send_failure == (1, True)
+    assert after_receive_error == (2, True)
+    assert pending == 0
+    assert errors["send"] == 1
+
+def test_disconnect_during_reconnect_handshake():
+    """재연결 핸드셰이크 중 disconnect()하면 그 시도는 연결되지 않고 부팅/루프도 시작하지 않음"""
+    logging.getLogger("charger_simulator").setLevel(logging.CRITICAL)
+    original_connect = charger_simulator.websockets.connect
+
+    async def run():
+        server = OCPPServer(host="127.0.0.1", port=DISCONNECT_PORT)
+        server_task = asyncio.create_task(server.start())
+        await asyncio.sleep(0.3)
+        entered = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow_connect(*args, **kwargs):
+            websocket = await original_connect(*args, **kwargs)
+            entered.set()
+            try:
+                await release.wait()
+            except asyncio.CancelledError:
+                await websocket.close()
+                raise
+            return websocket
+
+        results = []
+        for name, tracked in (("CP_DISC_AUTO", True), ("CP_DISC_DIRECT", False)):
+            charger = ChargerSimulator(
+                name, f"ws://127.0.0.1:{DISCONNECT_PORT}", heartbeat_interval=0.05,
+                auto_reconnect=tracked, reconnect_base_delay=0.01, reconnect_max_delay=0.01
+            )
+            await charger.connect(start_loops=True)
+            await asyncio.sleep(0.1)
+            entered.clear()
+            release.clear()
+            charger_simulator.websockets.connect = slow_connect
+            try:
+                charger.websocket.transport.abort()
+                if tracked:
+                    # 자동 재연결 (disconnect()가 재연결 태스크를 취소)
+                    attempt = None
+                else:
+                    # 직접 시작한 재연결 (핸드셰이크 뒤 _closing 재확인)
+                    while charger.connected:
+                        await asyncio.sleep(0.01)
+                    attempt = asyncio.create_task(charger.reconnect())
+                await asyncio.wait_for(entered.wait(), 2.0)
+                await charger.disconnect()
+                release.set()
+                reconnected = await attempt if attempt is not None else None
+            finally:
+                charger_simulator.websockets.connect = original_connect
+            await asyncio.sleep(0.3)
+            results.append((
+                charger.connected, charger.reconnect_count, reconnected,
+                _running_loops("heartbeat_loop"), server.get_action_stats()["BootNotification"]["count"]
+            ))
+        server.shutdown_event.set()
+        await server_task
+        return results
+
+    auto, direct = asyncio.run(run())
+    assert auto == (False, 0, None, 0, 1)
+    assert direct == (False, 0, False, 0, 2)
+
+
+if __name__ == "__main__":
+    test_backoff_delay_bounds()
+    test_auto_reconnect_after_drop()
+    test_reconnect_with_loops_keeps_single_loop_set()
+    test_reconnect_after_send_failure_and_receive_error()
+    test_disconnect_during_reconnect_handshake()
+    print("✅ 충전기 재연결 테스트 통과")
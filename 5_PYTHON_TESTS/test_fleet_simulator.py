@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+대규모 부하 생성기(fleet 모드) 테스트
+지표 집계/병합과 로컬 서버 대상 소규모 부하 실행 검증
+"""
+
+import sys
+import os
+import asyncio
+import logging
+
+# 프로젝트 경로 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, '8_DATABASE'))
+sys.path.insert(0, os.path.join(project_root, '4_PYTHON_SOURCE'))
+
+from fleet_simulator import Fleet, FleetMetrics
+from ocpp_server import OCPPServer
+
+TEST_PORT = 9141
+
+
+def test_metrics_merge():
+    """워커 지표 병합"""
+    first, second = FleetMetrics(), FleetMetrics()
+    first.record_rtt("Heartbeat", 0.010)
+    first.record_error("timeout")
+    second.record_rtt("Heartbeat", 0.020)
+    second.record_error("timeout")
+    second.record_connect(0.005)
+    first.merge(second.to_dict())
+    report = first.report()
+    assert report["rtt"]["Heartbeat"]["count"] == 2
+    assert report["rtt"]["Heartbeat"]["max_ms"] == 20.0
+    assert report["errors"] == {"timeout": 2}
+    assert report["connect"]["count"] == 1
+
+
+def test_fleet_against_local_server():
+    """로컬 서버에 소규모 fleet 실행: 단일 타이머로 하트비트/미터 갱신 전송"""
+    logging.getLogger("charger_simulator").setLevel(logging.WARNING)
+
+    async def run():
+        server = OCPPServer(host="127.0.0.1", port=TEST_PORT)
+        server_task = asyncio.create_task(server.start())
+        await asyncio.sleep(0.3)
+        fleet = Fleet(
+            server_url=f"ws://127.0.0.1:{TEST_PORT}", count=20, ramp_rate=200,
+            heartbeat_interval=0.5, meter_interval=0.5, charging_ratio=0.5, tick=0.05
+        )
+        data = await fleet.run(duration=1.5)
+        stats = server.get_action_stats()
+        server.shutdown_event.set()
+        await server_task
+        return fleet.metrics.report(), data, stats
+
+    report, data, stats = asyncio.run(run())
+    assert report["connect"]["count"] == 20
+    assert data["connected_at_end"] == 20
+    assert report["rtt"]["BootNotification"]["count"] == 20
+    assert report["rtt"]["Heartbeat"]["count"] >= 20
+    assert report["rtt"]["TransactionEvent"]["count"] >= 10
+    assert report["errors"] == {}
+    assert stats["Heartbeat"]["count"] >= report["rtt"]["Heartbeat"]["count"]
+
+
+if __name__ == "__main__":
+    test_metrics_merge()
+    test_fleet_against_local_server()
+    print("✅ fleet 부하 생성기 테스트 통과")
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+줌별 충전기 클러스터 테스트
+증분 갱신(이동·삭제·상태 변경) 결과가 전체 재구성과 같은지, /geo/clusters 응답과 상태 반영 검증 (SQLite)
+"""
+
+import sys
+import os
+import asyncio
+import random
+import tempfile
+
+# 프로젝트 경로 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, '8_DATABASE'))
+sys.path.insert(0, os.path.join(project_root, '4_PYTHON_SOURCE'))
+
+from database.models import DatabaseManager, ChargerTypeEnum
+from database.services import StationService, ChargerService
+from geo_cluster import GeoClusterIndex
+import gis_dashboard_api
+
+STATUSES = ["available", "in_use", "fault", "offline"]
+
+
+def _snapshot(index, zoom):
+    return sorted(
+        (cluster.count, round(cluster.longitude, 9), round(cluster.latitude, 9), sorted(cluster.statuses.items()))
+        for cluster in index.query(zoom)
+    )
+
+
+def test_incremental_updates_match_rebuild():
+    """추가/이동/삭제/상태 변경 후 모든 줌의 클러스터가 재구성 결과와 같음"""
+    rng = random.Random(3)
+    index = GeoClusterIndex(max_zoom=14)
+    index.rebuild(
+        (f"CP{i:05d}", rng.uniform(126.1, 127.0), rng.uniform(33.1, 33.6), rng.choice(STATUSES))
+        for i in range(3000)
+    )
+    for _ in range(2000):
+        key = f"CP{rng.randrange(3200):05d}"
+        action = rng.random()
+        if action < 0.5:
+            index.set_status(key, rng.choice(STATUSES))
+        elif action < 0.8:
+            index.upsert(key, rng.uniform(126.1, 127.0), rng.uniform(33.1, 33.6), rng.choice(STATUSES))
+        else:
+            index.remove(key)
+
+    rebuilt = GeoClusterIndex(max_zoom=14)
+    rebuilt.rebuild((key, lon, lat, status) for key, (lon, lat, status, _, _) in index.points.items())
+    for zoom in range(15):
+        assert _snapshot(index, zoom) == _snapshot(rebuilt, zoom)
+        assert sum(cluster.count for cluster in index.query(zoom)) == len(index)
+
+    # 줌을 낮출수록 클러스터 수가 줄고, 영역 조회는 전체 조회의 부분 집합
+    assert len(index.query(8)) < len(index.query(11)) < len(index.query(14))
+    in_view = index.query(12, 126.4, 33.3, 126.6, 33.4)
+    assert 0 < len(in_view) < len(index.query(12))
+    assert all(126.3 < cluster.longitude < 126.7 and 33.2 < cluster.latitude < 33.5 for cluster in in_view)
+
+
+def test_clusters_endpoint_follows_status_changes():
+    """/geo/clusters 상태별 수가 /live/events·상태 변경 API로 증분 갱신됨"""
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = DatabaseManager(f"sqlite:///{os.path.join(tmp, 'cluster.db')}")
+        manager.initialize()
+        session = manager.get_session()
+        StationService.create_station(session, "ST001", "테스트 충전소", "제주시", 126.5, 33.5)
+        for index in range(10):
+            ChargerService.create_charger(
+                session, f"CP{index:03d}", "ST001", f"SN-{index:03d}", ChargerTypeEnum.FAST,
+                rated_power=50, max_output=50, min_output=5,
+                longitude=126.50 + index * 0.01, latitude=33.50
+            )
+        gis_dashboard_api._geo_index_loaded_at = None
+        try:
+            before = asyncio.run(gis_dashboard_api.get_geo_clusters(3, None, db=session))
+
+            asyncio.run(gis_dashboard_api.ingest_live_events(gis_dashboard_api.LiveEventBatch(
+                statuses={"CP001": "Charging", "CP002": "Available", "CP003": "Faulted", "UNKNOWN": "Charging"}
+            )))
+            asyncio.run(gis_dashboard_api.update_charger_status(
+                "CP004", gis_dashboard_api.ChargerStatusUpdate(status="in_use"), db=session
+            ))
+            after = asyncio.run(gis_dashboard_api.get_geo_clusters(3, "126.0,33.0,127.0,34.0", db=session))
+            outside = asyncio.run(gis_dashboard_api.get_geo_clusters(3, "120.0,30.0,121.0,31.0", db=session))
+            singles = asyncio.run(gis_dashboard_api.get_geo_clusters(20, "126.515,33.4,126.535,33.6", db=session))
+        finally:
+            gis_dashboard_api._geo_index_loaded_at = None
+            session.close()
+            manager.close()
+
+    assert len(before) == 1
+    assert before[0]["count"] == 10 and before[0]["offline"] == 10
+    assert abs(before[0]["longitude"] - 126.545) < 1e-9
+
+    assert len(after) == 1 and outside == []
+    assert (after[0]["available"], after[0]["in_use"], after[0]["fault"], after[0]["offline"]) == (1, 2, 1, 6)
+
+    # 클러스터 최대 줌보다 확대하면 개별 충전기
+    assert sorted((c["charger_id"], c["count"]) for c in singles) == [("CP002", 1), ("CP003", 1)]
+    assert {c["charger_id"]: c["fault"] for c in singles} == {"CP002": 0, "CP003": 1}
+
+
+if __name__ == "__main__":
+    test_incremental_updates_match_rebuild()
+    test_clusters_endpoint_follows_status_changes()
+    print("✅ 클러스터 테스트 통과")
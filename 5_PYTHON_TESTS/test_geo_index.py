@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+충전기 위치 격자 인덱스 테스트
+영역/반경/최근접 조회를 전수 비교 결과와 대조하고, GIS 엔드포인트의 bbox/반경/최근접 파라미터 검증 (SQLite)
+"""
+
+import sys
+import os
+import asyncio
+import random
+import tempfile
+
+# 프로젝트 경로 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, '8_DATABASE'))
+sys.path.insert(0, os.path.join(project_root, '4_PYTHON_SOURCE'))
+
+from database.models import DatabaseManager, ChargerTypeEnum
+from database.services import StationService, ChargerService
+from geo_index import GeoGridIndex, haversine_km
+import gis_dashboard_api
+
+
+def _random_points(count, seed=7):
+    rng = random.Random(seed)
+    return [(f"CP{i:05d}", rng.uniform(126.1, 127.0), rng.uniform(33.1, 33.6)) for i in range(count)]
+
+
+def test_queries_match_brute_force():
+    """bbox/반경/최근접 결과가 전수 비교와 같음 (이동·삭제 포함)"""
+    points = _random_points(5000)
+    index = GeoGridIndex(cell_size=0.02)
+    index.rebuild(points)
+    index.upsert("CP00000", 126.55, 33.45)  # 이동
+    index.remove("CP00001")
+    coords = dict(index.points)
+    assert len(index) == 4999
+
+    rng = random.Random(1)
+    for _ in range(20):
+        west, east = sorted(rng.uniform(126.0, 127.1) for _ in range(2))
+        south, north = sorted(rng.uniform(33.0, 33.7) for _ in range(2))
+        expected = {key for key, (lon, lat) in coords.items()
+                    if west <= lon <= east and south <= lat <= north}
+        assert set(index.bbox(west, south, east, north)) == expected
+
+        lon, lat = rng.uniform(126.1, 127.0), rng.uniform(33.1, 33.6)
+        distances = sorted((haversine_km(lon, lat, *coords[key]), key) for key in coords)
+        radius = rng.uniform(0.5, 10)
+        assert [key for key, _ in index.radius(lon, lat, radius)] == \
+            [key for distance, key in distances if distance <= radius]
+        assert [key for key, _ in index.nearest(lon, lat, 7)] == [key for _, key in distances[:7]]
+
+    # 점이 멀리 떨어져 있어도 최근접 탐색이 찾아감
+    far = GeoGridIndex()
+    far.rebuild([("A", 126.5, 33.5), ("B", 127.5, 34.5)])
+    assert [key for key, _ in far.nearest(120.0, 30.0, 2)] == ["A", "B"]
+
+
+def test_geo_endpoints_with_spatial_filters():
+    """/geo/chargers bbox·반경, /geo/nearest, /geo/heatmap bbox 파라미터"""
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = DatabaseManager(f"sqlite:///{os.path.join(tmp, 'geo.db')}")
+        manager.initialize()
+        session = manager.get_session()
+        StationService.create_station(session, "ST001", "테스트 충전소", "제주시", 126.5, 33.5)
+        for index in range(10):
+            ChargerService.create_charger(
+                session, f"CP{index:03d}", "ST001", f"SN-{index:03d}", ChargerTypeEnum.FAST,
+                rated_power=50, max_output=50, min_output=5,
+                longitude=126.50 + index * 0.01, latitude=33.50
+            )
+        gis_dashboard_api._geo_index_loaded_at = None
+        try:
+            in_view = asyncio.run(gis_dashboard_api.get_geo_chargers(
+                None, None, None, "126.525,33.4,126.555,33.6", None, None, None, db=session
+            ))
+            in_radius = asyncio.run(gis_dashboard_api.get_geo_chargers(
+                None, None, None, None, 126.546, 33.50, 1.5, db=session
+            ))
+            nearest = asyncio.run(gis_dashboard_api.get_nearest_chargers(126.571, 33.501, 3, None, db=session))
+        finally:
+            gis_dashboard_api._geo_index_loaded_at = None
+            session.close()
+            manager.close()
+
+    assert sorted(c["charger_id"] for c in in_view) == ["CP003", "CP004", "CP005"]
+    # 반경 결과는 가까운 순
+    assert [c["charger_id"] for c in in_radius] == ["CP005", "CP004", "CP006", "CP003"]
+    assert [c["charger_id"] for c in nearest] == ["CP007", "CP008", "CP006"]
+    assert nearest[0]["distance_km"] < nearest[1]["distance_km"] and nearest[0]["station_name"] == "테스트 충전소"
+
+
+if __name__ == "__main__":
+    test_queries_match_brute_force()
+    test_geo_endpoints_with_spatial_filters()
+    print("✅ 공간 인덱스 테스트 통과")
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+GIS 엔드포인트 쿼리 수 테스트
+충전기 수(N)를 늘려도 /geo/chargers, /geo/heatmap, /statistics/dashboard, 충전소 요약의
+SQL 실행 횟수가 일정한지 검증 (SQLite)
+"""
+
+import sys
+import os
+import asyncio
+import tempfile
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+# 프로젝트 경로 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, '8_DATABASE'))
+sys.path.insert(0, os.path.join(project_root, '4_PYTHON_SOURCE'))
+
+from sqlalchemy import event
+
+from database.models import (
+    DatabaseManager, StationInfo, ChargerInfo, ChargerUsageLog, DailyChargerStats,
+    ChargerTypeEnum, ChargerStatusEnum
+)
+from database.services import StatisticsService
+import gis_dashboard_api
+
+
+def _seed(tmp_dir, num_chargers, num_days=3):
+    """충전소 1곳에 충전기 N대, 일일 통계 num_days일치, 오늘 완료 세션 1건씩 생성"""
+    manager = DatabaseManager(f"sqlite:///{os.path.join(tmp_dir, f'geo_{num_chargers}.db')}")
+    manager.initialize()
+    session = manager.get_session()
+    session.add(StationInfo(
+        station_id="ST001", station_name="테스트 충전소", address="제주시",
+        longitude=126.5, latitude=33.5
+    ))
+    today = date.today()
+    for index in range(num_chargers):
+        charger_id = f"CP{index:05d}"
+        session.add(ChargerInfo(
+            charger_id=charger_id, station_id="ST001", serial_number=f"SN-{index:05d}",
+            charger_type=ChargerTypeEnum.FAST, rated_power=50, max_output=50, min_output=5,
+            longitude=126.5 + index * 0.001, latitude=33.5,
+            current_status=ChargerStatusEnum.IN_USE if index % 2 else ChargerStatusEnum.AVAILABLE
+        ))
+        session.add(ChargerUsageLog(
+            charger_id=charger_id, transaction_id=f"tx-{index}", session_date=today,
+            start_time=datetime.combine(today, datetime.min.time()),
+            energy_delivered=Decimal("5"), total_charge=Decimal("1500"), payment_status="completed"
+        ))
+        for day in range(num_days):
+            session.add(DailyChargerStats(
+                charger_id=charger_id, stats_date=today - timedelta(days=day),
+                num_sessions=2, total_energy=Decimal("10.5"), total_revenue=Decimal("3000")
+            ))
+    session.commit()
+    session.close()
+    return manager
+
+
+@contextmanager
+def _count_queries(engine):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def _measure(manager):
+    """엔드포인트별 쿼리 수와 결과"""
+    start, end = date.today() - timedelta(days=30), date.today()
+    counts = {}
+    results = {}
+    session = manager.get_session()
+    try:
+        with _count_queries(manager.engine) as statements:
+            results["geo"] = asyncio.run(gis_dashboard_api.get_geo_chargers(
+                None, None, None, None, None, None, None, db=session
+            ))
+        counts["geo"] = len(statements)
+        session.expunge_all()
+
+        gis_dashboard_api.heatmap_tiles = None  # DB별로 다시 적재
+        with _count_queries(manager.engine) as statements:
+            results["heatmap"] = asyncio.run(gis_dashboard_api.get_heatmap_data(start, end, None, db=session))
+        counts["heatmap"] = len(statements)
+
+        with _count_queries(manager.engine) as statements:
+            results["dashboard"] = asyncio.run(gis_dashboard_api.get_dashboard_stats(end, db=session))
+        counts["dashboard"] = len(statements)
+
+        with _count_queries(manager.engine) as statements:
+            results["station"] = StatisticsService.get_station_summary(session, "ST001", start, end)
+        counts["station"] = len(statements)
+    finally:
+        session.close()
+    return counts, results
+
+
+def test_query_count_constant_in_charger_count():
+    """충전기 10대와 200대의 쿼리 수가 같음"""
+    with tempfile.TemporaryDirectory() as tmp:
+        small_manager = _seed(tmp, 10)
+        large_manager = _seed(tmp, 200)
+        small, _ = _measure(small_manager)
+        large, results = _measure(large_manager)
+        small_manager.close()
+        large_manager.close()
+
+    assert small == large, f"충전기 수에 따라 쿼리 수 증가: {small} -> {large}"
+    assert all(count <= 2 for count in large.values()), large
+
+    assert len(results["geo"]) == 200
+    assert results["geo"][0]["station_name"] == "테스트 충전소"
+    heatmap = results["heatmap"]["data"]
+    assert sum(cell["num_chargers"] for cell in heatmap) == 200
+    assert sum(cell["revenue"] for cell in heatmap) == 200 * 9000.0
+    assert abs(sum(cell["energy"] for cell in heatmap) - 200 * 31.5) < 1e-6
+    assert results["station"]["num_chargers"] == 200
+    assert results["station"]["total_revenue"] == Decimal("1800000")
+    dashboard = results["dashboard"]
+    assert dashboard["total_stations"] == 1 and dashboard["total_chargers"] == 200
+    assert dashboard["charger_status"] == {"available": 100, "in_use": 100, "fault": 0, "offline": 0}
+    assert dashboard["daily_stats"] == {
+        "sessions": 200, "total_revenue": 300000.0, "total_energy": 1000.0, "avg_charge": 1500.0
+    }
+
+
+def test_dashboard_cache():
+    """DASHBOARD_CACHE_TTL 동안은 DB 조회 없이 캐시된 응답 반환"""
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = _seed(tmp, 5, num_days=1)
+        session = manager.get_session()
+        original_ttl = gis_dashboard_api.DASHBOARD_CACHE_TTL
+        gis_dashboard_api.DASHBOARD_CACHE_TTL = 60
+        gis_dashboard_api._dashboard_cache.clear()
+        try:
+            first = asyncio.run(gis_dashboard_api.get_dashboard_stats(date.today(), db=session))
+            with _count_queries(manager.engine) as statements:
+                second = asyncio.run(gis_dashboard_api.get_dashboard_stats(date.today(), db=session))
+        finally:
+            gis_dashboard_api.DASHBOARD_CACHE_TTL = original_ttl
+            gis_dashboard_api._dashboard_cache.clear()
+            session.close()
+            manager.close()
+
+    assert statements == []
+    assert second is first and first["total_chargers"] == 5
+
+
+if __name__ == "__main__":
+    test_query_count_constant_in_charger_count()
+    test_dashboard_cache()
+    print("✅ GIS 쿼리 수 테스트 통과")
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+히트맵 격자 누적 배열 테스트
+임의 기간 합계가 전수 합산과 같은지, /geo/heatmap이 전일/당일 값만 증분 갱신하고 충전기 이전 시 다시 적재하는지 검증 (SQLite)
+"""
+
+import sys
+import os
+import asyncio
+import math
+import random
+import tempfile
+from datetime import date, timedelta
+from decimal import Decimal
+
+# 프로젝트 경로 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, '8_DATABASE'))
+sys.path.insert(0, os.path.join(project_root, '4_PYTHON_SOURCE'))
+
+from database.models import DatabaseManager, DailyChargerStats, ChargerTypeEnum
+from database.services import StationService, ChargerService
+from heatmap_tiles import HeatmapTiles
+import gis_dashboard_api
+
+
+def _cell_key(lon, lat, cell_size=0.01):
+    return (math.floor(lon / cell_size), math.floor(lat / cell_size))
+
+
+def test_range_sums_match_brute_force():
+    """임의 기간/영역 합계가 전수 합산과 같고, 날짜 교체·범위 확장이 반영됨"""
+    rng = random.Random(5)
+    first_day = date(2025, 1, 1)
+    chargers = [(f"CP{i:04d}", rng.uniform(126.2, 126.9), rng.uniform(33.2, 33.55)) for i in range(300)]
+    values = []
+    for _ in range(20000):
+        charger_id, lon, lat = rng.choice(chargers)
+        values.append((
+            charger_id, lon, lat, first_day + timedelta(days=rng.randrange(-5, 400)),
+            Decimal(str(round(rng.uniform(0, 60), 3))), Decimal(str(rng.randrange(0, 30000)))
+        ))
+    # 같은 충전기·날짜는 하나로 (DailyChargerStats 유일 제약과 동일)
+    values = list({(v[0], v[3]): v for v in values}.values())
+
+    tiles = HeatmapTiles(first_day, day_capacity=8)
+    assert tiles.replace_days(values) == sum(1 for v in values if v[3] >= first_day)
+
+    # 하루를 새 값으로 교체
+    replaced_day = first_day + timedelta(days=200)
+    values = [v for v in values if v[3] != replaced_day]
+    values.append(("CP0000", *chargers[0][1:], replaced_day, Decimal("7.5"), Decimal("1234")))
+    tiles.replace_days([v for v in values if v[3] == replaced_day], {replaced_day})
+
+    for _ in range(30):
+        start = first_day + timedelta(days=rng.randrange(-10, 420))
+        end = start + timedelta(days=rng.randrange(0, 400))
+        bbox = (126.4, 33.3, 126.7, 33.5) if rng.random() < 0.3 else None
+
+        expected = {}
+        for charger_id, lon, lat, stats_date, energy, revenue in values:
+            if max(start, first_day) <= stats_date <= end:
+                cell = expected.setdefault(_cell_key(lon, lat), [0.0, 0.0])
+                cell[0] += float(energy)
+                cell[1] += float(revenue)
+
+        result = {_cell_key(c["longitude"], c["latitude"]): c for c in tiles.query(start, end, bbox)}
+        if bbox is None:
+            assert set(result) == {key for key, (e, r) in expected.items() if e > 0 or r > 0}
+        for key, cell in result.items():
+            assert abs(cell["energy"] - expected[key][0]) < 1e-3
+            assert abs(cell["revenue"] - expected[key][1]) < 1e-2
+            if bbox is not None:
+                assert 126.4 <= cell["longitude"] <= 126.7 and 33.3 <= cell["latitude"] <= 33.5
+
+    assert tiles.query(first_day - timedelta(days=30), first_day - timedelta(days=1)) == []
+
+
+def test_heatmap_endpoint_refreshes_recent_days():
+    """/geo/heatmap: 첫 조회에 전체 적재, 이후에는 갱신 주기마다 전일/당일만 다시 읽음"""
+    today = date.today()
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = DatabaseManager(f"sqlite:///{os.path.join(tmp, 'heatmap.db')}")
+        manager.initialize()
+        session = manager.get_session()
+        StationService.create_station(session, "ST001", "테스트 충전소", "제주시", 126.5, 33.5)
+        for index in range(4):
+            ChargerService.create_charger(
+                session, f"CP{index:03d}", "ST001", f"SN-{index:03d}", ChargerTypeEnum.FAST,
+                rated_power=50, max_output=50, min_output=5,
+                longitude=126.501 + (index // 2) * 0.05, latitude=33.501
+            )
+            for days_ago in (1, 100):
+                session.add(DailyChargerStats(
+                    charger_id=f"CP{index:03d}", stats_date=today - timedelta(days=days_ago),
+                    num_sessions=1, total_energy=Decimal("10"), total_revenue=Decimal("3000")
+                ))
+        session.commit()
+
+        gis_dashboard_api.heatmap_tiles = None
+        try:
+            year = asyncio.run(gis_dashboard_api.get_heatmap_data(
+                today - timedelta(days=365), today, None, db=session
+            ))
+            week = asyncio.run(gis_dashboard_api.get_heatmap_data(
+                today - timedelta(days=7), today, "126.4,33.4,126.52,33.6", db=session
+            ))
+
+            # 당일 통계 추가 -> 갱신 주기 전에는 그대로, 지난 뒤에는 반영
+            session.add(DailyChargerStats(
+                charger_id="CP000", stats_date=today,
+                num_sessions=1, total_energy=Decimal("2.5"), total_revenue=Decimal("500")
+            ))
+            session.commit()
+            cached = asyncio.run(gis_dashboard_api.get_heatmap_data(today, today, None, db=session))
+            gis_dashboard_api._heatmap_refreshed_at -= gis_dashboard_api.HEATMAP_REFRESH_INTERVAL
+            refreshed = asyncio.run(gis_dashboard_api.get_heatmap_data(today, today, None, db=session))
+            total = asyncio.run(gis_dashboard_api.get_heatmap_data(
+                today - timedelta(days=365), today, None, db=session
+            ))
+
+            # CP000을 다른 칸으로 이전 -> 다음 갱신에서 과거 값까지 새 칸으로 옮김
+            ChargerService.get_charger(session, "CP000").longitude = 126.701
+            session.commit()
+            gis_dashboard_api._heatmap_refreshed_at -= gis_dashboard_api.HEATMAP_REFRESH_INTERVAL
+            relocated = asyncio.run(gis_dashboard_api.get_heatmap_data(
+                today - timedelta(days=365), today, None, db=session
+            ))
+        finally:
+            gis_dashboard_api.heatmap_tiles = None
+            session.close()
+            manager.close()
+
+    # 충전기 2대씩 두 칸
+    assert sorted((c["num_chargers"], c["revenue"], c["energy"]) for c in year["data"]) == [
+        (2, 12000.0, 40.0), (2, 12000.0, 40.0)
+    ]
+    assert [(c["revenue"], c["energy"]) for c in week["data"]] == [(6000.0, 20.0)]
+    assert cached["data"] == []
+    assert [(c["revenue"], c["energy"]) for c in refreshed["data"]] == [(500.0, 2.5)]
+    assert sorted(c["revenue"] for c in total["data"]) == [12000.0, 12500.0]
+    assert sorted((c["num_chargers"], c["revenue"]) for c in relocated["data"]) == [
+        (1, 6000.0), (1, 6500.0), (2, 12000.0)
+    ]
+    assert any(c["longitude"] > 126.7 and c["revenue"] == 6500.0 for c in relocated["data"])
+
+
+if __name__ == "__main__":
+    test_range_sums_match_brute_force()
+    test_heatmap_endpoint_refreshes_recent_days()
+    print("✅ 히트맵 격자 테스트 통과")
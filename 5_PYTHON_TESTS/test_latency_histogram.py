@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+왕복 시간 HDR 히스토그램 테스트
+백분위수 정확도, 병합/직렬화, 시뮬레이터 CALLRESULT/CALLERROR 매칭 검증
+"""
+
+import sys
+import os
+import asyncio
+import json
+import random
+
+# 프로젝트 경로 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, '8_DATABASE'))
+sys.path.insert(0, os.path.join(project_root, '4_PYTHON_SOURCE'))
+
+from latency_histogram import LatencyHistogram, LatencyRecorder
+from charger_simulator import ChargerSimulator
+from helpers import FakeWebSocket
+
+
+def test_percentile_accuracy():
+    """정렬 기준 백분위수와 상대 오차 1% 이내"""
+    rng = random.Random(7)
+    values = [rng.lognormvariate(-4, 1) for _ in range(20000)]
+    hist = LatencyHistogram()
+    for value in values:
+        hist.record(value)
+
+    ordered = sorted(values)
+    for pct in (50, 90, 99, 99.9):
+        exact = ordered[int(pct / 100 * len(ordered)) - 1]
+        assert abs(hist.percentile(pct) - exact) / exact < 0.02, pct
+    assert hist.count == 20000
+    assert hist.max_us == int(max(values) * 1_000_000)
+    # 버킷 수는 샘플 수가 아니라 값의 범위에 비례
+    assert len(hist.counts) < 1000
+    assert LatencyHistogram().percentile(99) == 0.0
+
+
+def test_recorder_merge_roundtrip():
+    """JSON 직렬화 후 병합해도 같은 결과"""
+    first, second = LatencyRecorder(), LatencyRecorder()
+    for i in range(1, 101):
+        first.record_rtt("Heartbeat", i / 1000)
+        second.record_rtt("Heartbeat", (100 + i) / 1000)
+    second.record_rtt("BootNotification", 0.004)
+    second.record_error("timeout")
+
+    first.merge_dict(json.loads(json.dumps(second.to_dict())))
+    stats = first.get_stats()
+    assert stats["rtt"]["Heartbeat"]["count"] == 200
+    assert abs(stats["rtt"]["Heartbeat"]["p50_ms"] - 100) < 1
+    assert stats["rtt"]["Heartbeat"]["max_ms"] == 200.0
+    assert stats["rtt"]["BootNotification"]["count"] == 1
+    assert stats["errors"] == {"timeout": 1}
+    assert "Heartbeat n=200" in first.format_summary()
+
+
+def test_simulator_resolves_pending():
+    """send 시 등록한 메시지 ID를 CALLRESULT/CALLERROR로 해소하고 액션별로 기록"""
+    async def run():
+        charger = ChargerSimulator("CP_LAT")
+        charger.websocket = FakeWebSocket()
+        charger.connected = True
+
+        await charger.send_boot_notification()
+        await charger.send_heartbeat()
+        await charger.send_heartbeat()
+        assert len(charger.pending_requests) == 3
+
+        boot_id, hb_id, hb2_id = [json.loads(m)[1] for m in charger.websocket.sent]
+        await charger.handle_message(json.dumps([3, boot_id, {"status": "Accepted"}]))
+        await charger.handle_message(json.dumps([3, hb_id, {}]))
+        await charger.handle_message(json.dumps([4, hb2_id, "InternalError", "", {}]))
+        # 모르는 ID의 응답은 무시
+        await charger.handle_message(json.dumps([3, "unknown", {}]))
+        return charger.get_latency_stats()
+
+    stats = asyncio.run(run())
+    assert stats["pending"] == 0
+    assert stats["rtt"]["BootNotification"]["count"] == 1
+    assert stats["rtt"]["Heartbeat"]["count"] == 2
+    assert stats["errors"] == {"Heartbeat:InternalError": 1}
+
+
+if __name__ == "__main__":
+    test_percentile_accuracy()
+    test_recorder_merge_roundtrip()
+    test_simulator_resolves_pending()
+    print("✅ 왕복 시간 히스토그램 테스트 통과")
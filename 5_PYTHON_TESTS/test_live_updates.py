@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+대시보드 실시간 전달 테스트
+LivePublisher -> /live/events -> LiveHub -> /ws/live 구독자까지의 변경분 전달 검증 (SQLite)
+"""
+
+import sys
+import os
+import asyncio
+import json
+import tempfile
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+# 프로젝트 경로 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, '8_DATABASE'))
+sys.path.insert(0, os.path.join(project_root, '4_PYTHON_SOURCE'))
+
+import uvicorn
+import websockets
+
+from database.models import ChargerStatusEnum
+from database.services import UsageLogService
+from live_push import LivePublisher
+import gis_dashboard_api
+from helpers import new_database
+
+TEST_PORT = 9145
+
+
+def test_publisher_to_websocket_subscriber():
+    """상태 변경과 거래 종료가 구독자에게 변경분과 갱신된 집계로 전달됨"""
+    async def run():
+        server = uvicorn.Server(uvicorn.Config(
+            gis_dashboard_api.app, host="127.0.0.1", port=TEST_PORT, log_level="error"
+        ))
+        server_task = asyncio.create_task(server.serve())
+        while not server.started:
+            assert not server_task.done(), "대시보드 API 시작 실패"
+            await asyncio.sleep(0.01)
+
+        publisher = LivePublisher(f"http://127.0.0.1:{TEST_PORT}/live/events")
+        try:
+            async with websockets.connect(f"ws://127.0.0.1:{TEST_PORT}/ws/live") as websocket:
+                snapshot = json.loads(await websocket.recv())
+
+                publisher.record_status("CP000", "Occupied")
+                publisher.record_status("CP001", "Charging")
+                publisher.record_status("CP001", "Faulted")  # 마지막 상태만 전달
+                publisher.record_status("UNKNOWN", "Available")
+                publisher.record_transaction("CP000", "Updated", "tx-1", 1.0, 0)
+                publisher.record_transaction("CP002", "Ended", "tx-2", 12.5, 3750)
+                assert await publisher.push()
+                delta = json.loads(await asyncio.wait_for(websocket.recv(), 5))
+
+                # 변화 없는 상태(Occupied -> Charging 모두 사용 중)는 배포하지 않음
+                publisher.record_status("CP000", "Charging")
+                assert await publisher.push()
+                try:
+                    quiet = await asyncio.wait_for(websocket.recv(), 0.3)
+                except asyncio.TimeoutError:
+                    quiet = None
+        finally:
+            await publisher.stop()
+            server.should_exit = True
+            await server_task
+        return snapshot, delta, publisher.stats, quiet
+
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = new_database(
+            tmp, charger_ids=("CP000", "CP001", "CP002"), db_name="live.db",
+            current_status=ChargerStatusEnum.AVAILABLE
+        )
+        gis_dashboard_api.db_manager = manager
+        try:
+            snapshot, delta, stats, quiet = asyncio.run(run())
+        finally:
+            gis_dashboard_api.db_manager = None
+            gis_dashboard_api.live_hub.subscribers.clear()
+            manager.close()
+
+    assert snapshot["type"] == "snapshot"
+    assert snapshot["dashboard"]["charger_status"]["available"] == 3
+    assert delta["type"] == "delta"
+    assert delta["chargers"] == [
+        {"charger_id": "CP000", "current_status": "in_use"},
+        {"charger_id": "CP001", "current_status": "fault"},
+    ]
+    assert delta["dashboard"]["charger_status"] == {"available": 1, "in_use": 1, "fault": 1, "offline": 0}
+    assert delta["dashboard"]["daily_stats"]["sessions"] == 1
+    assert delta["dashboard"]["daily_stats"]["total_revenue"] == 3750.0
+    assert quiet is None
+    assert stats["pushed"] == 2 and stats["failed"] == 0
+
+
+def test_slow_subscriber_dropped():
+    """큐가 가득 찬 구독자는 배포 대상에서 제외되고 종료 신호를 받음"""
+    async def run():
+        hub = gis_dashboard_api.LiveHub(queue_size=2)
+        slow = hub.subscribe()
+        hub.publish("a")
+        hub.publish("b")
+        hub.publish("c")
+        return hub, slow
+
+    hub, slow = asyncio.run(run())
+    assert slow not in hub.subscribers
+    assert [slow.get_nowait(), slow.get_nowait()] == ["b", None]
+
+
+
+def test_hub_counts_each_completed_session_once():
+    """재전송된 종료 거래, DB에 이미 반영된 거래, 다른 날짜 세션은 당일 집계에 더하지 않음"""
+    today = datetime.now(timezone.utc).date()
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = new_database(
+            tmp, charger_ids=("CP000", "CP001", "CP002"), db_name="live.db",
+            current_status=ChargerStatusEnum.AVAILABLE
+        )
+        session = manager.get_session()
+        UsageLogService.bulk_insert_usage_logs(session, [{
+            "charger_id": "CP000", "transaction_id": "tx-db", "start_time": datetime.combine(today, datetime.min.time()),
+            "total_charge": 1000, "energy_delivered": 4, "payment_status": "completed"
+        }])
+        session.close()
+        gis_dashboard_api.db_manager = manager
+        try:
+            hub = gis_dashboard_api.LiveHub()
+            hub.ensure_loaded()
+            loaded_date = hub.summary_date
+            before = hub.summary['num_sessions']
+            ended = {"charger_id": "CP001", "transaction_id": "tx-1", "session_date": today.isoformat(),
+                     "energy_kwh": 10.0, "total_cost": 3000}
+            hub.apply(gis_dashboard_api.LiveEventBatch(sessions=[
+                ended,
+                dict(ended),  # 같은 묶음 안의 재전송
+                {**ended, "transaction_id": "tx-db"},  # 이미 DB 집계에 포함
+                {**ended, "transaction_id": "tx-old", "session_date": (today - timedelta(days=1)).isoformat()},
+            ]))
+            hub.apply(gis_dashboard_api.LiveEventBatch(sessions=[ended]))  # 다음 묶음의 재전송
+            summary = hub.summary
+        finally:
+            gis_dashboard_api.db_manager = None
+            manager.close()
+
+    assert loaded_date == today  # 세션 날짜와 같은 UTC 기준
+    assert before == 1
+    assert summary['num_sessions'] == 2
+    assert summary['total_revenue'] == Decimal("4000")
+    assert summary['total_energy'] == Decimal("14")
+
+
+def test_publisher_sends_session_start_date():
+    """종료 거래에 시작 이벤트의 날짜를 붙여 전달"""
+    publisher = LivePublisher("http://127.0.0.1:1/live/events")
+    publisher.record_transaction("CP000", "Started", "tx-1")
+    publisher._started["tx-1"] = ("CP000", "2024-12-31")  # 자정 전에 시작한 거래
+    publisher.record_transaction("CP000", "Ended", "tx-1", 5.0, 1500)
+    publisher.record_transaction("CP000", "Ended", "tx-2", 1.0, 300)
+    sessions = publisher.take_batch()["sessions"]
+    assert [item["session_date"] for item in sessions] == [
+        "2024-12-31", datetime.now(timezone.utc).date().isoformat()
+    ]
+    assert publisher._started == {}
+
+
+def test_publisher_forgets_unfinished_transactions():
+    """종료되지 않은 거래는 Offline 시 정리되고, 가득 차도 새 거래의 시작 날짜를 기록"""
+    publisher = LivePublisher("http://127.0.0.1:1/live/events", max_sessions=3)
+    for index in range(3):
+        publisher.record_transaction(f"CP00{index}", "Started", f"tx-{index}")
+    publisher.record_status("CP001", "Offline")
+    assert list(publisher._started) == ["tx-0", "tx-2"]
+
+    publisher.record_transaction("CP003", "Started", "tx-3")
+    publisher.record_transaction("CP004", "Started", "tx-4")
+    assert list(publisher._started) == ["tx-2", "tx-3", "tx-4"]
+    publisher._started["tx-4"] = ("CP004", "2024-12-31")
+    publisher.record_transaction("CP004", "Ended", "tx-4", 1.0, 300)
+    assert publisher.take_batch()["sessions"][0]["session_date"] == "2024-12-31"
+
+if __name__ == "__main__":
+    test_publisher_to_websocket_subscriber()
+    test_slow_subscriber_dropped()
+    test_hub_counts_each_completed_session_once()
+    test_publisher_sends_session_start_date()
+    test_publisher_forgets_unfinished_transactions()
+    print("✅ 실시간 전달 테스트 통과")
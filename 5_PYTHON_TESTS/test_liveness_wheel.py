@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+연결 생존 감시 타이머 휠 테스트
+수신 시각 갱신, 만료 처리, 서버 연동(오프라인 처리 및 소켓 종료) 검증
+"""
+
+import sys
+import os
+import asyncio
+
+# 프로젝트 경로 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, '8_DATABASE'))
+sys.path.insert(0, os.path.join(project_root, '4_PYTHON_SOURCE'))
+
+from liveness import LivenessWheel
+from ocpp_server import OCPPServer, ChargerConnection
+from helpers import FakeWebSocket
+
+
+class FakeClock:
+    """수동으로 진행하는 시계"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class Conn:
+    last_seen = 0.0
+
+
+def test_idle_connection_expires():
+    """timeout 동안 수신이 없으면 만료"""
+    clock = FakeClock()
+    expired = []
+    wheel = LivenessWheel(timeout=10, on_expire=expired.append, tick=1, clock=clock)
+    conn = Conn()
+    wheel.add(conn)
+
+    clock.now += 9
+    assert wheel.advance() == []
+    clock.now += 1.5
+    assert wheel.advance() == [conn]
+    assert expired == [conn] and len(wheel) == 0
+
+
+def test_activity_postpones_expiry():
+    """수신 시 last_seen만 갱신하면 만료가 미뤄짐"""
+    clock = FakeClock()
+    expired = []
+    wheel = LivenessWheel(timeout=10, on_expire=expired.append, tick=1, clock=clock)
+    busy, idle = Conn(), Conn()
+    wheel.add(busy)
+    wheel.add(idle)
+
+    for _ in range(30):
+        clock.now += 1
+        busy.last_seen = clock.now
+        wheel.advance()
+    assert expired == [idle]
+    assert len(wheel) == 1
+
+    wheel.remove(busy)
+    clock.now += 100
+    assert wheel.advance() == []
+
+
+def test_server_marks_stale_charger_offline():
+    """만료된 충전기는 연결 해제 표시 후 소켓 종료"""
+    async def run():
+        server = OCPPServer(liveness_timeout=5)
+        charger = ChargerConnection("TEST_001", FakeWebSocket(), "/TEST_001")
+        server.liveness.add(charger)
+        charger.last_seen -= 10
+        server.liveness.advance(charger.last_seen + 30)
+        await asyncio.sleep(0)
+        return charger
+
+    charger = asyncio.run(run())
+    assert charger.connected is False
+    assert charger.websocket.closed is True
+
+
+if __name__ == "__main__":
+    test_idle_connection_expires()
+    test_activity_postpones_expiry()
+    test_server_marks_stale_charger_offline()
+    print("✅ 생존 감시 테스트 통과")
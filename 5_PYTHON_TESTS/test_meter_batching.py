@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+미터 값 묶음 전송 테스트
+템플릿 프레임 형식, 시뮬레이터 묶음/flush 동작, 서버의 meterValue 단위 해석 검증
+"""
+
+import sys
+import os
+import asyncio
+import json
+
+# 프로젝트 경로 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, '8_DATABASE'))
+sys.path.insert(0, os.path.join(project_root, '4_PYTHON_SOURCE'))
+
+from ocpp_messages import TransactionEventTemplate, utc_timestamp
+from ocpp_models import compile_request_validators
+from ocpp_server import OCPPServer, ChargerConnection, read_meter_values
+from charger_simulator import ChargerSimulator
+from helpers import FakeWebSocket
+
+
+class FakePersistence:
+    """record_transaction 호출을 기록하는 저장 파이프라인 대역"""
+
+    def __init__(self):
+        self.transactions = []
+
+    def record_transaction(self, *args):
+        self.transactions.append(args)
+
+
+def test_template_frame_is_valid():
+    """템플릿 프레임은 유효한 JSON이며 TransactionEvent 검증을 통과하고 seqNo가 증가"""
+    template = TransactionEventTemplate('tx-"%d')
+    samples = [(utc_timestamp(1700000000 + i), 1000.0 * i, 7000.0) for i in range(3)]
+    first = json.loads(template.updated("m1", samples))
+    second = json.loads(template.updated("m2", samples[:1]))
+
+    assert first[:3] == [2, "m1", "TransactionEvent"]
+    payload = first[3]
+    compile_request_validators()["TransactionEvent"](payload)
+    assert payload["transactionInfo"]["transactionId"] == 'tx-"%d'
+    assert payload["timestamp"] == "2023-11-14T22:13:22Z"
+    assert [mv["sampledValue"][0]["value"] for mv in payload["meterValue"]] == [0.0, 1000.0, 2000.0]
+    assert (payload["seqNo"], second[3]["seqNo"]) == (1, 2)
+
+
+def test_simulator_batches_and_flushes():
+    """batch 크기만큼 모이면 한 프레임으로 전송, 거래 종료 시 남은 샘플 전송"""
+    async def run():
+        charger = ChargerSimulator("CP_BATCH", meter_batch_size=3)
+        charger.websocket = FakeWebSocket()
+        charger.connected = True
+        await charger.start_transaction(current=16.0)
+        for _ in range(4):
+            await charger.charging_tick(0.5)
+        await charger.stop_transaction()
+        return [json.loads(m) for m in charger.websocket.sent]
+
+    frames = asyncio.run(run())
+    events = [f[3] for f in frames if f[2] == "TransactionEvent"]
+    assert [e["eventType"] for e in events] == ["Started", "Updated", "Updated", "Ended"]
+    assert [len(e["meterValue"]) for e in events[1:3]] == [3, 1]
+    energies = [mv["sampledValue"][0]["value"] for e in events[1:3] for mv in e["meterValue"]]
+    assert energies == [500.0, 1000.0, 1500.0, 2000.0]
+    assert len(frames) == 4
+
+
+def test_server_reads_meter_value_units():
+    """서버는 meterValue의 단위/배수를 반영해 마지막 샘플을 kWh로 저장"""
+    assert read_meter_values([
+        {"timestamp": "t", "sampledValue": [{"value": 1500}]},
+        {"timestamp": "t", "sampledValue": [
+            {"value": 2.5, "measurand": "Energy.Active.Import.Register", "unitOfMeasure": {"unit": "kWh"}},
+            {"value": 7.2, "measurand": "Power.Active.Import", "unitOfMeasure": {"unit": "kW"}}
+        ]}
+    ]) == (2.5, 7200.0)
+    assert read_meter_values([{"sampledValue": [{"value": 12, "unitOfMeasure": {"unit": "Wh", "multiplier": 3}}]}]) == (12.0, None)
+    assert read_meter_values([]) == (None, None)
+
+    async def run():
+        persistence = FakePersistence()
+        server = OCPPServer(persistence=persistence)
+        charger = ChargerConnection("CP_BATCH", FakeWebSocket(), "/CP_BATCH")
+        template = TransactionEventTemplate("tx-1")
+        frame = json.loads(template.updated("m1", [(utc_timestamp(), 1200.0, 7000.0), (utc_timestamp(), 2400.0, 6500.0)]))
+        await server.handle_request(charger, frame[1], frame[2], frame[3])
+        return persistence.transactions, charger.websocket.sent
+
+    transactions, sent = asyncio.run(run())
+    assert transactions == [("CP_BATCH", "Updated", "tx-1", 2.4, 0, 6500.0)]
+    assert json.loads(sent[-1])[:2] == [3, "m1"]
+
+
+if __name__ == "__main__":
+    test_template_frame_is_valid()
+    test_simulator_batches_and_flushes()
+    test_server_reads_meter_value_units()
+    print("✅ 미터 값 묶음 전송 테스트 통과")
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+멀티 프로세스 샤딩 서버 테스트
+레지스트리 반영/정리, 워커 변경분 계산, 마스터 명령 전달과 응답/오류 변환,
+워커 재기동 시 대기 명령 실패 처리 검증 (소켓/프로세스 없이)
+"""
+
+import sys
+import os
+import asyncio
+import queue
+import time
+from types import SimpleNamespace
+
+# 프로젝트 경로 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, '8_DATABASE'))
+sys.path.insert(0, os.path.join(project_root, '4_PYTHON_SOURCE'))
+
+from ocpp_cluster import ShardRegistry, ShardWorker, ShardedOCPPServer
+from ocpp_server import OCPPCallError
+
+
+def _entry(worker_id, heartbeat=1.0):
+    return {"worker_id": worker_id, "connected": True, "boot_status": "Accepted", "last_heartbeat": heartbeat}
+
+
+def test_registry_publish_and_purge():
+    """다른 워커로 옮겨간 충전기는 이전 워커의 삭제 요청으로 지워지지 않음"""
+    registry = ShardRegistry({})
+    registry.publish(0, {"CP001": _entry(0), "CP002": _entry(0)}, [])
+    registry.publish(1, {"CP003": _entry(1), "CP002": _entry(1)}, [])
+    registry.publish(0, {}, ["CP001", "CP002"])
+    assert registry.lookup("CP001") is None
+    assert registry.lookup("CP002")["worker_id"] == 1
+
+    registry.publish(0, {"CP004": _entry(0)}, [])
+    registry.purge_worker(1)
+    assert sorted(registry.snapshot()) == ["CP004"]
+
+
+def test_worker_collects_only_changes():
+    """마지막 동기화 이후 바뀐 충전기와 사라진 충전기만 보고"""
+    chargers = {
+        "CP001": SimpleNamespace(connected=True, boot_status="Accepted", last_heartbeat=1.0),
+        "CP002": SimpleNamespace(connected=True, boot_status="Pending", last_heartbeat=2.0),
+    }
+    server = SimpleNamespace(chargers=chargers, shutdown_event=asyncio.Event())
+    worker = ShardWorker(3, server, ShardRegistry({}), None, None)
+
+    changed, removed = worker._collect_changes()
+    assert sorted(changed) == ["CP001", "CP002"] and removed == []
+    assert changed["CP001"] == _entry(3)
+    assert worker._collect_changes() == ({}, [])
+
+    chargers["CP002"].last_heartbeat = 5.0
+    del chargers["CP001"]
+    changed, removed = worker._collect_changes()
+    assert list(changed) == ["CP002"] and changed["CP002"]["last_heartbeat"] == 5.0
+    assert removed == ["CP001"]
+
+
+class SlowQueue(queue.Queue):
+    """Manager 프록시처럼 put이 오래 걸리는 큐"""
+
+    def put(self, item, block=True, timeout=None):
+        time.sleep(0.2)
+        super().put(item, block, timeout)
+
+
+def _cluster(command_queue):
+    cluster = ShardedOCPPServer(workers=1, command_timeout=2.0)
+    cluster.registry = ShardRegistry({"CP001": _entry(0)})
+    cluster.command_queues = [command_queue]
+    cluster.reply_queue = queue.Queue()
+    return cluster
+
+
+def test_dispatch_maps_replies_and_errors():
+    """워커 응답을 결과/TimeoutError/OCPPCallError/RuntimeError로 변환, 큐 put은 루프를 막지 않음"""
+    replies = [
+        {"result": {"status": "Accepted"}},
+        {"error": "timeout"},
+        {"error": "call_error", "error_code": "NotSupported", "error_message": "no"},
+        {"error": "exception", "error_message": "boom"},
+    ]
+
+    async def run():
+        command_queue = SlowQueue()
+        cluster = _cluster(command_queue)
+        loop = asyncio.get_running_loop()
+        reply_task = asyncio.create_task(cluster._reply_loop())
+
+        async def fake_worker():
+            for reply in replies:
+                command = await loop.run_in_executor(None, command_queue.get)
+                assert command["method"] == "request_start_transaction"
+                assert command["args"] == ("CP001", 2, 1)
+                cluster.reply_queue.put({"request_id": command["request_id"], **reply})
+
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        worker_task = asyncio.create_task(fake_worker())
+        ticker_task = asyncio.create_task(ticker())
+        outcomes = []
+        for _ in replies:
+            try:
+                outcomes.append(await cluster.request_start_transaction("CP001", 2, 1))
+            except OCPPCallError as e:
+                outcomes.append(("call_error", e.error_code))
+            except asyncio.TimeoutError:
+                outcomes.append("timeout")
+            except RuntimeError as e:
+                outcomes.append(("runtime", str(e)))
+        missing = await cluster.request_start_transaction("CP999")
+        await worker_task
+        ticker_task.cancel()
+        reply_task.cancel()
+        return outcomes, missing, ticks, cluster._waiters
+
+    outcomes, missing, ticks, waiters = asyncio.run(run())
+    assert outcomes == [
+        {"status": "Accepted"}, "timeout", ("call_error", "NotSupported"), ("runtime", "boom")
+    ]
+    assert missing is None
+    # put 4회 x 0.2초 동안 이벤트 루프가 계속 동작
+    assert ticks >= 40
+    assert waiters == {}
+
+
+def test_worker_restart_fails_pending_commands():
+    """종료된 워커는 레지스트리 정리 후 재기동되고, 그 워커에 보낸 명령은 즉시 실패"""
+
+    async def run():
+        command_queue = queue.Queue()
+        cluster = _cluster(command_queue)
+        started = []
+        cluster._start_worker = started.append
+
+        pending = asyncio.create_task(cluster.request_stop_transaction("CP001", "tx-1"))
+        while command_queue.empty():
+            await asyncio.sleep(0.01)
+        cluster._restart_worker(0)
+        cluster._fail_waiters(0)
+        try:
+            await pending
+            outcome = "returned"
+        except RuntimeError as e:
+            outcome = str(e)
+        return outcome, started, cluster.restart_count, cluster.registry.snapshot(), cluster._waiters
+
+    outcome, started, restarts, registry, waiters = asyncio.run(run())
+    assert outcome == "워커 0 종료"
+    assert started == [0] and restarts == 1
+    assert registry == {} and waiters == {}
+
+
+def test_worker_replies_off_loop_and_keeps_command_tasks():
+    """워커의 응답 큐 put은 루프를 막지 않고, 실행 중인 명령 태스크는 참조 유지 후 정리"""
+
+    class FakeServer:
+        def __init__(self):
+            self.chargers = {}
+            self.shutdown_event = asyncio.Event()
+
+        async def request_start_transaction(self, charger_id, evse_id, remote_start_id):
+            await asyncio.sleep(0.05)
+            return {"status": "Accepted", "charger_id": charger_id}
+
+    async def run():
+        server = FakeServer()
+        command_queue = queue.Queue()
+        reply_queue = SlowQueue()
+        worker = ShardWorker(0, server, ShardRegistry({}), command_queue, reply_queue)
+        for i in range(3):
+            command_queue.put({"request_id": f"r{i}", "method": "request_start_transaction",
+                               "args": (f"CP00{i}", 1, i)})
+        command_queue.put({"request_id": "r3", "method": "unknown", "args": ()})
+
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker_task = asyncio.create_task(ticker())
+        loop_task = asyncio.create_task(worker.command_loop())
+        while len(worker._commands) < 4:
+            await asyncio.sleep(0.005)
+        in_flight = len(worker._commands)
+        while reply_queue.qsize() < 4:
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.01)
+        command_queue.put(None)
+        await loop_task
+        ticker_task.cancel()
+        replies = sorted((reply_queue.get() for _ in range(4)), key=lambda r: r["request_id"])
+        return in_flight, worker._commands, replies, ticks
+
+    in_flight, remaining, replies, ticks = asyncio.run(run())
+    assert in_flight == 4 and remaining == set()
+    assert [r.get("result", {}).get("charger_id") for r in replies[:3]] == ["CP000", "CP001", "CP002"]
+    assert replies[3]["error"] == "exception"
+    # put 4회 x 0.2초 (스레드 풀에서 병렬) 동안 이벤트 루프가 계속 동작
+    assert ticks >= 15
+
+
+if __name__ == "__main__":
+    test_registry_publish_and_purge()
+    test_worker_collects_only_changes()
+    test_dispatch_maps_replies_and_errors()
+    test_worker_restart_fails_pending_commands()
+    test_worker_replies_off_loop_and_keeps_command_tasks()
+    print("✅ 샤딩 서버 테스트 통과")
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+OCPP JSON 코덱 테스트
+설치된 모든 코덱이 동일한 결과를 내는지, 메시지 생성/파싱과 호환되는지 검증
+"""
+
+import sys
+import os
+
+# 프로젝트 경로 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, '4_PYTHON_SOURCE'))
+
+from ocpp_codec import available_codecs, select_codec
+from ocpp_messages import OCPPMessage, OCPPv201RequestBuilder
+
+
+def test_codecs_round_trip():
+    """모든 코덱의 인코딩/디코딩 왕복 결과 일치"""
+    frame = [2, "id-1", "TransactionEvent", {"eventType": "Updated", "value": 1.5, "station": "제주"}]
+    for codec in available_codecs():
+        encoded = codec.dumps(frame)
+        assert isinstance(encoded, bytes), codec.name
+        assert isinstance(codec.dumps_str(frame), str), codec.name
+        assert codec.loads(encoded) == frame, codec.name
+        assert codec.loads(encoded.decode("utf-8")) == frame, codec.name
+
+
+def test_stdlib_fallback_selectable():
+    """표준 json 코덱은 항상 선택 가능"""
+    assert select_codec("json").name == "json"
+    assert select_codec("not-installed").name == available_codecs()[0].name
+
+
+def test_encode_and_parse_compatible():
+    """bytes/str 메시지 모두 parse_message로 파싱"""
+    encoded = OCPPMessage.encode_call_result("m1", {"status": "Accepted"})
+    assert OCPPMessage.parse_message(encoded) == (3, "m1", "", {"status": "Accepted"})
+
+    raw = OCPPv201RequestBuilder.heartbeat()
+    message_type, _, action, payload = OCPPMessage.parse_message(raw)
+    assert (message_type, action, payload) == (2, "Heartbeat", {})
+
+
+def test_invalid_json_raises_value_error():
+    """잘못된 JSON은 ValueError"""
+    try:
+        OCPPMessage.parse_message("[2, broken")
+    except ValueError:
+        return
+    assert False, "ValueError가 발생해야 합니다"
+
+
+if __name__ == "__main__":
+    test_codecs_round_trip()
+    test_stdlib_fallback_selectable()
+    test_encode_and_parse_compatible()
+    test_invalid_json_raises_value_error()
+    print("✅ 코덱 테스트 통과")
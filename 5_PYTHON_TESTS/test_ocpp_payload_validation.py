@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+OCPP 요청 페이로드 검증 테스트
+검증 활성화 시 잘못된 페이로드는 FormatViolation CallError, 비활성화 시 기존 동작 유지
+"""
+
+import sys
+import os
+import asyncio
+import json
+
+# 프로젝트 경로 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, '8_DATABASE'))
+sys.path.insert(0, os.path.join(project_root, '4_PYTHON_SOURCE'))
+
+from ocpp_server import OCPPServer, ChargerConnection
+from ocpp_messages import OCPPMessage, OCPPv201RequestBuilder
+from ocpp_models import REQUEST_MODELS, compile_request_validators
+from helpers import FakeWebSocket
+
+
+def _dispatch(server, action, payload):
+    async def run():
+        charger = ChargerConnection("TEST_001", FakeWebSocket(), "/TEST_001")
+        await server.handle_request(charger, "m1", action, payload)
+        return json.loads(charger.websocket.sent[-1])
+
+    return asyncio.run(run())
+
+
+def _payload(raw):
+    return OCPPMessage.parse_message(raw)[3]
+
+
+def test_simulator_payloads_are_valid():
+    """시뮬레이터가 보내는 요청은 모두 검증 통과"""
+    validators = compile_request_validators()
+    assert set(validators) == set(REQUEST_MODELS)
+    validators["BootNotification"](_payload(OCPPv201RequestBuilder.boot_notification("M", "V")))
+    validators["Heartbeat"](_payload(OCPPv201RequestBuilder.heartbeat()))
+    validators["StatusNotification"](_payload(OCPPv201RequestBuilder.status_notification(1, 1, "Occupied")))
+    validators["TransactionEvent"](_payload(OCPPv201RequestBuilder.transaction_event("Started", "tx-1", 1, 1)))
+    validators["Authorize"](_payload(OCPPv201RequestBuilder.authorize("TOKEN")))
+
+
+def test_invalid_payload_rejected_with_format_violation():
+    """검증 활성화 시 잘못된 페이로드는 핸들러를 거치지 않고 CallError"""
+    server = OCPPServer(validate_payloads=True)
+    frame = _dispatch(server, "BootNotification", {"reason": "NotAReason"})
+    assert frame[0] == OCPPMessage.CALLERROR
+    assert frame[2] == "FormatViolation"
+    assert frame[3].startswith("reason:")
+    assert server.get_action_stats()["BootNotification"]["errors"] == 1
+
+    frame = _dispatch(server, "StatusNotification", _payload(OCPPv201RequestBuilder.status_notification(1, 1)))
+    assert frame[0] == OCPPMessage.CALLRESULT
+
+
+def test_validation_disabled_by_default():
+    """기본값에서는 검증하지 않음 (기존 동작 유지)"""
+    server = OCPPServer()
+    assert server.validators == {}
+    frame = _dispatch(server, "BootNotification", {"reason": "NotAReason"})
+    assert frame[0] == OCPPMessage.CALLRESULT
+
+
+def test_meter_event_firmware_payloads():
+    """MeterValues / NotifyEvent / FirmwareStatusNotification도 핸들러 전에 검증"""
+    server = OCPPServer(validate_payloads=True)
+    now = "2025-01-01T00:00:00Z"
+    valid = {
+        "MeterValues": {"evseId": 1, "meterValue": [{"timestamp": now, "sampledValue": [{"value": 7.2}]}]},
+        "NotifyEvent": {"generatedAt": now, "seqNo": 0, "eventData": [{
+            "eventId": 1, "timestamp": now, "trigger": "Delta", "actualValue": "Faulted",
+            "component": {"name": "Connector"}, "variable": {"name": "AvailabilityState"},
+            "eventNotificationType": "HardWiredNotification"
+        }]},
+        "FirmwareStatusNotification": {"status": "Installed", "requestId": 3},
+    }
+    invalid = {
+        "MeterValues": ({"evseId": 1, "meterValue": []}, "meterValue:"),
+        "NotifyEvent": ({**valid["NotifyEvent"], "eventData": [{"eventId": 1}]}, "eventData.0."),
+        "FirmwareStatusNotification": ({"status": "Flashing"}, "status:"),
+    }
+    for action, payload in valid.items():
+        assert _dispatch(server, action, payload)[0] == OCPPMessage.CALLRESULT, action
+    for action, (payload, location) in invalid.items():
+        frame = _dispatch(server, action, payload)
+        assert frame[0] == OCPPMessage.CALLERROR and frame[2] == "FormatViolation", action
+        assert frame[3].startswith(location), frame[3]
+
+
+if __name__ == "__main__":
+    test_simulator_payloads_are_valid()
+    test_invalid_payload_rejected_with_format_violation()
+    test_validation_disabled_by_default()
+    test_meter_event_firmware_payloads()
+    print("✅ 페이로드 검증 테스트 통과")
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+서버 발신 CALL 요청/응답 상관 테스트
+메시지 ID 기반 응답 매칭, 타임아웃 제거, 연결 종료 시 실패 처리 검증 (실서버 불필요)
+"""
+
+import sys
+import os
+import asyncio
+import json
+
+# 프로젝트 경로 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, '8_DATABASE'))
+sys.path.insert(0, os.path.join(project_root, '4_PYTHON_SOURCE'))
+
+from ocpp_server import OCPPServer, ChargerConnection, OCPPCallError
+from helpers import FakeWebSocket
+
+
+def _connect(server, charger_id="TEST_001"):
+    charger = ChargerConnection(charger_id, FakeWebSocket(), f"/{charger_id}")
+    server.chargers[charger_id] = charger
+    return charger
+
+
+async def _wait_for_frame(charger):
+    while not charger.websocket.sent:
+        await asyncio.sleep(0)
+    return json.loads(charger.websocket.sent[-1])
+
+
+def test_start_transaction_returns_charger_answer():
+    """RequestStartTransaction 응답 페이로드 반환"""
+    async def run():
+        server = OCPPServer()
+        charger = _connect(server)
+        task = asyncio.create_task(server.request_start_transaction("TEST_001"))
+        frame = await _wait_for_frame(charger)
+        assert frame[0] == 2 and frame[2] == "RequestStartTransaction"
+        await server.handle_response("TEST_001", frame[1], {"status": "Accepted", "transactionId": "tx-1"})
+        result = await task
+        return server, charger, result
+
+    server, charger, result = asyncio.run(run())
+    assert result == {"status": "Accepted", "transactionId": "tx-1"}
+    assert server.pending_requests == {}
+    assert charger.pending_calls == set()
+
+
+def test_call_error_raises():
+    """CALLERROR 응답 시 OCPPCallError 발생"""
+    async def run():
+        server = OCPPServer()
+        charger = _connect(server)
+        task = asyncio.create_task(server.request_stop_transaction("TEST_001", "tx-1"))
+        frame = await _wait_for_frame(charger)
+        await server.handle_call_error("TEST_001", frame[1], "NotSupported", {"errorMessage": "no"})
+        try:
+            await task
+        except OCPPCallError as e:
+            return server, e
+        return server, None
+
+    server, error = asyncio.run(run())
+    assert error is not None and error.error_code == "NotSupported"
+    assert server.pending_requests == {}
+
+
+def test_timeout_evicts_pending_request():
+    """응답 타임아웃 시 상관 테이블에서 제거"""
+    async def run():
+        server = OCPPServer(call_timeout=0.01)
+        _connect(server)
+        try:
+            await server.request_start_transaction("TEST_001")
+        except asyncio.TimeoutError:
+            return server
+        return None
+
+    server = asyncio.run(run())
+    assert server is not None
+    assert server.pending_requests == {}
+
+
+def test_disconnect_fails_pending_calls():
+    """연결 종료 시 대기 중인 CALL 실패 처리"""
+    async def run():
+        server = OCPPServer()
+        charger = _connect(server)
+        task = asyncio.create_task(server.request_start_transaction("TEST_001"))
+        await _wait_for_frame(charger)
+        server._fail_pending_calls(charger)
+        try:
+            await task
+        except ConnectionError:
+            return server
+        return None
+
+    server = asyncio.run(run())
+    assert server is not None
+    assert server.pending_requests == {}
+
+
+def test_unknown_charger_returns_none():
+    """연결되지 않은 충전기는 None 반환"""
+    assert asyncio.run(OCPPServer().request_start_transaction("NOPE")) is None
+
+
+def test_response_from_other_charger_is_ignored():
+    """다른 충전기가 같은 메시지 ID로 보낸 응답/오류는 대기 중인 CALL에 반영하지 않음"""
+    async def run():
+        server = OCPPServer()
+        charger = _connect(server)
+        _connect(server, "TEST_002")
+        task = asyncio.create_task(server.request_start_transaction("TEST_001"))
+        frame = await _wait_for_frame(charger)
+        await server.handle_response("TEST_002", frame[1], {"status": "Rejected"})
+        await server.handle_call_error("TEST_002", frame[1], "InternalError", {})
+        still_pending = not task.done() and frame[1] in server.pending_requests
+        await server.handle_response("TEST_001", frame[1], {"status": "Accepted"})
+        return still_pending, await task
+
+    still_pending, result = asyncio.run(run())
+    assert still_pending
+    assert result == {"status": "Accepted"}
+
+
+def test_explicit_zero_timeout_is_kept():
+    """timeout=0은 기본 제한 시간으로 바뀌지 않고 즉시 타임아웃"""
+    async def run():
+        server = OCPPServer(call_timeout=30)
+        _connect(server)
+        started = asyncio.get_running_loop().time()
+        try:
+            await server.request_start_transaction("TEST_001", timeout=0)
+        except asyncio.TimeoutError:
+            return asyncio.get_running_loop().time() - started
+        return None
+
+    elapsed = asyncio.run(run())
+    assert elapsed is not None and elapsed < 1.0
+
+
+if __name__ == "__main__":
+    test_start_transaction_returns_charger_answer()
+    test_call_error_raises()
+    test_timeout_evicts_pending_request()
+    test_disconnect_fails_pending_calls()
+    test_unknown_charger_returns_none()
+    test_response_from_other_charger_is_ignored()
+    test_explicit_zero_timeout_is_kept()
+    print("✅ CALL 상관 테스트 통과")
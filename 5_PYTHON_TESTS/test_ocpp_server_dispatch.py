@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+OCPP 서버 액션 디스패치 테스트
+핸들러 레지스트리 등록/해제 및 액션별 통계 검증 (실서버 불필요)
+"""
+
+import sys
+import os
+import asyncio
+import json
+
+# 프로젝트 경로 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, '8_DATABASE'))
+sys.path.insert(0, os.path.join(project_root, '4_PYTHON_SOURCE'))
+
+from ocpp_server import OCPPServer, ChargerConnection
+from helpers import FakeWebSocket
+
+
+def _new_charger(charger_id="TEST_001"):
+    return ChargerConnection(charger_id, FakeWebSocket(), f"/{charger_id}")
+
+
+def test_default_handlers_registered():
+    """기본 액션 핸들러 등록 여부"""
+    server = OCPPServer()
+    for action in ("BootNotification", "Heartbeat", "StatusNotification",
+                   "TransactionEvent", "Authorize", "MeterValues",
+                   "NotifyEvent", "FirmwareStatusNotification"):
+        assert action in server.handlers
+
+
+def test_unknown_action_returns_not_implemented():
+    """미등록 액션은 NotImplemented CallError 응답"""
+    async def run():
+        server = OCPPServer()
+        charger = _new_charger()
+        await server.handle_request(charger, "m1", "DataTransfer", {})
+        return charger
+
+    charger = asyncio.run(run())
+    frame = json.loads(charger.websocket.sent[-1])
+    assert frame[0] == 4 and frame[1] == "m1" and frame[2] == "NotImplemented"
+
+
+def test_register_handler_decorator_and_stats():
+    """데코레이터 등록 핸들러 호출 및 액션 통계 집계"""
+    calls = []
+
+    async def run():
+        server = OCPPServer()
+
+        @server.register_handler("DataTransfer")
+        async def handle_data_transfer(charger, message_id, payload):
+            calls.append((charger.charger_id, message_id, payload))
+
+        charger = _new_charger()
+        await server.handle_request(charger, "m2", "DataTransfer", {"vendorId": "x"})
+        await server.handle_request(charger, "m3", "Heartbeat", {})
+        return server
+
+    server = asyncio.run(run())
+    assert calls == [("TEST_001", "m2", {"vendorId": "x"})]
+
+    stats = server.get_action_stats()
+    assert stats["DataTransfer"]["count"] == 1
+    assert stats["Heartbeat"]["count"] == 1
+    assert stats["Heartbeat"]["errors"] == 0
+
+    assert server.unregister_handler("DataTransfer")
+    assert "DataTransfer" not in server.handlers
+
+
+def test_handler_exception_counts_as_error():
+    """핸들러 예외 시 InternalError 응답 및 오류 카운트"""
+    async def run():
+        server = OCPPServer()
+
+        async def broken(charger, message_id, payload):
+            raise RuntimeError("boom")
+
+        server.register_handler("Heartbeat", broken)
+        charger = _new_charger()
+        await server.handle_request(charger, "m4", "Heartbeat", {})
+        return server, charger
+
+    server, charger = asyncio.run(run())
+    frame = json.loads(charger.websocket.sent[-1])
+    assert frame[2] == "InternalError"
+    assert server.get_action_stats()["Heartbeat"]["errors"] == 1
+
+
+if __name__ == "__main__":
+    test_default_handlers_registered()
+    test_unknown_action_returns_not_implemented()
+    test_register_handler_decorator_and_stats()
+    test_handler_exception_counts_as_error()
+    print("✅ 디스패치 테스트 통과")
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+DB 비동기 저장 파이프라인 테스트
+SQLite 임시 DB로 상태/거래 이벤트 일괄 반영과 핸들러 비대기 응답 검증 (PostgreSQL 불필요)
+"""
+
+import sys
+import os
+import asyncio
+import json
+import tempfile
+
+# 프로젝트 경로 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, '8_DATABASE'))
+sys.path.insert(0, os.path.join(project_root, '4_PYTHON_SOURCE'))
+
+from database.models import ChargerUsageLog, PowerConsumption, ChargerStatusEnum
+from database.services import ChargerService
+from persistence import PersistencePipeline
+from ocpp_server import OCPPServer, ChargerConnection
+from ocpp_messages import OCPPMessage, OCPPv201RequestBuilder
+from helpers import FakeWebSocket, new_database
+
+
+def test_events_written_in_batches():
+    """상태/거래 이벤트가 병합되어 일괄 반영되고 미등록 충전기는 건너뜀"""
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = new_database(tmp, db_name="persist.db")
+
+        async def run():
+            pipeline = PersistencePipeline(manager.get_session, flush_interval=0.05, batch_size=100)
+            pipeline.start()
+            pipeline.record_status("CP001", "Available")
+            pipeline.record_status("CP001", "Occupied")
+            pipeline.record_transaction("CP001", "Started", "tx-1", 0.0, 0, power_w=0.0)
+            pipeline.record_transaction("CP001", "Updated", "tx-1", 1.5, 0, power_w=7000.0)
+            pipeline.record_status("UNKNOWN", "Available")
+            await asyncio.sleep(0.2)
+            pipeline.record_transaction("CP001", "Ended", "tx-1", 3.25, 975)
+            await pipeline.stop()
+            return pipeline.get_stats()
+
+        stats = asyncio.run(run())
+        session = manager.get_session()
+        charger = ChargerService.get_charger(session, "CP001")
+        log = session.query(ChargerUsageLog).filter_by(transaction_id="tx-1").one()
+        power_rows = session.query(PowerConsumption).count()
+        session.close()
+        manager.close()
+
+    assert charger.current_status == ChargerStatusEnum.IN_USE
+    assert float(log.energy_delivered) == 3.25
+    assert float(log.total_charge) == 975
+    assert log.status == "completed" and log.end_time is not None
+    assert power_rows == 2
+    assert stats["written"] == 5 and stats["skipped"] == 1 and stats["failed"] == 0
+    assert stats["batches"] == 2 and stats["pending"] == 0
+
+
+def test_stop_during_flush_window_writes_collected_events():
+    """flush 대기 중 stop()해도 run()이 이미 꺼낸 이벤트를 반영"""
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = new_database(tmp, db_name="persist.db")
+
+        async def run():
+            pipeline = PersistencePipeline(manager.get_session, flush_interval=2.0, batch_size=100)
+            pipeline.start()
+            pipeline.record_transaction("CP001", "Started", "tx-1", 0.0, 0)
+            pipeline.record_transaction("CP001", "Ended", "tx-1", 3.25, 975)
+            await asyncio.sleep(0.1)
+            assert pipeline.queue.empty()
+            await pipeline.stop()
+            return pipeline.get_stats()
+
+        stats = asyncio.run(run())
+        session = manager.get_session()
+        logs = session.query(ChargerUsageLog).count()
+        session.close()
+        manager.close()
+
+    assert stats["queued"] == 2 and stats["written"] == 2 and stats["failed"] == 0 and stats["pending"] == 0
+    assert logs == 1
+
+def test_handler_does_not_wait_for_database():
+    """TransactionEvent 응답은 큐 적재 직후 전송 (DB 반영 전)"""
+    class RecordingPipeline:
+        def __init__(self):
+            self.events = []
+
+        def record_transaction(self, *args):
+            self.events.append(args)
+
+        def record_status(self, *args):
+            self.events.append(args)
+
+    async def run():
+        pipeline = RecordingPipeline()
+        server = OCPPServer(persistence=pipeline)
+        charger = ChargerConnection("CP001", FakeWebSocket(), "/CP001")
+        raw = OCPPv201RequestBuilder.transaction_event("Ended", "tx-9", 1, 1, meter_value=2.0, current=16.0)
+        _, message_id, _, payload = OCPPMessage.parse_message(raw)
+        await server.handle_transaction_event(charger, message_id, payload)
+        return pipeline, json.loads(charger.websocket.sent[-1])
+
+    pipeline, frame = asyncio.run(run())
+    assert frame[0] == OCPPMessage.CALLRESULT
+    assert pipeline.events == [("CP001", "Ended", "tx-9", 2.0, 0, 6400.0)]
+
+
+if __name__ == "__main__":
+    test_events_written_in_batches()
+    test_stop_during_flush_window_writes_collected_events()
+    test_handler_does_not_wait_for_database()
+    print("✅ 저장 파이프라인 테스트 통과")
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+전력 시계열 저장소 테스트
+묶음 이어 쓰기/봉인/기간 조회/축약, 파이프라인 저장, 테이블 이전과 전력 조회 API 결과 일치 검증 (SQLite)
+"""
+
+import sys
+import os
+import asyncio
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+import numpy as np
+
+# 프로젝트 경로 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, '8_DATABASE'))
+sys.path.insert(0, os.path.join(project_root, '4_PYTHON_SOURCE'))
+sys.path.insert(0, os.path.join(project_root, '6_PYTHON_SCRIPTS'))
+
+from database.models import PowerConsumption
+from database.services import PowerConsumptionService
+from database.timeseries import PowerSeriesStore, POWER_DTYPE, records_to_array, to_timestamp
+from persistence import PersistencePipeline, EVENT_TRANSACTION
+from migrate_power_to_timeseries import migrate
+import gis_dashboard_api
+from helpers import new_database
+
+DAY = datetime(2025, 3, 1)
+
+
+def _readings(start, count, step_seconds=5):
+    """(측정 시각, 전력, 전압, 전류, 누적 에너지) 목록"""
+    return [
+        (start + timedelta(seconds=i * step_seconds), 7.0 + (i % 4), 220.0 if i % 3 else None, 32.0, 0.01 * i)
+        for i in range(count)
+    ]
+
+
+def test_store_append_seal_read_downsample():
+    """날짜별 이어 쓰기, 순서 섞인 입력 정렬, 봉인 후에도 같은 조회 결과, 구간 축약"""
+    with tempfile.TemporaryDirectory() as tmp:
+        store = PowerSeriesStore(tmp)
+        # 자정을 넘기는 측정값을 두 번에 나눠, 순서를 섞어 씀
+        rows = _readings(DAY - timedelta(minutes=5), 240)
+        store.append("CP001", records_to_array(rows[120:]))
+        store.append("CP001", records_to_array(rows[:120]))
+        assert store.days("CP001") == [(DAY - timedelta(days=1)).date(), DAY.date()]
+
+        # 쓰는 중인 불완전 레코드는 무시
+        with open(os.path.join(tmp, "CP001", f"{DAY.date()}.bin"), "ab") as f:
+            f.write(b"\x00" * (POWER_DTYPE.itemsize // 2))
+
+        # 불완전 레코드 뒤에 이어 쓴 측정값도 정상 조회 (잘라낸 뒤 이어 씀)
+        late = [(DAY + timedelta(minutes=30), 9.0, 230.0, 16.0, 5.0)]
+        store.append("CP001", records_to_array(late))
+        tail = store.read("CP001", late[0][0], late[0][0])
+        assert tail.tolist() == records_to_array(late).tolist()
+        assert len(store.read_day("CP001", DAY.date())) == 240 - 60 + 1
+
+        start, end = DAY - timedelta(minutes=2), DAY + timedelta(minutes=10)
+        hot = store.read("CP001", start, end)
+        expected = [row for row in rows if start <= row[0] <= end]
+        assert len(hot) == len(expected)
+        assert np.all(np.diff(hot["timestamp"]) > 0)
+        assert hot["timestamp"][0] == to_timestamp(expected[0][0])
+
+        # 1분 구간: 12개씩, 평균/최대 전력, 전압은 있는 값만 평균, 에너지는 구간 마지막 값
+        series = store.downsample("CP001", DAY, DAY + timedelta(minutes=3) - timedelta(seconds=1), 60)
+        assert series["samples"].tolist() == [12, 12, 12]
+        assert series["power_avg"].tolist() == [8.5, 8.5, 8.5]
+        assert series["power_max"].tolist() == [10.0, 10.0, 10.0]
+        assert series["voltage"].tolist() == [220.0, 220.0, 220.0]
+        assert abs(series["energy"][0] - 0.01 * (60 + 11)) < 1e-9
+
+        assert store.seal(DAY.date() + timedelta(days=1)) == 2
+        assert sorted(os.listdir(os.path.join(tmp, "CP001"))) == ["2025-02-28.npz", "2025-03-01.npz"]
+        sealed = store.read("CP001", start, end)
+        assert sealed.tobytes() == hot.tobytes()  # 전압 NaN 포함 비교
+
+        # 같은 하루치를 다시 써도 중복되지 않음
+        before = len(store.read_day("CP001", DAY.date()))
+        assert store.write_day("CP001", DAY.date(), records_to_array(rows[60:])) == before
+
+        try:
+            store.append("../x", records_to_array(rows[:1]))
+            assert False, "경로 이탈 충전기 ID 허용"
+        except ValueError:
+            pass
+
+
+def test_pipeline_writes_power_to_store():
+    """파이프라인에 저장소를 주면 전력 측정값은 테이블 대신 저장소에 기록"""
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = new_database(tmp, db_name="power.db")
+        store = PowerSeriesStore(os.path.join(tmp, "store"))
+        pipeline = PersistencePipeline(manager.get_session, power_store=store)
+        now = time.time()
+        written = pipeline.write_batch([
+            (EVENT_TRANSACTION, "CP001", "Started", "tx-1", 0.0, 0.0, 7000.0, now - 10),
+            (EVENT_TRANSACTION, "CP001", "Updated", "tx-1", 1.5, 450.0, 7200.0, now),
+        ])
+        pipeline._executor.shutdown()
+
+        session = manager.get_session()
+        table_rows = session.query(PowerConsumption).count()
+        session.close()
+        manager.close()
+        stored = store.read("CP001", datetime.utcnow() - timedelta(minutes=1), datetime.utcnow() + timedelta(minutes=1))
+
+    assert written == 2 and table_rows == 0
+    assert np.allclose(stored["power"], [7.0, 7.2])
+    assert stored["energy"].tolist() == [0.0, 1.5]
+
+
+def test_migration_and_power_endpoint():
+    """테이블 이전 후 (재실행해도 중복 없음) 전력 조회 API 결과가 테이블 조회와 같음"""
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = new_database(tmp, charger_ids=("CP001", "CP002"), db_name="power.db")
+        session = manager.get_session()
+        for charger_id in ("CP001", "CP002"):
+            PowerConsumptionService.bulk_create_power_records(session, [
+                {
+                    "charger_id": charger_id, "measurement_time": measured_at, "input_power": power,
+                    "voltage": voltage, "current": current, "cumulative_energy": energy
+                }
+                for measured_at, power, voltage, current, energy in _readings(DAY - timedelta(hours=1), 1440)
+            ])
+
+        start, end = DAY - timedelta(minutes=30), DAY + timedelta(minutes=30)
+        original_store = gis_dashboard_api.power_store
+        try:
+            gis_dashboard_api.power_store = None
+            from_table = asyncio.run(gis_dashboard_api.get_charger_power_series("CP001", start, end, 300, db=session))
+
+            store = PowerSeriesStore(os.path.join(tmp, "store"))
+            first = migrate(manager, store, DAY.date() + timedelta(days=1), delete=False)
+            again = migrate(manager, store, DAY.date() + timedelta(days=1), delete=True)
+            remaining = session.query(PowerConsumption).count()
+
+            gis_dashboard_api.power_store = store
+            from_store = asyncio.run(gis_dashboard_api.get_charger_power_series("CP001", start, end, 300, db=session))
+            stored = len(store.read("CP001", DAY - timedelta(hours=1), DAY + timedelta(hours=1)))
+        finally:
+            gis_dashboard_api.power_store = original_store
+            session.close()
+            manager.close()
+
+    assert first == {"rows": 2880, "chunks": 4, "chargers": 2, "deleted": 0}
+    assert again["rows"] == 2880 and again["deleted"] == 2880 and remaining == 0
+    assert stored == 1440
+
+    assert from_table["source"] == "table" and from_store["source"] == "timeseries"
+    assert len(from_table["time"]) == 13 and from_table["samples"][0] == 60
+    for name in ("time", "samples", "power_avg", "power_max", "voltage", "current", "energy"):
+        assert from_table[name] == from_store[name], name
+
+
+if __name__ == "__main__":
+    test_store_append_seal_read_downsample()
+    test_pipeline_writes_power_to_store()
+    test_migration_and_power_endpoint()
+    print("✅ 전력 시계열 저장소 테스트 통과")
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+프로토콜 트레이스 테스트
+링 버퍼 기록, 조회 시 액션 추출, 바이너리 파일 왕복 및 회전 검증
+"""
+
+import sys
+import os
+import tempfile
+
+# 프로젝트 경로 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, '4_PYTHON_SOURCE'))
+
+from protocol_trace import ProtocolTrace, read_trace_file, format_record, DIRECTION_SEND, DIRECTION_RECV
+from ocpp_messages import OCPPMessage
+
+
+def test_ring_buffer_keeps_latest():
+    """링 버퍼는 최신 capacity건만 유지"""
+    trace = ProtocolTrace(capacity=3)
+    for i in range(5):
+        trace.record("CP001", DIRECTION_SEND, OCPPMessage.encode_call("Heartbeat", {}, message_id=f"m{i}"))
+    records = trace.records()
+    assert len(trace) == 3
+    assert [r["message_id"] for r in records] == ["m2", "m3", "m4"]
+
+
+def test_action_extracted_on_read():
+    """액션/메시지 ID는 조회할 때 원본에서 추출"""
+    trace = ProtocolTrace()
+    trace.record("CP001", DIRECTION_RECV, OCPPMessage.create_call("BootNotification", {}, message_id="b1"))
+    trace.record("CP002", DIRECTION_SEND, OCPPMessage.encode_call_result("b1", {"status": "Accepted"}))
+    first, second = trace.records()
+    assert (first["action"], first["message_id"], first["message_type"]) == ("BootNotification", "b1", 2)
+    assert (second["action"], second["message_type"]) == (None, 3)
+    assert [r["charger_id"] for r in trace.records(charger_id="CP002")] == ["CP002"]
+    assert '"status": "Accepted"' in format_record(second)
+
+
+def test_file_round_trip_and_rotation():
+    """바이너리 파일 기록/재생 및 크기 초과 시 회전"""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "trace.bin")
+        trace = ProtocolTrace(capacity=10, file_path=path, max_file_bytes=10 ** 6)
+        trace.record("충전기-1", DIRECTION_SEND, OCPPMessage.encode_call("Heartbeat", {}, message_id="h1"))
+        trace.record("충전기-1", DIRECTION_RECV, '[3,"h1",{"currentTime":"now"}]')
+        trace.close()
+        records = list(read_trace_file(path))
+        assert [(r["direction"], r["message_id"]) for r in records] == [(DIRECTION_SEND, "h1"), (DIRECTION_RECV, "h1")]
+        assert records[0]["charger_id"] == "충전기-1"
+
+        rotating = ProtocolTrace(file_path=path, max_file_bytes=200, backup_count=2)
+        for i in range(20):
+            rotating.record("CP001", DIRECTION_SEND, OCPPMessage.encode_call("Heartbeat", {}, message_id=f"r{i}"))
+        rotating.close()
+        assert os.path.exists(path + ".1")
+        assert os.path.exists(path + ".2")
+        assert not os.path.exists(path + ".3")
+
+
+if __name__ == "__main__":
+    test_ring_buffer_keeps_latest()
+    test_action_extracted_on_read()
+    test_file_round_trip_and_rotation()
+    print("✅ 프로토콜 트레이스 테스트 통과")
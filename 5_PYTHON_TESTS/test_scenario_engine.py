@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+시나리오 재생 엔진 테스트
+시드 기반 타임라인 결정성, 분포/출력 곡선, 로컬 서버 대상 재생 검증
+"""
+
+import sys
+import os
+import asyncio
+import logging
+import random
+
+# 프로젝트 경로 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, '8_DATABASE'))
+sys.path.insert(0, os.path.join(project_root, '4_PYTHON_SOURCE'))
+
+from scenario_engine import (
+    ScenarioRunner, build_timeline, curve_value, load_scenario, sample, with_defaults,
+    EVENT_START, EVENT_STOP, EVENT_FAULT, EVENT_DISCONNECT
+)
+from ocpp_server import OCPPServer
+
+TEST_PORT = 9142
+JEJU_SCENARIO = os.path.join(project_root, '10_CONFIG_BUILD', 'scenarios', 'jeju_day.json')
+
+
+def test_timeline_is_deterministic():
+    """같은 시드는 같은 타임라인, 충전기를 늘려도 기존 충전기 세션은 불변"""
+    scenario = load_scenario(JEJU_SCENARIO)
+    first = build_timeline(scenario)
+    assert first == build_timeline(scenario)
+    assert first != build_timeline({**scenario, "seed": scenario["seed"] + 1})
+
+    larger = with_defaults({**scenario, "chargers": {**scenario["chargers"], "count": 300}})
+    sessions = [e for e in first if e.kind == EVENT_START and e.charger == 0]
+    assert sessions == [e for e in build_timeline(larger) if e.kind == EVENT_START and e.charger == 0]
+
+    # 시간 순 정렬, 세션 종료는 시작 이후, 장애/재연결 대상 수는 fraction 비율
+    assert all(a.time <= b.time for a, b in zip(first, first[1:]))
+    starts = {(e.charger, e.params["session"]): e.time for e in first if e.kind == EVENT_START}
+    for event in first:
+        if event.kind == EVENT_STOP:
+            assert event.time > starts[(event.charger, event.params["session"])]
+    assert sum(1 for e in first if e.kind == EVENT_FAULT) == 4
+    assert sum(1 for e in first if e.kind == EVENT_DISCONNECT) == 60
+
+
+def test_distributions_and_curve():
+    """분포 표기와 구간 선형 출력 곡선"""
+    rng = random.Random(1)
+    assert sample(rng, 7) == 7.0
+    values = [sample(rng, {"distribution": "lognormal", "mean": 40, "sigma": 0.6, "min": 10, "max": 240})
+              for _ in range(5000)]
+    assert min(values) >= 10 and max(values) <= 240
+    assert 35 < sum(values) / len(values) < 45
+    assert {sample(rng, {"distribution": "choice", "values": [7, 50]}) for _ in range(100)} == {7.0, 50.0}
+
+    curve = [[0.0, 1.0], [0.8, 1.0], [1.0, 0.2]]
+    assert curve_value(curve, 0.5) == 1.0
+    assert abs(curve_value(curve, 0.9) - 0.6) < 1e-9
+    assert curve_value(curve, 1.5) == 0.2
+
+
+def test_replay_against_local_server():
+    """로컬 서버에 고배속 재생: 세션/장애/재연결 이벤트가 서버 메시지로 반영"""
+    logging.getLogger("charger_simulator").setLevel(logging.WARNING)
+    scenario = with_defaults({
+        "name": "test", "seed": 3, "duration": 1200, "time_scale": 1200,
+        "meter_interval": 30, "heartbeat_interval": 120,
+        "server_url": f"ws://127.0.0.1:{TEST_PORT}",
+        "chargers": {"count": 10, "prefix": "SCN_TEST", "ramp_rate": 0},
+        "arrivals": {"rate_per_hour": 6},
+        "session": {"duration_minutes": {"distribution": "uniform", "min": 2, "max": 6}},
+        "faults": [{"at": 300, "fraction": 0.2, "duration": 120}],
+        "reconnect_storms": [{"at": 600, "fraction": 0.3, "window": 30}]
+    })
+
+    async def run():
+        server = OCPPServer(host="127.0.0.1", port=TEST_PORT)
+        server_task = asyncio.create_task(server.start())
+        await asyncio.sleep(0.3)
+        report = await ScenarioRunner(scenario).run()
+        stats = server.get_action_stats()
+        server.shutdown_event.set()
+        await server_task
+        return report, stats
+
+    report, stats = asyncio.run(run())
+    assert report["errors"] == {}
+    assert report["executed"][EVENT_START] > 0
+    assert report["executed"]["fault"] == 2
+    assert report["executed"]["reconnect"] == 3
+    assert report["rtt"]["TransactionEvent"]["count"] > report["executed"][EVENT_START]
+    assert stats["BootNotification"]["count"] == 13
+    # 연결 해제 직전에 보낸 요청은 서버만 처리했을 수 있다
+    assert stats["StatusNotification"]["count"] >= report["rtt"]["StatusNotification"]["count"]
+
+
+if __name__ == "__main__":
+    test_timeline_is_deterministic()
+    test_distributions_and_curve()
+    test_replay_against_local_server()
+    print("✅ 시나리오 재생 엔진 테스트 통과")
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+충전 세션 증분 집계 테스트
+SQLite 임시 DB로 일별/시간별 통계 upsert가 전체 재계산(calculate_daily_stats)과 일치하는지 검증
+"""
+
+import sys
+import os
+import asyncio
+import tempfile
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+
+# 프로젝트 경로 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+sys.path.insert(0, os.path.join(project_root, '8_DATABASE'))
+sys.path.insert(0, os.path.join(project_root, '4_PYTHON_SOURCE'))
+
+from database.models import ChargerUsageLog, DailyChargerStats, HourlyChargerStats
+from database.services import UsageLogService, StatisticsService
+from database.aggregation import UsageAggregator
+from persistence import PersistencePipeline
+from helpers import new_database
+
+
+def test_incremental_flush_matches_full_recompute():
+    """두 번에 나눠 반영한 증분 통계가 전체 재계산 결과와 같음"""
+    # 오래된 날짜는 메모리에서 정리되므로 오늘 날짜 사용
+    today = datetime.combine(date.today(), datetime.min.time())
+    sessions = [
+        ("tx-1", today + timedelta(hours=9, minutes=10), today + timedelta(hours=9, minutes=40), "10.5", "3150"),
+        ("tx-2", today + timedelta(hours=9, minutes=50), today + timedelta(hours=10, minutes=20), "4.25", "1275"),
+        ("tx-3", today + timedelta(hours=14), today + timedelta(hours=15), "20", "6000"),
+    ]
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = new_database(tmp, db_name="stats.db")
+        session = manager.get_session()
+        aggregator = UsageAggregator(flush_interval=0)
+
+        for index, (tx, start, end, energy, charge) in enumerate(sessions):
+            UsageLogService.bulk_upsert_sessions(session, [{
+                "transaction_id": tx, "charger_id": "CP001", "start_time": start, "end_time": end,
+                "energy_delivered": energy, "total_charge": charge,
+                "status": "completed", "payment_status": "completed"
+            }], on_completed=lambda item: aggregator.record_session(
+                item["charger_id"], item["start_time"], item["energy_delivered"],
+                item["total_charge"], item["duration_minutes"]
+            ))
+            if index == 0:
+                assert aggregator.flush(session) == 2
+
+        # 미반영 증분도 조회에 포함
+        live = aggregator.get_daily_stats("CP001", today.date())
+        assert live["num_sessions"] == 3 and live["total_revenue"] == Decimal("10425")
+        assert aggregator.flush(session) == 3
+
+        daily = session.query(DailyChargerStats).one()
+        incremental = (
+            daily.num_sessions, daily.total_energy, daily.total_duration_minutes, daily.total_revenue,
+            daily.hourly_sessions
+        )
+        hourly = {row.stats_hour.hour: row.num_sessions for row in session.query(HourlyChargerStats)}
+
+        # 이미 완료된 세션의 재전송은 다시 집계하지 않음
+        UsageLogService.bulk_upsert_sessions(session, [{
+            "transaction_id": "tx-1", "charger_id": "CP001", "start_time": sessions[0][1],
+            "end_time": sessions[0][2], "payment_status": "completed"
+        }], on_completed=lambda item: aggregator.record_session(item["charger_id"], item["start_time"], 0, 0))
+        assert aggregator.pending_count() == 0
+
+        full = StatisticsService.calculate_daily_stats(session, "CP001", today.date())
+        recomputed = (
+            full.num_sessions, full.total_energy, full.total_duration_minutes, full.total_revenue,
+            {str(hour): count for hour, count in full.hourly_sessions.items()}
+        )
+        session.close()
+        manager.close()
+
+    assert incremental == recomputed
+    assert hourly == {9: 2, 14: 1}
+
+
+def test_pipeline_aggregates_ended_sessions():
+    """파이프라인이 커밋된 Ended 거래만 집계하고 종료 시 통계를 반영"""
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = new_database(tmp, db_name="stats.db")
+
+        async def run():
+            aggregator = UsageAggregator(flush_interval=60)
+            pipeline = PersistencePipeline(manager.get_session, flush_interval=0.05, aggregator=aggregator)
+            pipeline.start()
+            pipeline.record_transaction("CP001", "Started", "tx-1", 0.0, 0)
+            await asyncio.sleep(0.1)
+            pipeline.record_transaction("CP001", "Ended", "tx-1", 7.5, 2250)
+            pipeline.record_transaction("CP001", "Ended", "tx-1", 7.5, 2250)
+            await asyncio.sleep(0.1)
+            pending = pipeline.get_stats()["stats_pending"]
+            await pipeline.stop()
+            return aggregator, pending
+
+        aggregator, pending = asyncio.run(run())
+        session = manager.get_session()
+        log = session.query(ChargerUsageLog).one()
+        daily = session.query(DailyChargerStats).one()
+        session.close()
+        manager.close()
+
+    assert pending == 2
+    assert daily.num_sessions == 1 and daily.total_revenue == Decimal("2250")
+    assert aggregator.get_daily_stats("CP001", log.session_date)["total_energy"] == Decimal("7.5")
+
+
+def test_rebuild_daily_discards_pending_delta():
+    """재계산한 일일 통계 위에 미반영 증분이 다시 더해지지 않음 (시간별 증분은 유지)"""
+    today = datetime.combine(date.today(), datetime.min.time())
+    with tempfile.TemporaryDirectory() as tmp:
+        manager = new_database(tmp, db_name="stats.db")
+
+        async def run():
+            aggregator = UsageAggregator(flush_interval=60)
+            pipeline = PersistencePipeline(manager.get_session, flush_interval=0.05, aggregator=aggregator)
+            pipeline.start()
+            session = manager.get_session()
+            for index in range(2):
+                UsageLogService.bulk_upsert_sessions(session, [{
+                    "transaction_id": f"tx-{index}", "charger_id": "CP001",
+                    "start_time": today + timedelta(hours=8 + index),
+                    "end_time": today + timedelta(hours=8 + index, minutes=30),
+                    "energy_delivered": "5", "total_charge": "1500",
+                    "status": "completed", "payment_status": "completed"
+                }], on_completed=lambda item: aggregator.record_session(
+                    item["charger_id"], item["start_time"], item["energy_delivered"],
+                    item["total_charge"], item["duration_minutes"]
+                ))
+            session.close()
+            rebuilt = await pipeline.rebuild_daily_stats("CP001", today.date())
+            pending = aggregator.pending_count()
+            await pipeline.stop()
+            return aggregator, rebuilt, pending
+
+        aggregator, rebuilt, pending = asyncio.run(run())
+        session = manager.get_session()
+        daily = session.query(DailyChargerStats).one()
+        hourly = session.query(HourlyChargerStats).count()
+        stored = (daily.num_sessions, daily.total_revenue)
+        session.close()
+        manager.close()
+
+    assert rebuilt["num_sessions"] == 2 and rebuilt["hourly_sessions"] == {"8": 1, "9": 1}
+    assert pending == 2  # 시간별 증분만 남음
+    assert stored == (2, Decimal("3000"))
+    assert hourly == 2
+    assert aggregator.get_daily_stats("CP001", today.date())["num_sessions"] == 2
+
+
+if __name__ == "__main__":
+    test_incremental_flush_matches_full_recompute()
+    test_pipeline_aggregates_ended_sessions()
+    test_rebuild_daily_discards_pending_delta()
+    print("✅ 증분 집계 테스트 통과")
@@ -0,0 +1,300 @@
+"""
+부팅 폭주(재연결 폭주) 벤치마크
+
+네트워크 순단으로 모든 충전기가 동시에 끊겼다가 다시 붙는 상황을 재현한다.
+1. 별도 프로세스에 OCPP 서버를 띄우고 충전기 N대를 연결/부팅
+2. 모든 충전기의 소켓을 한꺼번에 강제 종료 (transport.abort)
+3. 충전기는 지터를 준 지수 백오프로 재연결 후 BootNotification 전송
+4. 측정:
+    - 전체 충전기 재부팅 완료까지 걸린 시간 (50% / 90% / 100%)
+    - 서버 프로세스 CPU 사용률 최고/평균 (/proc 기반, Linux)
+    - 서버 handle_boot_notification 처리 시간 p50/p99 (서버 액션 통계)
+    - 충전기에서 본 BootNotification 왕복 시간 p50/p99
+    - 재연결 실패 시도 수
+
+결과는 JSON 파일로 저장해 릴리스 간 회귀를 추적한다.
+--backoff-base 0으로 실행하면 백오프 없이 즉시 재연결하는 경우(기준선)를 측정한다.
+
+사용법:
+    python 6_PYTHON_SCRIPTS/bench_boot_storm.py --count 2000
+    python 6_PYTHON_SCRIPTS/bench_boot_storm.py --count 5000 --rounds 3 --backoff-base 0.5 --backoff-max 10
+    python 6_PYTHON_SCRIPTS/bench_boot_storm.py --count 5000 --backoff-base 0 --output storm_no_backoff.json
+
+    ※ 충전기 1대당 소켓 2개(클라이언트/서버)를 쓰므로 ulimit -n을 충전기 수의 2배 이상으로 설정해야 한다.
+"""
+import argparse
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+import subprocess
+import sys
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+# 프로젝트 경로 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(project_root, '4_PYTHON_SOURCE'))
+
+from charger_simulator import ChargerSimulator
+from latency_histogram import LatencyRecorder
+from ocpp_server import OCPPServer
+
+
+def raise_fd_limit():
+    """열린 파일 수 제한을 hard limit까지 올림 (지원하지 않는 OS는 무시)"""
+    try:
+        import resource
+        soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+        if soft < hard:
+            resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+    except (ImportError, ValueError, OSError):
+        pass
+
+
+def git_revision() -> Optional[str]:
+    """현재 커밋 (결과 비교용, git이 없으면 None)"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=project_root,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# ==================== 서버 프로세스 ====================
+
+def _server_process(host: str, port: int, conn):
+    """서버 프로세스 진입점: 파이프로 reset/stats/stop 명령 처리"""
+    # 충전기마다 남는 연결/해제 로그가 측정을 왜곡하지 않도록 오류만 출력
+    logging.getLogger().setLevel(logging.ERROR)
+
+    async def main():
+        server = OCPPServer(host=host, port=port)
+        server_task = asyncio.create_task(server.start())
+        await asyncio.sleep(0.5)
+        conn.send("ready")
+        loop = asyncio.get_running_loop()
+        while True:
+            command = await loop.run_in_executor(None, conn.recv)
+            if command == "reset":
+                server.reset_action_stats()
+                conn.send(True)
+            elif command == "stats":
+                conn.send({"actions": server.get_action_stats(), "connected": len(server.chargers)})
+            elif command == "stop":
+                server.shutdown_event.set()
+                break
+        await server_task
+
+    asyncio.run(main())
+
+
+class CpuSampler:
+    """/proc/<pid>/stat 기반 프로세스 CPU 사용률 샘플러 (Linux 외에는 측정 안 함)"""
+
+    def __init__(self, pid: int, interval: float = 0.1):
+        self.pid = pid
+        self.interval = interval
+        self.samples: List[float] = []
+        self._ticks = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+        self._task: Optional[asyncio.Task] = None
+
+    def _cpu_seconds(self) -> Optional[float]:
+        try:
+            with open(f"/proc/{self.pid}/stat") as f:
+                fields = f.read().rsplit(")", 1)[1].split()
+            # utime, stime (stat 14, 15번째 항목 -> ')' 뒤 기준 11, 12)
+            return (int(fields[11]) + int(fields[12])) / self._ticks
+        except (OSError, IndexError, ValueError):
+            return None
+
+    async def _run(self):
+        last_cpu = self._cpu_seconds()
+        last_time = time.monotonic()
+        if last_cpu is None:
+            return
+        while True:
+            await asyncio.sleep(self.interval)
+            cpu, now = self._cpu_seconds(), time.monotonic()
+            if cpu is None:
+                return
+            self.samples.append((cpu - last_cpu) / (now - last_time) * 100)
+            last_cpu, last_time = cpu, now
+
+    def start(self):
+        self.samples = []
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> Dict[str, Optional[float]]:
+        """샘플링 종료 후 {peak, mean} (%) 반환"""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        if not self.samples:
+            return {"peak": None, "mean": None}
+        return {"peak": max(self.samples), "mean": sum(self.samples) / len(self.samples)}
+
+
+# ==================== 부하 측 ====================
+
+async def wait_booted(chargers: List[ChargerSimulator], since: float, timeout: float) -> Dict[str, Optional[float]]:
+    """since 이후 부팅 완료된 충전기 비율이 50/90/100%에 도달한 시간 (초, 미도달 시 None)"""
+    total = len(chargers)
+    marks = {"p50": 0.5, "p90": 0.9, "all": 1.0}
+    reached: Dict[str, Optional[float]] = {name: None for name in marks}
+    while True:
+        elapsed = time.monotonic() - since
+        booted = sum(1 for c in chargers if c.boot_accepted_at is not None and c.boot_accepted_at > since)
+        for name, ratio in marks.items():
+            if reached[name] is None and booted >= total * ratio:
+                reached[name] = elapsed
+        if reached["all"] is not None or elapsed > timeout:
+            reached["booted"] = booted
+            return reached
+        await asyncio.sleep(0.02)
+
+
+async def run_benchmark(args, conn, server_pid: int) -> Dict[str, Any]:
+    url = f"ws://{args.host}:{args.port}"
+    metrics = LatencyRecorder()
+    chargers = [
+        ChargerSimulator(
+            f"{args.prefix}_{i:06d}", url, metrics=metrics,
+            auto_reconnect=True,
+            reconnect_base_delay=args.backoff_base,
+            reconnect_max_delay=args.backoff_max
+        )
+        for i in range(args.count)
+    ]
+
+    # 초기 연결 (ramp_rate대/초)
+    started = time.monotonic()
+    tasks = []
+    for i, charger in enumerate(chargers):
+        tasks.append(asyncio.create_task(charger.connect(start_loops=False)))
+        delay = started + (i + 1) / args.ramp_rate - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+    await asyncio.gather(*tasks, return_exceptions=True)
+    initial = await wait_booted(chargers, 0.0, args.timeout)
+    print(f"초기 연결: {initial['booted']}/{args.count}대 부팅 ({time.monotonic() - started:.1f}초)")
+
+    sampler = CpuSampler(server_pid)
+    rounds = []
+    for round_index in range(args.rounds):
+        await asyncio.sleep(args.settle)
+        conn.send("reset")
+        conn.recv()
+        metrics.histograms.clear()
+        metrics.errors.clear()
+        failures_before = sum(c.reconnect_failures for c in chargers)
+
+        sampler.start()
+        storm_started = time.monotonic()
+        for charger in chargers:
+            if charger.connected and charger.websocket is not None:
+                charger.websocket.transport.abort()
+        booted = await wait_booted(chargers, storm_started, args.timeout)
+        cpu = await sampler.stop()
+
+        conn.send("stats")
+        server_stats = conn.recv()
+        boot_server = server_stats["actions"].get("BootNotification", {})
+        boot_client = metrics.get_stats()["rtt"].get("BootNotification", {})
+        rounds.append({
+            "round": round_index + 1,
+            "booted": booted["booted"],
+            "time_to_50pct_s": booted["p50"],
+            "time_to_90pct_s": booted["p90"],
+            "time_to_all_booted_s": booted["all"],
+            "server_cpu_peak_pct": cpu["peak"],
+            "server_cpu_mean_pct": cpu["mean"],
+            "server_boot_count": boot_server.get("count", 0),
+            "server_boot_p50_ms": boot_server.get("p50_ms"),
+            "server_boot_p99_ms": boot_server.get("p99_ms"),
+            "server_boot_max_ms": boot_server.get("max_ms"),
+            "client_boot_rtt_p50_ms": boot_client.get("p50_ms"),
+            "client_boot_rtt_p99_ms": boot_client.get("p99_ms"),
+            "reconnect_failures": sum(c.reconnect_failures for c in chargers) - failures_before,
+            "server_connected": server_stats["connected"]
+        })
+
+    await asyncio.gather(*(c.disconnect() for c in chargers), return_exceptions=True)
+    return {
+        "benchmark": "boot_storm",
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "git_revision": git_revision(),
+        "config": {
+            "count": args.count,
+            "rounds": args.rounds,
+            "backoff_base_s": args.backoff_base,
+            "backoff_max_s": args.backoff_max,
+            "ramp_rate": args.ramp_rate
+        },
+        "rounds": rounds
+    }
+
+
+def _fmt(value: Optional[float], digits: int = 2) -> str:
+    return "-" if value is None else f"{value:.{digits}f}"
+
+
+def print_results(results: Dict[str, Any]):
+    """결과 표 출력"""
+    config = results["config"]
+    print(f"\n충전기 {config['count']}대, 백오프 기본 {config['backoff_base_s']}초 / 최대 {config['backoff_max_s']}초")
+    print(f"{'round':>6}{'booted':>8}{'t50(s)':>8}{'t90(s)':>8}{'all(s)':>8}{'cpu peak%':>11}{'cpu mean%':>11}"
+          f"{'srv p99(ms)':>13}{'rtt p99(ms)':>13}{'fail':>6}")
+    for r in results["rounds"]:
+        print(f"{r['round']:>6}{r['booted']:>8}{_fmt(r['time_to_50pct_s']):>8}{_fmt(r['time_to_90pct_s']):>8}"
+              f"{_fmt(r['time_to_all_booted_s']):>8}{_fmt(r['server_cpu_peak_pct'], 0):>11}"
+              f"{_fmt(r['server_cpu_mean_pct'], 0):>11}{_fmt(r['server_boot_p99_ms'], 3):>13}"
+              f"{_fmt(r['client_boot_rtt_p99_ms'], 1):>13}{r['reconnect_failures']:>6}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="부팅 폭주(재연결 폭주) 벤치마크")
+    parser.add_argument("--count", type=int, default=2000, help="충전기 수")
+    parser.add_argument("--rounds", type=int, default=1, help="폭주 반복 횟수")
+    parser.add_argument("--backoff-base", type=float, default=0.5, help="재연결 백오프 기본 지연 (초, 0이면 즉시 재연결)")
+    parser.add_argument("--backoff-max", type=float, default=10.0, help="재연결 백오프 최대 지연 (초)")
+    parser.add_argument("--ramp-rate", type=float, default=1000.0, help="초기 연결 속도 (대/초)")
+    parser.add_argument("--timeout", type=float, default=120.0, help="라운드당 최대 대기 (초)")
+    parser.add_argument("--settle", type=float, default=1.0, help="라운드 전 안정화 대기 (초)")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9150)
+    parser.add_argument("--prefix", default="STORM", help="충전기 ID 접두어")
+    parser.add_argument("--output", default="boot_storm_results.json", help="결과 JSON 파일 경로")
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.ERROR)
+    logging.getLogger("charger_simulator").setLevel(logging.CRITICAL)
+    raise_fd_limit()
+
+    parent_conn, child_conn = multiprocessing.Pipe()
+    server = multiprocessing.Process(target=_server_process, args=(args.host, args.port, child_conn), daemon=True)
+    server.start()
+    try:
+        parent_conn.recv()  # "ready"
+        results = asyncio.run(run_benchmark(args, parent_conn, server.pid))
+    finally:
+        parent_conn.send("stop")
+        server.join(timeout=10)
+        if server.is_alive():
+            server.terminate()
+
+    print_results(results)
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+    print(f"\n결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
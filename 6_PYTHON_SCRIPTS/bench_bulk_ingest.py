@@ -0,0 +1,167 @@
+"""
+사용 이력 / 전력 기록 일괄 적재 벤치마크
+
+같은 합성 데이터를 아래 방식으로 넣어 초당 행 수를 비교한다.
+- single: 기존 create_usage_log / create_power_record (행마다 INSERT + 커밋)
+- bulk_<chunk>: bulk_insert_usage_logs / bulk_insert_power_records (chunk마다 다중 INSERT + 커밋)
+- rerun: 같은 데이터 재적재 (모두 건너뜀, 중복 확인 비용)
+
+기본은 임시 SQLite 파일이며, --database-url로 PostgreSQL을 지정할 수 있다.
+벤치마크용 충전소/충전기(BENCH-*)와 그 데이터는 끝나면 삭제한다.
+
+사용법:
+    python 6_PYTHON_SCRIPTS/bench_bulk_ingest.py
+    python 6_PYTHON_SCRIPTS/bench_bulk_ingest.py --rows 50000 --single-rows 2000 --chunks 500 2000 10000
+    python 6_PYTHON_SCRIPTS/bench_bulk_ingest.py --database-url postgresql://charger_user:pw@localhost/charger_db --output bulk.json
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+# 프로젝트 루트 경로 추가 (database 모듈 import를 위함)
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(project_root, '8_DATABASE'))
+
+from database.models import DatabaseManager, ChargerTypeEnum, StationInfo, ChargerUsageLog, PowerConsumption
+from database.services import StationService, ChargerService, UsageLogService, PowerConsumptionService
+
+STATION_ID = "BENCH-ST"
+CHARGER_IDS = [f"BENCH-CP{i:02d}" for i in range(10)]
+START = datetime(2024, 1, 1)
+
+
+def usage_logs(count, prefix):
+    for i in range(count):
+        start_time = START + timedelta(minutes=7 * i)
+        yield {
+            "charger_id": CHARGER_IDS[i % len(CHARGER_IDS)],
+            "transaction_id": f"{prefix}-{i:08d}",
+            "start_time": start_time,
+            "end_time": start_time + timedelta(minutes=40),
+            "energy_delivered": 18.5,
+            "total_charge": Decimal("5550"),
+            "payment_status": "completed"
+        }
+
+
+def power_records(count, offset_days):
+    for i in range(count):
+        yield {
+            "charger_id": CHARGER_IDS[i % len(CHARGER_IDS)],
+            "measurement_time": START + timedelta(days=offset_days, seconds=5 * (i // len(CHARGER_IDS))),
+            "input_power": 7.2,
+            "cumulative_energy": 0.01 * i,
+            "is_charging": True
+        }
+
+
+def setup(session):
+    if StationService.get_station(session, STATION_ID) is None:
+        StationService.create_station(session, STATION_ID, "벤치마크 충전소", "제주시", 126.5, 33.5)
+    for charger_id in CHARGER_IDS:
+        if ChargerService.get_charger(session, charger_id) is None:
+            ChargerService.create_charger(
+                session, charger_id, STATION_ID, f"SN-{charger_id}", ChargerTypeEnum.FAST,
+                rated_power=50, max_output=50, min_output=5, longitude=126.5, latitude=33.5
+            )
+
+
+def cleanup(session):
+    session.query(ChargerUsageLog).filter(ChargerUsageLog.charger_id.in_(CHARGER_IDS)).delete(synchronize_session=False)
+    session.query(PowerConsumption).filter(PowerConsumption.charger_id.in_(CHARGER_IDS)).delete(synchronize_session=False)
+    session.commit()
+    for charger_id in CHARGER_IDS:
+        ChargerService.delete_charger(session, charger_id)
+    session.query(StationInfo).filter(StationInfo.station_id == STATION_ID).delete(synchronize_session=False)
+    session.commit()
+
+
+def measure(rows, func):
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    return {"rows": rows, "seconds": elapsed, "rows_per_sec": rows / elapsed if elapsed else 0.0}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="사용 이력 / 전력 기록 일괄 적재 벤치마크")
+    parser.add_argument("--database-url", help="대상 DB (기본: 임시 SQLite 파일)")
+    parser.add_argument("--rows", type=int, default=20000, help="bulk 방식 행 수")
+    parser.add_argument("--single-rows", type=int, default=1000, help="single 방식 행 수 (느리므로 적게)")
+    parser.add_argument("--chunks", type=int, nargs="+", default=[500, 5000], help="비교할 chunk 크기")
+    parser.add_argument("--output", help="결과 JSON 파일 경로")
+    args = parser.parse_args()
+
+    temp_dir = None
+    database_url = args.database_url
+    if not database_url:
+        temp_dir = tempfile.TemporaryDirectory()
+        database_url = f"sqlite:///{os.path.join(temp_dir.name, 'bench.db')}"
+
+    manager = DatabaseManager(database_url)
+    manager.initialize()
+    session = manager.get_session()
+    results = {}
+    try:
+        setup(session)
+
+        def single_usage():
+            for log in usage_logs(args.single_rows, "SINGLE"):
+                UsageLogService.create_usage_log(
+                    session, log.pop("charger_id"), log.pop("transaction_id"),
+                    log["start_time"].date(), log.pop("start_time"), **log
+                )
+
+        def single_power():
+            for record in power_records(args.single_rows, 0):
+                PowerConsumptionService.create_power_record(
+                    session, record.pop("charger_id"), record.pop("measurement_time"),
+                    record.pop("input_power"), record.pop("cumulative_energy"), **record
+                )
+
+        results["usage/single"] = measure(args.single_rows, single_usage)
+        results["power/single"] = measure(args.single_rows, single_power)
+
+        for index, chunk_size in enumerate(args.chunks, start=1):
+            results[f"usage/bulk_{chunk_size}"] = measure(args.rows, lambda: UsageLogService.bulk_insert_usage_logs(
+                session, usage_logs(args.rows, f"BULK{chunk_size}"), chunk_size=chunk_size
+            ))
+            results[f"power/bulk_{chunk_size}"] = measure(args.rows, lambda: PowerConsumptionService.bulk_insert_power_records(
+                session, power_records(args.rows, index), chunk_size=chunk_size
+            ))
+
+        chunk_size = args.chunks[-1]
+        results["usage/rerun"] = measure(args.rows, lambda: UsageLogService.bulk_insert_usage_logs(
+            session, usage_logs(args.rows, f"BULK{chunk_size}"), chunk_size=chunk_size
+        ))
+        results["power/rerun"] = measure(args.rows, lambda: PowerConsumptionService.bulk_insert_power_records(
+            session, power_records(args.rows, len(args.chunks)), chunk_size=chunk_size
+        ))
+    finally:
+        session.rollback()
+        cleanup(session)
+        session.close()
+        manager.close()
+        if temp_dir is not None:
+            temp_dir.cleanup()
+
+    dialect = database_url.split(":", 1)[0]
+    print(f"DB: {dialect}, bulk {args.rows}행, single {args.single_rows}행")
+    print(f"{'method':<20}{'rows':>10}{'seconds':>10}{'rows/s':>12}")
+    for name, r in results.items():
+        print(f"{name:<20}{r['rows']:>10}{r['seconds']:>10.2f}{r['rows_per_sec']:>12,.0f}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"database": dialect, "rows": args.rows, "single_rows": args.single_rows,
+                       "results": results}, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+충전기 연결 상태 메모리 벤치마크
+
+실제 소켓 없이 ChargerConnection을 N개 만들어 서버 레지스트리와 생존 감시 휠에 등록하고,
+tracemalloc으로 충전기 1대당 메모리를 측정한다.
+- writer=no: 연결 객체 + 레지스트리/휠 등록만
+- writer=yes: 큐 기반 송신까지 활성화한 상태 (유휴 연결은 송신 태스크/큐를 보유하지 않음)
+--transactions로 충전기당 종료 거래를 넣으면 거래 보관 상한(MAX_STORED_TRANSACTIONS) 동작도 확인할 수 있다.
+
+사용법:
+    python 6_PYTHON_SCRIPTS/bench_connection_memory.py
+    python 6_PYTHON_SCRIPTS/bench_connection_memory.py --counts 10000 --transactions 150
+    python 6_PYTHON_SCRIPTS/bench_connection_memory.py --counts 10000 50000 100000 --output conn_memory.json
+"""
+import argparse
+import asyncio
+import gc
+import json
+import logging
+import os
+import sys
+import time
+import tracemalloc
+
+# 프로젝트 경로 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(project_root, '4_PYTHON_SOURCE'))
+
+from ocpp_server import OCPPServer, ChargerConnection, MAX_STORED_TRANSACTIONS
+
+
+class NullWebSocket:
+    """아무것도 하지 않는 웹소켓 (연결 객체 크기만 측정하기 위함)"""
+
+    __slots__ = ()
+
+    async def send(self, message):
+        pass
+
+    async def close(self):
+        pass
+
+
+async def measure(count: int, with_writer: bool, transactions_per_charger: int):
+    """충전기 count대 연결 상태의 메모리 사용량 측정"""
+    server = OCPPServer()
+    websocket = NullWebSocket()
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+
+    for i in range(count):
+        charger_id = f"CP{i:06d}"
+        charger = ChargerConnection(charger_id, websocket, "/" + charger_id)
+        server.chargers[charger_id] = charger
+        server.liveness.add(charger)
+        if with_writer:
+            charger.start_writer()
+        for n in range(transactions_per_charger):
+            charger.store_transaction(f"{charger_id}-{n}", {
+                "transaction_id": f"{charger_id}-{n}",
+                "charger_id": charger_id,
+                "energy_delivered": 12.5,
+                "total_cost": 0,
+                "timestamp": time.time()
+            })
+    # 송신 태스크가 첫 대기 상태까지 진행하도록 양보
+    await asyncio.sleep(0)
+
+    gc.collect()
+    after, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    stored = sum(len(c.transactions) for c in server.chargers.values())
+    for charger in server.chargers.values():
+        await charger.stop_writer()
+
+    return {
+        "chargers": count,
+        "with_writer": with_writer,
+        "bytes_total": after - before,
+        "bytes_per_charger": (after - before) / count,
+        "peak_bytes": peak - before,
+        "stored_transactions": stored
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="충전기 연결 상태 메모리 벤치마크")
+    parser.add_argument("--counts", type=int, nargs="+", default=[10000, 50000, 100000])
+    parser.add_argument("--transactions", type=int, default=0,
+                        help=f"충전기당 기록할 종료 거래 수 (보관 상한 {MAX_STORED_TRANSACTIONS}건)")
+    parser.add_argument("--output", help="결과 JSON 파일 경로")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    results = []
+    for count in args.counts:
+        for with_writer in (False, True):
+            results.append(asyncio.run(measure(count, with_writer, args.transactions)))
+
+    print(f"{'chargers':>10}{'writer':>8}{'total(MB)':>12}{'bytes/charger':>15}{'transactions':>14}")
+    for r in results:
+        print(f"{r['chargers']:>10}{'yes' if r['with_writer'] else 'no':>8}{r['bytes_total'] / 1e6:>12.1f}"
+              f"{r['bytes_per_charger']:>15.0f}{r['stored_transactions']:>14}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\n결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+충전기 위치 격자 인덱스 조회 벤치마크
+
+제주 범위에 충전기 N대를 무작위로 배치하고 조회 종류별 평균/p99 시간을 잰다.
+- viewport: 지도 한 화면 크기(기본 0.05도 x 0.04도) 영역 조회
+- radius: 반경 2km 조회
+- nearest: 최근접 10대 조회
+- scan: 비교용 전수 비교 영역 조회 (인덱스 없이 모든 좌표 확인)
+- clusters_z10: 제주 전역 화면(줌 10)의 클러스터 조회 (geo_cluster)
+- clusters_z14: 지도 한 화면 영역의 줌 14 클러스터 조회
+- status: 충전기 상태 변경 1건의 클러스터 증분 갱신
+
+사용법:
+    python 6_PYTHON_SCRIPTS/bench_geo_index.py
+    python 6_PYTHON_SCRIPTS/bench_geo_index.py --chargers 100000 --queries 2000 --cell-size 0.01 --output geo_index.json
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+# 프로젝트 경로 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(project_root, '4_PYTHON_SOURCE'))
+
+from geo_index import GeoGridIndex
+from geo_cluster import GeoClusterIndex
+
+# 제주 경위도 범위
+JEJU_BOUNDS = (126.15, 33.19, 126.95, 33.57)
+STATUSES = ["available", "in_use", "fault", "offline"]
+
+
+def timed(queries, func):
+    """조회 함수를 쿼리마다 실행해 (평균 ms, p99 ms, 평균 결과 수) 반환"""
+    durations = []
+    results = 0
+    for query in queries:
+        start = time.perf_counter()
+        found = func(*query)
+        durations.append(time.perf_counter() - start)
+        results += len(found) if isinstance(found, list) else int(bool(found))
+    durations.sort()
+    return {
+        "mean_ms": sum(durations) / len(durations) * 1000,
+        "p99_ms": durations[min(len(durations) - 1, int(len(durations) * 0.99))] * 1000,
+        "avg_results": results / len(queries)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="충전기 위치 격자 인덱스 벤치마크")
+    parser.add_argument("--chargers", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--cell-size", type=float, default=0.01)
+    parser.add_argument("--viewport", type=float, nargs=2, default=[0.05, 0.04], metavar=("DLON", "DLAT"))
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="결과 JSON 파일 경로")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    west, south, east, north = JEJU_BOUNDS
+    points = [(f"CP{i:06d}", rng.uniform(west, east), rng.uniform(south, north)) for i in range(args.chargers)]
+
+    index = GeoGridIndex(cell_size=args.cell_size)
+    start = time.perf_counter()
+    index.rebuild(points)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    clusters = GeoClusterIndex()
+    start = time.perf_counter()
+    clusters.rebuild((key, lon, lat, rng.choice(STATUSES)) for key, lon, lat in points)
+    cluster_build_ms = (time.perf_counter() - start) * 1000
+
+    dlon, dlat = args.viewport
+    centers = [(rng.uniform(west, east), rng.uniform(south, north)) for _ in range(args.queries)]
+    viewports = [(lon - dlon / 2, lat - dlat / 2, lon + dlon / 2, lat + dlat / 2) for lon, lat in centers]
+
+    def scan(min_lon, min_lat, max_lon, max_lat):
+        return [key for key, lon, lat in points if min_lon <= lon <= max_lon and min_lat <= lat <= max_lat]
+
+    results = {
+        "viewport": timed(viewports, index.bbox),
+        "radius": timed([(lon, lat, 2.0) for lon, lat in centers], index.radius),
+        "nearest": timed([(lon, lat, 10) for lon, lat in centers], index.nearest),
+        "scan": timed(viewports[:max(1, args.queries // 20)], scan),
+        "clusters_z10": timed([(10, *JEJU_BOUNDS)] * args.queries, clusters.query),
+        "clusters_z14": timed([(14, *viewport) for viewport in viewports], clusters.query),
+        "status": timed(
+            [(points[rng.randrange(len(points))][0], rng.choice(STATUSES)) for _ in range(args.queries)],
+            clusters.set_status
+        ),
+    }
+
+    print(f"충전기 {args.chargers}대, 격자 {args.cell_size}도, 칸 {len(index.cells)}개, 구축 {build_ms:.0f}ms")
+    print(f"클러스터 줌 0~{clusters.max_zoom}, 구축 {cluster_build_ms:.0f}ms")
+    print(f"{'query':<14}{'mean ms':>10}{'p99 ms':>10}{'results':>10}")
+    for name, r in results.items():
+        print(f"{name:<14}{r['mean_ms']:>10.3f}{r['p99_ms']:>10.3f}{r['avg_results']:>10.1f}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({
+                "chargers": args.chargers,
+                "cell_size": args.cell_size,
+                "cells": len(index.cells),
+                "build_ms": build_ms,
+                "cluster_build_ms": cluster_build_ms,
+                "results": results
+            }, f, indent=2)
+        print(f"\n결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+히트맵 격자 누적 배열 벤치마크
+
+제주 범위에 충전기 N대를 배치하고 D일치 일일 통계를 만들어,
+조회 기간(1일/30일/365일)별 히트맵 계산 시간을 잰다.
+- tiles: HeatmapTiles 누적합 뺄셈 (기간 길이와 무관)
+- scan: 비교용 일일 통계 전수 합산 (기존 충전기별 SUM ... GROUP BY와 같은 방식)
+
+사용법:
+    python 6_PYTHON_SCRIPTS/bench_heatmap_tiles.py
+    python 6_PYTHON_SCRIPTS/bench_heatmap_tiles.py --chargers 10000 --days 365 --queries 200 --output heatmap.json
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+# 프로젝트 경로 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(project_root, '4_PYTHON_SOURCE'))
+
+from heatmap_tiles import HeatmapTiles
+
+# 제주 경위도 범위
+JEJU_BOUNDS = (126.15, 33.19, 126.95, 33.57)
+
+
+def timed(repeat, func):
+    """함수를 repeat번 실행해 (평균 ms, p99 ms) 반환"""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    durations.sort()
+    return {
+        "mean_ms": sum(durations) / len(durations) * 1000,
+        "p99_ms": durations[min(len(durations) - 1, int(len(durations) * 0.99))] * 1000
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="히트맵 격자 누적 배열 벤치마크")
+    parser.add_argument("--chargers", type=int, default=10000)
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="결과 JSON 파일 경로")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    west, south, east, north = JEJU_BOUNDS
+    today = date.today()
+    first_day = today - timedelta(days=args.days - 1)
+    chargers = [(f"CP{i:06d}", rng.uniform(west, east), rng.uniform(south, north)) for i in range(args.chargers)]
+    values = [
+        (charger_id, lon, lat, first_day + timedelta(days=day), rng.uniform(0, 80), rng.uniform(0, 25000))
+        for day in range(args.days)
+        for charger_id, lon, lat in chargers
+    ]
+
+    tiles = HeatmapTiles(first_day)
+    start = time.perf_counter()
+    tiles.replace_days(values)
+    tiles.query(today, today)  # 누적합 계산
+    build_ms = (time.perf_counter() - start) * 1000
+
+    # 당일 값 교체 (증분 갱신) 후 첫 조회까지
+    todays = [v for v in values if v[3] == today]
+
+    def refresh():
+        tiles.replace_days(todays, {today})
+        tiles.query(today, today)
+
+    def scan(period_start):
+        totals = {}
+        for charger_id, lon, lat, stats_date, energy, revenue in values:
+            if period_start <= stats_date <= today:
+                total = totals.get(charger_id)
+                if total is None:
+                    totals[charger_id] = [energy, revenue]
+                else:
+                    total[0] += energy
+                    total[1] += revenue
+        return totals
+
+    results = {}
+    for period in (1, 30, 365):
+        if period > args.days:
+            continue
+        period_start = today - timedelta(days=period - 1)
+        results[f"tiles_{period}d"] = timed(args.queries, lambda: tiles.query(period_start, today))
+        results[f"scan_{period}d"] = timed(max(1, args.queries // 100), lambda: scan(period_start))
+    results["refresh_today"] = timed(max(1, args.queries // 10), refresh)
+
+    print(f"충전기 {args.chargers}대 x {args.days}일 = {len(values)}행, 칸 {len(tiles)}개, 적재 {build_ms:.0f}ms")
+    print(f"{'query':<16}{'mean ms':>10}{'p99 ms':>10}")
+    for name, r in results.items():
+        print(f"{name:<16}{r['mean_ms']:>10.3f}{r['p99_ms']:>10.3f}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({
+                "chargers": args.chargers,
+                "days": args.days,
+                "cells": len(tiles),
+                "build_ms": build_ms,
+                "results": results
+            }, f, indent=2)
+        print(f"\n결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
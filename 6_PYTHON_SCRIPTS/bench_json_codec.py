@@ -0,0 +1,94 @@
+"""
+OCPP JSON 코덱 마이크로 벤치마크
+
+OCPPv201RequestBuilder.transaction_event로 만든 실제 TransactionEvent 프레임을
+설치된 코덱(orjson/msgspec/ujson/json)별로 인코딩/디코딩하여 비교한다.
+
+사용법:
+    python 6_PYTHON_SCRIPTS/bench_json_codec.py
+    python 6_PYTHON_SCRIPTS/bench_json_codec.py --iterations 200000 --output codec_bench.json
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import uuid
+
+# 프로젝트 경로 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(project_root, '4_PYTHON_SOURCE'))
+
+from ocpp_codec import available_codecs
+from ocpp_messages import OCPPv201RequestBuilder
+
+
+def build_frames(count: int = 100):
+    """벤치마크용 TransactionEvent 프레임 생성 (Started/Updated/Ended 혼합)"""
+    frames = []
+    event_types = ("Started", "Updated", "Updated", "Updated", "Ended")
+    for i in range(count):
+        raw = OCPPv201RequestBuilder.transaction_event(
+            event_type=event_types[i % len(event_types)],
+            transaction_id=str(uuid.uuid4()),
+            evse_id=1 + i % 2,
+            connector_id=1,
+            meter_value=i * 0.1,
+            voltage=400.0,
+            current=16.0 + (i % 16)
+        )
+        frames.append(json.loads(raw))
+    return frames
+
+
+def bench_codec(codec, frames, iterations: int):
+    """코덱 하나의 인코딩/디코딩 처리 시간 측정"""
+    encoded = [codec.dumps(frame) for frame in frames]
+    n = len(frames)
+
+    dumps = codec.dumps
+    start = time.perf_counter()
+    for i in range(iterations):
+        dumps(frames[i % n])
+    encode_time = time.perf_counter() - start
+
+    loads = codec.loads
+    start = time.perf_counter()
+    for i in range(iterations):
+        loads(encoded[i % n])
+    decode_time = time.perf_counter() - start
+
+    return {
+        "codec": codec.name,
+        "iterations": iterations,
+        "avg_frame_bytes": sum(len(e) for e in encoded) / n,
+        "encode_us": encode_time / iterations * 1e6,
+        "decode_us": decode_time / iterations * 1e6,
+        "encode_per_sec": iterations / encode_time,
+        "decode_per_sec": iterations / decode_time
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OCPP JSON 코덱 벤치마크")
+    parser.add_argument("--iterations", type=int, default=100000)
+    parser.add_argument("--output", help="결과 JSON 파일 경로")
+    args = parser.parse_args()
+
+    frames = build_frames()
+    results = [bench_codec(codec, frames, args.iterations) for codec in available_codecs()]
+    baseline = next(r for r in results if r["codec"] == "json")
+
+    print(f"{'codec':<10}{'bytes':>8}{'encode(us)':>12}{'decode(us)':>12}{'enc x':>8}{'dec x':>8}")
+    for r in results:
+        print(f"{r['codec']:<10}{r['avg_frame_bytes']:>8.0f}{r['encode_us']:>12.2f}{r['decode_us']:>12.2f}"
+              f"{baseline['encode_us'] / r['encode_us']:>8.1f}{baseline['decode_us'] / r['decode_us']:>8.1f}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\n결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+미터 값 전송 방식별 프레임 생성 비용 벤치마크
+
+같은 수의 미터 샘플을 보낼 때 샘플당 CPU 시간, 바이트, 프레임 수를 비교한다.
+- builder: 샘플마다 OCPPv201RequestBuilder.transaction_event로 Updated 프레임 생성 (기존 방식)
+- template xN: TransactionEventTemplate로 샘플 N개를 meterValue 배열 하나에 묶어 생성
+
+샘플당 시간으로 한 프로세스가 감당할 수 있는 충전기 수를 가늠할 수 있다
+(예: 1초 샘플링이면 충전기당 초당 1샘플).
+
+사용법:
+    python 6_PYTHON_SCRIPTS/bench_meter_batching.py
+    python 6_PYTHON_SCRIPTS/bench_meter_batching.py --samples 200000 --batches 1 5 10 30 --output meter_batching.json
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+# 프로젝트 경로 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(project_root, '4_PYTHON_SOURCE'))
+
+from ocpp_messages import OCPPv201RequestBuilder, TransactionEventTemplate, utc_timestamp
+
+
+def bench_builder(samples: int):
+    """샘플마다 전체 프레임을 새로 생성"""
+    total_bytes = 0
+    start = time.perf_counter()
+    for i in range(samples):
+        frame = OCPPv201RequestBuilder.transaction_event(
+            "Updated", "tx-0001", 1, 1, meter_value=i * 0.01, current=32.0
+        )
+        total_bytes += len(frame)
+    elapsed = time.perf_counter() - start
+    return {"mode": "builder", "batch": 1, "frames": samples, "elapsed": elapsed, "bytes": total_bytes}
+
+
+def bench_template(samples: int, batch: int):
+    """템플릿에 샘플 batch개씩 묶어 생성 (시뮬레이터 묶음 모드와 같은 경로)"""
+    template = TransactionEventTemplate("tx-0001")
+    total_bytes = 0
+    frames = 0
+    pending = []
+    start = time.perf_counter()
+    for i in range(samples):
+        pending.append((utc_timestamp(), i * 10.0, 12800.0))
+        if len(pending) >= batch:
+            total_bytes += len(template.updated("00000000-0000-0000-0000-000000000000", pending))
+            frames += 1
+            pending = []
+    elapsed = time.perf_counter() - start
+    return {"mode": "template", "batch": batch, "frames": frames, "elapsed": elapsed, "bytes": total_bytes}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="미터 값 묶음 전송 벤치마크")
+    parser.add_argument("--samples", type=int, default=100000)
+    parser.add_argument("--batches", type=int, nargs="+", default=[1, 5, 10, 30])
+    parser.add_argument("--output", help="결과 JSON 파일 경로")
+    args = parser.parse_args()
+
+    results = [bench_builder(args.samples)]
+    results += [bench_template(args.samples, batch) for batch in args.batches]
+    for r in results:
+        r["samples"] = args.samples
+        r["us_per_sample"] = r["elapsed"] / args.samples * 1e6
+        r["bytes_per_sample"] = r["bytes"] / args.samples
+        r["samples_per_sec"] = args.samples / r["elapsed"]
+
+    print(f"{'mode':<14}{'frames':>10}{'us/sample':>12}{'bytes/sample':>14}{'samples/s':>12}")
+    for r in results:
+        name = r["mode"] if r["mode"] == "builder" else f"template x{r['batch']}"
+        print(f"{name:<14}{r['frames']:>10}{r['us_per_sample']:>12.2f}{r['bytes_per_sample']:>14.0f}{r['samples_per_sec']:>12.0f}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\n결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
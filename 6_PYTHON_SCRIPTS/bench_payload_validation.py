@@ -0,0 +1,89 @@
+"""
+OCPP 요청 페이로드 검증 비용 벤치마크
+
+시뮬레이터가 실제로 보내는 요청 페이로드를 액션별로 검증하여 메시지당 비용을 측정한다.
+- compiled: 서버가 사용하는 방식 (compile_request_validators로 시작 시 한 번 컴파일)
+- per-message: 메시지마다 TypeAdapter를 새로 만드는 방식 (비교용)
+
+사용법:
+    python 6_PYTHON_SCRIPTS/bench_payload_validation.py
+    python 6_PYTHON_SCRIPTS/bench_payload_validation.py --iterations 100000 --output validation_bench.json
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+# 프로젝트 경로 추가
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(project_root, '4_PYTHON_SOURCE'))
+
+from pydantic import TypeAdapter
+
+from ocpp_messages import OCPPMessage, OCPPv201RequestBuilder
+from ocpp_models import REQUEST_MODELS, compile_request_validators
+
+
+def build_payloads():
+    """액션별 대표 페이로드"""
+    frames = {
+        "BootNotification": OCPPv201RequestBuilder.boot_notification("Model-X", "Vendor"),
+        "Heartbeat": OCPPv201RequestBuilder.heartbeat(),
+        "StatusNotification": OCPPv201RequestBuilder.status_notification(1, 1, "Occupied"),
+        "TransactionEvent": OCPPv201RequestBuilder.transaction_event(
+            "Updated", "tx-0001", 1, 1, meter_value=12.5, current=32.0
+        ),
+        "Authorize": OCPPv201RequestBuilder.authorize("RFID-0001"),
+    }
+    return {action: OCPPMessage.parse_message(raw)[3] for action, raw in frames.items()}
+
+
+def bench_action(action, payload, validator, iterations: int):
+    """액션 하나의 검증 시간 측정"""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        validator(payload)
+    compiled = time.perf_counter() - start
+
+    model = REQUEST_MODELS[action]
+    uncompiled_iterations = max(1, iterations // 100)
+    start = time.perf_counter()
+    for _ in range(uncompiled_iterations):
+        TypeAdapter(model).validate_python(payload)
+    uncompiled = time.perf_counter() - start
+
+    return {
+        "action": action,
+        "iterations": iterations,
+        "compiled_us": compiled / iterations * 1e6,
+        "per_message_us": uncompiled / uncompiled_iterations * 1e6,
+        "compiled_per_sec": iterations / compiled
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OCPP 페이로드 검증 벤치마크")
+    parser.add_argument("--iterations", type=int, default=50000)
+    parser.add_argument("--output", help="결과 JSON 파일 경로")
+    args = parser.parse_args()
+
+    validators = compile_request_validators()
+    payloads = build_payloads()
+    results = [
+        bench_action(action, payload, validators[action], args.iterations)
+        for action, payload in payloads.items()
+    ]
+
+    print(f"{'action':<22}{'compiled(us)':>14}{'per-msg(us)':>14}{'msgs/s':>12}")
+    for r in results:
+        print(f"{r['action']:<22}{r['compiled_us']:>14.2f}{r['per_message_us']:>14.1f}{r['compiled_per_sec']:>12.0f}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\n결과 저장: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
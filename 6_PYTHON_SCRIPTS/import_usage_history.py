@@ -0,0 +1,142 @@
+"""
+과거 사용 이력 / 전력 기록 일괄 적재 (CSV, JSONL)
+
+파일을 한 줄씩 읽어 chunk 단위로 다중 INSERT 한다 (파일 전체를 메모리에 올리지 않음).
+- usage: charger_usage_log, transaction_id가 이미 있으면 건너뜀
+- power: power_consumption, (charger_id, measurement_time)이 이미 있으면 건너뜀
+chunk마다 커밋하므로 중단된 적재는 같은 명령으로 다시 실행하면 이어진다.
+
+열 이름은 테이블 컬럼 이름과 같아야 하며 (모르는 열은 무시), 값은 컬럼 타입에 맞게 변환한다.
+날짜/시각은 ISO 8601 (예: 2025-01-31, 2025-01-31T09:30:00), 빈 값은 NULL.
+
+사용법:
+    python 6_PYTHON_SCRIPTS/import_usage_history.py usage usage_2024.csv
+    python 6_PYTHON_SCRIPTS/import_usage_history.py power power_2024.jsonl --chunk-size 10000
+    python 6_PYTHON_SCRIPTS/import_usage_history.py usage a.csv b.jsonl --database-url postgresql://...
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterator
+
+# 프로젝트 루트 경로 추가 (database 모듈 import를 위함)
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(project_root, '8_DATABASE'))
+
+from database.models import DatabaseManager, DEFAULT_DATABASE_URL, ChargerUsageLog, PowerConsumption
+from database.services import UsageLogService, PowerConsumptionService
+
+# 종류 -> (모델, 일괄 적재 함수, 기본 chunk 크기)
+KINDS = {
+    "usage": (ChargerUsageLog, UsageLogService.bulk_insert_usage_logs, 1000),
+    "power": (PowerConsumption, PowerConsumptionService.bulk_insert_power_records, 5000),
+}
+
+
+def _parse_bool(value: str) -> bool:
+    return value.strip().lower() in ("1", "true", "yes", "y")
+
+
+# 컬럼 python 타입 -> 문자열 변환 함수
+_PARSERS: Dict[type, Callable[[str], Any]] = {
+    datetime: datetime.fromisoformat,
+    date: date.fromisoformat,
+    Decimal: Decimal,
+    int: int,
+    float: float,
+    bool: _parse_bool,
+    dict: json.loads,
+}
+
+
+def column_parsers(model) -> Dict[str, Callable[[str], Any]]:
+    """모델 컬럼 이름 -> 문자열 값 변환 함수 (id, created_at 제외)"""
+    parsers = {}
+    for column in model.__table__.columns:
+        if column.name in ("id", "created_at"):
+            continue
+        try:
+            python_type = column.type.python_type
+        except NotImplementedError:
+            python_type = str
+        parsers[column.name] = _PARSERS.get(python_type, str)
+    return parsers
+
+
+def iter_file(path: str) -> Iterator[Dict[str, Any]]:
+    """CSV(.csv) 또는 JSON Lines(그 외) 파일을 한 행씩 dict로 읽기"""
+    with open(path, encoding="utf-8", newline="") as f:
+        if path.lower().endswith(".csv"):
+            yield from csv.DictReader(f)
+        else:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def iter_rows(path: str, model) -> Iterator[Dict[str, Any]]:
+    """파일 행 -> 컬럼 타입으로 변환한 dict (문자열이 아닌 JSON 값은 그대로)"""
+    parsers = column_parsers(model)
+    ignored = set()
+    for line_number, raw in enumerate(iter_file(path), start=1):
+        row = {}
+        for key, value in raw.items():
+            parser = parsers.get(key)
+            if parser is None:
+                if key not in ignored:
+                    ignored.add(key)
+                    print(f"⚠️  {path}: 알 수 없는 열 '{key}' 무시")
+                continue
+            if value is None or value == "":
+                continue
+            try:
+                row[key] = parser(value) if isinstance(value, str) else value
+            except (ValueError, ArithmeticError) as e:
+                raise ValueError(f"{path}:{line_number} '{key}' 값 변환 실패: {value!r} ({e})") from e
+        yield row
+
+
+def import_file(manager, kind: str, path: str, chunk_size: int = None) -> Dict[str, int]:
+    """
+    파일 1개 적재
+
+    Returns:
+        {"inserted", "skipped"}
+    """
+    model, bulk_insert, default_chunk_size = KINDS[kind]
+    session = manager.get_session()
+    try:
+        return bulk_insert(session, iter_rows(path, model), chunk_size=chunk_size or default_chunk_size)
+    finally:
+        session.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="과거 사용 이력 / 전력 기록 일괄 적재 (CSV, JSONL)")
+    parser.add_argument("kind", choices=sorted(KINDS), help="usage: 사용 이력, power: 전력 기록")
+    parser.add_argument("files", nargs="+", help="CSV(.csv) 또는 JSON Lines 파일")
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL", DEFAULT_DATABASE_URL))
+    parser.add_argument("--chunk-size", type=int, help="INSERT/커밋 단위 행 수 (기본: usage 1000, power 5000)")
+    args = parser.parse_args()
+
+    manager = DatabaseManager(args.database_url)
+    manager.initialize()
+    try:
+        for path in args.files:
+            started = time.perf_counter()
+            result = import_file(manager, args.kind, path, args.chunk_size)
+            elapsed = time.perf_counter() - started
+            total = result["inserted"] + result["skipped"]
+            print(f"✅ {path}: 생성 {result['inserted']}건, 건너뜀 {result['skipped']}건 "
+                  f"({elapsed:.1f}초, {total / elapsed if elapsed else 0:,.0f}행/초)")
+    finally:
+        manager.close()
+
+
+if __name__ == "__main__":
+    main()
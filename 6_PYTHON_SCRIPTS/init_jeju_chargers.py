@@ -257,6 +257,7 @@ def init_jeju_chargers():
     print("\n📊 샘플 사용 이력 생성 중...")
     for i in range(7):
         target_date = date.today() - timedelta(days=i)
+        usage_logs = []
         for charger in all_chargers:
             # 하루에 3-8번의 충전 세션
             num_sessions = random.randint(3, 8)
@@ -276,21 +277,23 @@ def init_jeju_chargers():
                 
                 transaction_id = f"TXN-{charger.charger_id}-{int(target_date.toordinal())}-{j}"
                 
-                log = UsageLogService.create_usage_log(
-                    session,
-                    charger.charger_id,
-                    transaction_id,
-                    target_date,
-                    start_time,
-                    end_time=start_time + timedelta(minutes=duration),
-                    energy_delivered=Decimal(str(energy)),
-                    duration_minutes=duration,
-                    base_charge=charger.base_fee,
-                    energy_charge=energy_charge,
-                    time_charge=time_charge,
-                    total_charge=total_charge,
-                    payment_status='completed'
-                )
+                usage_logs.append({
+                    "charger_id": charger.charger_id,
+                    "transaction_id": transaction_id,
+                    "session_date": target_date,
+                    "start_time": start_time,
+                    "end_time": start_time + timedelta(minutes=duration),
+                    "energy_delivered": Decimal(str(energy)),
+                    "duration_minutes": duration,
+                    "base_charge": charger.base_fee,
+                    "energy_charge": energy_charge,
+                    "time_charge": time_charge,
+                    "total_charge": total_charge,
+                    "payment_status": 'completed'
+                })
+        
+        # 하루치 사용 이력 일괄 생성 (이미 있는 transaction_id는 건너뜀)
+        UsageLogService.bulk_insert_usage_logs(session, usage_logs)
         
         # 일일 통계 계산
         for charger in all_chargers:
@@ -303,6 +306,7 @@ def init_jeju_chargers():
     # 전력 사용량 데이터 생성
     print("\n⚡ 전력 사용량 데이터 생성 중...")
     target_date = date.today()
+    power_records = []
     for charger in all_chargers:
         cumulative = Decimal('0')
         daily_cumulative = Decimal('0')
@@ -325,16 +329,16 @@ def init_jeju_chargers():
                 cumulative += Decimal(str(input_power / 4))  # 15분 단위
                 daily_cumulative += Decimal(str(input_power / 4))
                 
-                PowerConsumptionService.create_power_record(
-                    session,
-                    charger.charger_id,
-                    measurement_time,
-                    input_power,
-                    cumulative,
-                    daily_cumulative=daily_cumulative,
-                    is_charging=is_charging
-                )
+                power_records.append({
+                    "charger_id": charger.charger_id,
+                    "measurement_time": measurement_time,
+                    "input_power": input_power,
+                    "cumulative_energy": cumulative,
+                    "daily_cumulative": daily_cumulative,
+                    "is_charging": is_charging
+                })
     
+    PowerConsumptionService.bulk_insert_power_records(session, power_records)
     print(f"  ✅ 전력 사용량 데이터 생성 완료")
     
     session.commit()
@@ -0,0 +1,116 @@
+"""
+power_consumption 테이블 -> 전력 시계열 저장소 이전
+
+테이블을 충전기·시각 순으로 나눠 읽어 충전기별·날짜별 묶음(.npz)으로 저장한다.
+같은 시각의 측정값은 저장소에 이미 있는 값을 유지하므로 중단 후 다시 실행해도 중복되지 않는다.
+--delete를 주면 저장소의 측정값 수를 확인한 뒤 이전한 행을 테이블에서 삭제한다.
+
+이전 후 OCPP 서버와 대시보드 API에 OCPP_POWER_STORE_DIR을 같은 경로로 설정하면
+새 측정값은 저장소에 쓰이고 /statistics/charger/{charger_id}/power도 저장소에서 읽는다.
+
+사용법:
+    python 6_PYTHON_SCRIPTS/migrate_power_to_timeseries.py --store-dir ./power_store
+    python 6_PYTHON_SCRIPTS/migrate_power_to_timeseries.py --store-dir ./power_store --before 2025-01-01 --delete
+    python 6_PYTHON_SCRIPTS/migrate_power_to_timeseries.py --database-url postgresql://... --store-dir ./power_store --charger CP001
+"""
+import argparse
+import os
+import sys
+import time
+from datetime import date, datetime, timezone
+
+# 프로젝트 루트 경로 추가 (database 모듈 import를 위함)
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(project_root, '8_DATABASE'))
+
+from database.models import DatabaseManager, DEFAULT_DATABASE_URL
+from database.services import PowerConsumptionService
+from database.timeseries import PowerSeriesStore, records_to_array
+
+
+def migrate(manager, store: PowerSeriesStore, before: date, charger_id=None, delete=False, batch_size=50000):
+    """
+    테이블 -> 저장소 이전 (before 이전 날짜만)
+
+    Returns:
+        {"rows", "chunks", "chargers", "deleted"}
+    """
+    result = {"rows": 0, "chunks": 0, "chargers": 0, "deleted": 0}
+    migrated = {}  # 충전기 ID -> 이전한 행 수
+    current_key = None
+    rows = []
+
+    def write_chunk():
+        charger, day = current_key
+        store.write_day(charger, day, records_to_array(rows))
+        result["rows"] += len(rows)
+        result["chunks"] += 1
+        migrated[charger] = migrated.get(charger, 0) + len(rows)
+
+    session = manager.get_session()
+    try:
+        for charger, measured_at, power, voltage, current, energy in PowerConsumptionService.iter_power_columns(
+            session, before=datetime.combine(before, datetime.min.time()),
+            charger_id=charger_id, batch_size=batch_size
+        ):
+            key = (charger, measured_at.date())
+            if key != current_key:
+                if current_key is not None:
+                    write_chunk()
+                current_key = key
+                rows = []
+            rows.append((measured_at, power, voltage, current, energy))
+        if current_key is not None:
+            write_chunk()
+    finally:
+        session.close()
+    result["chargers"] = len(migrated)
+
+    if delete:
+        # 읽기가 끝난 뒤, 저장소 측정값이 이전한 행 수 이상인 충전기만 삭제
+        session = manager.get_session()
+        try:
+            for charger, count in migrated.items():
+                stored = sum(len(store.read_day(charger, day)) for day in store.days(charger) if day < before)
+                if stored < count:
+                    print(f"⚠️  {charger}: 저장소 측정값 {stored}건 < 이전 {count}건, 삭제 건너뜀")
+                    continue
+                result["deleted"] += PowerConsumptionService.delete_power_records(
+                    session, charger, datetime.combine(before, datetime.min.time())
+                )
+        finally:
+            session.close()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="power_consumption 테이블 -> 전력 시계열 저장소 이전")
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL", DEFAULT_DATABASE_URL))
+    parser.add_argument("--store-dir", default=os.getenv("OCPP_POWER_STORE_DIR"), help="시계열 저장소 경로")
+    parser.add_argument("--before", type=date.fromisoformat, default=datetime.now(timezone.utc).date(),
+                        help="이 날짜(UTC) 이전 측정값만 이전 (기본: 오늘, 진행 중인 당일 제외)")
+    parser.add_argument("--charger", help="특정 충전기만 이전")
+    parser.add_argument("--delete", action="store_true", help="이전한 행을 테이블에서 삭제")
+    parser.add_argument("--batch-size", type=int, default=50000, help="한 번에 읽을 행 수")
+    args = parser.parse_args()
+
+    if not args.store_dir:
+        parser.error("--store-dir 또는 OCPP_POWER_STORE_DIR이 필요합니다")
+
+    manager = DatabaseManager(args.database_url)
+    manager.initialize()
+    store = PowerSeriesStore(args.store_dir)
+
+    started = time.perf_counter()
+    result = migrate(manager, store, args.before, args.charger, args.delete, args.batch_size)
+    elapsed = time.perf_counter() - started
+    manager.close()
+
+    print(f"✅ 이전 완료: 충전기 {result['chargers']}대, 묶음 {result['chunks']}개, "
+          f"측정값 {result['rows']}건 ({elapsed:.1f}초)")
+    if args.delete:
+        print(f"   테이블에서 삭제: {result['deleted']}행")
+
+
+if __name__ == "__main__":
+    main()
@@ -21,6 +21,8 @@ from .services import (
     PowerConsumptionService,
     StatisticsService,
 )
+from .aggregation import UsageAggregator
+from .timeseries import PowerSeriesStore
 
 __all__ = [
     "DatabaseManager",
@@ -38,4 +40,6 @@ __all__ = [
     "UsageLogService",
     "PowerConsumptionService",
     "StatisticsService",
+    "UsageAggregator",
+    "PowerSeriesStore",
 ]
@@ -0,0 +1,215 @@
+"""
+충전기별 에너지/매출 증분 집계
+
+완료된 충전 세션이 들어올 때마다 충전기별·일별, 충전기별·시간별 카운터만 갱신하고,
+주기적으로 DailyChargerStats / HourlyChargerStats에 증분 upsert로 반영한다.
+StatisticsService.calculate_daily_stats처럼 하루치 사용 이력 전체를 다시 읽지 않으므로
+반영 비용은 세션 수가 아니라 변경된 키 수에 비례한다.
+대시보드/API(get_charger_totals 등)는 이렇게 최신으로 유지되는 일별/시간별 행을 읽는다.
+get_daily_stats()/get_hourly_stats()의 메모리 조회는 집계기를 가진 프로세스 안에서만 쓸 수 있다.
+
+집계기가 반영 중인 행을 사용 이력에서 다시 계산할 때는 rebuild_daily()를 쓴다
+(calculate_daily_stats를 직접 호출하면 미반영 증분이 다음 flush에서 한 번 더 더해짐).
+
+세션은 시작 시각(start_time) 기준 날짜/시간대에 집계한다 (calculate_daily_stats와 동일).
+"""
+import time
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from database.services import StatisticsService
+
+DailyKey = Tuple[str, date]
+HourlyKey = Tuple[str, datetime]
+
+
+def _empty_daily() -> Dict[str, Any]:
+    return {
+        "num_sessions": 0,
+        "total_energy": Decimal('0'),
+        "total_duration_minutes": 0,
+        "total_revenue": Decimal('0'),
+        "hourly_energy": {},
+        "hourly_sessions": {},
+        "hourly_revenue": {}
+    }
+
+
+def _empty_hourly() -> Dict[str, Any]:
+    return {
+        "num_sessions": 0,
+        "total_energy": Decimal('0'),
+        "total_duration_minutes": 0,
+        "total_revenue": Decimal('0')
+    }
+
+
+def _combine(base: Optional[Dict[str, Any]], delta: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """누적값 + 미반영 증분"""
+    if base is None or delta is None:
+        return dict(base or delta) if (base or delta) else None
+    result = dict(base)
+    for name, value in delta.items():
+        if isinstance(value, dict):
+            merged = dict(base.get(name) or {})
+            for hour, amount in value.items():
+                merged[hour] = merged.get(hour, 0) + amount
+            result[name] = merged
+        elif name != "avg_charge_per_session":
+            result[name] = (base.get(name) or 0) + value
+    if result["num_sessions"]:
+        result["avg_charge_per_session"] = (
+            Decimal(result["total_revenue"]) / result["num_sessions"]
+        ).quantize(Decimal('0.01'))
+    return result
+
+
+class UsageAggregator:
+    """
+    충전 세션 스트리밍 집계기
+
+    record_session()은 메모리 카운터만 갱신한다 (DB 접근 없음).
+    flush()가 미반영 증분을 한 트랜잭션으로 upsert하고, 반영 결과(기존 행 + 증분)를
+    메모리에 보관하므로 이후 get_daily_stats()/get_hourly_stats()는 DB 조회 없이 응답한다.
+    retain_days보다 오래된 날짜의 누적값은 flush 때 메모리에서 정리한다.
+    """
+
+    def __init__(self, flush_interval: float = 60.0, retain_days: int = 2):
+        self.flush_interval = flush_interval
+        self.retain_days = retain_days
+        # 반영 완료된 누적값 (DB와 동일)
+        self._daily: Dict[DailyKey, Dict[str, Any]] = {}
+        self._hourly: Dict[HourlyKey, Dict[str, Any]] = {}
+        # 아직 반영되지 않은 증분
+        self._pending_daily: Dict[DailyKey, Dict[str, Any]] = {}
+        self._pending_hourly: Dict[HourlyKey, Dict[str, Any]] = {}
+        self._last_flush = time.monotonic()
+        self.stats = {"sessions": 0, "flushes": 0, "rows": 0}
+
+    def record_session(
+        self,
+        charger_id: str,
+        start_time: datetime,
+        energy_kwh: Any,
+        revenue: Any,
+        duration_minutes: int = 0
+    ):
+        """완료된 세션 한 건 집계"""
+        energy = Decimal(str(energy_kwh or 0))
+        charge = Decimal(str(revenue or 0))
+        hour = str(start_time.hour)
+
+        daily = self._pending_daily.get((charger_id, start_time.date()))
+        if daily is None:
+            daily = self._pending_daily[(charger_id, start_time.date())] = _empty_daily()
+        daily["num_sessions"] += 1
+        daily["total_energy"] += energy
+        daily["total_duration_minutes"] += duration_minutes or 0
+        daily["total_revenue"] += charge
+        daily["hourly_energy"][hour] = daily["hourly_energy"].get(hour, 0) + float(energy)
+        daily["hourly_sessions"][hour] = daily["hourly_sessions"].get(hour, 0) + 1
+        daily["hourly_revenue"][hour] = daily["hourly_revenue"].get(hour, 0) + float(charge)
+
+        hour_key = (charger_id, start_time.replace(minute=0, second=0, microsecond=0))
+        hourly = self._pending_hourly.get(hour_key)
+        if hourly is None:
+            hourly = self._pending_hourly[hour_key] = _empty_hourly()
+        hourly["num_sessions"] += 1
+        hourly["total_energy"] += energy
+        hourly["total_duration_minutes"] += duration_minutes or 0
+        hourly["total_revenue"] += charge
+
+        self.stats["sessions"] += 1
+
+    def due(self) -> bool:
+        """반영 주기가 지났고 미반영 증분이 있는지"""
+        return bool(self._pending_daily) and time.monotonic() - self._last_flush >= self.flush_interval
+
+    def pending_count(self) -> int:
+        return len(self._pending_daily) + len(self._pending_hourly)
+
+    def flush(self, session: Session, commit: bool = True) -> int:
+        """
+        미반영 증분을 DailyChargerStats / HourlyChargerStats에 upsert
+
+        실패하면 증분을 되돌려 다음 flush에서 다시 반영한다.
+
+        Returns:
+            반영한 행 수
+        """
+        self._last_flush = time.monotonic()
+        pending_daily, self._pending_daily = self._pending_daily, {}
+        pending_hourly, self._pending_hourly = self._pending_hourly, {}
+        if not pending_daily and not pending_hourly:
+            return 0
+
+        try:
+            daily_totals = StatisticsService.apply_daily_deltas(session, pending_daily, commit=False)
+            hourly_totals = StatisticsService.apply_hourly_deltas(session, pending_hourly, commit=False)
+            if commit:
+                session.commit()
+        except Exception:
+            self._restore(pending_daily, pending_hourly)
+            raise
+
+        self._daily.update(daily_totals)
+        self._hourly.update(hourly_totals)
+        self._prune()
+        rows = len(daily_totals) + len(hourly_totals)
+        self.stats["flushes"] += 1
+        self.stats["rows"] += rows
+        return rows
+
+    def _restore(self, pending_daily: Dict[DailyKey, Dict[str, Any]], pending_hourly: Dict[HourlyKey, Dict[str, Any]]):
+        """반영 실패한 증분을 이후 기록과 합쳐 되돌림"""
+        for key, delta in pending_daily.items():
+            self._pending_daily[key] = _combine(delta, self._pending_daily.get(key))
+        for key, delta in pending_hourly.items():
+            self._pending_hourly[key] = _combine(delta, self._pending_hourly.get(key))
+
+    def rebuild_daily(self, session: Session, charger_id: str, stats_date: date) -> Dict[str, Any]:
+        """
+        일일 통계를 사용 이력에서 다시 계산 (StatisticsService.calculate_daily_stats)
+
+        집계된 세션은 모두 커밋된 사용 이력이므로 재계산 결과에 이미 포함된다.
+        해당 키의 미반영 일일 증분은 버린다 (시간별 행은 재계산하지 않으므로 유지).
+        flush()와 같은 스레드에서 호출한다.
+
+        Returns:
+            재계산 후 누적값
+        """
+        key = (charger_id, stats_date)
+        self._pending_daily.pop(key, None)
+        stats = StatisticsService.calculate_daily_stats(session, charger_id, stats_date)
+        total = {
+            "num_sessions": stats.num_sessions or 0,
+            "total_energy": Decimal(str(stats.total_energy or 0)),
+            "total_duration_minutes": stats.total_duration_minutes or 0,
+            "total_revenue": Decimal(str(stats.total_revenue or 0))
+        }
+        if total["num_sessions"]:
+            total["avg_charge_per_session"] = (total["total_revenue"] / total["num_sessions"]).quantize(Decimal('0.01'))
+        for name in ("hourly_energy", "hourly_sessions", "hourly_revenue"):
+            total[name] = {str(hour): value for hour, value in (getattr(stats, name) or {}).items()}
+        self._daily[key] = total
+        return total
+
+    def _prune(self):
+        cutoff = date.today() - timedelta(days=self.retain_days)
+        for key in [key for key in self._daily if key[1] < cutoff]:
+            del self._daily[key]
+        for key in [key for key in self._hourly if key[1].date() < cutoff]:
+            del self._hourly[key]
+
+    def get_daily_stats(self, charger_id: str, stats_date: date) -> Optional[Dict[str, Any]]:
+        """충전기 일일 누적값 (반영분 + 미반영 증분, 집계된 적 없으면 None)"""
+        key = (charger_id, stats_date)
+        return _combine(self._daily.get(key), self._pending_daily.get(key))
+
+    def get_hourly_stats(self, charger_id: str, stats_hour: datetime) -> Optional[Dict[str, Any]]:
+        """충전기 시간별 누적값 (stats_hour는 정시로 절삭)"""
+        key = (charger_id, stats_hour.replace(minute=0, second=0, microsecond=0))
+        return _combine(self._hourly.get(key), self._pending_hourly.get(key))
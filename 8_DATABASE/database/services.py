@@ -5,15 +5,32 @@ CRUD 작업 및 통계 조회 기능 제공
 
 from datetime import datetime, date, timedelta
 from decimal import Decimal
-from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func
+from itertools import islice
+from typing import List, Optional, Dict, Any, Iterable, Iterator, Set, Callable, Tuple
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import and_, or_, func, insert, update
 from database.models import (
     StationInfo, ChargerInfo, ChargerUsageLog, PowerConsumption,
     DailyChargerStats, HourlyChargerStats, StationDailyStats,
     ChargerTypeEnum, ChargerStatusEnum
 )
 
+# 사용 이력의 Numeric 컬럼 (float 입력은 Decimal로 변환)
+USAGE_DECIMAL_FIELDS = (
+    "energy_delivered", "energy_meter_start", "energy_meter_end",
+    "base_charge", "energy_charge", "time_charge", "parking_charge", "total_charge"
+)
+
+
+def _chunked(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """items를 size개씩 나눈 목록 (전체를 메모리에 올리지 않음)"""
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
 
 class StationService:
     """충전소 관리 서비스"""
@@ -141,6 +158,50 @@ class ChargerService:
             ChargerInfo.charger_type == charger_type
         ).all()
     
+    @staticmethod
+    def get_chargers_with_station(
+        session: Session,
+        station_id: Optional[str] = None,
+        status: Optional[ChargerStatusEnum] = None,
+        charger_type: Optional[ChargerTypeEnum] = None,
+        charger_ids: Optional[Iterable[str]] = None
+    ) -> List[ChargerInfo]:
+        """
+        충전기 + 소속 충전소 조회 (JOIN 쿼리 1회)
+
+        필터는 station_id > status > charger_type 순으로 하나만 적용한다.
+        charger_ids(공간 인덱스 조회 결과 등)를 주면 해당 충전기로 추가 제한하며,
+        IN 목록이 길면 1000개 단위로 나눠 조회한다.
+        charger.station은 함께 로드되므로 추가 쿼리가 발생하지 않는다.
+        """
+        query = session.query(ChargerInfo).options(joinedload(ChargerInfo.station))
+        if station_id:
+            query = query.filter(ChargerInfo.station_id == station_id)
+        elif status:
+            query = query.filter(ChargerInfo.current_status == status)
+        elif charger_type:
+            query = query.filter(ChargerInfo.charger_type == charger_type)
+        if charger_ids is None:
+            return query.all()
+
+        charger_ids = list(charger_ids)
+        chargers = []
+        for start in range(0, len(charger_ids), 1000):
+            chargers.extend(query.filter(ChargerInfo.charger_id.in_(charger_ids[start:start + 1000])).all())
+        return chargers
+
+    @staticmethod
+    def get_locations(session: Session, with_status: bool = False) -> List[Tuple]:
+        """
+        전체 충전기 (ID, 경도, 위도) 목록 (공간 인덱스 적재용, 쿼리 1회)
+
+        with_status=True면 (ID, 경도, 위도, 현재 상태)
+        """
+        columns = [ChargerInfo.charger_id, ChargerInfo.longitude, ChargerInfo.latitude]
+        if with_status:
+            columns.append(ChargerInfo.current_status)
+        return [tuple(row) for row in session.query(*columns)]
+
     @staticmethod
     def update_charger_status(
         session: Session,
@@ -155,6 +216,59 @@ class ChargerService:
             session.commit()
         return charger
     
+    @staticmethod
+    def get_status_map(session: Session) -> Dict[str, ChargerStatusEnum]:
+        """충전기 ID -> 현재 상태 (쿼리 1회)"""
+        return {
+            charger_id: status
+            for charger_id, status in session.query(ChargerInfo.charger_id, ChargerInfo.current_status)
+        }
+
+    @staticmethod
+    def get_existing_charger_ids(session: Session, charger_ids: Iterable[str]) -> Set[str]:
+        """등록된 충전기 ID만 추출 (쿼리 1회)"""
+        charger_ids = list(charger_ids)
+        if not charger_ids:
+            return set()
+        rows = session.query(ChargerInfo.charger_id).filter(
+            ChargerInfo.charger_id.in_(charger_ids)
+        ).all()
+        return {row[0] for row in rows}
+
+    @staticmethod
+    def bulk_update_status(
+        session: Session,
+        statuses: Dict[str, ChargerStatusEnum],
+        updated_at: datetime = None,
+        commit: bool = True
+    ) -> int:
+        """
+        여러 충전기 상태 일괄 업데이트 (상태 값별 UPDATE 1회)
+
+        Args:
+            statuses: 충전기 ID -> 새 상태
+
+        Returns:
+            변경된 행 수
+        """
+        updated_at = updated_at or datetime.utcnow()
+        by_status: Dict[ChargerStatusEnum, List[str]] = {}
+        for charger_id, status in statuses.items():
+            by_status.setdefault(status, []).append(charger_id)
+
+        changed = 0
+        for status, charger_ids in by_status.items():
+            result = session.execute(
+                update(ChargerInfo)
+                .where(ChargerInfo.charger_id.in_(charger_ids))
+                .values(current_status=status, last_status_update=updated_at)
+                .execution_options(synchronize_session=False)
+            )
+            changed += result.rowcount or 0
+        if commit:
+            session.commit()
+        return changed
+
     @staticmethod
     def update_power_limit(
         session: Session,
@@ -256,6 +370,149 @@ class UsageLogService:
             session.commit()
         return log
     
+    @staticmethod
+    def bulk_upsert_sessions(
+        session: Session,
+        sessions: List[Dict[str, Any]],
+        commit: bool = True,
+        on_completed: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Dict[str, int]:
+        """
+        충전 세션 일괄 생성/갱신 (transaction_id 기준)
+
+        기존 세션 조회 1회 후, 신규 세션은 다중 INSERT로, 기존 세션은 기본키 기준
+        일괄 UPDATE로 반영한다. end_time이 있으면 세션 종료로 보고
+        duration_minutes를 계산한다. 목록 안의 transaction_id는 중복되지 않아야 한다.
+
+        Args:
+            sessions: {"transaction_id", "charger_id", "start_time", 선택: "end_time",
+                       "energy_delivered", "total_charge", "status", "payment_status"} 목록
+            on_completed: 이번 호출로 결제 완료(payment_status='completed')가 된 세션마다
+                          {"charger_id", "transaction_id", "start_time", "end_time",
+                           "duration_minutes", "energy_delivered", "total_charge"}로 호출
+                          (이미 완료된 세션의 재전송은 다시 호출하지 않음)
+
+        Returns:
+            {"inserted": 신규 건수, "updated": 갱신 건수}
+        """
+        if not sessions:
+            return {"inserted": 0, "updated": 0}
+
+        existing = {
+            row.transaction_id: row
+            for row in session.query(
+                ChargerUsageLog.id, ChargerUsageLog.transaction_id, ChargerUsageLog.start_time,
+                ChargerUsageLog.payment_status
+            ).filter(
+                ChargerUsageLog.transaction_id.in_([s["transaction_id"] for s in sessions])
+            )
+        }
+
+        new_rows = []
+        update_rows = []
+        for item in sessions:
+            values = {
+                key: item[key]
+                for key in ("end_time", "status", "payment_status")
+                if item.get(key) is not None
+            }
+            for key in ("energy_delivered", "total_charge"):
+                if item.get(key) is not None:
+                    values[key] = Decimal(str(item[key]))
+
+            row = existing.get(item["transaction_id"])
+            start_time = row.start_time if row is not None else item["start_time"]
+            if values.get("end_time") is not None and start_time is not None:
+                values["duration_minutes"] = int((values["end_time"] - start_time).total_seconds() / 60)
+
+            if row is None:
+                new_rows.append({
+                    "charger_id": item["charger_id"],
+                    "transaction_id": item["transaction_id"],
+                    "session_date": start_time.date(),
+                    "start_time": start_time,
+                    **values
+                })
+            elif values:
+                values["id"] = row.id
+                update_rows.append(values)
+
+            if (on_completed is not None and values.get("payment_status") == 'completed'
+                    and (row is None or row.payment_status != 'completed')):
+                on_completed({
+                    "charger_id": item["charger_id"],
+                    "transaction_id": item["transaction_id"],
+                    "start_time": start_time,
+                    "end_time": values.get("end_time"),
+                    "duration_minutes": values.get("duration_minutes") or 0,
+                    "energy_delivered": values.get("energy_delivered", Decimal('0')),
+                    "total_charge": values.get("total_charge", Decimal('0'))
+                })
+
+        if new_rows:
+            session.execute(insert(ChargerUsageLog), new_rows)
+        if update_rows:
+            session.execute(update(ChargerUsageLog), update_rows)
+        if commit:
+            session.commit()
+        return {"inserted": len(new_rows), "updated": len(update_rows)}
+
+    @staticmethod
+    def bulk_insert_usage_logs(
+        session: Session,
+        logs: Iterable[Dict[str, Any]],
+        chunk_size: int = 1000,
+        commit: bool = True
+    ) -> Dict[str, int]:
+        """
+        과거 사용 이력 일괄 생성 (transaction_id 기준 중복 건너뜀)
+
+        chunk_size건마다 기존 transaction_id 조회 1회와 다중 INSERT 1회로 반영하고
+        (commit=True면) 커밋한다. 이미 있는 거래와 입력 안의 중복 거래는 건너뛰므로
+        같은 파일을 다시 넣거나 중단된 적재를 이어서 실행해도 결과가 같다.
+
+        Args:
+            logs: {"charger_id", "transaction_id", "start_time", 선택: "session_date"
+                   (기본: 시작 날짜), "end_time", "duration_minutes" (기본: 종료-시작),
+                   그 밖의 ChargerUsageLog 컬럼} 목록 또는 iterator
+
+        Returns:
+            {"inserted": 생성 건수, "skipped": 건너뛴 건수}
+        """
+        result = {"inserted": 0, "skipped": 0}
+        for chunk in _chunked(logs, chunk_size):
+            by_transaction = {}
+            for item in chunk:
+                by_transaction.setdefault(item["transaction_id"], item)
+            existing = {
+                transaction_id for (transaction_id,) in session.query(ChargerUsageLog.transaction_id).filter(
+                    ChargerUsageLog.transaction_id.in_(list(by_transaction))
+                )
+            }
+
+            new_rows = []
+            for transaction_id, item in by_transaction.items():
+                if transaction_id in existing:
+                    continue
+                row = dict(item)
+                start_time, end_time = row["start_time"], row.get("end_time")
+                if row.get("session_date") is None:
+                    row["session_date"] = start_time.date()
+                if end_time is not None and row.get("duration_minutes") is None:
+                    row["duration_minutes"] = int((end_time - start_time).total_seconds() / 60)
+                for key in USAGE_DECIMAL_FIELDS:
+                    if row.get(key) is not None:
+                        row[key] = Decimal(str(row[key]))
+                new_rows.append(row)
+
+            if new_rows:
+                session.execute(insert(ChargerUsageLog), new_rows)
+            if commit:
+                session.commit()
+            result["inserted"] += len(new_rows)
+            result["skipped"] += len(chunk) - len(new_rows)
+        return result
+
     @staticmethod
     def get_usage_logs_by_charger(
         session: Session,
@@ -275,6 +532,16 @@ class UsageLogService:
         
         return query.order_by(ChargerUsageLog.start_time.desc()).all()
     
+    @staticmethod
+    def get_completed_transaction_ids(session: Session, session_date: date) -> Set[str]:
+        """세션 날짜별 결제 완료 거래 ID (실시간 집계 중복 반영 방지용)"""
+        return {
+            transaction_id for (transaction_id,) in session.query(ChargerUsageLog.transaction_id).filter(
+                ChargerUsageLog.session_date == session_date,
+                ChargerUsageLog.payment_status == 'completed'
+            )
+        }
+
     @staticmethod
     def get_daily_revenue(
         session: Session,
@@ -330,6 +597,76 @@ class PowerConsumptionService:
         session.commit()
         return record
     
+    @staticmethod
+    def bulk_create_power_records(
+        session: Session,
+        records: List[Dict[str, Any]],
+        commit: bool = True
+    ) -> int:
+        """
+        전력 기록 일괄 생성 (다중 INSERT)
+
+        Args:
+            records: {"charger_id", "measurement_time", "input_power", "cumulative_energy",
+                      선택: "daily_cumulative", "voltage", "current", "is_charging", "charger_status"} 목록
+        """
+        if not records:
+            return 0
+        rows = []
+        for record in records:
+            measurement_time = record["measurement_time"]
+            rows.append({
+                **record,
+                "measurement_date": measurement_time.date(),
+                "hour": measurement_time.hour,
+                "cumulative_energy": Decimal(str(record["cumulative_energy"])),
+                "daily_cumulative": Decimal(str(record.get("daily_cumulative", 0)))
+            })
+        session.execute(insert(PowerConsumption), rows)
+        if commit:
+            session.commit()
+        return len(rows)
+
+    @staticmethod
+    def bulk_insert_power_records(
+        session: Session,
+        records: Iterable[Dict[str, Any]],
+        chunk_size: int = 5000,
+        commit: bool = True
+    ) -> Dict[str, int]:
+        """
+        과거 전력 기록 일괄 생성 ((충전기 ID, 측정 시각) 기준 중복 건너뜀)
+
+        chunk_size건마다 기존 측정 시각 조회 1회와 bulk_create_power_records 1회로
+        반영하고 (commit=True면) 커밋한다. 다시 실행해도 중복 행이 생기지 않는다.
+
+        Returns:
+            {"inserted": 생성 건수, "skipped": 건너뛴 건수}
+        """
+        result = {"inserted": 0, "skipped": 0}
+        for chunk in _chunked(records, chunk_size):
+            by_key = {}
+            for record in chunk:
+                by_key.setdefault((record["charger_id"], record["measurement_time"]), record)
+            times = [measurement_time for _, measurement_time in by_key]
+            existing = set(
+                tuple(row) for row in session.query(
+                    PowerConsumption.charger_id, PowerConsumption.measurement_time
+                ).filter(
+                    PowerConsumption.charger_id.in_({charger_id for charger_id, _ in by_key}),
+                    PowerConsumption.measurement_time >= min(times),
+                    PowerConsumption.measurement_time <= max(times)
+                )
+            )
+            new_records = [record for key, record in by_key.items() if key not in existing]
+
+            PowerConsumptionService.bulk_create_power_records(session, new_records, commit=False)
+            if commit:
+                session.commit()
+            result["inserted"] += len(new_records)
+            result["skipped"] += len(chunk) - len(new_records)
+        return result
+
     @staticmethod
     def get_power_consumption(
         session: Session,
@@ -346,6 +683,77 @@ class PowerConsumptionService:
             )
         ).order_by(PowerConsumption.measurement_time).all()
     
+    @staticmethod
+    def get_power_columns(
+        session: Session,
+        charger_id: str,
+        start_time: datetime,
+        end_time: datetime
+    ) -> List[Tuple[datetime, float, Optional[float], Optional[float], Decimal]]:
+        """
+        전력 데이터 조회 (ORM 객체 없이 시계열 컬럼만)
+
+        Returns:
+            (측정 시각, 입력 전력, 전압, 전류, 누적 에너지) 목록, 시각 순
+        """
+        return [tuple(row) for row in session.query(
+            PowerConsumption.measurement_time,
+            PowerConsumption.input_power,
+            PowerConsumption.voltage,
+            PowerConsumption.current,
+            PowerConsumption.cumulative_energy
+        ).filter(
+            PowerConsumption.charger_id == charger_id,
+            PowerConsumption.measurement_time >= start_time,
+            PowerConsumption.measurement_time <= end_time
+        ).order_by(PowerConsumption.measurement_time)]
+
+    @staticmethod
+    def iter_power_columns(
+        session: Session,
+        before: Optional[datetime] = None,
+        charger_id: Optional[str] = None,
+        batch_size: int = 50000
+    ) -> Iterable[Tuple[str, datetime, float, Optional[float], Optional[float], Decimal]]:
+        """
+        전체 전력 데이터를 충전기·시각 순으로 나눠 읽기 (시계열 저장소 이전용)
+
+        Yields:
+            (충전기 ID, 측정 시각, 입력 전력, 전압, 전류, 누적 에너지)
+        """
+        query = session.query(
+            PowerConsumption.charger_id,
+            PowerConsumption.measurement_time,
+            PowerConsumption.input_power,
+            PowerConsumption.voltage,
+            PowerConsumption.current,
+            PowerConsumption.cumulative_energy
+        )
+        if before is not None:
+            query = query.filter(PowerConsumption.measurement_time < before)
+        if charger_id is not None:
+            query = query.filter(PowerConsumption.charger_id == charger_id)
+        for row in query.order_by(
+            PowerConsumption.charger_id, PowerConsumption.measurement_time
+        ).yield_per(batch_size):
+            yield tuple(row)
+
+    @staticmethod
+    def delete_power_records(
+        session: Session,
+        charger_id: str,
+        before: Optional[datetime] = None,
+        commit: bool = True
+    ) -> int:
+        """충전기 전력 데이터 일괄 삭제 (before 이전만, 쿼리 1회)"""
+        query = session.query(PowerConsumption).filter(PowerConsumption.charger_id == charger_id)
+        if before is not None:
+            query = query.filter(PowerConsumption.measurement_time < before)
+        deleted = query.delete(synchronize_session=False)
+        if commit:
+            session.commit()
+        return deleted
+
     @staticmethod
     def get_hourly_energy(
         session: Session,
@@ -374,7 +782,12 @@ class StatisticsService:
     
     @staticmethod
     def calculate_daily_stats(session: Session, charger_id: str, target_date: date) -> DailyChargerStats:
-        """일일 통계 계산 및 저장"""
+        """
+        일일 통계 계산 및 저장
+
+        UsageAggregator가 반영 중인 충전기/날짜는 UsageAggregator.rebuild_daily로 재계산한다
+        (직접 호출하면 집계기의 미반영 증분이 재계산 결과 위에 한 번 더 더해짐).
+        """
         # 기존 통계 확인
         existing = session.query(DailyChargerStats).filter(
             and_(
@@ -431,6 +844,244 @@ class StatisticsService:
         session.commit()
         return stats
     
+    @staticmethod
+    def apply_daily_deltas(
+        session: Session,
+        deltas: Dict[Tuple[str, date], Dict[str, Any]],
+        commit: bool = True
+    ) -> Dict[Tuple[str, date], Dict[str, Any]]:
+        """
+        일일 통계 증분 반영 (upsert)
+
+        사용 이력을 다시 집계하지 않고 기존 행에 증분만 더한다.
+        기존 행 조회 1회 후 신규 행은 다중 INSERT, 기존 행은 기본키 기준 일괄 UPDATE.
+
+        기존 행은 SELECT ... FOR UPDATE(기본키 순)로 잠그므로 여러 워커 프로세스가 같은 행에
+        동시에 반영해도 증분이 유실되지 않는다 (커밋까지 다른 워커는 대기).
+        같은 신규 행을 동시에 INSERT하면 한쪽이 유일 제약 위반으로 실패하며,
+        UsageAggregator.flush가 증분을 되돌려 다음 flush에서 기존 행 갱신으로 다시 반영한다.
+
+        Args:
+            deltas: {(charger_id, stats_date): {"num_sessions", "total_energy", "total_duration_minutes",
+                     "total_revenue", "hourly_energy", "hourly_sessions", "hourly_revenue"}}
+                    시간대별 항목은 {"시(0~23)": 값} 형식
+
+        Returns:
+            키별 반영 후 누적값 (deltas와 같은 형식)
+        """
+        if not deltas:
+            return {}
+
+        existing = {
+            (row.charger_id, row.stats_date): row
+            for row in session.query(DailyChargerStats).filter(
+                DailyChargerStats.charger_id.in_({key[0] for key in deltas}),
+                DailyChargerStats.stats_date.in_({key[1] for key in deltas})
+            ).order_by(DailyChargerStats.id).with_for_update()
+        }
+
+        now = datetime.utcnow()
+        new_rows = []
+        update_rows = []
+        totals = {}
+        for key, delta in deltas.items():
+            row = existing.get(key)
+            total = {
+                "num_sessions": delta["num_sessions"],
+                "total_energy": Decimal(str(delta["total_energy"])),
+                "total_duration_minutes": delta["total_duration_minutes"],
+                "total_revenue": Decimal(str(delta["total_revenue"]))
+            }
+            hourly = {name: dict(delta[name]) for name in ("hourly_energy", "hourly_sessions", "hourly_revenue")}
+            if row is not None:
+                total["num_sessions"] += row.num_sessions or 0
+                total["total_energy"] += row.total_energy or Decimal('0')
+                total["total_duration_minutes"] += row.total_duration_minutes or 0
+                total["total_revenue"] += row.total_revenue or Decimal('0')
+                for name, values in hourly.items():
+                    for hour, value in (getattr(row, name) or {}).items():
+                        values[str(hour)] = values.get(str(hour), 0) + value
+            if total["num_sessions"]:
+                total["avg_charge_per_session"] = (total["total_revenue"] / total["num_sessions"]).quantize(Decimal('0.01'))
+            total.update(hourly)
+            totals[key] = total
+
+            if row is None:
+                new_rows.append({"charger_id": key[0], "stats_date": key[1], **total})
+            else:
+                update_rows.append({"id": row.id, "updated_at": now, **total})
+
+        if new_rows:
+            session.execute(insert(DailyChargerStats), new_rows)
+        if update_rows:
+            session.execute(update(DailyChargerStats), update_rows)
+        if commit:
+            session.commit()
+        return totals
+
+    @staticmethod
+    def apply_hourly_deltas(
+        session: Session,
+        deltas: Dict[Tuple[str, datetime], Dict[str, Any]],
+        commit: bool = True
+    ) -> Dict[Tuple[str, datetime], Dict[str, Any]]:
+        """
+        시간별 통계 증분 반영 (upsert, 동시 반영 처리는 apply_daily_deltas와 같음)
+
+        Args:
+            deltas: {(charger_id, stats_hour): {"num_sessions", "total_energy",
+                     "total_duration_minutes", "total_revenue"}}
+
+        Returns:
+            키별 반영 후 누적값
+        """
+        if not deltas:
+            return {}
+
+        existing = {
+            (row.charger_id, row.stats_hour): row
+            for row in session.query(HourlyChargerStats).filter(
+                HourlyChargerStats.charger_id.in_({key[0] for key in deltas}),
+                HourlyChargerStats.stats_hour.in_({key[1] for key in deltas})
+            ).order_by(HourlyChargerStats.id).with_for_update()
+        }
+
+        now = datetime.utcnow()
+        new_rows = []
+        update_rows = []
+        totals = {}
+        for key, delta in deltas.items():
+            row = existing.get(key)
+            total = {
+                "num_sessions": delta["num_sessions"],
+                "total_energy": Decimal(str(delta["total_energy"])),
+                "total_duration_minutes": delta["total_duration_minutes"],
+                "total_revenue": Decimal(str(delta["total_revenue"]))
+            }
+            if row is None:
+                new_rows.append({"charger_id": key[0], "stats_hour": key[1], **total})
+            else:
+                total["num_sessions"] += row.num_sessions or 0
+                total["total_energy"] += row.total_energy or Decimal('0')
+                total["total_duration_minutes"] += row.total_duration_minutes or 0
+                total["total_revenue"] += row.total_revenue or Decimal('0')
+                update_rows.append({"id": row.id, "updated_at": now, **total})
+            totals[key] = total
+
+        if new_rows:
+            session.execute(insert(HourlyChargerStats), new_rows)
+        if update_rows:
+            session.execute(update(HourlyChargerStats), update_rows)
+        if commit:
+            session.commit()
+        return totals
+
+    @staticmethod
+    def get_charger_totals(
+        session: Session,
+        start_date: date,
+        end_date: date,
+        station_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        충전기별 기간 합계 (SUM ... GROUP BY charger_id 쿼리 1회)
+
+        일일 통계가 있는 충전기만 위치와 함께 반환한다.
+        """
+        query = session.query(
+            ChargerInfo.charger_id,
+            ChargerInfo.longitude,
+            ChargerInfo.latitude,
+            func.count(DailyChargerStats.id).label('num_days'),
+            func.coalesce(func.sum(DailyChargerStats.num_sessions), 0).label('num_sessions'),
+            func.coalesce(func.sum(DailyChargerStats.total_energy), 0).label('total_energy'),
+            func.coalesce(func.sum(DailyChargerStats.total_revenue), 0).label('total_revenue')
+        ).join(
+            DailyChargerStats, DailyChargerStats.charger_id == ChargerInfo.charger_id
+        ).filter(
+            DailyChargerStats.stats_date >= start_date,
+            DailyChargerStats.stats_date <= end_date
+        )
+        if station_id:
+            query = query.filter(ChargerInfo.station_id == station_id)
+        rows = query.group_by(
+            ChargerInfo.charger_id, ChargerInfo.longitude, ChargerInfo.latitude
+        ).all()
+
+        return [
+            {
+                'charger_id': row.charger_id,
+                'longitude': row.longitude,
+                'latitude': row.latitude,
+                'num_days': row.num_days,
+                'num_sessions': row.num_sessions,
+                'total_energy': Decimal(str(row.total_energy)),
+                'total_revenue': Decimal(str(row.total_revenue))
+            }
+            for row in rows
+        ]
+
+    @staticmethod
+    def get_daily_values(
+        session: Session,
+        start_date: date,
+        end_date: Optional[date] = None
+    ) -> List[Tuple[str, float, float, date, Decimal, Decimal]]:
+        """
+        충전기별 일일 에너지/매출 (위치 포함, 쿼리 1회)
+
+        Returns:
+            (충전기 ID, 경도, 위도, 날짜, 총 에너지, 총 매출) 목록
+        """
+        query = session.query(
+            DailyChargerStats.charger_id,
+            ChargerInfo.longitude,
+            ChargerInfo.latitude,
+            DailyChargerStats.stats_date,
+            DailyChargerStats.total_energy,
+            DailyChargerStats.total_revenue
+        ).join(
+            ChargerInfo, DailyChargerStats.charger_id == ChargerInfo.charger_id
+        ).filter(DailyChargerStats.stats_date >= start_date)
+        if end_date is not None:
+            query = query.filter(DailyChargerStats.stats_date <= end_date)
+        return [tuple(row) for row in query]
+
+    @staticmethod
+    def get_dashboard_summary(session: Session, target_date: date) -> Dict[str, Any]:
+        """
+        전체 대시보드 집계 (쿼리 2회, 충전기 수와 무관)
+
+            1. 충전기 상태별 COUNT(*) GROUP BY current_status
+            2. 충전소 수 + 당일 완료 세션의 COUNT/SUM(total_charge)/SUM(energy_delivered)
+        """
+        status_counts = {
+            status: count
+            for status, count in session.query(
+                ChargerInfo.current_status, func.count(ChargerInfo.id)
+            ).group_by(ChargerInfo.current_status)
+        }
+
+        station_count = session.query(func.count(StationInfo.id)).scalar_subquery()
+        totals = session.query(
+            station_count.label('num_stations'),
+            func.count(ChargerUsageLog.id).label('num_sessions'),
+            func.coalesce(func.sum(ChargerUsageLog.total_charge), 0).label('total_revenue'),
+            func.coalesce(func.sum(ChargerUsageLog.energy_delivered), 0).label('total_energy')
+        ).filter(
+            ChargerUsageLog.session_date == target_date,
+            ChargerUsageLog.payment_status == 'completed'
+        ).one()
+
+        return {
+            'num_stations': totals.num_stations,
+            'num_chargers': sum(status_counts.values()),
+            'status_counts': status_counts,
+            'num_sessions': totals.num_sessions,
+            'total_revenue': Decimal(str(totals.total_revenue)),
+            'total_energy': Decimal(str(totals.total_energy))
+        }
+
     @staticmethod
     def get_charger_summary(
         session: Session,
@@ -477,32 +1128,21 @@ class StatisticsService:
         end_date: date
     ) -> Dict[str, Any]:
         """충전소 기간별 요약 통계"""
-        chargers = session.query(ChargerInfo).filter(
+        num_chargers = session.query(func.count(ChargerInfo.id)).filter(
             ChargerInfo.station_id == station_id
-        ).all()
-        
-        total_energy = Decimal('0')
-        total_revenue = Decimal('0')
-        
-        for charger in chargers:
-            daily_stats = session.query(DailyChargerStats).filter(
-                and_(
-                    DailyChargerStats.charger_id == charger.charger_id,
-                    DailyChargerStats.stats_date >= start_date,
-                    DailyChargerStats.stats_date <= end_date
-                )
-            ).all()
-            
-            total_energy += sum(s.total_energy or 0 for s in daily_stats)
-            total_revenue += sum(s.total_revenue or 0 for s in daily_stats)
+        ).scalar()
+
+        totals = StatisticsService.get_charger_totals(session, start_date, end_date, station_id=station_id)
+        total_energy = sum((t['total_energy'] for t in totals), Decimal('0'))
+        total_revenue = sum((t['total_revenue'] for t in totals), Decimal('0'))
         
         return {
             'station_id': station_id,
             'period': f"{start_date} ~ {end_date}",
-            'num_chargers': len(chargers),
+            'num_chargers': num_chargers,
             'total_energy': total_energy,
             'total_revenue': total_revenue,
-            'avg_charger_revenue': total_revenue / len(chargers) if chargers else Decimal('0')
+            'avg_charger_revenue': total_revenue / num_chargers if num_chargers else Decimal('0')
         }
 
 
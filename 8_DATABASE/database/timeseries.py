@@ -0,0 +1,275 @@
+"""
+충전기 전력 측정값 컬럼형 시계열 저장소
+
+power_consumption 테이블은 측정값 1건마다 약 15개 컬럼의 행을 만들기 때문에
+5초 주기 측정이 쌓이면 행 수와 ORM 객체 생성 비용이 감당하기 어렵다.
+이 저장소는 충전기별·날짜(UTC)별 묶음(chunk)으로 아래 5개 컬럼만 NumPy 구조 배열로 보관한다.
+
+    timestamp (UTC epoch 초), power (kW), voltage (V), current (A), energy (누적 kWh)
+
+디렉터리 구조:
+    <root>/<충전기 ID>/<YYYY-MM-DD>.bin   당일 등 진행 중인 묶음 (레코드를 이어 붙이는 원시 파일, memmap으로 읽음)
+    <root>/<충전기 ID>/<YYYY-MM-DD>.npz   봉인된 묶음 (압축, 시각 순 정렬·중복 제거)
+
+    - append_records(): 측정값을 날짜별 .bin에 이어 씀 (행 단위 INSERT 없음)
+    - seal(): 지난 날짜의 .bin을 .npz로 압축
+    - read() / downsample(): 기간 조회와 구간 평균/최대 축약
+    - write_day(): 하루치 배열을 기존 묶음과 병합 (테이블 이전용, 같은 시각은 기존 값 유지)
+"""
+import os
+from datetime import date, datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+# 측정값 1건 (28 bytes)
+POWER_DTYPE = np.dtype([
+    ("timestamp", "<f8"),
+    ("power", "<f4"),
+    ("voltage", "<f4"),
+    ("current", "<f4"),
+    ("energy", "<f8"),
+])
+
+# downsample() 결과 1구간
+DOWNSAMPLE_DTYPE = np.dtype([
+    ("timestamp", "<f8"),   # 구간 시작 시각
+    ("samples", "<i4"),
+    ("power_avg", "<f4"),
+    ("power_max", "<f4"),
+    ("voltage", "<f4"),     # 구간 평균 (측정값 없으면 NaN)
+    ("current", "<f4"),
+    ("energy", "<f8"),      # 구간 마지막 누적 에너지
+])
+
+SECONDS_PER_DAY = 86400
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_ORDINAL = _EPOCH.toordinal()
+
+
+def to_timestamp(value: datetime) -> float:
+    """naive UTC datetime -> epoch 초"""
+    return (value - _EPOCH).total_seconds()
+
+
+def from_timestamp(timestamp: float) -> datetime:
+    """epoch 초 -> naive UTC datetime"""
+    return _EPOCH + timedelta(seconds=float(timestamp))
+
+
+def records_to_array(rows: Iterable[Tuple]) -> np.ndarray:
+    """(측정 시각, 전력 kW, 전압, 전류, 누적 에너지) 목록 -> POWER_DTYPE 배열 (None은 NaN)"""
+    rows = list(rows)
+    array = np.empty(len(rows), dtype=POWER_DTYPE)
+    if rows:
+        times, power, voltage, current, energy = zip(*rows)
+        array["timestamp"] = [to_timestamp(value) for value in times]
+        array["power"] = np.array(power, dtype=float)
+        array["voltage"] = np.array(voltage, dtype=float)
+        array["current"] = np.array(current, dtype=float)
+        array["energy"] = np.array(energy, dtype=float)
+    return array
+
+
+def downsample(data: np.ndarray, start: float, bucket_seconds: float) -> np.ndarray:
+    """
+    시각 순 정렬된 측정값을 bucket_seconds 구간으로 축약
+
+    Args:
+        start: 구간 기준 시각 (epoch 초)
+    """
+    if not len(data):
+        return np.empty(0, dtype=DOWNSAMPLE_DTYPE)
+    buckets = ((data["timestamp"] - start) // bucket_seconds).astype(np.int64)
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    ends = np.r_[starts[1:], len(data)]
+    counts = ends - starts
+
+    result = np.empty(len(starts), dtype=DOWNSAMPLE_DTYPE)
+    result["timestamp"] = start + buckets[starts] * bucket_seconds
+    result["samples"] = counts
+    power = data["power"].astype(np.float64)
+    result["power_avg"] = np.add.reduceat(power, starts) / counts
+    result["power_max"] = np.maximum.reduceat(power, starts)
+    for name in ("voltage", "current"):
+        values = data[name].astype(np.float64)
+        present = ~np.isnan(values)
+        totals = np.add.reduceat(np.where(present, values, 0.0), starts)
+        samples = np.add.reduceat(present.astype(np.int64), starts)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            result[name] = np.where(samples > 0, totals / samples, np.nan)
+    result["energy"] = data["energy"][ends - 1]
+    return result
+
+
+def _unique_sorted(array: np.ndarray) -> np.ndarray:
+    """시각 순 정렬, 같은 시각은 먼저 나온 값만 유지"""
+    _, first = np.unique(array["timestamp"], return_index=True)
+    return array[first]
+
+
+class PowerSeriesStore:
+    """충전기별·날짜별 전력 측정값 묶음 저장소"""
+
+    def __init__(self, root_dir: str):
+        self.root_dir = root_dir
+        os.makedirs(root_dir, exist_ok=True)
+
+    # ==================== 경로 ====================
+
+    def _charger_dir(self, charger_id: str) -> str:
+        if not charger_id or charger_id in (".", "..") or "/" in charger_id or "\\" in charger_id:
+            raise ValueError(f"저장소에 쓸 수 없는 충전기 ID: {charger_id!r}")
+        return os.path.join(self.root_dir, charger_id)
+
+    def _paths(self, charger_id: str, day: date) -> Tuple[str, str]:
+        """(진행 중 .bin, 봉인 .npz) 경로"""
+        base = os.path.join(self._charger_dir(charger_id), day.isoformat())
+        return base + ".bin", base + ".npz"
+
+    def charger_ids(self) -> List[str]:
+        return sorted(
+            name for name in os.listdir(self.root_dir)
+            if os.path.isdir(os.path.join(self.root_dir, name))
+        )
+
+    def days(self, charger_id: str) -> List[date]:
+        """묶음이 있는 날짜 목록"""
+        directory = self._charger_dir(charger_id)
+        if not os.path.isdir(directory):
+            return []
+        return sorted({
+            date.fromisoformat(name[:-4]) for name in os.listdir(directory)
+            if name.endswith((".bin", ".npz"))
+        })
+
+    # ==================== 쓰기 ====================
+
+    def append(self, charger_id: str, array: np.ndarray) -> int:
+        """측정값 배열을 날짜별 .bin에 이어 씀"""
+        if not len(array):
+            return 0
+        os.makedirs(self._charger_dir(charger_id), exist_ok=True)
+        day_numbers = (array["timestamp"] // SECONDS_PER_DAY).astype(np.int64)
+        for day_number in np.unique(day_numbers):
+            hot_path, _ = self._paths(charger_id, date.fromordinal(_EPOCH_ORDINAL + int(day_number)))
+            with open(hot_path, "ab") as f:
+                # 중단된 쓰기로 남은 불완전 레코드를 잘라내 이후 레코드 정렬 유지
+                size = f.seek(0, os.SEEK_END)
+                if size % POWER_DTYPE.itemsize:
+                    f.truncate(size - size % POWER_DTYPE.itemsize)
+                array[day_numbers == day_number].tofile(f)
+        return len(array)
+
+    def append_records(self, records: List[Dict[str, Any]]) -> int:
+        """
+        PowerConsumptionService.bulk_create_power_records와 같은 형식의 측정값 저장
+
+        Args:
+            records: {"charger_id", "measurement_time", "input_power", "cumulative_energy",
+                      선택: "voltage", "current"} 목록
+        """
+        by_charger: Dict[str, List[Tuple]] = {}
+        for record in records:
+            by_charger.setdefault(record["charger_id"], []).append((
+                record["measurement_time"],
+                record["input_power"],
+                record.get("voltage"),
+                record.get("current"),
+                record["cumulative_energy"]
+            ))
+        return sum(self.append(charger_id, records_to_array(rows)) for charger_id, rows in by_charger.items())
+
+    def write_day(self, charger_id: str, day: date, array: np.ndarray) -> int:
+        """
+        하루치 측정값을 기존 묶음과 병합해 봉인된 .npz로 저장
+
+        같은 시각의 측정값은 기존 값을 유지하므로 같은 데이터로 여러 번 실행해도 결과가 같다.
+
+        Returns:
+            저장된 묶음의 측정값 수
+        """
+        os.makedirs(self._charger_dir(charger_id), exist_ok=True)
+        hot_path, sealed_path = self._paths(charger_id, day)
+        merged = _unique_sorted(np.concatenate([self.read_day(charger_id, day), array.astype(POWER_DTYPE)]))
+        temp_path = sealed_path + ".tmp"
+        with open(temp_path, "wb") as f:
+            np.savez_compressed(f, data=merged)
+        os.replace(temp_path, sealed_path)
+        if os.path.exists(hot_path):
+            os.remove(hot_path)
+        return len(merged)
+
+    def seal(self, before: date) -> int:
+        """
+        before 이전 날짜의 .bin을 압축 .npz로 봉인
+
+        Returns:
+            봉인한 묶음 수
+        """
+        sealed = 0
+        for charger_id in self.charger_ids():
+            directory = self._charger_dir(charger_id)
+            for name in os.listdir(directory):
+                if not name.endswith(".bin"):
+                    continue
+                day = date.fromisoformat(name[:-4])
+                if day < before:
+                    self.write_day(charger_id, day, np.empty(0, dtype=POWER_DTYPE))
+                    sealed += 1
+        return sealed
+
+    # ==================== 읽기 ====================
+
+    def read_day(self, charger_id: str, day: date) -> np.ndarray:
+        """하루치 측정값, 시각 순"""
+        hot_path, sealed_path = self._paths(charger_id, day)
+        parts = []
+        if os.path.exists(sealed_path):
+            with np.load(sealed_path) as chunk:
+                parts.append(chunk["data"])
+        if os.path.exists(hot_path):
+            # 쓰는 중인 마지막 레코드는 제외
+            count = os.path.getsize(hot_path) // POWER_DTYPE.itemsize
+            if count:
+                parts.append(np.memmap(hot_path, dtype=POWER_DTYPE, mode="r", shape=(count,)))
+        if not parts:
+            return np.empty(0, dtype=POWER_DTYPE)
+        if len(parts) == 1 and os.path.exists(sealed_path):
+            return parts[0]
+        return _unique_sorted(np.concatenate(parts))
+
+    def read(self, charger_id: str, start_time: datetime, end_time: datetime) -> np.ndarray:
+        """기간(시작/종료 포함) 측정값, 시각 순"""
+        start, end = to_timestamp(start_time), to_timestamp(end_time)
+        parts = []
+        day = start_time.date()
+        while day <= end_time.date():
+            data = self.read_day(charger_id, day)
+            if len(data):
+                timestamps = data["timestamp"]
+                parts.append(np.array(data[(timestamps >= start) & (timestamps <= end)]))
+            day += timedelta(days=1)
+        if not parts:
+            return np.empty(0, dtype=POWER_DTYPE)
+        return np.concatenate(parts)
+
+    def downsample(
+        self,
+        charger_id: str,
+        start_time: datetime,
+        end_time: datetime,
+        bucket_seconds: float
+    ) -> np.ndarray:
+        """기간 측정값을 bucket_seconds 구간 평균/최대로 축약"""
+        return downsample(self.read(charger_id, start_time, end_time), to_timestamp(start_time), bucket_seconds)
+
+
+def create_store_from_env() -> Optional[PowerSeriesStore]:
+    """
+    OCPP_POWER_STORE_DIR 설정 시 저장소 생성 (없으면 None, power_consumption 테이블 사용)
+    """
+    root_dir = os.getenv("OCPP_POWER_STORE_DIR")
+    if not root_dir:
+        return None
+    return PowerSeriesStore(root_dir)